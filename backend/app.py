@@ -1,4 +1,4 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response, stream_with_context
 from flask_cors import CORS
 from flask_caching import Cache
 from flask_jwt_extended import JWTManager, jwt_required, get_jwt_identity
@@ -9,6 +9,7 @@ import pandas as pd
 from datetime import timedelta, datetime
 from dotenv import load_dotenv
 import traceback
+import json
 
 
 # Add current directory to path
@@ -18,7 +19,8 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 load_dotenv()
 
 # Import utilities
-from utils.fetch_data import fetch_stock_data, fetch_live_candles
+from utils.fetch_data import fetch_stock_data, fetch_live_candles, fetch_bulk_stock_data
+from utils.universes import resolve_universe, UNIVERSES
 from utils.live_stream import stream
 from utils.sentiment_volatility import analyze_market_sentiment, calculate_atr_volatility
 from utils.explainability import generate_prediction_reasoning
@@ -27,18 +29,29 @@ from utils.news_sentiment import fetch_news_sentiment, get_sentiment_summary
 from utils.confidence_calculator import get_confidence_explanation
 from utils.market_data import fetch_market_valuation, get_market_summary
 from utils.market_hours import is_market_open, get_market_status_message
+from utils.downsampling import (
+    parse_max_points, parse_method, downsample_frame, downsample_strategy_result, downsample_prediction_result
+)
+from utils.synthetic_market import synthetic_bars
+from utils.response_format import (
+    FastJSONProvider, parse_format, parse_fields, parse_time_encoding, parse_stream, stream_json,
+    columnar_strategy_result, columnar_prediction_result, STRATEGY_STREAM_KEYS, PREDICTION_STREAM_KEYS
+)
 
 # Import strategies
-from strategies.ema_crossover import ema_crossover_strategy
-from strategies.rsi_strategy import rsi_strategy
-from strategies.macd_strategy import macd_strategy
-from strategies.bollinger_scalping import bollinger_scalping_strategy
-from strategies.supertrend import supertrend_strategy
-from strategies.ichimoku_strategy import ichimoku_strategy
-from strategies.adx_dmi_strategy import adx_dmi_strategy
-from strategies.vwap_strategy import vwap_strategy
-from strategies.breakout_strategy import breakout_strategy
-from strategies.ml_lstm_strategy import ml_lstm_strategy
+from strategies.registry import STRATEGIES
+from strategies.runner import run_strategies_batch, check_params
+from strategies.kernels import strategy_signals
+from strategies.incremental import LiveStrategyCache
+from strategies.screener import screen_universe, SIGNAL_TYPES
+from strategies.multi_timeframe import multi_timeframe_analysis, finest_timeframe
+from strategies.param_surface import PARAM_SURFACES, DEFAULT_GRIDS, parse_grid_axis, evaluate_param_surface
+from backtesting.metrics import periods_per_year_for_interval, OBJECTIVES
+from backtesting.optimizer import PARAM_GRIDS, load_bars
+from backtesting.walk_forward import walk_forward
+from backtesting.vectorized import run_backtest, backtest_report
+from backtesting.portfolio import portfolio_backtest, SIZING_RULES
+from backtesting.monte_carlo import monte_carlo, METHODS as MONTE_CARLO_METHODS
 
 # Import models
 from models.lstm_model import lstm_predict
@@ -68,6 +81,8 @@ from chatbot.chat_history import (
 
 # Initialize Flask app
 app = Flask(__name__)
+# NaN-safe JSON for every response: NaN/inf -> null, NumPy arrays and timestamps encoded directly
+app.json = FastJSONProvider(app)
 CORS(app, resources={r"/api/*": {"origins": "*"}}, supports_credentials=True)
 
 # JWT Configuration
@@ -78,6 +93,18 @@ jwt = JWTManager(app)
 # Configure caching
 cache = Cache(app, config={'CACHE_TYPE': 'simple', 'CACHE_DEFAULT_TIMEOUT': 300})
 
+# Strategy outputs share the request's bars instead of copying them (kernels.overlay_frame),
+# which needs copy-on-write: always on from pandas 3, opted into for the app on pandas 2
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
+# Largest mock market the simulator generates per request, in bars per interval (about 40
+# years of daily bars); bigger markets come from utils.synthetic_market directly
+MAX_SIMULATOR_BARS = {'1d': 10_000, '1h': 20_000, '30m': 20_000, '15m': 20_000, '5m': 20_000, '1m': 20_000}
+
+# Indicator state of recently polled live strategies, reused for incremental re-evaluation
+live_strategy_cache = LiveStrategyCache()
+
 # Initialize database
 from database import init_db, add_favorite, remove_favorite, list_favorites
 from utils.market_snapshots import get_intraday_summary
@@ -93,43 +120,31 @@ except Exception:
 from auth import auth_bp
 app.register_blueprint(auth_bp, url_prefix='/api/auth')
 
-def clean_nan_values(obj):
+def format_result(result, response_format, encode):
     """
-    Recursively replace NaN, Infinity with None for valid JSON serialization
+    Strategy or prediction result in the requested response format
+
+    Args:
+        result: Result dict
+        response_format: 'rows' (as computed) or 'columnar'
+        encode: columnar_strategy_result or columnar_prediction_result
     """
-    if isinstance(obj, dict):
-        return {key: clean_nan_values(value) for key, value in obj.items()}
-    elif isinstance(obj, list):
-        return [clean_nan_values(item) for item in obj]
-    elif isinstance(obj, (pd.Timestamp, datetime, np.datetime64)):
-        try:
-            return pd.to_datetime(obj).isoformat()
-        except Exception:
-            return str(obj)
-    elif isinstance(obj, float):
-        if np.isnan(obj) or np.isinf(obj):
-            return None
-        return obj
-    elif isinstance(obj, (np.integer, np.floating)):
-        if np.isnan(obj) or np.isinf(obj):
-            return None
-        return float(obj) if isinstance(obj, np.floating) else int(obj)
-    else:
-        return obj
-
-# Strategy mapping
-STRATEGIES = {
-    'ema_crossover': ema_crossover_strategy,
-    'rsi': rsi_strategy,
-    'macd': macd_strategy,
-    'bollinger_scalping': bollinger_scalping_strategy,
-    'supertrend': supertrend_strategy,
-    'ichimoku': ichimoku_strategy,
-    'adx_dmi': adx_dmi_strategy,
-    'vwap': vwap_strategy,
-    'breakout': breakout_strategy,
-    'ml_lstm': ml_lstm_strategy
-}
+    if response_format != 'columnar':
+        return result
+    return encode(result, parse_fields(request.args.get('fields')), parse_time_encoding(request.args.get('times')))
+
+def json_response(result, streamed, stream_keys):
+    """
+    JSON response for a result, sent in chunks when requested
+
+    Args:
+        result: Result dict
+        streamed: Send the document in chunks (small keys first, then ``stream_keys`` in batches)
+        stream_keys: Keys of the large per-bar payload
+    """
+    if not streamed:
+        return jsonify(result)
+    return Response(stream_with_context(stream_json(result, stream_keys)), mimetype='application/json')
 
 # Model mapping
 MODELS = {
@@ -159,6 +174,13 @@ def root():
             'health': '/api/health',
             'strategies': '/api/strategies',
             'strategy': '/api/strategy?name=<strategy>&symbol=<symbol>&period=<period>',
+            'strategy_batch': '/api/strategy/batch?symbol=<symbol>&strategies=<a,b,...>&period=<period>',
+            'strategy_surface': '/api/strategy/surface?name=<strategy>&symbol=<symbol>&<param>=<start:stop:step>',
+            'strategy_walk_forward': '/api/strategy/walk-forward?name=<strategy>&symbol=<symbol>&train=<bars>&test=<bars>',
+            'strategy_multi_timeframe': '/api/strategy/multi-timeframe?name=<strategy>&symbol=<symbol>&timeframes=1d,1h,5m',
+            'strategy_monte_carlo': '/api/strategy/monte-carlo?name=<strategy>&symbol=<symbol>&paths=<n>&seed=<seed>',
+            'screener': '/api/screener?universe=<NIFTY50|SP500|a,b,...>&strategy=<strategy>&within=<bars>&signal=<buy|sell|any>',
+            'portfolio_backtest': '/api/portfolio/backtest?strategy=<strategy>&symbols=<a,b,...>&sizing=<equal|fixed|inverse_vol>',
             'models': '/api/models',
             'predict': '/api/predict?model=<model>&symbol=<symbol>&period=<period>',
             'chatbot': '/api/chatbot (POST)',
@@ -192,18 +214,37 @@ def live_quote():
 
 @app.route('/api/live/candles', methods=['GET'])
 def live_candles():
+    """
+    Recent candles of a streamed symbol
+
+    Query Parameters:
+        symbol: Stock symbol
+        lookback: Number of most recent candles (default: 300)
+        max_points: Optional cap on returned candles; longer windows are merged into OHLC buckets
+        downsample: 'ohlc' (default) or 'lttb' (keep the candles that shape the close line)
+    """
     symbol = request.args.get('symbol')
     lookback = int(request.args.get('lookback', '300'))
     if not symbol:
         return jsonify({'error': 'symbol is required'}), 400
+    try:
+        max_points = parse_max_points(request.args.get('max_points'))
+        method = parse_method(request.args.get('downsample'), default='ohlc')
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     df = stream.get_candles(symbol, lookback=lookback)
     if df is None or df.empty:
         return jsonify({'error': 'No candles yet'}), 404
-    return jsonify({
+    response = {
         'symbol': symbol.upper(),
-        'data_source': 'websocket' if stream.mode == 'websocket' else 'polling',
-        'candles': df.to_dict('records')
-    })
+        'data_source': 'websocket' if stream.mode == 'websocket' else 'polling'
+    }
+    if max_points and len(df) > max_points:
+        response['downsampled'] = {'method': method, 'original_points': len(df)}
+        df, _ = downsample_frame(df, max_points, method)
+        response['downsampled']['points'] = len(df)
+    response['candles'] = df.to_dict('records')
+    return jsonify(response)
 
 @app.route('/api/strategy', methods=['GET'])
 def get_strategy():
@@ -211,29 +252,48 @@ def get_strategy():
     Get trading strategy signals based on historical price data
     
     Query Parameters:
-        name: Strategy name (ema_crossover, rsi, macd, bollinger_scalping, supertrend)
+        name: Strategy name (ema_crossover, rsi, macd, bollinger_scalping, supertrend, ..., ensemble)
         symbol: Stock symbol (e.g., AAPL, INFY.NS)
         period: Data period (default: 1y)
         interval: Data interval (default: 1d)
+        params: Optional JSON object of strategy parameters,
+                e.g. {"members": ["ema_crossover", "macd", "vwap"], "min_agree": 2} for ensemble
+        backtest: '1' to add a long/flat backtest of the signals (equity, drawdown, trades, metrics)
+        commission: Backtest commission per side as a fraction (default: 0)
+        slippage: Backtest slippage per side as a fraction of price (default: 0)
+        capital: Backtest starting equity (default: 10000)
+        format: 'rows' (default, one dict per bar) or 'columnar' (one array per field)
+        fields: Columnar only, comma-separated fields to return (e.g. date,close,signal)
+        times: Columnar only, 'epoch' (default, integer seconds) or 'iso' timestamps
+        max_points: Optional cap on returned bars and backtest trades (signal bars are kept while they fit); the backtest runs on every bar
+        downsample: 'lttb' (default, keep the bars that shape the close line) or 'ohlc' (merge bars into candles)
+        stream: '1' to send the JSON in chunks (metadata and signals first, then the bars in batches)
     """
     try:
         strategy_name = request.args.get('name', '').lower()
         symbol = request.args.get('symbol', 'AAPL').upper()
         period = request.args.get('period', '1y')
         interval = request.args.get('interval', '1d')
+        backtest = request.args.get('backtest', '0').lower() in ['1', 'true', 'yes']
+        params = json.loads(request.args.get('params') or '{}')
+        response_format = parse_format(request.args.get('format'))
+        max_points = parse_max_points(request.args.get('max_points'))
+        method = parse_method(request.args.get('downsample'))
+        streamed = parse_stream(request.args.get('stream'))
         
         if not strategy_name or strategy_name not in STRATEGIES:
             return jsonify({
                 'error': 'Invalid strategy name',
                 'available_strategies': list(STRATEGIES.keys())
             }), 400
+        check_params(strategy_name, params)
         
         # Fetch historical data (training/backtesting friendly)
         df = fetch_stock_data(symbol, period=period, interval=interval)
         
         # Apply strategy
         strategy_func = STRATEGIES[strategy_name]
-        result = strategy_func(df)
+        result = strategy_func(df, **params)
         
         # Add data source flag for frontend visibility
         try:
@@ -241,11 +301,25 @@ def get_strategy():
         except Exception:
             result['data_source'] = 'yfinance'
 
-        # Clean NaN values for valid JSON
-        result = clean_nan_values(result)
+        if backtest:
+            signal = [row.get('signal', 0) for row in result['data']]
+            backtest_result = run_backtest(
+                df['close'].to_numpy(dtype=float), signal,
+                commission=float(request.args.get('commission', 0)),
+                slippage=float(request.args.get('slippage', 0)),
+                initial_capital=float(request.args.get('capital', 10000)),
+                periods_per_year=periods_per_year_for_interval(interval)
+            )
+            dates = [row.get('date') for row in result['data']]
+            result['backtest'] = backtest_report(backtest_result, dates)
+
+        result = downsample_strategy_result(result, max_points, method)
+        result = format_result(result, response_format, columnar_strategy_result)
         
-        return jsonify(result)
+        return json_response(result, streamed, STRATEGY_STREAM_KEYS)
     
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         tb = traceback.format_exc()
         try:
@@ -257,6 +331,401 @@ def get_strategy():
             return jsonify({'error': str(e), 'traceback': tb}), 500
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/strategy/batch', methods=['GET', 'POST'])
+def get_strategy_batch():
+    """
+    Evaluate several strategies over a single data fetch
+    
+    Query Parameters (or JSON body for POST):
+        symbol: Stock symbol (e.g., AAPL, INFY.NS)
+        strategies: Comma-separated strategy names or a JSON list (default: all)
+        params: Optional JSON object of per-strategy parameters, e.g. {"rsi": {"period": 10}}
+        period: Data period (default: 1y)
+        interval: Data interval (default: 1d)
+    """
+    try:
+        body = (request.get_json(silent=True) or {}) if request.method == 'POST' else {}
+        args = request.args
+        
+        symbol = str(body.get('symbol') or args.get('symbol', 'AAPL')).upper()
+        period = body.get('period') or args.get('period', '1y')
+        interval = body.get('interval') or args.get('interval', '1d')
+        
+        names = body.get('strategies') or args.get('strategies') or list(STRATEGIES.keys())
+        if isinstance(names, str):
+            names = [n.strip() for n in names.split(',') if n.strip()]
+        names = [str(n).lower() for n in names]
+        
+        params = body.get('params') or args.get('params') or {}
+        if isinstance(params, str):
+            params = json.loads(params)
+        if not isinstance(params, dict):
+            return jsonify({'error': 'params must be an object keyed by strategy name'}), 400
+        
+        invalid = [n for n in names if n not in STRATEGIES]
+        if invalid:
+            return jsonify({
+                'error': f"Invalid strategy name(s): {', '.join(invalid)}",
+                'available_strategies': list(STRATEGIES.keys())
+            }), 400
+        
+        # One fetch shared by every strategy
+        df = fetch_stock_data(symbol, period=period, interval=interval)
+        result = run_strategies_batch(df, names, params)
+        
+        result['symbol'] = symbol
+        result['period'] = period
+        result['interval'] = interval
+        try:
+            result['data_source'] = df.attrs.get('data_source', 'yfinance')
+        except Exception:
+            result['data_source'] = 'yfinance'
+        
+        return jsonify(result)
+    
+    except Exception as e:
+        tb = traceback.format_exc()
+        try:
+            print(tb)
+        except Exception:
+            pass
+        if (os.getenv('FLASK_ENV', '').lower() == 'development') or (os.getenv('FLASK_DEBUG', '').lower() in ['1', 'true', 'yes']):
+            return jsonify({'error': str(e), 'traceback': tb}), 500
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/strategy/surface', methods=['GET'])
+def get_strategy_surface():
+    """
+    Evaluate a strategy over a whole parameter grid in one batched pass
+    
+    Query Parameters:
+        name: Strategy name (ema_crossover, rsi, supertrend)
+        symbol: Stock symbol (e.g., AAPL, INFY.NS)
+        period: Data period (default: 5y)
+        interval: Data interval (default: 1d)
+        <axis>: Grid for each strategy parameter as 'start:stop:step' or 'a,b,c'
+                (ema_crossover: short_period, long_period; rsi: period, oversold, overbought;
+                 supertrend: period, multiplier). Missing axes use a default grid.
+    """
+    try:
+        strategy_name = request.args.get('name', '').lower()
+        symbol = request.args.get('symbol', 'AAPL').upper()
+        period = request.args.get('period', '5y')
+        interval = request.args.get('interval', '1d')
+        
+        if strategy_name not in PARAM_SURFACES:
+            return jsonify({
+                'error': 'Invalid strategy name for parameter surface',
+                'available_strategies': list(PARAM_SURFACES.keys())
+            }), 400
+        
+        grid = {}
+        for axis in PARAM_SURFACES[strategy_name][1]:
+            text = request.args.get(axis)
+            grid[axis] = parse_grid_axis(text) if text else DEFAULT_GRIDS[strategy_name][axis]
+            if not grid[axis]:
+                return jsonify({'error': f'Empty grid for {axis}'}), 400
+        
+        df = fetch_stock_data(symbol, period=period, interval=interval)
+        surface = evaluate_param_surface(strategy_name, df, grid, periods_per_year=periods_per_year_for_interval(interval))
+        
+        result = {
+            'strategy': strategy_name,
+            'symbol': symbol,
+            'period': period,
+            'interval': interval,
+            'axes': surface['axes'],
+            'metrics': {name: values.tolist() for name, values in surface['metrics'].items()},
+            'best': surface['best']
+        }
+        return jsonify(result)
+    
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/strategy/walk-forward', methods=['GET'])
+def get_strategy_walk_forward():
+    """
+    Walk-forward optimization: re-optimize on each training window, trade the next test window
+    
+    Query Parameters:
+        name: Strategy name (any registered strategy)
+        symbol: Stock symbol (e.g., AAPL, INFY.NS)
+        period: Data period (default: 10y)
+        interval: Data interval (default: 1d)
+        train: Bars per training window (default: 504)
+        test: Bars per test window (default: 126)
+        step: Bars between windows (default: test)
+        anchored: 'true' to grow the training window from the first bar
+        objective: Metric optimized on each training window (default: sharpe)
+        <param>: Grid for a strategy parameter as 'start:stop:step' or 'a,b,c' (default: optimizer grid)
+    """
+    try:
+        strategy_name = request.args.get('name', '').lower()
+        symbol = request.args.get('symbol', 'AAPL').upper()
+        period = request.args.get('period', '10y')
+        interval = request.args.get('interval', '1d')
+        train_size = int(request.args.get('train', 504))
+        test_size = int(request.args.get('test', 126))
+        step = int(request.args.get('step', 0)) or None
+        anchored = request.args.get('anchored', 'false').lower() in ['1', 'true', 'yes']
+        objective = request.args.get('objective', 'sharpe')
+        
+        if strategy_name not in STRATEGIES:
+            return jsonify({
+                'error': 'Invalid strategy name',
+                'available_strategies': list(STRATEGIES.keys())
+            }), 400
+        if train_size < 2 or test_size < 1:
+            return jsonify({'error': 'train must be at least 2 bars and test at least 1 bar'}), 400
+        if objective not in OBJECTIVES:
+            return jsonify({'error': f"objective must be one of {', '.join(OBJECTIVES)}"}), 400
+        
+        grid = dict(PARAM_GRIDS.get(strategy_name, {}))
+        for axis in grid:
+            text = request.args.get(axis)
+            if text:
+                grid[axis] = parse_grid_axis(text)
+                if not grid[axis]:
+                    return jsonify({'error': f'Empty grid for {axis}'}), 400
+        
+        df = fetch_stock_data(symbol, period=period, interval=interval)
+        # In this process: a process pool per request would fork CPU-count workers inside each server worker
+        result = walk_forward(
+            df, strategy_name, grid,
+            train_size=train_size, test_size=test_size, step=step, anchored=anchored,
+            objective=objective, periods_per_year=periods_per_year_for_interval(interval), workers=1
+        )
+        result.update({'symbol': symbol, 'period': period, 'interval': interval})
+        return jsonify(result)
+    
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/strategy/multi-timeframe', methods=['GET'])
+def get_strategy_multi_timeframe():
+    """
+    Run a strategy on several timeframes from one fetch and report their confluence
+    
+    Query Parameters:
+        name: Strategy name (any registered strategy)
+        symbol: Stock symbol (e.g., AAPL, INFY.NS)
+        timeframes: Comma-separated timeframes (default: 1d,1h,5m)
+        interval: Base interval to fetch (default: the finest timeframe)
+        period: Data period (default: 60d, the longest yfinance keeps for 5m bars)
+        params: Optional JSON object of strategy parameters used on every timeframe
+    """
+    try:
+        strategy_name = request.args.get('name', '').lower()
+        symbol = request.args.get('symbol', 'AAPL').upper()
+        timeframes = [t.strip() for t in request.args.get('timeframes', '1d,1h,5m').split(',') if t.strip()]
+        period = request.args.get('period', '60d')
+        params = json.loads(request.args.get('params') or '{}')
+        
+        if strategy_name not in STRATEGIES:
+            return jsonify({
+                'error': 'Invalid strategy name',
+                'available_strategies': list(STRATEGIES.keys())
+            }), 400
+        if not timeframes:
+            return jsonify({'error': 'timeframes is required (e.g. 1d,1h,5m)'}), 400
+        
+        interval = request.args.get('interval') or finest_timeframe(timeframes)
+        
+        # One fetch at the finest resolution; coarser timeframes are resampled from it
+        df = fetch_stock_data(symbol, period=period, interval=interval)
+        result = multi_timeframe_analysis(df, strategy_name, timeframes, params)
+        result.update({'symbol': symbol, 'period': period, 'interval': interval})
+        return jsonify(result)
+    
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/strategy/monte-carlo', methods=['GET'])
+def get_strategy_monte_carlo():
+    """
+    Monte Carlo robustness of a strategy's backtest
+    
+    Query Parameters:
+        name: Strategy name (any registered strategy)
+        symbol: Stock symbol (e.g., AAPL, INFY.NS)
+        period: Data period (default: 5y)
+        interval: Data interval (default: 1d)
+        methods: Comma-separated subset of bootstrap, block_bootstrap, shuffle_trades (default: all)
+        paths: Resampled paths per method (default: 1000, max: 20000)
+        block: Block size in bars for block_bootstrap (default: 20)
+        seed: Random seed for reproducible results
+        commission, slippage: Backtest costs per side as fractions (default: 0)
+    """
+    try:
+        strategy_name = request.args.get('name', '').lower()
+        symbol = request.args.get('symbol', 'AAPL').upper()
+        period = request.args.get('period', '5y')
+        interval = request.args.get('interval', '1d')
+        methods = [m.strip() for m in request.args.get('methods', '').split(',') if m.strip()] or list(MONTE_CARLO_METHODS)
+        n_paths = min(int(request.args.get('paths', 1000)), 20000)
+        seed = request.args.get('seed')
+        
+        if strategy_name not in STRATEGIES:
+            return jsonify({
+                'error': 'Invalid strategy name',
+                'available_strategies': list(STRATEGIES.keys())
+            }), 400
+        
+        df = fetch_stock_data(symbol, period=period, interval=interval)
+        signal = strategy_signals(df, strategy_name)
+        periods_per_year = periods_per_year_for_interval(interval)
+        backtest_result = run_backtest(
+            df['close'].to_numpy(dtype=float), signal,
+            commission=float(request.args.get('commission', 0)),
+            slippage=float(request.args.get('slippage', 0)),
+            periods_per_year=periods_per_year
+        )
+        
+        trade_returns = backtest_result['trades']['return']
+        years = len(df) / periods_per_year
+        if len(trade_returns) < 2 and 'shuffle_trades' in methods:
+            methods = [m for m in methods if m != 'shuffle_trades']
+        distributions = monte_carlo(
+            returns=backtest_result['returns'], trade_returns=trade_returns, methods=methods,
+            n_paths=n_paths, block_size=int(request.args.get('block', 20)),
+            seed=int(seed) if seed is not None else None,
+            periods_per_year=periods_per_year, trades_per_year=len(trade_returns) / years if years else None
+        )
+        
+        response = {
+            'strategy': strategy_name,
+            'symbol': symbol,
+            'period': period,
+            'interval': interval,
+            'seed': int(seed) if seed is not None else None,
+            'backtest': backtest_result['metrics'],
+            'distributions': distributions
+        }
+        return jsonify(response)
+    
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/portfolio/backtest', methods=['GET'])
+def get_portfolio_backtest():
+    """
+    Run one strategy across several symbols with shared capital
+    
+    Query Parameters:
+        strategy: Strategy name (any registered strategy)
+        symbols: Comma-separated stock symbols
+        params: Optional JSON object of strategy parameters applied to every symbol
+        period: Data period (default: 1y)
+        interval: Data interval (default: 1d)
+        sizing: equal, fixed or inverse_vol (default: equal)
+        max_weight: Optional weight cap per symbol (e.g. 0.2)
+        commission: Cost per unit of turnover as a fraction (default: 0)
+        slippage: Slippage per unit of turnover as a fraction (default: 0)
+        capital: Starting equity (default: 100000)
+    """
+    try:
+        strategy_name = request.args.get('strategy', '').lower()
+        symbols = [s.strip().upper() for s in request.args.get('symbols', '').split(',') if s.strip()]
+        params = json.loads(request.args.get('params') or '{}')
+        period = request.args.get('period', '1y')
+        interval = request.args.get('interval', '1d')
+        sizing = request.args.get('sizing', 'equal').lower()
+        max_weight = request.args.get('max_weight')
+        
+        if strategy_name not in STRATEGIES:
+            return jsonify({
+                'error': 'Invalid strategy name',
+                'available_strategies': list(STRATEGIES.keys())
+            }), 400
+        if not symbols:
+            return jsonify({'error': 'symbols is required (comma-separated)'}), 400
+        if sizing not in SIZING_RULES:
+            return jsonify({'error': 'Invalid sizing rule', 'available_sizing': SIZING_RULES}), 400
+        
+        bars, errors = load_bars(symbols, period=period, interval=interval)
+        if not bars:
+            return jsonify({'error': 'No data available for any symbol', 'errors': errors}), 404
+        
+        result = portfolio_backtest(
+            bars, strategy_name, params, sizing=sizing,
+            max_weight=float(max_weight) if max_weight else None,
+            commission=float(request.args.get('commission', 0)),
+            slippage=float(request.args.get('slippage', 0)),
+            initial_capital=float(request.args.get('capital', 100000)),
+            periods_per_year=periods_per_year_for_interval(interval)
+        )
+        result.update({'period': period, 'interval': interval, 'errors': errors})
+        return jsonify(result)
+    
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/screener', methods=['GET'])
+def get_screener():
+    """
+    Screen a symbol universe for recent strategy signals
+    
+    Query Parameters:
+        universe: NIFTY50, SP500 or a comma-separated symbol list (default: NIFTY50)
+        strategy: Strategy name (any registered strategy)
+        params: Optional JSON object of strategy parameters
+        within: Match signals fired in the last N bars (default: 3)
+        signal: buy, sell or any (default: buy)
+        period: Data period (default: 1y)
+        interval: Data interval (default: 1d)
+    """
+    try:
+        strategy_name = request.args.get('strategy', '').lower()
+        params = json.loads(request.args.get('params') or '{}')
+        within = int(request.args.get('within', 3))
+        signal_type = request.args.get('signal', 'buy').lower()
+        period = request.args.get('period', '1y')
+        interval = request.args.get('interval', '1d')
+        
+        if strategy_name not in STRATEGIES:
+            return jsonify({
+                'error': 'Invalid strategy name',
+                'available_strategies': list(STRATEGIES.keys())
+            }), 400
+        if signal_type not in SIGNAL_TYPES:
+            return jsonify({'error': 'signal must be one of: ' + ', '.join(SIGNAL_TYPES)}), 400
+        if within < 1:
+            return jsonify({'error': 'within must be at least 1'}), 400
+        universe = request.args.get('universe') or 'NIFTY50'
+        symbols = resolve_universe(universe)
+        
+        started = datetime.now()
+        bars, fetch_errors = fetch_bulk_stock_data(symbols, period=period, interval=interval)
+        matches, errors = screen_universe(bars, strategy_name, params, within_bars=within, signal_type=signal_type)
+        
+        result = {
+            'strategy': strategy_name,
+            'universe': universe,
+            'within_bars': within,
+            'signal': signal_type,
+            'scanned': len(bars),
+            'matches': matches,
+            'errors': {**fetch_errors, **errors},
+            'elapsed_seconds': round((datetime.now() - started).total_seconds(), 2)
+        }
+        return jsonify(result)
+    
+    except ValueError as e:
+        return jsonify({'error': str(e), 'available_universes': list(UNIVERSES.keys())}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/strategy/live', methods=['GET'])
 def get_strategy_live():
     """Run a trading strategy on recent intraday candles for near-real-time signals.
@@ -266,12 +735,21 @@ def get_strategy_live():
         symbol: Stock symbol (e.g., AAPL, RELIANCE.NS)
         resolution: Candle resolution in minutes. Supported: '1','5','15','30','60' (default: '1')
         lookback: Number of minutes to look back for candles (default: 240)
+        params: Optional JSON object of strategy parameters
+        format, fields, times: Response format as for /api/strategy
+
+    For long lookbacks, repeated polls of rolling-window strategies for the same symbol, params
+    and resolution only recompute indicators over the bars that changed since the previous poll;
+    other polls run the strategy directly (see 'incremental'). The result is always that of
+    running the strategy on the returned candles alone.
     """
     try:
         strategy_name = request.args.get('name', '').lower()
         symbol = request.args.get('symbol', 'AAPL').upper()
         resolution = request.args.get('resolution', '1')
         lookback = int(request.args.get('lookback', '240'))
+        params = json.loads(request.args.get('params') or '{}')
+        response_format = parse_format(request.args.get('format'))
 
         if not strategy_name or strategy_name not in STRATEGIES:
             return jsonify({
@@ -287,9 +765,8 @@ def get_strategy_live():
         if df is None or df.empty:
             return jsonify({'error': f'No live candle data available for symbol: {symbol}'}), 404
 
-        # Apply strategy on live candles
-        strategy_func = STRATEGIES[strategy_name]
-        result = strategy_func(df)
+        # Apply strategy on live candles, reusing indicators from the previous poll
+        result = live_strategy_cache.evaluate(df, symbol, strategy_name, params, resolution)
 
         # Attach data source
         try:
@@ -331,9 +808,11 @@ def get_strategy_live():
         result['resolution'] = resolution
         result['lookback'] = lookback
 
-        result = clean_nan_values(result)
+        result = format_result(result, response_format, columnar_strategy_result)
         return jsonify(result)
 
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         tb = traceback.format_exc()
         try:
@@ -367,8 +846,6 @@ def get_trading_signal():
         # Optional: benchmark could be fetched here (e.g., SPY / ^NSEI) and passed in
         result = train_and_predict_multi_horizon(df)
 
-        # Clean NaN/infs
-        result = clean_nan_values(result)
         return jsonify(result)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -443,10 +920,10 @@ def favorites_summary():
         cache_key = f"fav_summary:{current_user_id}:{','.join(sorted(symbols))}"
         cached = cache.get(cache_key)
         if cached:
-            return jsonify(clean_nan_values(cached))
+            return jsonify(cached)
         summary = get_intraday_summary(symbols)
         cache.set(cache_key, summary, timeout=60)
-        return jsonify(clean_nan_values(summary))
+        return jsonify(summary)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -459,11 +936,19 @@ def get_prediction():
         model: Model name (lstm, prophet, arima, randomforest, xgboost, logistic_regression, xgboost_classifier, randomforest_classifier, lstm_classifier, svm)
         symbol: Stock symbol (e.g., AAPL, INFY.NS)
         period: Data period (default: 2y)
+        format: 'rows' (default) or 'columnar' (dates, predictions, actual, ... as one 'series' payload)
+        fields: Columnar only, comma-separated series to return (e.g. dates,predictions)
+        times: Columnar only, 'epoch' (default, integer seconds) or 'iso' timestamps
+        max_points: Optional cap on returned dates; the series are reduced with LTTB on the actual prices
+        stream: '1' to send the JSON in chunks (metrics and metadata first, then the series in batches)
     """
     try:
         model_name = request.args.get('model', '').lower()
         symbol = request.args.get('symbol', 'AAPL').upper()
         period = request.args.get('period', '2y')
+        response_format = parse_format(request.args.get('format'))
+        max_points = parse_max_points(request.args.get('max_points'))
+        streamed = parse_stream(request.args.get('stream'))
         
         if not model_name or model_name not in MODELS:
             return jsonify({
@@ -490,11 +975,13 @@ def get_prediction():
         # Add reasoning to result
         result['reasoning'] = reasoning
         
-        # Clean NaN values for valid JSON
-        result = clean_nan_values(result)
+        result = downsample_prediction_result(result, max_points)
+        result = format_result(result, response_format, columnar_prediction_result)
         
-        return jsonify(result)
+        return json_response(result, streamed, PREDICTION_STREAM_KEYS)
     
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -604,7 +1091,8 @@ def list_strategies():
             {'id': 'rsi', 'name': 'RSI Strategy', 'description': 'Relative Strength Index momentum strategy'},
             {'id': 'macd', 'name': 'MACD Strategy', 'description': 'Moving Average Convergence Divergence strategy'},
             {'id': 'bollinger_scalping', 'name': 'Bollinger Scalping', 'description': 'Bollinger Bands mean reversion strategy'},
-            {'id': 'supertrend', 'name': 'SuperTrend', 'description': 'SuperTrend indicator trend-following strategy'}
+            {'id': 'supertrend', 'name': 'SuperTrend', 'description': 'SuperTrend indicator trend-following strategy'},
+            {'id': 'ensemble', 'name': 'Ensemble Voting', 'description': 'Weighted vote across EMA, MACD, SuperTrend, ADX/DMI and VWAP signals'}
         ]
     })
 
@@ -812,6 +1300,9 @@ def get_simulator_data():
     Query Parameters:
         symbol: Stock symbol (e.g., AAPL)
         strategy: Strategy name for signal detection (e.g., macd, rsi)
+        days: Number of mock bars (default: 90, at most MAX_SIMULATOR_BARS for the interval)
+        interval: Mock bar interval, '1d' (default) or '1m', '5m', '15m', '30m', '1h'
+        seed: Optional random seed for a reproducible mock market
     """
     try:
         symbol = request.args.get('symbol', 'AAPL')
@@ -826,37 +1317,26 @@ def get_simulator_data():
         
         # ALWAYS generate mock data for now (guaranteed to work)
         # You can enable Yahoo Finance later by uncommenting the code below
-        from datetime import datetime, timedelta
-        
         print(f"Generating mock data for {symbol}...")
         
-        num_days = 90
-        base_price = 150.0
-        current_date = datetime.now()
-        
-        # Create dates and prices
-        prices = [base_price]
-        
-        for i in range(1, num_days):
-            # Random walk simulation
-            change = np.random.randn() * 2.0
-            new_price = prices[-1] * (1 + change/100)
-            prices.append(max(new_price, base_price * 0.7))
-        
-        dates = [(current_date - timedelta(days=num_days-i)).strftime('%Y-%m-%d') for i in range(num_days)]
-        
-        # Create DataFrame
-        df = pd.DataFrame({
-            'date': dates,
-            'open': [p * (1 + np.random.uniform(-0.01, 0.01)) for p in prices],
-            'high': [p * (1 + abs(np.random.uniform(0, 0.02))) for p in prices],
-            'low': [p * (1 - abs(np.random.uniform(0, 0.02))) for p in prices],
-            'close': prices,
-            'volume': [np.random.randint(1000000, 10000000) for _ in range(num_days)]
-        })
+        # Seeded GBM bars ending today (about 2% daily moves, as the old random walk)
+        num_days = max(int(request.args.get('days', 90)), 2)
+        interval = request.args.get('interval', '1d')
+        if interval not in MAX_SIMULATOR_BARS:
+            return jsonify({'error': f"interval must be one of {', '.join(MAX_SIMULATOR_BARS)}", 'success': False}), 400
+        if num_days > MAX_SIMULATOR_BARS[interval]:
+            return jsonify({'error': f"days must be at most {MAX_SIMULATOR_BARS[interval]:,} for {interval} bars",
+                            'success': False}), 400
+        seed = request.args.get('seed')
+        df = synthetic_bars(
+            num_days, interval, seed=int(seed) if seed else None, end=datetime.now(),
+            start_price=150.0, drift=0.0, volatility=0.32, base_volume=5_000_000
+        )
+        df['date'] = df['date'].dt.strftime('%Y-%m-%d' if interval == '1d' else '%Y-%m-%d %H:%M:%S')
+        prices = df['close']
         
         print(f"✓ Generated {len(df)} days of MOCK data")
-        print(f"  Price range: ₹{min(prices):.2f} - ₹{max(prices):.2f}")
+        print(f"  Price range: ₹{prices.min():.2f} - ₹{prices.max():.2f}")
         print(f"  Data source: {data_source.upper()}")
         
         # OPTIONAL: Try Yahoo Finance (uncomment to enable)
@@ -873,51 +1353,16 @@ def get_simulator_data():
         # except Exception as e:
         #     print(f"✗ Yahoo Finance failed, using mock data: {str(e)}")
         
-        # Apply strategy to detect signals
-        from strategies.macd_strategy import macd_strategy
-        from strategies.rsi_strategy import rsi_strategy
-        from strategies.ema_crossover import ema_crossover_strategy
-        
-        strategy_functions = {
-            'macd': macd_strategy,
-            'rsi': rsi_strategy,
-            'ema_crossover': ema_crossover_strategy
-        }
+        # Signal column from the strategy's array kernel; records are built column-wise
+        from strategies.kernels import strategy_signals, signal_records
         
-        strategy_func = strategy_functions.get(strategy_name, macd_strategy)
+        strategy_key = strategy_name if strategy_name in ('macd', 'rsi', 'ema_crossover') else 'macd'
         
         print(f"Running {strategy_name} strategy...")
-        result = strategy_func(df.copy())
-        
-        # Build response with signals
-        data_with_signals = []
-        buy_count = 0
-        sell_count = 0
-        
-        for idx, row in enumerate(result['data']):
-            # Ensure we have the required fields
-            data_point = {
-                'date': str(row.get('date', '')),
-                'open': float(row.get('open', 0)),
-                'high': float(row.get('high', 0)),
-                'low': float(row.get('low', 0)),
-                'close': float(row.get('close', 0)),
-                'volume': int(row.get('volume', 0)),
-                'signal': 0
-            }
-            
-            # Check for buy/sell signals
-            buy_signal = any(str(s.get('date', '')) == data_point['date'] for s in result.get('buy_signals', []))
-            sell_signal = any(str(s.get('date', '')) == data_point['date'] for s in result.get('sell_signals', []))
-            
-            if buy_signal:
-                data_point['signal'] = 1
-                buy_count += 1
-            elif sell_signal:
-                data_point['signal'] = -1
-                sell_count += 1
-            
-            data_with_signals.append(data_point)
+        signal = strategy_signals(df, strategy_key)
+        data_with_signals = signal_records(df, signal)
+        buy_count = int(np.count_nonzero(signal == 1))
+        sell_count = int(np.count_nonzero(signal == -1))
         
         print(f"✓ Strategy processed")
         print(f"  Buy signals: {buy_count}")
@@ -940,6 +1385,8 @@ def get_simulator_data():
         
         return jsonify(response_data)
         
+    except ValueError as e:
+        return jsonify({'error': str(e), 'success': False}), 400
     except Exception as e:
         import traceback
         error_trace = traceback.format_exc()
@@ -0,0 +1 @@
+# Backtesting and research module
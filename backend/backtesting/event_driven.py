@@ -0,0 +1,415 @@
+"""
+Event-driven intraday backtester that replays bar streams.
+
+Bars from every symbol are merged into one time-ordered stream and fed one at a time
+through a replay stream with the LivePriceStream interface. Strategy signals become
+orders that wait out an injected latency, then fill against later bars through a fill
+model (market, limit and stop orders, optional volume-limited partial fills).
+
+Usage (from backend/):
+    python -m backtesting.event_driven --symbols AAPL,MSFT --strategy ema_crossover --period 5d --interval 1m
+"""
+import os
+import sys
+import json
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from strategies.registry import STRATEGIES
+from strategies.kernels import strategy_signals
+from strategies.runner import prepare_bars
+from utils.live_stream import LivePriceStream
+from backtesting.metrics import return_metrics, periods_per_year_for_interval
+
+BUY = 1
+SELL = -1
+
+
+class Order:
+    """A working order. ``qty=None`` on a sell means "whatever is held" (exits and brackets)"""
+    __slots__ = ('symbol', 'side', 'kind', 'qty', 'price', 'active_from', 'filled', 'tag')
+
+    def __init__(self, symbol, side, kind, qty, price, active_from, tag):
+        self.symbol = symbol
+        self.side = side
+        self.kind = kind
+        self.qty = qty
+        self.price = price
+        self.active_from = active_from
+        self.filled = 0.0
+        self.tag = tag
+
+
+class FillModel:
+    """
+    Fills the whole remaining quantity once an order triggers
+
+    Market orders fill at the bar open. Limit orders fill at the limit (or a better open) when
+    the bar trades through it; stop orders fill at the stop (or a worse open after a gap).
+    Market and stop fills pay ``slippage`` as a fraction of price; limit fills do not.
+    """
+
+    def __init__(self, slippage=0.0):
+        self.slippage = slippage
+
+    def fill_price(self, order, open_, high, low):
+        kind = order.kind
+        if kind == 'market':
+            price = open_
+        elif kind == 'limit':
+            if order.side == BUY:
+                if low > order.price:
+                    return None
+                return min(open_, order.price)
+            if high < order.price:
+                return None
+            return max(open_, order.price)
+        elif order.side == SELL:
+            if low > order.price:
+                return None
+            price = min(open_, order.price)
+        else:
+            if high < order.price:
+                return None
+            price = max(open_, order.price)
+        return price * (1 + self.slippage) if order.side == BUY else price * (1 - self.slippage)
+
+    def fill_quantity(self, remaining, volume):
+        return remaining
+
+
+class VolumeParticipationFill(FillModel):
+    """Caps each bar's fill at ``participation`` of its volume, leaving the rest working"""
+
+    def __init__(self, slippage=0.0, participation=0.1):
+        super().__init__(slippage)
+        self.participation = participation
+
+    def fill_quantity(self, remaining, volume):
+        return min(remaining, volume * self.participation)
+
+
+class ReplayPriceStream(LivePriceStream):
+    """
+    LivePriceStream fed from recorded bars instead of polling
+
+    ``get_quote`` and ``get_candles`` answer as the live stream would at the replay cursor,
+    so code written against the live stream runs unchanged during a replay.
+    """
+
+    def __init__(self, frames):
+        super().__init__()
+        self.mode = 'replay'
+        self.frames = frames
+        self.cursor = {symbol: -1 for symbol in frames}
+        self.subscribed = set(frames)
+
+    def start(self):
+        pass
+
+    def advance(self, symbol, index):
+        self.cursor[symbol] = index
+
+    def get_quote(self, symbol: str):
+        symbol = symbol.upper()
+        index = self.cursor.get(symbol, -1)
+        if index < 0:
+            return None
+        bar = self.frames[symbol].iloc[index]
+        return {
+            'symbol': symbol,
+            'price': float(bar['close']),
+            'timestamp': int(pd.Timestamp(bar['date']).timestamp()),
+            'data_source': 'replay'
+        }
+
+    def get_candles(self, symbol: str, lookback: int = 300):
+        symbol = symbol.upper()
+        index = self.cursor.get(symbol, -1)
+        if index < 0:
+            return None
+        return self.frames[symbol].iloc[max(0, index - lookback + 1):index + 1].reset_index(drop=True)
+
+
+class EventBacktester:
+    """
+    Replay bars through strategy signals, orders and fills with shared cash across symbols
+
+    Args:
+        strategy: Strategy name from STRATEGIES
+        params: Strategy parameters
+        initial_capital: Starting cash shared by all symbols
+        allocation: Fraction of equity committed per entry (default: 1 / number of symbols)
+        commission: Commission per fill as a fraction of traded value
+        fill_model: FillModel instance (default: FillModel() with no slippage)
+        latency_bars: Bars between a signal and the first bar its order can fill on (>= 1)
+        latency_jitter: Extra random latency of 0..latency_jitter bars per order
+        entry_order: 'market' or 'limit' entries
+        limit_offset: Limit entry price below the signal close, as a fraction
+        stop_loss: Protective stop below the average entry price, as a fraction (optional)
+        take_profit: Profit-taking limit above the average entry price, as a fraction (optional)
+        live_window: If set, re-run the strategy on the last ``live_window`` candles of the replay
+                     stream at every bar (the /api/strategy/live path) instead of precomputing
+                     signals once over the whole history; much slower, for validation
+        seed: Seed for the latency jitter
+        periods_per_year: Bars per year for annualizing Sharpe
+    """
+
+    def __init__(self, strategy, params=None, initial_capital=100000.0, allocation=None, commission=0.0,
+                 fill_model=None, latency_bars=1, latency_jitter=0, entry_order='market', limit_offset=0.0,
+                 stop_loss=None, take_profit=None, live_window=None, seed=None, periods_per_year=252 * 390):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown strategy: {strategy}")
+        if entry_order not in ('market', 'limit'):
+            raise ValueError("entry_order must be 'market' or 'limit'")
+        self.strategy = strategy
+        self.params = params or {}
+        self.initial_capital = float(initial_capital)
+        self.allocation = allocation
+        self.commission = commission
+        self.fill_model = fill_model or FillModel()
+        self.latency_bars = max(1, int(latency_bars))
+        self.latency_jitter = int(latency_jitter)
+        self.entry_order = entry_order
+        self.limit_offset = limit_offset
+        self.stop_loss = stop_loss
+        self.take_profit = take_profit
+        self.live_window = live_window
+        self.rng = np.random.default_rng(seed)
+        self.periods_per_year = periods_per_year
+
+    def _signals(self, df):
+        return strategy_signals(df, self.strategy, self.params).astype(int).tolist()
+
+    def _live_signal(self, stream, symbol):
+        candles = stream.get_candles(symbol, self.live_window)
+        signal = strategy_signals(candles, self.strategy, self.params)
+        return int(signal[-1]) if len(signal) else 0
+
+    def _latency(self):
+        if self.latency_jitter:
+            return self.latency_bars + int(self.rng.integers(0, self.latency_jitter + 1))
+        return self.latency_bars
+
+    def run(self, bars):
+        """
+        Replay ``bars`` ({symbol: DataFrame of OHLCV bars}) and return fills, trades, equity and metrics
+        """
+        started = time.perf_counter()
+        symbols = list(bars)
+        frames = {symbol: prepare_bars(bars[symbol]) for symbol in symbols}
+        n_symbols = len(symbols)
+        allocation = self.allocation or 1.0 / max(1, n_symbols)
+
+        # Columnar bars as Python lists: indexing lists is the cheapest access in the hot loop
+        opens, highs, lows, closes, volumes, signals, stamps = [], [], [], [], [], [], []
+        for symbol in symbols:
+            df = frames[symbol]
+            opens.append(df['open'].to_numpy(dtype=float).tolist())
+            highs.append(df['high'].to_numpy(dtype=float).tolist())
+            lows.append(df['low'].to_numpy(dtype=float).tolist())
+            closes.append(df['close'].to_numpy(dtype=float).tolist())
+            volume = df['volume'].to_numpy(dtype=float) if 'volume' in df.columns else np.zeros(len(df))
+            volumes.append(np.nan_to_num(volume).tolist())
+            signals.append(None if self.live_window else self._signals(df))
+            stamps.append(pd.to_datetime(df['date'], utc=True).to_numpy(dtype='datetime64[ns]').astype(np.int64))
+        signal_seconds = time.perf_counter() - started
+
+        # Merge every symbol's bars into one time-ordered event stream
+        event_ts = np.concatenate(stamps) if stamps else np.array([], dtype=np.int64)
+        event_symbol = np.concatenate([np.full(len(s), k) for k, s in enumerate(stamps)]) if stamps else np.array([], dtype=int)
+        event_index = np.concatenate([np.arange(len(s)) for s in stamps]) if stamps else np.array([], dtype=int)
+        order = np.lexsort((event_symbol, event_ts))
+        event_ts = event_ts[order].tolist()
+        event_symbol = event_symbol[order].tolist()
+        event_index = event_index[order].tolist()
+
+        stream = ReplayPriceStream(frames)
+        fill_model = self.fill_model
+        commission = self.commission
+        working = [[] for _ in symbols]
+        shares = [0.0] * n_symbols
+        last = [0.0] * n_symbols
+        cost_basis = [0.0] * n_symbols
+        proceeds = [0.0] * n_symbols
+        entry_ts = [0] * n_symbols
+        cash = self.initial_capital
+        market_value = 0.0
+        fills = []
+        trades = []
+        equity_ts = []
+        equity = []
+        current_ts = event_ts[0] if event_ts else 0
+
+        for k in range(len(event_ts)):
+            ts = event_ts[k]
+            s = event_symbol[k]
+            i = event_index[k]
+            if ts != current_ts:
+                equity_ts.append(current_ts)
+                equity.append(cash + market_value)
+                current_ts = ts
+            close = closes[s][i]
+
+            # 1. Match working orders against this bar
+            orders = working[s]
+            if orders:
+                open_, high, low, volume = opens[s][i], highs[s][i], lows[s][i], volumes[s][i]
+                for o in list(orders):
+                    if o.active_from > i or o not in orders:
+                        continue
+                    price = fill_model.fill_price(o, open_, high, low)
+                    if price is None:
+                        continue
+                    if o.side == BUY:
+                        remaining = o.qty - o.filled
+                        affordable = cash / (price * (1 + commission))
+                        qty = min(fill_model.fill_quantity(remaining, volume), affordable)
+                        if qty <= 0:
+                            continue
+                        value = qty * price
+                        cash -= value * (1 + commission)
+                        if shares[s] == 0:
+                            entry_ts[s] = ts
+                        cost_basis[s] += value * (1 + commission)
+                        shares[s] += qty
+                        market_value += qty * last[s]
+                        o.filled += qty
+                        # Filled, or out of cash: an unfunded remainder would only fill rounding dust later
+                        if o.filled >= o.qty - 1e-9 or qty >= affordable:
+                            orders.remove(o)
+                        self._place_brackets(orders, s, symbols[s], cost_basis[s] / shares[s], i)
+                    else:
+                        held = shares[s]
+                        qty = fill_model.fill_quantity(held if o.qty is None else min(held, o.qty - o.filled), volume)
+                        if qty <= 0:
+                            continue
+                        value = qty * price
+                        cash += value * (1 - commission)
+                        proceeds[s] += value * (1 - commission)
+                        shares[s] = held - qty
+                        market_value -= qty * last[s]
+                        o.filled += qty
+                        if shares[s] <= 1e-12:
+                            shares[s] = 0.0
+                            orders.clear()
+                            trades.append((entry_ts[s], ts, s, proceeds[s] / cost_basis[s] - 1, proceeds[s] - cost_basis[s]))
+                            cost_basis[s] = proceeds[s] = 0.0
+                        elif o.qty is not None and o.filled >= o.qty:
+                            orders.remove(o)
+                    fills.append((ts, s, o.side, qty, price, o.tag))
+
+            # 2. Mark to market and advance the replay stream
+            if shares[s]:
+                market_value += shares[s] * (close - last[s])
+            last[s] = close
+
+            # 3. Turn this bar's signal into orders
+            if self.live_window:
+                stream.advance(symbols[s], i)
+                signal = self._live_signal(stream, symbols[s])
+            else:
+                signal = signals[s][i]
+            if signal == BUY and shares[s] == 0 and not orders:
+                notional = min(cash, (cash + market_value) * allocation)
+                if notional > 0 and close > 0:
+                    if self.entry_order == 'limit':
+                        limit = close * (1 - self.limit_offset)
+                        orders.append(Order(symbols[s], BUY, 'limit', notional / limit, limit, i + self._latency(), 'entry'))
+                    else:
+                        orders.append(Order(symbols[s], BUY, 'market', notional / close, None, i + self._latency(), 'entry'))
+            elif signal == SELL and (shares[s] or orders):
+                orders.clear()
+                if shares[s]:
+                    orders.append(Order(symbols[s], SELL, 'market', None, None, i + self._latency(), 'exit'))
+
+        if event_ts:
+            equity_ts.append(current_ts)
+            equity.append(cash + market_value)
+
+        equity = np.asarray(equity, dtype=float)
+        returns = np.diff(equity) / equity[:-1] if len(equity) > 1 else np.array([])
+        metrics = {name: float(value) for name, value in return_metrics(returns, self.periods_per_year).items()}
+        trade_returns = np.array([t[3] for t in trades])
+        metrics.update({
+            'final_equity': float(equity[-1]) if len(equity) else self.initial_capital,
+            'num_trades': len(trades),
+            'num_fills': len(fills),
+            'win_rate': float((trade_returns > 0).mean()) if len(trades) else None,
+            'open_positions': int(sum(1 for q in shares if q))
+        })
+
+        elapsed = time.perf_counter() - started
+        to_iso = lambda ns: pd.Timestamp(ns, tz='UTC').isoformat()
+        return {
+            'strategy': self.strategy,
+            'symbols': symbols,
+            'metrics': metrics,
+            'equity_curve': {'timestamp': equity_ts, 'equity': equity.tolist()},
+            'fills': [
+                {'date': to_iso(ts), 'symbol': symbols[s], 'side': 'BUY' if side == BUY else 'SELL',
+                 'qty': qty, 'price': price, 'tag': tag}
+                for ts, s, side, qty, price, tag in fills
+            ],
+            'trades': [
+                {'entry_date': to_iso(entry), 'exit_date': to_iso(exit_), 'symbol': symbols[s],
+                 'return_pct': round(ret * 100, 4), 'pnl': round(pnl, 2)}
+                for entry, exit_, s, ret, pnl in trades
+            ],
+            'stats': {
+                'events': len(event_ts),
+                'signal_seconds': round(signal_seconds, 3),
+                'replay_seconds': round(elapsed - signal_seconds, 3),
+                'events_per_second': round(len(event_ts) / max(elapsed - signal_seconds, 1e-9))
+            }
+        }
+
+    def _place_brackets(self, orders, s, symbol, avg_price, i):
+        """(Re)attach the protective stop and profit target after an entry fill"""
+        if self.stop_loss is None and self.take_profit is None:
+            return
+        orders[:] = [o for o in orders if o.tag not in ('stop_loss', 'take_profit')]
+        # Stops go first so a bar that touches both levels is treated as stopped out
+        if self.stop_loss is not None:
+            orders.append(Order(symbol, SELL, 'stop', None, avg_price * (1 - self.stop_loss), i + 1, 'stop_loss'))
+        if self.take_profit is not None:
+            orders.append(Order(symbol, SELL, 'limit', None, avg_price * (1 + self.take_profit), i + 1, 'take_profit'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay intraday bars through a strategy with an event-driven backtester')
+    parser.add_argument('--symbols', required=True, help='Comma-separated symbols')
+    parser.add_argument('--strategy', default='ema_crossover')
+    parser.add_argument('--params', default='{}', help='Strategy parameters as JSON')
+    parser.add_argument('--period', default='5d')
+    parser.add_argument('--interval', default='1m')
+    parser.add_argument('--capital', type=float, default=100000.0)
+    parser.add_argument('--commission', type=float, default=0.0)
+    parser.add_argument('--slippage', type=float, default=0.0)
+    parser.add_argument('--participation', type=float, default=None, help='Max fill as a fraction of bar volume')
+    parser.add_argument('--latency', type=int, default=1, help='Bars between signal and first possible fill')
+    parser.add_argument('--stop-loss', type=float, default=None)
+    parser.add_argument('--take-profit', type=float, default=None)
+    args = parser.parse_args()
+
+    from utils.fetch_data import fetch_stock_data
+    symbols = [s.strip().upper() for s in args.symbols.split(',') if s.strip()]
+    bars = {symbol: fetch_stock_data(symbol, period=args.period, interval=args.interval) for symbol in symbols}
+    fill_model = (VolumeParticipationFill(args.slippage, args.participation) if args.participation
+                  else FillModel(args.slippage))
+    engine = EventBacktester(
+        args.strategy, json.loads(args.params), initial_capital=args.capital, commission=args.commission,
+        fill_model=fill_model, latency_bars=args.latency, stop_loss=args.stop_loss, take_profit=args.take_profit,
+        periods_per_year=periods_per_year_for_interval(args.interval)
+    )
+    result = engine.run(bars)
+    print(json.dumps({'metrics': result['metrics'], 'stats': result['stats']}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+import numpy as np
+
+
+# Metrics returned by performance_metrics, each usable as an optimization objective
+OBJECTIVES = ('total_return', 'sharpe', 'max_drawdown', 'num_trades', 'exposure')
+
+
+def positions_from_signals(signal, axis=-1):
+    """
+    Long/flat position implied by a signal array (1 = buy, -1 = sell, 0 = hold)
+
+    The position after a buy stays long until the next sell. Works on arrays of
+    any shape, carrying the last non-zero signal forward along ``axis``.
+    """
+    signal = np.moveaxis(np.asarray(signal, dtype=float), axis, -1)
+    if signal.shape[-1] == 0:
+        return np.moveaxis(np.zeros(signal.shape), -1, axis)
+    steps = np.arange(signal.shape[-1])
+    last_idx = np.where(signal != 0, steps, 0)
+    last_idx = np.maximum.accumulate(last_idx, axis=-1)
+    last_signal = np.take_along_axis(signal, last_idx, axis=-1)
+    return np.moveaxis((last_signal > 0).astype(float), -1, axis)
+
+
+def simple_returns(close):
+    """Bar-to-bar simple returns with the first bar (and any invalid price) set to 0"""
+    close = np.asarray(close, dtype=float)
+    returns = np.zeros(close.shape)
+    if close.shape[-1] > 1:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            returns[..., 1:] = close[..., 1:] / close[..., :-1] - 1
+    return np.nan_to_num(returns, nan=0.0, posinf=0.0, neginf=0.0)
+
+
+def held_positions(position):
+    """Shift positions one bar forward: the position taken at bar t earns the return of bar t+1"""
+    position = np.asarray(position, dtype=float)
+    held = np.zeros(position.shape)
+    held[..., 1:] = position[..., :-1]
+    return held
+
+
+def return_metrics(strategy_returns, periods_per_year=252):
+    """
+    Total return, annualized Sharpe and max drawdown of a strategy return series, vectorized over leading axes
+    """
+    strategy_returns = np.asarray(strategy_returns, dtype=float)
+    leading = strategy_returns.shape[:-1]
+    if strategy_returns.shape[-1] == 0:
+        zeros = np.zeros(leading)
+        return {'total_return': zeros, 'sharpe': zeros.copy(), 'max_drawdown': zeros.copy()}
+
+    equity = np.cumprod(1 + strategy_returns, axis=-1)
+    total_return = equity[..., -1] - 1
+
+    mean = strategy_returns.mean(axis=-1)
+    std = strategy_returns.std(axis=-1, ddof=1) if strategy_returns.shape[-1] > 1 else np.zeros(leading)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sharpe = np.where(std > 0, mean / std * np.sqrt(periods_per_year), 0.0)
+
+    # The starting equity counts as a peak, so a loss on the first step is a drawdown
+    peak = np.maximum(np.maximum.accumulate(equity, axis=-1), 1.0)
+    max_drawdown = (equity / peak - 1).min(axis=-1)
+
+    return {'total_return': total_return, 'sharpe': sharpe, 'max_drawdown': max_drawdown}
+
+
+def performance_metrics(position, returns, periods_per_year=252):
+    """
+    Performance metrics for positions against bar returns, vectorized over leading axes
+
+    Args:
+        position: Array (..., T) of positions decided at each bar's close
+        returns: Array (T,) or broadcastable (..., T) of simple bar returns
+        periods_per_year: Bars per year for annualizing Sharpe
+
+    Returns:
+        dict of arrays with shape (...): total_return, sharpe, max_drawdown, num_trades, exposure
+    """
+    position = np.asarray(position, dtype=float)
+    metrics = return_metrics(held_positions(position) * returns, periods_per_year)
+
+    entries = np.diff(position, axis=-1, prepend=0) > 0
+    metrics['num_trades'] = entries.sum(axis=-1)
+    metrics['exposure'] = position.mean(axis=-1) if position.shape[-1] else np.zeros(position.shape[:-1])
+    return metrics
+
+
+def periods_per_year_for_interval(interval):
+    """Approximate number of bars per year for a yfinance-style interval (e.g. '1d', '5m', '1h')"""
+    interval = str(interval or '1d').lower()
+    fixed = {'1d': 252, '5d': 50, '1wk': 52, '1mo': 12, '3mo': 4}
+    if interval in fixed:
+        return fixed[interval]
+    digits = ''.join(ch for ch in interval if ch.isdigit()) or '1'
+    size = max(1, int(digits))
+    if interval.endswith('m'):
+        return int(252 * 390 / size)
+    if interval.endswith('h'):
+        return int(252 * 6.5 / size)
+    return 252
@@ -0,0 +1,124 @@
+"""
+Monte Carlo robustness analysis for strategy returns.
+
+Resamples a strategy's bar returns (bootstrap, circular block bootstrap) or its trade
+returns (shuffled order) into many alternative paths. Every path is a row of one 2-D array,
+so metrics for all paths come from a single vectorized pass.
+"""
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backtesting.metrics import return_metrics
+
+METHODS = ['bootstrap', 'block_bootstrap', 'shuffle_trades']
+PERCENTILES = [5, 25, 50, 75, 95]
+
+# Upper bound on elements per (paths x steps) block so thousands of long paths stay in memory
+MAX_BLOCK_ELEMENTS = 4_000_000
+
+
+def bootstrap_paths(returns, n_paths, rng):
+    """Paths drawn bar by bar with replacement"""
+    returns = np.asarray(returns, dtype=float)
+    return returns[rng.integers(0, len(returns), size=(n_paths, len(returns)))]
+
+
+def block_bootstrap_paths(returns, n_paths, rng, block_size=20):
+    """Paths stitched from random circular blocks of ``block_size`` consecutive bars, keeping short-range autocorrelation"""
+    returns = np.asarray(returns, dtype=float)
+    n = len(returns)
+    block_size = max(1, min(int(block_size), n))
+    n_blocks = -(-n // block_size)
+    starts = rng.integers(0, n, size=(n_paths, n_blocks))
+    index = (starts[:, :, None] + np.arange(block_size)) % n
+    return returns[index.reshape(n_paths, -1)[:, :n]]
+
+
+def shuffle_paths(returns, n_paths, rng):
+    """Paths with the same returns in a random order: final return is unchanged, drawdown and Sharpe path-dependence are not"""
+    returns = np.asarray(returns, dtype=float)
+    return rng.permuted(np.broadcast_to(returns, (n_paths, len(returns))), axis=1)
+
+
+def summarize_distribution(values, observed=None):
+    """Percentiles, mean and spread of a metric across paths, plus where the observed value ranks"""
+    values = np.asarray(values, dtype=float)
+    summary = {f"p{p}": float(v) for p, v in zip(PERCENTILES, np.percentile(values, PERCENTILES))}
+    summary.update({'mean': float(values.mean()), 'std': float(values.std())})
+    if observed is not None:
+        summary['observed'] = float(observed)
+        # Ties (e.g. final return under shuffled trades) count half, so an unchanged value ranks at 50
+        ties = np.isclose(values, observed, rtol=1e-9, atol=1e-12)
+        summary['observed_percentile'] = float(((values < observed) & ~ties).mean() * 100 + ties.mean() * 50)
+    return summary
+
+
+def _path_metrics(generate, n_paths, n_steps, periods_per_year):
+    """Metrics for ``n_paths`` paths generated in row blocks of at most MAX_BLOCK_ELEMENTS elements"""
+    rows_per_block = max(1, MAX_BLOCK_ELEMENTS // max(1, n_steps))
+    metrics = {}
+    for start in range(0, n_paths, rows_per_block):
+        block = return_metrics(generate(min(rows_per_block, n_paths - start)), periods_per_year)
+        for name, values in block.items():
+            metrics.setdefault(name, []).append(values)
+    return {name: np.concatenate(parts) for name, parts in metrics.items()}
+
+
+def monte_carlo(returns=None, trade_returns=None, methods=None, n_paths=1000, block_size=20, seed=None,
+                periods_per_year=252, trades_per_year=None, include_paths=False):
+    """
+    Distributions of final return, max drawdown and Sharpe under resampling
+
+    Args:
+        returns: Per-bar strategy returns (used by 'bootstrap' and 'block_bootstrap')
+        trade_returns: Per-trade returns (used by 'shuffle_trades')
+        methods: Subset of METHODS (default: every method the inputs allow)
+        n_paths: Resampled paths per method
+        block_size: Bars per block for 'block_bootstrap'
+        seed: Seed for np.random.default_rng, for reproducible results
+        periods_per_year: Bars per year for annualizing Sharpe on bar returns
+        trades_per_year: Trades per year for annualizing Sharpe on trade returns (default: not annualized)
+        include_paths: Also return each path's metric values
+
+    Returns:
+        dict of {method: {'total_return', 'max_drawdown', 'sharpe': distribution summaries}}
+    """
+    if methods is None:
+        methods = [m for m in METHODS if (trade_returns if m == 'shuffle_trades' else returns) is not None]
+    unknown = [m for m in methods if m not in METHODS]
+    if unknown:
+        raise ValueError(f"Unknown Monte Carlo methods: {unknown}. Available: {METHODS}")
+    if n_paths < 1:
+        raise ValueError("n_paths must be at least 1")
+
+    rng = np.random.default_rng(seed)
+    results = {}
+    for method in methods:
+        if method == 'shuffle_trades':
+            series = np.asarray(trade_returns if trade_returns is not None else [], dtype=float)
+            scale = trades_per_year or 1
+            generate = lambda rows, s=series: shuffle_paths(s, rows, rng)
+        else:
+            series = np.asarray(returns if returns is not None else [], dtype=float)
+            scale = periods_per_year
+            if method == 'bootstrap':
+                generate = lambda rows, s=series: bootstrap_paths(s, rows, rng)
+            else:
+                generate = lambda rows, s=series: block_bootstrap_paths(s, rows, rng, block_size)
+        if len(series) < 2:
+            raise ValueError(f"Need at least 2 {'trades' if method == 'shuffle_trades' else 'returns'} for {method}")
+
+        metrics = _path_metrics(generate, n_paths, len(series), scale)
+        observed = {name: float(value) for name, value in return_metrics(series, scale).items()}
+        summary = {name: summarize_distribution(metrics[name], observed[name]) for name in ('total_return', 'max_drawdown', 'sharpe')}
+        summary['probability_of_loss'] = float((metrics['total_return'] < 0).mean())
+        summary['n_paths'] = n_paths
+        summary['n_steps'] = len(series)
+        if include_paths:
+            summary['paths'] = {name: values.tolist() for name, values in metrics.items()}
+        results[method] = summary
+    return results
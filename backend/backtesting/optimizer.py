@@ -0,0 +1,295 @@
+"""
+Process-pool strategy optimizer across symbols and parameter grids.
+
+Distributes (symbol, strategy, param-set) jobs over worker processes, checkpoints every
+finished work unit so interrupted runs resume where they stopped, and writes ranked
+results when done.
+
+Usage (from backend/):
+    python -m backtesting.optimizer --symbols AAPL,MSFT,NVDA --period 5y --out runs/opt
+    python -m backtesting.optimizer --symbols-file universe.txt --strategies ema_crossover,rsi --workers 8 --out runs/opt
+"""
+import os
+import sys
+import json
+import time
+import hashlib
+import pickle
+import argparse
+import itertools
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from strategies.registry import STRATEGIES
+from strategies.kernels import strategy_signals
+from utils.indicator_cache import IndicatorContext
+from backtesting.metrics import (
+    positions_from_signals, simple_returns, performance_metrics, periods_per_year_for_interval, OBJECTIVES
+)
+
+# Default search space per strategy
+PARAM_GRIDS = {
+    'ema_crossover': {'short_period': [5, 9, 12, 15, 20], 'long_period': [21, 30, 40, 50, 60]},
+    'rsi': {'period': [7, 10, 14, 21], 'oversold': [25, 30, 35], 'overbought': [65, 70, 75]},
+    'macd': {'fast': [8, 12, 16], 'slow': [21, 26, 34], 'signal': [7, 9, 12]},
+    'bollinger_scalping': {'period': [10, 15, 20, 30], 'std_dev': [1.5, 2, 2.5]},
+    'supertrend': {'period': [7, 10, 14], 'multiplier': [2, 2.5, 3, 4]},
+    'ichimoku': {'tenkan': [7, 9, 12], 'kijun': [22, 26, 30], 'senkou_b': [44, 52]},
+    'adx_dmi': {'period': [10, 14, 20], 'adx_threshold': [20, 25, 30]},
+    'vwap': {'use_bands': [True, False], 'std_mult': [1.5, 2, 2.5]},
+    'breakout': {'period': [10, 20, 30], 'volume_mult': [1.2, 1.5, 2.0]},
+    'ml_lstm': {'threshold': [0.01, 0.02, 0.03]}
+}
+
+CHECKPOINT_FILE = 'checkpoint.jsonl'
+
+# Bars shared read-only by every task in a worker process (set once by the pool initializer)
+_BARS = {}
+
+
+def expand_grid(grid):
+    """All parameter combinations of a {param: [values]} grid as a list of dicts"""
+    if not grid:
+        return [{}]
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*[grid[name] for name in names])]
+
+
+def load_bars(symbols, period='5y', interval='1d', cache_dir=None):
+    """
+    Fetch bars for every symbol, reusing a pickle cache in ``cache_dir`` when present
+
+    Returns:
+        (dict of {symbol: DataFrame}, dict of {symbol: error message})
+    """
+    from utils.fetch_data import fetch_stock_data
+
+    bars = {}
+    errors = {}
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+    for symbol in symbols:
+        cache_path = os.path.join(cache_dir, f"{symbol}_{period}_{interval}.pkl") if cache_dir else None
+        try:
+            if cache_path and os.path.exists(cache_path):
+                with open(cache_path, 'rb') as f:
+                    df = pickle.load(f)
+            else:
+                df = fetch_stock_data(symbol, period=period, interval=interval)
+                if 'date' not in df.columns and 'datetime' in df.columns:
+                    df = df.rename(columns={'datetime': 'date'})
+                df = df[['date', 'open', 'high', 'low', 'close', 'volume']].reset_index(drop=True)
+                if cache_path:
+                    with open(cache_path, 'wb') as f:
+                        pickle.dump(df, f)
+            bars[symbol] = df
+        except Exception as e:
+            errors[symbol] = str(e)
+    return bars, errors
+
+
+def unit_digest(param_sets, config=None):
+    """Short hash of a unit's parameter sets and the run configuration"""
+    text = json.dumps({'param_sets': param_sets, 'config': config or {}}, sort_keys=True, default=str)
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+
+
+def build_work_units(symbols, strategies, grids=None, chunk_size=16, config=None):
+    """
+    Split (symbol, strategy, param-set) jobs into work units
+
+    Each unit holds up to ``chunk_size`` parameter sets for one symbol and strategy, so a
+    worker can share one indicator cache across the whole unit. Unit keys include a hash
+    of the parameter sets and ``config`` (e.g. period and interval), so a checkpoint from a
+    run with another grid or data window is never mistaken for this run's results.
+    """
+    grids = grids or PARAM_GRIDS
+    units = []
+    for symbol in symbols:
+        for strategy in strategies:
+            param_sets = expand_grid(grids.get(strategy, {}))
+            for start in range(0, len(param_sets), chunk_size):
+                chunk = param_sets[start:start + chunk_size]
+                key = f"{symbol}|{strategy}|{start}|{unit_digest(chunk, config)}"
+                units.append({'key': key, 'symbol': symbol, 'strategy': strategy, 'param_sets': chunk})
+    return units
+
+
+def _init_worker(bars):
+    global _BARS
+    _BARS = bars
+
+
+def evaluate_params(df, strategy, params, periods_per_year=252, indicators=None):
+    """Run one strategy/param-set on bars and return scalar performance metrics"""
+    signal = strategy_signals(df, strategy, params, indicators)
+    metrics = performance_metrics(positions_from_signals(signal), simple_returns(df['close'].to_numpy(dtype=float)), periods_per_year)
+    return {name: float(value) for name, value in metrics.items()}
+
+
+def run_work_unit(unit, periods_per_year=252):
+    """Evaluate every parameter set of a work unit against the worker's shared bars"""
+    df = _BARS[unit['symbol']]
+    indicators = IndicatorContext(df)
+    rows = []
+    for params in unit['param_sets']:
+        row = {'symbol': unit['symbol'], 'strategy': unit['strategy'], 'params': params}
+        try:
+            row.update(evaluate_params(df, unit['strategy'], params, periods_per_year, indicators))
+        except Exception as e:
+            row['error'] = str(e)
+        rows.append(row)
+    return {'key': unit['key'], 'rows': rows}
+
+
+def read_checkpoint(out_dir):
+    """Completed unit keys and their rows from a previous (possibly interrupted) run"""
+    path = os.path.join(out_dir, CHECKPOINT_FILE)
+    done = {}
+    if not os.path.exists(path):
+        return done
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # A partially written last line from an interrupted run; that unit is redone
+                continue
+            done[record['key']] = record['rows']
+    return done
+
+
+def _ends_with_newline(path):
+    """True when ``path`` is empty or its last byte is a newline"""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() == 0:
+            return True
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b'\n'
+
+
+def rank_results(rows, objective='sharpe'):
+    """
+    Rank results by ``objective``
+
+    Returns:
+        (all rows as a sorted DataFrame, best parameter set per symbol and strategy)
+    """
+    table = pd.DataFrame([r for r in rows if 'error' not in r])
+    if table.empty:
+        return table, table
+    table['params'] = table['params'].apply(lambda p: json.dumps(p, sort_keys=True))
+    table = table.sort_values(objective, ascending=False, kind='mergesort').reset_index(drop=True)
+    best = table.drop_duplicates(['symbol', 'strategy']).reset_index(drop=True)
+    return table, best
+
+
+def optimize(symbols, strategies=None, grids=None, period='5y', interval='1d', out_dir='optimizer_run',
+             workers=None, chunk_size=16, objective='sharpe', bars=None, progress=True):
+    """
+    Find the best parameters for each strategy on each symbol using a process pool
+
+    Args:
+        symbols: List of symbols
+        strategies: Strategy names (default: every strategy with a grid)
+        grids: Optional {strategy: {param: [values]}} overriding PARAM_GRIDS
+        period, interval: Data window passed to fetch_stock_data
+        out_dir: Directory for the checkpoint, bar cache and ranked results
+        workers: Process count (default: os.cpu_count())
+        chunk_size: Parameter sets per work unit
+        objective: Metric used for ranking, one of OBJECTIVES
+        bars: Optional preloaded {symbol: DataFrame} (skips fetching)
+
+    Returns:
+        dict with output file paths and run counts
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"objective must be one of {', '.join(OBJECTIVES)}")
+    grids = {**PARAM_GRIDS, **(grids or {})}
+    strategies = strategies or [name for name in STRATEGIES if name in grids]
+    unknown = [name for name in strategies if name not in STRATEGIES]
+    if unknown:
+        raise ValueError(f"Unknown strategies: {unknown}")
+    os.makedirs(out_dir, exist_ok=True)
+
+    load_errors = {}
+    if bars is None:
+        bars, load_errors = load_bars(symbols, period, interval, cache_dir=os.path.join(out_dir, 'bars'))
+    symbols = [s for s in symbols if s in bars]
+
+    units = build_work_units(symbols, strategies, grids, chunk_size, {'period': period, 'interval': interval})
+    done = read_checkpoint(out_dir)
+    pending = [u for u in units if u['key'] not in done]
+    periods_per_year = periods_per_year_for_interval(interval)
+
+    started = time.perf_counter()
+    checkpoint_path = os.path.join(out_dir, CHECKPOINT_FILE)
+    if pending:
+        with open(checkpoint_path, 'a') as checkpoint, \
+                ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(bars,)) as executor:
+            if not _ends_with_newline(checkpoint_path):
+                # The last line was cut off mid-write; new records start on their own line
+                checkpoint.write('\n')
+            futures = [executor.submit(run_work_unit, unit, periods_per_year) for unit in pending]
+            for count, future in enumerate(as_completed(futures), 1):
+                record = future.result()
+                done[record['key']] = record['rows']
+                checkpoint.write(json.dumps(record) + '\n')
+                checkpoint.flush()
+                if progress and (count % 50 == 0 or count == len(pending)):
+                    print(f"  {count}/{len(pending)} units ({time.perf_counter() - started:.1f}s)")
+
+    # Aggregate only the units that belong to this run's configuration
+    rows = [row for unit in units for row in done.get(unit['key'], [])]
+    table, best = rank_results(rows, objective)
+    results_path = os.path.join(out_dir, 'results.csv')
+    best_path = os.path.join(out_dir, 'best_params.csv')
+    table.to_csv(results_path, index=False)
+    best.to_csv(best_path, index=False)
+
+    return {
+        'results': results_path,
+        'best_params': best_path,
+        'units_total': len(units),
+        'units_run': len(pending),
+        'evaluations': len(rows),
+        'load_errors': load_errors,
+        'elapsed_seconds': round(time.perf_counter() - started, 2)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Optimize strategy parameters across symbols with a process pool')
+    parser.add_argument('--symbols', default='', help='Comma-separated symbols')
+    parser.add_argument('--symbols-file', help='File with one symbol per line')
+    parser.add_argument('--strategies', default='', help='Comma-separated strategy names (default: all)')
+    parser.add_argument('--period', default='5y')
+    parser.add_argument('--interval', default='1d')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--chunk-size', type=int, default=16)
+    parser.add_argument('--objective', default='sharpe', choices=OBJECTIVES)
+    parser.add_argument('--out', default='optimizer_run')
+    args = parser.parse_args()
+
+    symbols = [s.strip().upper() for s in args.symbols.split(',') if s.strip()]
+    if args.symbols_file:
+        with open(args.symbols_file) as f:
+            symbols += [line.strip().upper() for line in f if line.strip() and not line.startswith('#')]
+    if not symbols:
+        parser.error('No symbols given (use --symbols or --symbols-file)')
+    strategies = [s.strip() for s in args.strategies.split(',') if s.strip()] or None
+
+    summary = optimize(symbols, strategies, period=args.period, interval=args.interval, out_dir=args.out,
+                       workers=args.workers, chunk_size=args.chunk_size, objective=args.objective)
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == '__main__':
+    main()
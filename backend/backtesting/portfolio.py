@@ -0,0 +1,183 @@
+"""
+Multi-symbol portfolio backtest with shared capital.
+
+Every symbol is aligned onto one time axis, giving (symbols x time) panels of prices and
+signals (each symbol's signals come from its own bars). Position sizing, portfolio returns,
+exposure and turnover are then computed on the whole panel at once.
+"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from strategies.registry import STRATEGIES
+from strategies.kernels import strategy_signals
+from strategies.runner import prepare_bars
+from backtesting.metrics import positions_from_signals, simple_returns, held_positions, return_metrics
+
+SIZING_RULES = ['equal', 'fixed', 'inverse_vol']
+
+
+def _time_key(dates):
+    """Calendar dates for daily bars (so exchanges in different time zones line up), UTC otherwise"""
+    dates = pd.Series(dates)
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates)
+    if dates.dt.tz is not None:
+        local = dates.dt.tz_localize(None)
+        if (local == local.dt.normalize()).all():
+            return local
+        return dates.dt.tz_convert('UTC').dt.tz_localize(None)
+    return dates
+
+
+def align_panel(bars):
+    """
+    Align bars from several symbols onto the union of their timestamps
+
+    Args:
+        bars: dict of {symbol: DataFrame with OHLCV bars}
+
+    Returns:
+        (DatetimeIndex, list of symbols, close panel (symbols x time), listed mask (symbols x time)).
+        Closes are forward-filled inside each symbol's history; ``listed`` is False before a
+        symbol's first bar, where its close stays NaN.
+    """
+    symbols = list(bars)
+    columns = {}
+    for symbol in symbols:
+        df = prepare_bars(bars[symbol])
+        close = pd.Series(df['close'].to_numpy(dtype=float), index=_time_key(df['date']).to_numpy())
+        columns[symbol] = close[~close.index.duplicated(keep='last')]
+    frame = pd.concat(columns, axis=1).sort_index()
+    listed = frame.notna().cummax().to_numpy().T
+    closes = frame.ffill().to_numpy().T
+    return frame.index, symbols, closes, listed
+
+
+def signal_panel(bars, strategy, params=None, dates=None):
+    """
+    (symbols x time) signal panel for a strategy
+
+    The strategy runs once per symbol on that symbol's own bars, so indicator recursions never
+    see the forward-filled closes of days it did not trade; signals are then placed on the
+    shared time axis (0 where a symbol has no bar).
+    """
+    params = params or {}
+    if dates is None:
+        dates = align_panel(bars)[0]
+
+    signals = np.zeros((len(bars), len(dates)))
+    for row, symbol in enumerate(bars):
+        df = prepare_bars(bars[symbol])
+        signal = pd.Series(strategy_signals(df, strategy, params), index=_time_key(df['date']).to_numpy())
+        signal = signal[~signal.index.duplicated(keep='last')]
+        signals[row] = signal.reindex(dates, fill_value=0).to_numpy()
+    return signals
+
+
+def target_weights(desired, returns, sizing='equal', max_weight=None, vol_window=20):
+    """
+    Portfolio weights (symbols x time) for the symbols a strategy wants to hold
+
+    Args:
+        desired: (symbols x time) array, 1 where the strategy is long
+        returns: (symbols x time) bar returns, used by inverse-volatility sizing
+        sizing: 'equal' (split capital across current longs), 'fixed' (1 / number of symbols
+                per long, rest in cash) or 'inverse_vol' (longs weighted by 1 / rolling volatility)
+        max_weight: Optional cap per symbol; capped weight stays in cash
+        vol_window: Bars in the rolling volatility estimate
+    """
+    if sizing not in SIZING_RULES:
+        raise ValueError(f"Unknown sizing rule: {sizing}. Available: {SIZING_RULES}")
+    desired = np.asarray(desired, dtype=float)
+    if sizing == 'fixed':
+        weights = desired / max(1, desired.shape[0])
+    else:
+        if sizing == 'inverse_vol':
+            vol = pd.DataFrame(returns.T).rolling(window=vol_window).std().to_numpy().T
+            with np.errstate(divide='ignore', invalid='ignore'):
+                score = np.where(vol > 0, 1 / vol, 0.0)
+            score = desired * np.nan_to_num(score)
+        else:
+            score = desired
+        total = score.sum(axis=0, keepdims=True)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            weights = np.where(total > 0, score / total, 0.0)
+    if max_weight is not None:
+        weights = np.minimum(weights, max_weight)
+    return weights
+
+
+def portfolio_backtest(bars, strategy, params=None, sizing='equal', max_weight=None, commission=0.0,
+                       slippage=0.0, initial_capital=100000.0, periods_per_year=252, vol_window=20):
+    """
+    Run one strategy across several symbols with shared capital
+
+    Weights are rebalanced to their targets at every close and earn the next bar's returns;
+    turnover is the sum of absolute target-weight changes and is charged commission + slippage.
+
+    Args:
+        bars: dict of {symbol: DataFrame with OHLCV bars}
+        strategy: Strategy name from STRATEGIES
+        params: Strategy parameters applied to every symbol
+        sizing, max_weight, vol_window: Position sizing (see target_weights)
+        commission, slippage: Costs per unit of turnover, as fractions
+        initial_capital: Starting portfolio equity
+        periods_per_year: Bars per year for annualizing Sharpe and turnover
+
+    Returns:
+        dict with the portfolio equity/exposure/turnover curves, metrics and per-symbol stats
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy: {strategy}")
+    if not bars:
+        raise ValueError("No symbols to backtest")
+    dates, symbols, closes, listed = align_panel(bars)
+    signals = signal_panel(bars, strategy, params, dates)
+
+    returns = simple_returns(closes)
+    desired = positions_from_signals(signals) * listed
+    weights = target_weights(desired, returns, sizing, max_weight, vol_window)
+
+    held = held_positions(weights)
+    contribution = held * returns
+    turnover = np.abs(np.diff(weights, axis=-1, prepend=0.0)).sum(axis=0)
+    portfolio_returns = contribution.sum(axis=0) - turnover * (commission + slippage)
+    equity = initial_capital * np.cumprod(1 + portfolio_returns)
+    exposure = weights.sum(axis=0)
+
+    metrics = {name: float(value) for name, value in return_metrics(portfolio_returns, periods_per_year).items()}
+    metrics.update({
+        'final_equity': float(equity[-1]) if len(equity) else initial_capital,
+        'avg_exposure': float(exposure.mean()) if len(exposure) else 0.0,
+        'annual_turnover': float(turnover.mean() * periods_per_year) if len(turnover) else 0.0,
+        'avg_positions': float((weights > 0).sum(axis=0).mean()) if len(exposure) else 0.0
+    })
+
+    entries = (np.diff(desired, axis=-1, prepend=0.0) > 0).sum(axis=-1)
+    per_symbol = {
+        symbol: {
+            'contribution_pct': round(float(contribution[row].sum() * 100), 2),
+            'avg_weight': round(float(weights[row].mean()), 4),
+            'time_in_market_pct': round(float(desired[row].mean() * 100), 1),
+            'entries': int(entries[row])
+        }
+        for row, symbol in enumerate(symbols)
+    }
+
+    return {
+        'strategy': strategy,
+        'symbols': symbols,
+        'sizing': sizing,
+        'dates': [pd.Timestamp(d).isoformat() for d in dates],
+        'equity': equity.tolist(),
+        'exposure': exposure.tolist(),
+        'turnover': turnover.tolist(),
+        'positions': (weights > 0).sum(axis=0).tolist(),
+        'metrics': metrics,
+        'per_symbol': per_symbol
+    }
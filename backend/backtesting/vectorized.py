@@ -0,0 +1,135 @@
+"""
+Vectorized long/flat backtester for strategy signal columns.
+
+Positions, costs, equity, drawdown and the trade list are all computed with array
+operations; the only Python-level loop is over finished trades when formatting them.
+"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backtesting.metrics import positions_from_signals, simple_returns, held_positions, return_metrics
+
+
+def run_backtest(close, signal, commission=0.0, slippage=0.0, initial_capital=10000.0, periods_per_year=252):
+    """
+    Backtest a signal column trading long on buys and going flat on sells
+
+    Orders fill at the signal bar's close. Slippage moves the fill price against the trade
+    (entries pay ``close * (1 + slippage)``, exits get ``close * (1 - slippage)``) and
+    commission is charged as a fraction of traded value on each side.
+
+    Args:
+        close: Array of close prices
+        signal: Array of signals (1 = buy, -1 = sell, 0 = hold)
+        commission: Commission per side as a fraction (0.001 = 10 bps)
+        slippage: Slippage per side as a fraction of price
+        initial_capital: Starting equity
+        periods_per_year: Bars per year for annualizing Sharpe
+
+    Drawdown is measured from the running equity peak, with ``initial_capital`` as the first
+    peak, so entry costs on the first bar already count as a drawdown.
+
+    Returns:
+        dict with per-bar 'position', 'equity', 'drawdown', per-bar 'returns' net of costs,
+        columnar 'trades' (bar indices, fill prices, returns) and scalar 'metrics'
+    """
+    close = np.asarray(close, dtype=float)
+    position = positions_from_signals(signal)
+    n_bars = len(close)
+
+    # Cost factors applied to equity on the bar where the position changes
+    entry_factor = (1 - commission) / (1 + slippage)
+    exit_factor = (1 - commission) * (1 - slippage)
+    change = np.diff(position, prepend=0.0)
+    cost_factor = np.where(change > 0, entry_factor, np.where(change < 0, exit_factor, 1.0))
+
+    growth = (1 + held_positions(position) * simple_returns(close)) * cost_factor
+    net_returns = growth - 1
+    equity = initial_capital * np.cumprod(growth)
+    peak = np.maximum(np.maximum.accumulate(equity), initial_capital) if n_bars else equity
+    drawdown = equity / peak - 1 if n_bars else equity
+
+    # Round trips: entry on a flat->long change, exit on the following long->flat change
+    entries = np.flatnonzero(change > 0)
+    exits = np.flatnonzero(change < 0)
+    num_closed = len(exits)
+    entry_bars = entries[:num_closed]
+    entry_prices = close[entry_bars] * (1 + slippage)
+    exit_prices = close[exits] * (1 - slippage)
+    trade_returns = (exit_prices / entry_prices) * (1 - commission) ** 2 - 1
+
+    metrics = {name: float(value) for name, value in return_metrics(net_returns, periods_per_year).items()}
+    wins = trade_returns[trade_returns > 0]
+    losses = trade_returns[trade_returns < 0]
+    metrics.update({
+        'final_equity': float(equity[-1]) if n_bars else float(initial_capital),
+        'num_trades': int(num_closed),
+        'win_rate': float((trade_returns > 0).mean()) if num_closed else None,
+        'avg_trade_return': float(trade_returns.mean()) if num_closed else None,
+        'profit_factor': float(wins.sum() / -losses.sum()) if len(losses) and losses.sum() < 0 else None,
+        'exposure': float(position.mean()) if n_bars else 0.0,
+        'costs_paid_pct': float((1 - np.prod(cost_factor)) * 100) if n_bars else 0.0,
+        'open_position': bool(n_bars and position[-1] > 0)
+    })
+
+    return {
+        'position': position,
+        'returns': net_returns,
+        'equity': equity,
+        'drawdown': drawdown,
+        'trades': {
+            'entry_bar': entry_bars,
+            'exit_bar': exits,
+            'entry_price': entry_prices,
+            'exit_price': exit_prices,
+            'return': trade_returns
+        },
+        'metrics': metrics
+    }
+
+
+def backtest_report(result, dates=None, max_trades=None):
+    """
+    JSON-ready view of a run_backtest result
+
+    Args:
+        result: Output of run_backtest
+        dates: Optional bar dates used to label trades
+        max_trades: Keep only the most recent trades (default: all)
+
+    Returns:
+        dict with 'metrics', 'trades' (one dict per round trip) and the per-bar
+        'equity' and 'drawdown' curves
+    """
+    trades = result['trades']
+    start = 0 if not max_trades else max(0, len(trades['exit_bar']) - max_trades)
+    labels = None
+    if dates is not None:
+        labels = [pd.Timestamp(d).isoformat() for d in pd.Series(dates).iloc[np.concatenate(
+            [trades['entry_bar'][start:], trades['exit_bar'][start:]])]]
+
+    trade_list = []
+    count = len(trades['exit_bar']) - start
+    for i in range(count):
+        entry_bar = int(trades['entry_bar'][start + i])
+        exit_bar = int(trades['exit_bar'][start + i])
+        trade_list.append({
+            'entry_date': labels[i] if labels else entry_bar,
+            'exit_date': labels[count + i] if labels else exit_bar,
+            'entry_price': round(float(trades['entry_price'][start + i]), 4),
+            'exit_price': round(float(trades['exit_price'][start + i]), 4),
+            'return_pct': round(float(trades['return'][start + i]) * 100, 2),
+            'bars_held': exit_bar - entry_bar
+        })
+
+    return {
+        'metrics': result['metrics'],
+        'trades': trade_list,
+        'equity': np.round(result['equity'], 2).tolist(),
+        'drawdown': np.round(result['drawdown'], 4).tolist()
+    }
@@ -0,0 +1,195 @@
+"""
+Walk-forward optimization with out-of-sample evaluation.
+
+For each rolling window the strategy parameters are re-optimized on the training slice,
+then applied unchanged to the following test slice. The test-slice returns are stitched
+into one out-of-sample equity curve.
+"""
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from strategies.registry import STRATEGIES
+from strategies.kernels import strategy_signals
+from strategies.param_surface import PARAM_SURFACES, evaluate_param_surface, _best
+from utils.indicator_cache import IndicatorContext
+from backtesting.metrics import (
+    positions_from_signals, simple_returns, held_positions, performance_metrics, return_metrics, OBJECTIVES
+)
+from backtesting.optimizer import PARAM_GRIDS, expand_grid
+from strategies.runner import prepare_bars
+
+
+def build_windows(n_bars, train_size, test_size, step=None, anchored=False):
+    """
+    Rolling (or anchored) train/test windows as (train_start, train_end, test_end) position triples
+
+    The last test window may be shorter than ``test_size`` so the tail of the data is covered.
+    """
+    step = step or test_size
+    windows = []
+    train_start = 0
+    train_end = train_size
+    while train_end < n_bars:
+        test_end = min(n_bars, train_end + test_size)
+        windows.append((0 if anchored else train_start, train_end, test_end))
+        train_start += step
+        train_end += step
+    return windows
+
+
+def _signal_column(df, strategy, params, indicators):
+    return strategy_signals(df, strategy, params, indicators)
+
+
+def _iso(value):
+    return pd.Timestamp(value).isoformat()
+
+
+def _scalar(metrics):
+    return {name: float(value) for name, value in metrics.items()}
+
+
+def optimize_window(train_df, strategy, grid, objective='sharpe', periods_per_year=252):
+    """
+    Best parameters on one training slice
+
+    Indicators are computed once for the slice: batched surfaces share them across the whole
+    grid, and other strategies share one IndicatorContext across every parameter set.
+    """
+    surface_axes = PARAM_SURFACES.get(strategy, (None, []))[1]
+    if strategy in PARAM_SURFACES and set(grid) == set(surface_axes):
+        surface = evaluate_param_surface(strategy, train_df, grid, periods_per_year)
+        # The surface's own 'best' maximizes Sharpe; rank by the requested objective instead
+        best = _best(surface['metrics'], surface['axes'], objective)
+        params = {axis: best[axis] for axis in surface_axes}
+        return params, {name: best[name] for name in surface['metrics']}
+
+    indicators = IndicatorContext(train_df)
+    returns = simple_returns(train_df['close'].to_numpy(dtype=float))
+    best_params, best_metrics, best_score = None, None, -np.inf
+    for params in expand_grid(grid):
+        signal = _signal_column(train_df, strategy, params, indicators)
+        metrics = _scalar(performance_metrics(positions_from_signals(signal), returns, periods_per_year))
+        score = metrics[objective] if np.isfinite(metrics[objective]) else -np.inf
+        if best_params is None or score > best_score:
+            best_params, best_metrics, best_score = params, metrics, score
+    return best_params, best_metrics
+
+
+def evaluate_window(window_df, train_bars, strategy, grid, objective='sharpe', periods_per_year=252):
+    """
+    Optimize on the first ``train_bars`` rows of ``window_df`` and score the rest out of sample
+
+    The chosen parameters run over the whole window so indicators are warmed up when the test
+    slice starts; only the test slice's returns count as out-of-sample.
+    """
+    train_df = window_df.iloc[:train_bars].reset_index(drop=True)
+    params, in_sample = optimize_window(train_df, strategy, grid, objective, periods_per_year)
+
+    window_df = window_df.reset_index(drop=True)
+    signal = _signal_column(window_df, strategy, params, IndicatorContext(window_df))
+    position = positions_from_signals(signal)
+    returns = simple_returns(window_df['close'].to_numpy(dtype=float))
+    test_returns = (held_positions(position) * returns)[train_bars:]
+
+    out_of_sample = _scalar(return_metrics(test_returns, periods_per_year))
+    out_of_sample['exposure'] = float(position[train_bars:].mean()) if len(test_returns) else 0.0
+    return {
+        'params': params,
+        'in_sample': in_sample,
+        'out_of_sample': out_of_sample,
+        'test_returns': test_returns
+    }
+
+
+def walk_forward(df, strategy, grid=None, train_size=504, test_size=126, step=None, anchored=False,
+                 objective='sharpe', periods_per_year=252, workers=None):
+    """
+    Walk-forward optimization of a strategy over rolling windows
+
+    Args:
+        df: DataFrame with OHLCV data
+        strategy: Strategy name from STRATEGIES
+        grid: {param: [values]} search space (default: optimizer PARAM_GRIDS)
+        train_size, test_size: Bars per training and test slice
+        step: Bars between window starts (default: test_size, i.e. back-to-back test slices)
+        anchored: Keep every training slice starting at the first bar
+        objective: Metric maximized on each training slice
+        workers: Processes for evaluating windows in parallel (1 = run in this process; request
+            handlers should pass 1, since every call with more starts its own process pool)
+
+    Returns:
+        dict with per-window results, the stitched out-of-sample equity curve and its metrics
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy: {strategy}")
+    if objective not in OBJECTIVES:
+        raise ValueError(f"objective must be one of {', '.join(OBJECTIVES)}")
+    grid = grid or PARAM_GRIDS.get(strategy, {})
+    df = prepare_bars(df)
+    windows = build_windows(len(df), train_size, test_size, step, anchored)
+    if not windows:
+        raise ValueError(f"Not enough data for walk-forward: {len(df)} bars, need more than {train_size}")
+
+    jobs = [(df.iloc[start:test_end], train_end - start) for start, train_end, test_end in windows]
+    args = (strategy, grid, objective, periods_per_year)
+    if workers == 1 or len(jobs) == 1:
+        results = [evaluate_window(window_df, train_bars, *args) for window_df, train_bars in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(evaluate_window, window_df, train_bars, *args) for window_df, train_bars in jobs]
+            results = [future.result() for future in futures]
+
+    # Stitch test slices; overlapping slices (step < test_size) keep the earliest window's bars
+    dates = df['date']
+    stitched_returns = []
+    stitched_dates = []
+    covered_until = 0
+    window_reports = []
+    for (start, train_end, test_end), result in zip(windows, results):
+        first_new = max(train_end, covered_until)
+        offset = first_new - train_end
+        stitched_returns.append(result['test_returns'][offset:])
+        stitched_dates.append(dates.iloc[first_new:test_end])
+        covered_until = max(covered_until, test_end)
+        window_reports.append({
+            'train_start': _iso(dates.iloc[start]),
+            'train_end': _iso(dates.iloc[train_end - 1]),
+            'test_start': _iso(dates.iloc[train_end]),
+            'test_end': _iso(dates.iloc[test_end - 1]),
+            'params': result['params'],
+            'in_sample': result['in_sample'],
+            'out_of_sample': result['out_of_sample']
+        })
+
+    oos_returns = np.concatenate(stitched_returns) if stitched_returns else np.array([])
+    equity = np.cumprod(1 + oos_returns)
+    oos_metrics = _scalar(return_metrics(oos_returns, periods_per_year))
+
+    in_sample_sharpe = np.mean([w['in_sample']['sharpe'] for w in window_reports])
+    efficiency = oos_metrics['sharpe'] / in_sample_sharpe if in_sample_sharpe > 0 else None
+
+    return {
+        'strategy': strategy,
+        'windows': window_reports,
+        'equity_curve': {
+            'date': [_iso(d) for d in pd.concat(stitched_dates)] if stitched_dates else [],
+            'equity': equity.tolist()
+        },
+        'out_of_sample': oos_metrics,
+        'walk_forward_efficiency': efficiency,
+        'parameters': {
+            'train_size': train_size,
+            'test_size': test_size,
+            'step': step or test_size,
+            'anchored': anchored,
+            'objective': objective,
+            'grid': grid
+        }
+    }
@@ -0,0 +1,48 @@
+"""
+Confidence scoring benchmark: per-signal scan-and-score loop vs the batch scorer.
+
+Usage (from backend/):
+    python -m benchmarks.bench_confidence
+"""
+import sys
+import os
+import argparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.confidence_calculator import calculate_signal_confidence, calculate_single_signal_confidence
+from benchmarks.common import make_bars, time_call, format_seconds
+
+
+def legacy_signal_confidence(df, signals, signal_type):
+    """Old path: boolean date scan per signal, then rolling windows recomputed per signal"""
+    df = df.reset_index(drop=True)
+    for signal in signals:
+        signal_row = df[df['date'] == signal['date']]
+        if not signal_row.empty:
+            confidence = calculate_single_signal_confidence(df, int(signal_row.index[0]), signal_type, 'technical')
+            signal['confidence'] = confidence['score']
+    return signals
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--bars', type=int, default=20000)
+    parser.add_argument('--signals', default='10,100,1000')
+    args = parser.parse_args()
+
+    df = make_bars(args.bars)
+    print(f"{args.bars} bars")
+    print(f"{'signals':>8} {'batch':>12} {'legacy':>12} {'speedup':>9}")
+    for count in [int(c) for c in args.signals.split(',')]:
+        step = max(1, args.bars // count)
+        buys = [{'date': d} for d in df['date'].iloc[::step][:count]]
+
+        batch_time = time_call(lambda: calculate_signal_confidence(df, [dict(b) for b in buys], []), repeat=3)
+        legacy_time = time_call(lambda: legacy_signal_confidence(df, [dict(b) for b in buys], 'buy'), repeat=1)
+        print(f"{count:>8} {format_seconds(batch_time):>12} {format_seconds(legacy_time):>12} "
+              f"{legacy_time / batch_time:>8.0f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Downsampling benchmark: strategy payload size and serialization time with and without max_points.
+
+Usage (from backend/):
+    python -m benchmarks.bench_downsampling
+    python -m benchmarks.bench_downsampling --bars 1000000 --max-points 5000
+"""
+import sys
+import os
+import argparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from strategies.registry import STRATEGIES
+from utils.downsampling import downsample_strategy_result
+from utils.response_format import dumps
+from benchmarks.common import make_bars, time_call, format_seconds, format_bytes
+
+
+def full_payload(result):
+    return dumps(result)
+
+
+def downsampled_payload(result, max_points, method):
+    return dumps(downsample_strategy_result(result, max_points, method))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--bars', type=int, default=100_000)
+    parser.add_argument('--max-points', type=int, default=2000)
+    parser.add_argument('--strategy', default='macd')
+    args = parser.parse_args()
+
+    result = STRATEGIES[args.strategy](make_bars(args.bars))
+    signals = len(result['buy_signals']) + len(result['sell_signals'])
+    print(f"{args.bars:,} bars, {args.strategy} ({signals:,} signal bars), max_points={args.max_points:,}")
+    print(f"{'payload':<14} {'points':>8} {'reduce + dumps':>15} {'bytes':>10}")
+
+    size = len(full_payload(result))
+    print(f"{'full':<14} {args.bars:>8,} {format_seconds(time_call(full_payload, result)):>15} {format_bytes(size):>10}")
+    for method in ('lttb', 'ohlc'):
+        reduced = downsample_strategy_result(result, args.max_points, method)
+        elapsed = time_call(downsampled_payload, result, args.max_points, method)
+        size = len(downsampled_payload(result, args.max_points, method))
+        print(f"{method:<14} {len(reduced['data']):>8,} {format_seconds(elapsed):>15} {format_bytes(size):>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+Event-driven replay benchmark: a month of 1-minute bars for many symbols.
+
+Usage (from backend/):
+    python -m benchmarks.bench_event_replay
+    python -m benchmarks.bench_event_replay --symbols 50 --days 21 --profile
+"""
+import sys
+import os
+import argparse
+import cProfile
+import pstats
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backtesting.event_driven import EventBacktester, VolumeParticipationFill
+from benchmarks.common import make_bars, format_seconds
+
+MINUTES_PER_DAY = 390
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--symbols', type=int, default=50)
+    parser.add_argument('--days', type=int, default=21)
+    parser.add_argument('--strategy', default='ema_crossover')
+    parser.add_argument('--profile', action='store_true', help='Print the top functions of the replay by cumulative time')
+    args = parser.parse_args()
+
+    n = args.days * MINUTES_PER_DAY
+    bars = {f"SYM{k:02d}": make_bars(n, seed=k) for k in range(args.symbols)}
+    engine = EventBacktester(
+        args.strategy, commission=0.0005, fill_model=VolumeParticipationFill(slippage=0.0002, participation=0.05),
+        latency_bars=1, latency_jitter=2, stop_loss=0.01, take_profit=0.02, seed=1
+    )
+
+    profiler = cProfile.Profile() if args.profile else None
+    if profiler:
+        profiler.enable()
+    result = engine.run(bars)
+    if profiler:
+        profiler.disable()
+
+    stats = result['stats']
+    print(f"{args.symbols} symbols x {n:,} 1-minute bars = {stats['events']:,} events")
+    print(f"signals (strategy once per symbol): {format_seconds(stats['signal_seconds'])}")
+    print(f"event replay: {format_seconds(stats['replay_seconds'])} ({stats['events_per_second']:,} events/s), "
+          f"{result['metrics']['num_fills']:,} fills, {result['metrics']['num_trades']:,} round trips")
+    if profiler:
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(12)
+
+
+if __name__ == '__main__':
+    main()
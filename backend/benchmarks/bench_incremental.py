@@ -0,0 +1,66 @@
+"""
+Live polling benchmark: full strategy re-evaluation vs incremental evaluation per poll.
+
+By default each poll slides the window by one bar. With --forming the window keeps its first
+bar and each poll revises the still forming last bar, as polls within one candle do.
+
+Usage (from backend/):
+    python -m benchmarks.bench_incremental
+    python -m benchmarks.bench_incremental --forming
+    python -m benchmarks.bench_incremental --window 5000 --polls 50 --strategies macd,vwap
+"""
+import sys
+import os
+import time
+import argparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from strategies.registry import STRATEGIES
+from strategies.kernels import KERNELS
+from strategies.incremental import LiveStrategyCache
+from benchmarks.common import make_bars, format_seconds
+
+
+def poll_windows(bars, window, polls, forming=False):
+    if not forming:
+        return [bars.iloc[i:i + window] for i in range(polls + 1)]
+    windows = []
+    for i in range(polls + 1):
+        df = bars.iloc[:window].copy()
+        df.iloc[-1, df.columns.get_loc('close')] *= 1 + 0.0001 * i
+        windows.append(df)
+    return windows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--window', type=int, default=2000)
+    parser.add_argument('--polls', type=int, default=30)
+    parser.add_argument('--strategies', default=','.join(KERNELS))
+    parser.add_argument('--forming', action='store_true', help='Revise the last bar instead of sliding')
+    args = parser.parse_args()
+
+    windows = poll_windows(make_bars(args.window + args.polls + 1), args.window, args.polls, args.forming)
+    polls = 'forming-bar' if args.forming else 'sliding'
+    print(f"{args.window:,}-bar window, {args.polls} {polls} polls (per-poll averages)")
+    print(f"{'strategy':<20} {'full':>10} {'incremental':>12} {'speedup':>8} {'last poll':>12} {'recomputed':>10}")
+    for name in args.strategies.split(','):
+        start = time.perf_counter()
+        for df in windows[1:]:
+            STRATEGIES[name](df)
+        full_time = (time.perf_counter() - start) / args.polls
+
+        cache = LiveStrategyCache()
+        cache.evaluate(windows[0], 'BENCH', name)
+        start = time.perf_counter()
+        for df in windows[1:]:
+            result = cache.evaluate(df, 'BENCH', name)
+        incremental_time = (time.perf_counter() - start) / args.polls
+        update = result['incremental']
+        print(f"{name:<20} {format_seconds(full_time):>10} {format_seconds(incremental_time):>12} "
+              f"{full_time / incremental_time:>7.1f}x {update['mode']:>12} {update['recomputed_bars']:>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+"""
+Indicator benchmark: per-call ``ta`` indicator objects vs the shared-family NumPy library.
+
+Usage (from backend/):
+    python -m benchmarks.bench_indicators
+    python -m benchmarks.bench_indicators --bars 1000000
+"""
+import sys
+import os
+import argparse
+
+import numpy as np
+from ta.trend import SMAIndicator, EMAIndicator, MACD, ADXIndicator
+from ta.momentum import RSIIndicator, StochasticOscillator, WilliamsRIndicator, ROCIndicator
+from ta.volatility import BollingerBands, AverageTrueRange
+from ta.volume import OnBalanceVolumeIndicator, MFIIndicator
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import indicators
+from benchmarks.common import make_bars, time_call, format_seconds
+
+
+# Indicator families as the model feature builders request them, ta first, then the library
+
+def ta_moving_averages(df):
+    close = df['close']
+    return ([SMAIndicator(close=close, window=w).sma_indicator() for w in (5, 10, 20, 50, 200)] +
+            [EMAIndicator(close=close, window=w).ema_indicator() for w in (12, 26)])
+
+
+def lib_moving_averages(df):
+    close = df['close'].to_numpy(dtype=float)
+    return indicators.sma(close, (5, 10, 20, 50, 200)), indicators.ema(close, (12, 26))
+
+
+def ta_rsi(df):
+    return [RSIIndicator(close=df['close'], window=w).rsi() for w in (7, 14, 21)]
+
+
+def lib_rsi(df):
+    return indicators.rsi(df['close'].to_numpy(dtype=float), (7, 14, 21))
+
+
+def ta_macd_bollinger(df):
+    macd = MACD(close=df['close'], window_fast=12, window_slow=26, window_sign=9)
+    bb = BollingerBands(close=df['close'], window=20, window_dev=2)
+    return (macd.macd(), macd.macd_signal(), macd.macd_diff(),
+            bb.bollinger_hband(), bb.bollinger_mavg(), bb.bollinger_lband(), bb.bollinger_wband())
+
+
+def lib_macd_bollinger(df):
+    close = df['close'].to_numpy(dtype=float)
+    return indicators.macd(close), indicators.bollinger(close, 20, 2)
+
+
+def ta_stochastic(df):
+    high, low, close = df['high'], df['low'], df['close']
+    stoch = StochasticOscillator(high=high, low=low, close=close, window=14, smooth_window=3)
+    return stoch.stoch(), stoch.stoch_signal(), WilliamsRIndicator(high=high, low=low, close=close, lbp=14).williams_r()
+
+
+def lib_stochastic(df):
+    return indicators.stochastic(df['high'], df['low'], df['close'], 14, 3)
+
+
+def ta_adx_atr(df):
+    high, low, close = df['high'], df['low'], df['close']
+    adx = ADXIndicator(high=high, low=low, close=close, window=14)
+    atr = AverageTrueRange(high=high, low=low, close=close, window=14)
+    return adx.adx(), adx.adx_pos(), adx.adx_neg(), atr.average_true_range()
+
+
+def lib_adx_atr(df):
+    high = df['high'].to_numpy(dtype=float)
+    low = df['low'].to_numpy(dtype=float)
+    close = df['close'].to_numpy(dtype=float)
+    return indicators.adx(high, low, close, 14), indicators.atr(high, low, close, 14)
+
+
+def ta_volume(df):
+    high, low, close, volume = df['high'], df['low'], df['close'], df['volume']
+    return (OnBalanceVolumeIndicator(close=close, volume=volume).on_balance_volume(),
+            MFIIndicator(high=high, low=low, close=close, volume=volume, window=14).money_flow_index(),
+            SMAIndicator(close=volume, window=20).sma_indicator(),
+            [ROCIndicator(close=close, window=w).roc() for w in (5, 10)])
+
+
+def lib_volume(df):
+    high, low, close, volume = (df[c].to_numpy(dtype=float) for c in ('high', 'low', 'close', 'volume'))
+    return (indicators.obv(close, volume), indicators.mfi(high, low, close, volume, 14),
+            indicators.sma(volume, (20,)), indicators.roc(close, (5, 10)))
+
+
+FAMILIES = {
+    'SMA 5-200 + EMA 12/26': (ta_moving_averages, lib_moving_averages),
+    'RSI 7/14/21': (ta_rsi, lib_rsi),
+    'MACD + Bollinger': (ta_macd_bollinger, lib_macd_bollinger),
+    'Stochastic + %R': (ta_stochastic, lib_stochastic),
+    'ADX/DI + ATR': (ta_adx_atr, lib_adx_atr),
+    'OBV, MFI, ROC, vol SMA': (ta_volume, lib_volume)
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--bars', type=int, default=100_000)
+    args = parser.parse_args()
+
+    df = make_bars(args.bars)
+    # Same values as ta on the families most likely to drift (Wilder recursions)
+    reference = ta_adx_atr(df)
+    adx, atr = lib_adx_atr(df)
+    assert np.allclose(adx['adx'], reference[0], rtol=1e-9, atol=1e-9, equal_nan=True)
+    assert np.allclose(atr, reference[3], rtol=1e-9, atol=1e-9, equal_nan=True)
+
+    print(f"{args.bars:,} bars")
+    print(f"{'family':<24} {'ta':>10} {'library':>10} {'speedup':>8}")
+    ta_total = lib_total = 0.0
+    for label, (ta_func, lib_func) in FAMILIES.items():
+        ta_time = time_call(ta_func, df)
+        lib_time = time_call(lib_func, df)
+        ta_total += ta_time
+        lib_total += lib_time
+        print(f"{label:<24} {format_seconds(ta_time):>10} {format_seconds(lib_time):>10} {ta_time / lib_time:>7.1f}x")
+    print(f"{'total':<24} {format_seconds(ta_total):>10} {format_seconds(lib_total):>10} {ta_total / lib_total:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
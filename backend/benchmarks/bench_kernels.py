@@ -0,0 +1,49 @@
+"""
+Strategy kernel benchmark: signals from the array kernels vs the full strategy output.
+
+Usage (from backend/):
+    python -m benchmarks.bench_kernels
+    python -m benchmarks.bench_kernels --bars 100000 --strategies ema_crossover,macd
+"""
+import sys
+import os
+import argparse
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from strategies.registry import STRATEGIES
+from strategies.kernels import KERNELS, strategy_signals
+from benchmarks.common import make_bars, time_call, peak_memory, format_seconds, format_bytes
+
+
+def strategy_output_signals(df, name):
+    """Old signal-only path: run the strategy and read 'signal' back from its per-bar records"""
+    result = STRATEGIES[name](df)
+    return np.array([row.get('signal', 0) or 0 for row in result['data']], dtype=float)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--bars', type=int, default=20000)
+    parser.add_argument('--strategies', default=','.join(KERNELS))
+    args = parser.parse_args()
+
+    df = make_bars(args.bars)
+    print(f"{args.bars:,} bars")
+    print(f"{'strategy':<20} {'strategy':>10} {'kernel':>10} {'speedup':>8} {'peak (strategy)':>16} {'peak (kernel)':>14}")
+    for name in args.strategies.split(','):
+        kernel_signal = strategy_signals(df, name)
+        assert np.array_equal(kernel_signal, strategy_output_signals(df, name)), name
+
+        full_time = time_call(strategy_output_signals, df, name, repeat=1)
+        kernel_time = time_call(strategy_signals, df, name, repeat=3)
+        full_peak = peak_memory(strategy_output_signals, df, name)
+        kernel_peak = peak_memory(strategy_signals, df, name)
+        print(f"{name:<20} {format_seconds(full_time):>10} {format_seconds(kernel_time):>10} "
+              f"{full_time / kernel_time:>7.0f}x {format_bytes(full_peak):>16} {format_bytes(kernel_peak):>14}")
+
+
+if __name__ == '__main__':
+    main()
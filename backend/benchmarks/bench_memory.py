@@ -0,0 +1,40 @@
+"""
+Per-request memory benchmark: peak Python-allocated memory of strategy runs on a large intraday frame.
+
+Usage (from backend/):
+    python -m benchmarks.bench_memory
+    python -m benchmarks.bench_memory --bars 500000 --strategies ema_crossover,rsi
+"""
+import sys
+import os
+import argparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from strategies.registry import STRATEGIES
+from utils.confidence_calculator import calculate_signal_confidence
+from benchmarks.common import make_bars, time_call, peak_memory, format_seconds, format_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--bars', type=int, default=200000)
+    parser.add_argument('--strategies', default='ema_crossover,rsi,macd,supertrend,vwap,ensemble')
+    args = parser.parse_args()
+
+    df = make_bars(args.bars)
+    frame_size = int(df.memory_usage(deep=True).sum())
+    print(f"{args.bars:,} 1-minute bars, input frame {format_bytes(frame_size)}")
+    print(f"{'step':<28} {'peak':>10} {'x frame':>8} {'time':>10}")
+
+    buys = [{'date': d, 'close': c} for d, c in zip(df['date'].iloc[::100], df['close'].iloc[::100])]
+    rows = [('confidence scoring', lambda: calculate_signal_confidence(df, [dict(b) for b in buys], []))]
+    rows += [(f"strategy {name}", lambda name=name: STRATEGIES[name](df)) for name in args.strategies.split(',')]
+    for label, func in rows:
+        peak = peak_memory(func)
+        elapsed = time_call(func, repeat=1)
+        print(f"{label:<28} {format_bytes(peak):>10} {peak / frame_size:>7.1f}x {format_seconds(elapsed):>10}")
+
+
+if __name__ == '__main__':
+    main()
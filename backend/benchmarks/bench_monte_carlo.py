@@ -0,0 +1,38 @@
+"""
+Monte Carlo benchmark: thousands of resampled paths per method in one vectorized pass.
+
+Usage (from backend/):
+    python -m benchmarks.bench_monte_carlo
+    python -m benchmarks.bench_monte_carlo --paths 10000 --bars 2520
+"""
+import sys
+import os
+import argparse
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backtesting.monte_carlo import monte_carlo, METHODS
+from benchmarks.common import time_call, format_seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--paths', type=int, default=10000)
+    parser.add_argument('--bars', type=int, default=2520, help='Default: ~10 years of daily returns')
+    parser.add_argument('--trades', type=int, default=200)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    returns = rng.normal(0.0004, 0.01, args.bars)
+    trades = rng.normal(0.01, 0.05, args.trades)
+
+    print(f"{args.paths:,} paths, {args.bars:,} bar returns, {args.trades} trades")
+    for method in METHODS:
+        elapsed = time_call(monte_carlo, returns, trades, methods=[method], n_paths=args.paths, seed=1)
+        print(f"  {method}: {format_seconds(elapsed)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""
+Parameter surface benchmark: batched grid evaluation vs one strategy run per combination.
+
+Usage (from backend/):
+    python -m benchmarks.bench_param_surface
+"""
+import sys
+import os
+import argparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from strategies.ema_crossover import ema_crossover_strategy
+from strategies.param_surface import ema_crossover_surface, rsi_surface, supertrend_surface
+from benchmarks.common import make_bars, time_call, format_seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--bars', type=int, default=1260, help='Default: ~5 years of daily bars')
+    parser.add_argument('--sample', type=int, default=20, help='Per-combination runs timed to extrapolate the loop')
+    args = parser.parse_args()
+
+    df = make_bars(args.bars, freq='D')
+    short_periods = list(range(2, 52))
+    long_periods = list(range(10, 110, 2))
+    combos = len(short_periods) * len(long_periods)
+
+    surface_time = time_call(ema_crossover_surface, df, short_periods, long_periods, repeat=3)
+    per_run = time_call(lambda: [ema_crossover_strategy(df, s, 50) for s in short_periods[:args.sample]], repeat=1) / args.sample
+    loop_time = per_run * combos
+
+    print(f"{args.bars} bars")
+    print(f"EMA crossover {len(short_periods)}x{len(long_periods)} grid: batched {format_seconds(surface_time)}, "
+          f"per-combination loop ~{format_seconds(loop_time)} (extrapolated), ~{loop_time / surface_time:.0f}x")
+    print(f"RSI 24x5x5 grid: {format_seconds(time_call(rsi_surface, df, range(6, 30), [20, 25, 30, 35, 40], [60, 65, 70, 75, 80]))}")
+    print(f"SuperTrend 20x7 grid: {format_seconds(time_call(supertrend_surface, df, range(5, 25), [1, 1.5, 2, 2.5, 3, 3.5, 4]))}")
+
+
+if __name__ == '__main__':
+    main()
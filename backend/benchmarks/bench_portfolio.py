@@ -0,0 +1,37 @@
+"""
+Portfolio backtest benchmark: many symbols on one panel vs a single-symbol strategy run.
+
+Usage (from backend/):
+    python -m benchmarks.bench_portfolio
+    python -m benchmarks.bench_portfolio --symbols 100 --years 10 --strategy macd
+"""
+import sys
+import os
+import argparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from strategies.registry import STRATEGIES
+from backtesting.portfolio import portfolio_backtest
+from benchmarks.common import make_bars, time_call, format_seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--symbols', type=int, default=100)
+    parser.add_argument('--years', type=int, default=10)
+    parser.add_argument('--strategy', default='ema_crossover')
+    args = parser.parse_args()
+
+    n = args.years * 252
+    bars = {f"SYM{k:03d}": make_bars(n, seed=k, freq='B') for k in range(args.symbols)}
+    single = time_call(STRATEGIES[args.strategy], bars['SYM000'])
+    portfolio = time_call(portfolio_backtest, bars, args.strategy, sizing='inverse_vol', commission=0.0005, repeat=1)
+
+    print(f"{args.strategy}, {n:,} daily bars per symbol")
+    print(f"single-symbol strategy run: {format_seconds(single)}")
+    print(f"{args.symbols}-symbol portfolio backtest: {format_seconds(portfolio)} ({portfolio / single:.1f}x a single run)")
+
+
+if __name__ == '__main__':
+    main()
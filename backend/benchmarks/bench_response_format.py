@@ -0,0 +1,51 @@
+"""
+Response format benchmark: per-bar records vs columnar strategy payloads (encode + JSON bytes).
+
+Usage (from backend/):
+    python -m benchmarks.bench_response_format
+    python -m benchmarks.bench_response_format --bars 500000 --strategy vwap
+"""
+import sys
+import os
+import argparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from strategies.registry import STRATEGIES
+from utils.response_format import dumps, columnar_strategy_result
+from benchmarks.common import make_bars, time_call, format_seconds, format_bytes
+
+# Fields a price chart with signal markers needs
+CHART_FIELDS = ['date', 'open', 'high', 'low', 'close', 'signal']
+
+
+def rows_payload(result):
+    return dumps(result)
+
+
+def columnar_payload(result, fields=None):
+    return dumps(columnar_strategy_result(result, fields))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--bars', type=int, default=100_000)
+    parser.add_argument('--strategy', default='ema_crossover')
+    args = parser.parse_args()
+
+    result = STRATEGIES[args.strategy](make_bars(args.bars))
+    variants = {
+        'rows (default)': lambda: rows_payload(result),
+        'columnar, all fields': lambda: columnar_payload(result),
+        'columnar, chart fields': lambda: columnar_payload(result, CHART_FIELDS)
+    }
+
+    print(f"{args.bars:,} bars, {args.strategy}, {len(result['data'][0])} fields per bar")
+    print(f"{'format':<24} {'encode + dumps':>14} {'bytes':>10}")
+    for label, func in variants.items():
+        size = len(func())
+        print(f"{label:<24} {format_seconds(time_call(func)):>14} {format_bytes(size):>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Rolling extrema benchmark: one pandas rolling max/min per window vs the shared multi-window pass.
+
+Usage (from backend/):
+    python -m benchmarks.bench_rolling_extrema
+    python -m benchmarks.bench_rolling_extrema --bars 5000000 --windows 20,55,100
+"""
+import sys
+import os
+import argparse
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.rolling_extrema import rolling_extrema
+from benchmarks.common import make_bars, time_call, format_seconds
+
+# Window sets of the Donchian-style indicators in the strategies
+WINDOW_SETS = {
+    'breakout (20)': (20,),
+    'ichimoku (9, 26, 52)': (9, 26, 52)
+}
+
+
+def pandas_channels(high, low, windows):
+    return [(high.rolling(w).max(), low.rolling(w).min()) for w in windows]
+
+
+def shared_channels(high, low, windows):
+    return rolling_extrema(high, windows, 'max'), rolling_extrema(low, windows, 'min')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--bars', type=int, default=1_000_000)
+    parser.add_argument('--windows', default=None, help='Extra comma-separated window set to time')
+    args = parser.parse_args()
+
+    df = make_bars(args.bars)
+    high, low = df['high'], df['low']
+    window_sets = dict(WINDOW_SETS)
+    if args.windows:
+        window_sets[args.windows] = tuple(int(w) for w in args.windows.split(','))
+
+    print(f"{args.bars:,} bars, rolling high and low channel")
+    print(f"{'windows':<24} {'pandas':>10} {'shared pass':>12} {'speedup':>8}")
+    for label, windows in window_sets.items():
+        highs, lows = shared_channels(high.to_numpy(), low.to_numpy(), windows)
+        for w, (ref_high, ref_low) in zip(windows, pandas_channels(high, low, windows)):
+            assert np.array_equal(highs[w], ref_high.to_numpy(), equal_nan=True), w
+            assert np.array_equal(lows[w], ref_low.to_numpy(), equal_nan=True), w
+
+        pandas_time = time_call(pandas_channels, high, low, windows)
+        shared_time = time_call(shared_channels, high.to_numpy(), low.to_numpy(), windows)
+        print(f"{label:<24} {format_seconds(pandas_time):>10} {format_seconds(shared_time):>12} "
+              f"{pandas_time / shared_time:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
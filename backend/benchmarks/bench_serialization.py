@@ -0,0 +1,82 @@
+"""
+Serialization benchmark: clean_nan_values + stdlib JSON (the previous jsonify path) vs the orjson provider.
+
+Usage (from backend/):
+    python -m benchmarks.bench_serialization
+    python -m benchmarks.bench_serialization --bars 500000 --strategy vwap
+"""
+import sys
+import os
+import json
+import argparse
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from strategies.registry import STRATEGIES
+from utils.response_format import dumps, columnar_strategy_result
+from benchmarks.common import make_bars, time_call, format_seconds, format_bytes
+
+
+def clean_nan_values(obj):
+    """Recursively replace NaN, Infinity with None for valid JSON serialization"""
+    if isinstance(obj, dict):
+        return {key: clean_nan_values(value) for key, value in obj.items()}
+    elif isinstance(obj, list):
+        return [clean_nan_values(item) for item in obj]
+    elif isinstance(obj, (pd.Timestamp, datetime, np.datetime64)):
+        try:
+            return pd.to_datetime(obj).isoformat()
+        except Exception:
+            return str(obj)
+    elif isinstance(obj, float):
+        if np.isnan(obj) or np.isinf(obj):
+            return None
+        return obj
+    elif isinstance(obj, (np.integer, np.floating)):
+        if np.isnan(obj) or np.isinf(obj):
+            return None
+        return float(obj) if isinstance(obj, np.floating) else int(obj)
+    else:
+        return obj
+
+
+def previous_path(result):
+    # What the endpoints did before: rebuild the result in Python, then Flask's default encoder
+    return json.dumps(clean_nan_values(result), ensure_ascii=False, sort_keys=True).encode('utf-8')
+
+
+def provider_path(result):
+    return dumps(result)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--bars', type=int, default=100_000)
+    parser.add_argument('--strategy', default='ema_crossover')
+    args = parser.parse_args()
+
+    result = STRATEGIES[args.strategy](make_bars(args.bars))
+    assert json.loads(previous_path(result)) == json.loads(provider_path(result))
+    columnar = columnar_strategy_result(result)
+
+    print(f"{args.bars:,}-row {args.strategy} result")
+    print(f"{'path':<40} {'time':>10} {'bytes':>10} {'speedup':>7}")
+    rows = [
+        ('clean_nan_values + json (previous)', previous_path, result),
+        ('orjson provider, rows', provider_path, result),
+        ('orjson provider, format=columnar', provider_path, columnar)
+    ]
+    baseline = None
+    for label, func, payload in rows:
+        elapsed = time_call(func, payload)
+        baseline = baseline or elapsed
+        print(f"{label:<40} {format_seconds(elapsed):>10} {format_bytes(len(func(payload))):>10} "
+              f"{baseline / elapsed:>6.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+Simulator signal tagging benchmark: per-row date matching against the signal lists vs
+records built from the kernel's signal column.
+
+Usage (from backend/):
+    python -m benchmarks.bench_simulator_signals
+    python -m benchmarks.bench_simulator_signals --bars 20000 --strategy rsi
+"""
+import sys
+import os
+import argparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from strategies.registry import STRATEGIES
+from strategies.kernels import strategy_signals, signal_records
+from utils.synthetic_market import synthetic_bars
+from benchmarks.common import time_call, format_seconds
+
+
+def loop_tagging(df, strategy):
+    # The simulator's previous path: full strategy output, then any() over the signal lists per bar
+    result = STRATEGIES[strategy](df)
+    data = []
+    for row in result['data']:
+        point = {
+            'date': str(row.get('date', '')),
+            'open': float(row.get('open', 0)),
+            'high': float(row.get('high', 0)),
+            'low': float(row.get('low', 0)),
+            'close': float(row.get('close', 0)),
+            'volume': int(row.get('volume', 0)),
+            'signal': 0
+        }
+        if any(str(s.get('date', '')) == point['date'] for s in result.get('buy_signals', [])):
+            point['signal'] = 1
+        elif any(str(s.get('date', '')) == point['date'] for s in result.get('sell_signals', [])):
+            point['signal'] = -1
+        data.append(point)
+    return data
+
+
+def column_tagging(df, strategy):
+    return signal_records(df, strategy_signals(df, strategy))
+
+
+def simulator_bars(n_bars):
+    df = synthetic_bars(n_bars, '5m', seed=11, start_price=150.0, drift=0.0, volatility=0.32)
+    df['date'] = df['date'].dt.strftime('%Y-%m-%d %H:%M:%S')
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--bars', type=int, nargs='+', default=[1_000, 5_000, 20_000])
+    parser.add_argument('--strategy', default='macd', choices=('macd', 'rsi', 'ema_crossover'))
+    parser.add_argument('--large', type=int, default=1_000_000, help='Bars timed with the column path only')
+    args = parser.parse_args()
+
+    print(f"{args.strategy}, 5m bars")
+    print(f"{'bars':>10} {'signals':>8} {'per-row any()':>14} {'column':>10} {'speedup':>8}")
+    for n in args.bars:
+        df = simulator_bars(n)
+        expected = loop_tagging(df, args.strategy)
+        records = column_tagging(df, args.strategy)
+        assert records == expected
+        signals = sum(1 for r in records if r['signal'])
+        loop_time = time_call(loop_tagging, df, args.strategy, repeat=1)
+        column_time = time_call(column_tagging, df, args.strategy)
+        print(f"{n:>10,} {signals:>8,} {format_seconds(loop_time):>14} {format_seconds(column_time):>10} "
+              f"{loop_time / column_time:>7.0f}x")
+    if args.large:
+        df = simulator_bars(args.large)
+        column_time = time_call(column_tagging, df, args.strategy, repeat=1)
+        print(f"{args.large:>10,} {'':>8} {'-':>14} {format_seconds(column_time):>10}")
+
+
+if __name__ == '__main__':
+    main()
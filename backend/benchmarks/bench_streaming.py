@@ -0,0 +1,61 @@
+"""
+Streaming benchmark: one JSON document vs chunked stream_json for a large strategy result.
+
+Usage (from backend/):
+    python -m benchmarks.bench_streaming
+    python -m benchmarks.bench_streaming --bars 1000000 --batch 5000
+"""
+import sys
+import os
+import time
+import argparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from strategies.registry import STRATEGIES
+from backtesting.vectorized import run_backtest, backtest_report
+from utils.response_format import dumps, stream_json, STRATEGY_STREAM_KEYS
+from benchmarks.common import make_bars, time_call, peak_memory, format_seconds, format_bytes
+
+
+def whole_document(result):
+    body = dumps(result)
+    return len(body)
+
+
+def streamed_document(result, batch_size):
+    # A WSGI server writes each chunk out and drops it; only the sizes are kept here
+    return sum(len(chunk) for chunk in stream_json(result, STRATEGY_STREAM_KEYS, batch_size))
+
+
+def first_chunk_time(result, batch_size):
+    start = time.perf_counter()
+    next(iter(stream_json(result, STRATEGY_STREAM_KEYS, batch_size)))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--bars', type=int, default=100_000)
+    parser.add_argument('--strategy', default='macd')
+    parser.add_argument('--batch', type=int, default=2000)
+    args = parser.parse_args()
+
+    df = make_bars(args.bars)
+    result = STRATEGIES[args.strategy](df)
+    signal = [row['signal'] for row in result['data']]
+    result['backtest'] = backtest_report(run_backtest(df['close'].to_numpy(dtype=float), signal))
+    assert whole_document(result) == streamed_document(result, args.batch)
+
+    print(f"{args.bars:,}-bar {args.strategy} result with backtest, batches of {args.batch:,} bars")
+    print(f"{'response':<12} {'first byte':>11} {'total':>10} {'peak memory':>12}")
+    total = time_call(whole_document, result)
+    print(f"{'document':<12} {format_seconds(total):>11} {format_seconds(total):>10} "
+          f"{format_bytes(peak_memory(whole_document, result)):>12}")
+    print(f"{'streamed':<12} {format_seconds(first_chunk_time(result, args.batch)):>11} "
+          f"{format_seconds(time_call(streamed_document, result, args.batch)):>10} "
+          f"{format_bytes(peak_memory(streamed_document, result, args.batch)):>12}")
+
+
+if __name__ == '__main__':
+    main()
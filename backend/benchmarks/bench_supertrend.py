@@ -0,0 +1,75 @@
+"""
+SuperTrend benchmark: legacy per-element pandas loop vs the array kernel.
+
+Usage (from backend/):
+    python -m benchmarks.bench_supertrend            # 1k, 100k, 1M bars
+    python -m benchmarks.bench_supertrend --legacy   # also time the old loop (slow)
+"""
+import sys
+import os
+import argparse
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from strategies.supertrend import calculate_atr, calculate_supertrend
+from benchmarks.common import make_bars, time_call, format_seconds
+
+
+def legacy_calculate_supertrend(df, period=10, multiplier=3):
+    """The original implementation, kept here as the reference for timing and parity"""
+    hl_avg = (df['high'] + df['low']) / 2
+    atr = calculate_atr(df, period)
+
+    upper_band = hl_avg + (multiplier * atr)
+    lower_band = hl_avg - (multiplier * atr)
+
+    supertrend = pd.Series(index=df.index, dtype=float)
+    direction = pd.Series(index=df.index, dtype=int)
+
+    for i in range(period, len(df)):
+        if i == period:
+            supertrend.iloc[i] = lower_band.iloc[i]
+            direction.iloc[i] = 1
+        else:
+            if df['close'].iloc[i] > supertrend.iloc[i-1]:
+                supertrend.iloc[i] = lower_band.iloc[i]
+                direction.iloc[i] = 1
+            elif df['close'].iloc[i] < supertrend.iloc[i-1]:
+                supertrend.iloc[i] = upper_band.iloc[i]
+                direction.iloc[i] = -1
+            else:
+                supertrend.iloc[i] = supertrend.iloc[i-1]
+                direction.iloc[i] = direction.iloc[i-1]
+
+    return supertrend, direction
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default='1000,100000,1000000')
+    parser.add_argument('--legacy', action='store_true', help='Time the legacy loop too (up to 100k bars)')
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(',')]
+    print(f"{'bars':>10} {'kernel':>12} {'legacy':>12} {'speedup':>9}")
+    for n in sizes:
+        df = make_bars(n)
+        new_time = time_call(calculate_supertrend, df, repeat=3)
+
+        legacy_time = None
+        if args.legacy and n <= 100_000:
+            legacy_st, legacy_dir = legacy_calculate_supertrend(df)
+            st, direction = calculate_supertrend(df)
+            assert np.array_equal(legacy_st.to_numpy(), st.to_numpy(), equal_nan=True)
+            assert np.array_equal(legacy_dir.to_numpy(), direction.to_numpy(), equal_nan=True)
+            legacy_time = time_call(legacy_calculate_supertrend, df, repeat=1)
+
+        legacy_col = format_seconds(legacy_time) if legacy_time else '-'
+        speedup = f"{legacy_time / new_time:.0f}x" if legacy_time else '-'
+        print(f"{n:>10} {format_seconds(new_time):>12} {legacy_col:>12} {speedup:>9}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Synthetic market benchmark: the simulator's former per-bar random walk vs the vectorized generator.
+
+Usage (from backend/):
+    python -m benchmarks.bench_synthetic_market
+    python -m benchmarks.bench_synthetic_market --bars 1000000 --symbols 20
+"""
+import sys
+import os
+import argparse
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.synthetic_market import generate_market
+from benchmarks.common import time_call, format_seconds
+
+
+def loop_random_walk(num_days, base_price=150.0):
+    # The simulator's previous mock data: one np.random call per bar and field
+    prices = [base_price]
+    for i in range(1, num_days):
+        change = np.random.randn() * 2.0
+        prices.append(max(prices[-1] * (1 + change / 100), base_price * 0.7))
+    return pd.DataFrame({
+        'open': [p * (1 + np.random.uniform(-0.01, 0.01)) for p in prices],
+        'high': [p * (1 + abs(np.random.uniform(0, 0.02))) for p in prices],
+        'low': [p * (1 - abs(np.random.uniform(0, 0.02))) for p in prices],
+        'close': prices,
+        'volume': [np.random.randint(1000000, 10000000) for _ in range(num_days)]
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--bars', type=int, default=1_000_000, help='Bars per symbol')
+    parser.add_argument('--symbols', type=int, default=1)
+    args = parser.parse_args()
+
+    symbols = [f"SYN{k:03d}" for k in range(args.symbols)]
+    total = args.bars * args.symbols
+    print(f"{args.symbols} symbol(s) x {args.bars:,} bars = {total:,} bars")
+    print(f"{'generator':<44} {'time':>10} {'bars/s':>12}")
+
+    # The loop is timed on fewer bars and reported per bar
+    loop_bars = min(args.bars, 100_000)
+    elapsed = time_call(loop_random_walk, loop_bars, repeat=1) * total / loop_bars
+    print(f"{'per-bar loop (previous simulator)':<44} {format_seconds(elapsed):>10} {total / elapsed:>12,.0f}")
+
+    configs = {
+        'GBM, daily': dict(interval='1d'),
+        'GBM + jumps + regimes, daily': dict(interval='1d', jump_intensity=10, regimes=(1.0, 2.5)),
+        'GBM + jumps + regimes + seasonality, 1m': dict(interval='1m', jump_intensity=10, regimes=(1.0, 2.5)),
+        'correlated (0.6), 1m': dict(interval='1m', correlation=0.6)
+    }
+    for label, options in configs.items():
+        elapsed = time_call(generate_market, symbols, args.bars, seed=7, **options)
+        print(f"{label:<44} {format_seconds(elapsed):>10} {total / elapsed:>12,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+import time
+import tracemalloc
+import numpy as np
+import pandas as pd
+
+
+def make_bars(n, seed=42, freq='min'):
+    """Build a reproducible random-walk OHLCV frame with ``n`` bars"""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, n)))
+    spread = close * rng.uniform(0.0005, 0.003, n)
+    open_ = close * (1 + rng.normal(0, 0.0005, n))
+    high = np.maximum(open_, close) + spread
+    low = np.minimum(open_, close) - spread
+    volume = rng.integers(1_000, 100_000, n).astype(float)
+    return pd.DataFrame({
+        'date': pd.date_range('2015-01-01', periods=n, freq=freq),
+        'open': open_,
+        'high': high,
+        'low': low,
+        'close': close,
+        'volume': volume
+    })
+
+
+def make_market(n_symbols, n, seed=42, interval='1m', **kwargs):
+    """Reproducible correlated multi-symbol market ({symbol: OHLCV frame}) from utils.synthetic_market"""
+    from utils.synthetic_market import generate_market
+    symbols = [f"SYN{k:03d}" for k in range(n_symbols)]
+    return generate_market(symbols, n, interval, seed, **kwargs)
+
+
+def time_call(func, *args, repeat=3, **kwargs):
+    """Return the best wall-clock time in seconds over ``repeat`` runs"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_memory(func, *args, **kwargs):
+    """Return the peak bytes allocated through Python while running ``func`` once"""
+    tracemalloc.start()
+    try:
+        func(*args, **kwargs)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def format_bytes(size):
+    if size < 1024 ** 2:
+        return f"{size / 1024:.0f} KB"
+    return f"{size / 1024 ** 2:.1f} MB"
+
+
+def format_seconds(seconds):
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.0f} µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.1f} ms"
+    return f"{seconds:.2f} s"
@@ -3,60 +3,62 @@ import numpy as np
 from sklearn.linear_model import LogisticRegression
 from sklearn.preprocessing import StandardScaler
 from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
-from ta.trend import SMAIndicator, EMAIndicator, MACD, ADXIndicator
-from ta.momentum import RSIIndicator, StochasticOscillator, ROCIndicator
-from ta.volatility import BollingerBands, AverageTrueRange
-from ta.volume import OnBalanceVolumeIndicator
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils import indicators
 
 def create_technical_features(df):
     """Create comprehensive technical indicators for classification"""
     data = df.copy()
+    high = data['high'].to_numpy(dtype=float)
+    low = data['low'].to_numpy(dtype=float)
+    close = data['close'].to_numpy(dtype=float)
+    volume = data['volume'].to_numpy(dtype=float)
     
     # Trend Indicators
-    data['SMA_5'] = SMAIndicator(close=data['close'], window=5).sma_indicator()
-    data['SMA_10'] = SMAIndicator(close=data['close'], window=10).sma_indicator()
-    data['SMA_20'] = SMAIndicator(close=data['close'], window=20).sma_indicator()
-    data['EMA_12'] = EMAIndicator(close=data['close'], window=12).ema_indicator()
-    data['EMA_26'] = EMAIndicator(close=data['close'], window=26).ema_indicator()
+    smas = indicators.sma(close, (5, 10, 20))
+    emas = indicators.ema(close, (12, 26))
+    data['SMA_5'] = smas[5]
+    data['SMA_10'] = smas[10]
+    data['SMA_20'] = smas[20]
+    data['EMA_12'] = emas[12]
+    data['EMA_26'] = emas[26]
     
     # MACD
-    macd_indicator = MACD(close=data['close'], window_fast=12, window_slow=26, window_sign=9)
-    data['MACD'] = macd_indicator.macd()
-    data['MACD_signal'] = macd_indicator.macd_signal()
-    data['MACD_hist'] = macd_indicator.macd_diff()
+    macd = indicators.macd(close, 12, 26, 9, emas=emas)
+    data['MACD'] = macd['macd']
+    data['MACD_signal'] = macd['signal']
+    data['MACD_hist'] = macd['hist']
     
     # RSI
-    data['RSI_14'] = RSIIndicator(close=data['close'], window=14).rsi()
+    data['RSI_14'] = indicators.rsi(close, (14,))[14]
     
     # Bollinger Bands
-    bb = BollingerBands(close=data['close'], window=20, window_dev=2)
-    data['BB_upper'] = bb.bollinger_hband()
-    data['BB_middle'] = bb.bollinger_mavg()
-    data['BB_lower'] = bb.bollinger_lband()
-    data['BB_width'] = bb.bollinger_wband()
+    bb = indicators.bollinger(close, 20, 2, middle=smas[20])
+    data['BB_upper'] = bb['upper']
+    data['BB_middle'] = bb['middle']
+    data['BB_lower'] = bb['lower']
+    data['BB_width'] = bb['width']
     
     # Stochastic
-    stoch = StochasticOscillator(high=data['high'], low=data['low'], close=data['close'], window=14, smooth_window=3)
-    data['STOCH_K'] = stoch.stoch()
-    data['STOCH_D'] = stoch.stoch_signal()
+    stoch = indicators.stochastic(high, low, close, 14, 3)
+    data['STOCH_K'] = stoch['k']
+    data['STOCH_D'] = stoch['d']
     
     # ADX
-    adx = ADXIndicator(high=data['high'], low=data['low'], close=data['close'], window=14)
-    data['ADX'] = adx.adx()
+    data['ADX'] = indicators.adx(high, low, close, 14)['adx']
     
     # ATR (Volatility)
-    atr = AverageTrueRange(high=data['high'], low=data['low'], close=data['close'], window=14)
-    data['ATR'] = atr.average_true_range()
+    data['ATR'] = indicators.atr(high, low, close, 14)
     
     # Volume indicators
-    obv = OnBalanceVolumeIndicator(close=data['close'], volume=data['volume'])
-    data['OBV'] = obv.on_balance_volume()
-    data['Volume_SMA'] = SMAIndicator(close=data['volume'], window=20).sma_indicator()
+    data['OBV'] = indicators.obv(close, volume)
+    data['Volume_SMA'] = indicators.sma(volume, (20,))[20]
     
     # Momentum
     data['MOM'] = data['close'].diff(periods=10)
-    roc = ROCIndicator(close=data['close'], window=10)
-    data['ROC'] = roc.roc()
+    data['ROC'] = indicators.roc(close, (10,))[10]
     
     # Price patterns
     data['price_change'] = data['close'].diff()
@@ -7,37 +7,42 @@ from tensorflow.keras.layers import LSTM, Dense, Dropout, BatchNormalization
 from tensorflow.keras.callbacks import EarlyStopping
 from sklearn.preprocessing import MinMaxScaler
 from sklearn.metrics import accuracy_score, confusion_matrix
-from ta.trend import SMAIndicator, EMAIndicator, MACD
-from ta.momentum import RSIIndicator
-from ta.volatility import BollingerBands, AverageTrueRange
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils import indicators
 
 def create_lstm_features(df):
     """Create features for LSTM classification"""
     data = df.copy()
+    high = data['high'].to_numpy(dtype=float)
+    low = data['low'].to_numpy(dtype=float)
+    close = data['close'].to_numpy(dtype=float)
     
     # Technical indicators
-    data['SMA_10'] = SMAIndicator(close=data['close'], window=10).sma_indicator()
-    data['SMA_20'] = SMAIndicator(close=data['close'], window=20).sma_indicator()
-    data['EMA_12'] = EMAIndicator(close=data['close'], window=12).ema_indicator()
+    smas = indicators.sma(close, (10, 20))
+    emas = indicators.ema(close, (12, 26))
+    data['SMA_10'] = smas[10]
+    data['SMA_20'] = smas[20]
+    data['EMA_12'] = emas[12]
     
     # MACD
-    macd_indicator = MACD(close=data['close'], window_fast=12, window_slow=26, window_sign=9)
-    data['MACD'] = macd_indicator.macd()
-    data['MACD_signal'] = macd_indicator.macd_signal()
+    macd = indicators.macd(close, 12, 26, 9, emas=emas)
+    data['MACD'] = macd['macd']
+    data['MACD_signal'] = macd['signal']
     
     # RSI
-    data['RSI'] = RSIIndicator(close=data['close'], window=14).rsi()
+    data['RSI'] = indicators.rsi(close, (14,))[14]
     
     # Bollinger Bands
-    bb = BollingerBands(close=data['close'], window=20, window_dev=2)
-    data['BB_upper'] = bb.bollinger_hband()
-    data['BB_middle'] = bb.bollinger_mavg()
-    data['BB_lower'] = bb.bollinger_lband()
+    bb = indicators.bollinger(close, 20, 2, middle=smas[20])
+    data['BB_upper'] = bb['upper']
+    data['BB_middle'] = bb['middle']
+    data['BB_lower'] = bb['lower']
     data['BB_width'] = (data['BB_upper'] - data['BB_lower']) / data['BB_middle']
     
     # ATR
-    atr = AverageTrueRange(high=data['high'], low=data['low'], close=data['close'], window=14)
-    data['ATR'] = atr.average_true_range()
+    data['ATR'] = indicators.atr(high, low, close, 14)
     
     # Volume
     data['Volume_norm'] = data['volume'] / data['volume'].rolling(20).mean()
@@ -1,10 +1,10 @@
 import numpy as np
 import pandas as pd
 import xgboost as xgb
-from ta.trend import SMAIndicator, EMAIndicator, MACD, ADXIndicator
-from ta.momentum import RSIIndicator, StochasticOscillator, ROCIndicator
-from ta.volatility import AverageTrueRange, BollingerBands
-from ta.volume import OnBalanceVolumeIndicator, MFIIndicator
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils import indicators
 
 BUY = 1
 HOLD = 0
@@ -15,8 +15,9 @@ RET_THRESH = {3: 0.015, 7: 0.025, 14: 0.04}  # horizon-specific return threshold
 
 
 def compute_regime(data: pd.DataFrame) -> pd.Series:
-    sma50 = SMAIndicator(close=data['close'], window=50).sma_indicator()
-    sma200 = SMAIndicator(close=data['close'], window=200).sma_indicator()
+    smas = indicators.sma(data['close'], (50, 200))
+    sma50 = smas[50]
+    sma200 = smas[200]
     regime = pd.Series(index=data.index, dtype='int32')
     regime[:] = 0
     regime[sma50 > sma200 * 1.01] = 1  # bull
@@ -26,6 +27,10 @@ def compute_regime(data: pd.DataFrame) -> pd.Series:
 
 def build_features(df: pd.DataFrame, benchmark: pd.DataFrame | None = None) -> pd.DataFrame:
     data = df.copy()
+    high = data['high'].to_numpy(dtype=float)
+    low = data['low'].to_numpy(dtype=float)
+    close = data['close'].to_numpy(dtype=float)
+    volume = data['volume'].to_numpy(dtype=float)
     # Basic returns & volatility
     data['ret_1'] = data['close'].pct_change(1)
     data['ret_3'] = data['close'].pct_change(3)
@@ -34,39 +39,36 @@ def build_features(df: pd.DataFrame, benchmark: pd.DataFrame | None = None) -> p
     data['vol_20'] = data['ret_1'].rolling(20).std()
 
     # Trend & momentum
-    for w in [5, 10, 20, 50, 100, 200]:
-        data[f'SMA_{w}'] = SMAIndicator(close=data['close'], window=w).sma_indicator()
-    data['EMA_12'] = EMAIndicator(close=data['close'], window=12).ema_indicator()
-    data['EMA_26'] = EMAIndicator(close=data['close'], window=26).ema_indicator()
-    macd = MACD(close=data['close'], window_fast=12, window_slow=26, window_sign=9)
-    data['MACD'] = macd.macd()
-    data['MACD_signal'] = macd.macd_signal()
+    for w, values in indicators.sma(close, (5, 10, 20, 50, 100, 200)).items():
+        data[f'SMA_{w}'] = values
+    emas = indicators.ema(close, (12, 26))
+    data['EMA_12'] = emas[12]
+    data['EMA_26'] = emas[26]
+    macd = indicators.macd(close, 12, 26, 9, emas=emas)
+    data['MACD'] = macd['macd']
+    data['MACD_signal'] = macd['signal']
 
     # Oscillators
-    data['RSI_14'] = RSIIndicator(close=data['close'], window=14).rsi()
-    stoch = StochasticOscillator(high=data['high'], low=data['low'], close=data['close'], window=14, smooth_window=3)
-    data['STOCH_K'] = stoch.stoch()
-    data['STOCH_D'] = stoch.stoch_signal()
+    data['RSI_14'] = indicators.rsi(close, (14,))[14]
+    stoch = indicators.stochastic(high, low, close, 14, 3)
+    data['STOCH_K'] = stoch['k']
+    data['STOCH_D'] = stoch['d']
 
     # Volatility & bands
-    atr = AverageTrueRange(high=data['high'], low=data['low'], close=data['close'], window=14)
-    data['ATR'] = atr.average_true_range()
-    bb = BollingerBands(close=data['close'], window=20, window_dev=2)
-    data['BB_width'] = bb.bollinger_wband()
+    data['ATR'] = indicators.atr(high, low, close, 14)
+    data['BB_width'] = indicators.bollinger(close, 20, 2, middle=data['SMA_20'].to_numpy())['width']
 
     # Volume
-    obv = OnBalanceVolumeIndicator(close=data['close'], volume=data['volume'])
-    data['OBV'] = obv.on_balance_volume()
+    data['OBV'] = indicators.obv(close, volume)
     data['VOL_SMA20'] = data['volume'].rolling(20).mean()
     data['VOL_ratio'] = data['volume'] / data['VOL_SMA20']
-    mfi = MFIIndicator(high=data['high'], low=data['low'], close=data['close'], volume=data['volume'], window=14)
-    data['MFI'] = mfi.money_flow_index()
+    data['MFI'] = indicators.mfi(high, low, close, volume, 14)
 
     # ADX / DMI
-    adx = ADXIndicator(high=data['high'], low=data['low'], close=data['close'], window=14)
-    data['ADX'] = adx.adx()
-    data['PLUS_DI'] = adx.adx_pos()
-    data['MINUS_DI'] = adx.adx_neg()
+    adx = indicators.adx(high, low, close, 14)
+    data['ADX'] = adx['adx']
+    data['PLUS_DI'] = adx['plus_di']
+    data['MINUS_DI'] = adx['minus_di']
 
     # Relative strength vs benchmark (optional)
     if benchmark is not None and not benchmark.empty:
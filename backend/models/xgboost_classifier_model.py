@@ -3,84 +3,89 @@ import numpy as np
 import xgboost as xgb
 from sklearn.preprocessing import StandardScaler
 from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
-from ta.trend import SMAIndicator, EMAIndicator, MACD, ADXIndicator
-from ta.momentum import RSIIndicator, StochasticOscillator, WilliamsRIndicator, ROCIndicator
-from ta.volatility import BollingerBands, AverageTrueRange
-from ta.volume import OnBalanceVolumeIndicator
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils import indicators
 
 def create_advanced_features(df):
     """Create comprehensive features for XGBoost"""
     data = df.copy()
+    high = data['high'].to_numpy(dtype=float)
+    low = data['low'].to_numpy(dtype=float)
+    close = data['close'].to_numpy(dtype=float)
+    volume = data['volume'].to_numpy(dtype=float)
     
     # Price-based features
     data['HL_pct'] = (data['high'] - data['low']) / data['close'] * 100
     data['OC_pct'] = (data['close'] - data['open']) / data['open'] * 100
     
     # Trend Indicators
-    data['SMA_5'] = SMAIndicator(close=data['close'], window=5).sma_indicator()
-    data['SMA_10'] = SMAIndicator(close=data['close'], window=10).sma_indicator()
-    data['SMA_20'] = SMAIndicator(close=data['close'], window=20).sma_indicator()
-    data['SMA_50'] = SMAIndicator(close=data['close'], window=50).sma_indicator()
-    data['EMA_12'] = EMAIndicator(close=data['close'], window=12).ema_indicator()
-    data['EMA_26'] = EMAIndicator(close=data['close'], window=26).ema_indicator()
+    smas = indicators.sma(close, (5, 10, 20, 50))
+    emas = indicators.ema(close, (12, 26))
+    data['SMA_5'] = smas[5]
+    data['SMA_10'] = smas[10]
+    data['SMA_20'] = smas[20]
+    data['SMA_50'] = smas[50]
+    data['EMA_12'] = emas[12]
+    data['EMA_26'] = emas[26]
     
     # Price relative to SMAs
     data['price_to_SMA5'] = (data['close'] / data['SMA_5'] - 1) * 100
     data['price_to_SMA20'] = (data['close'] / data['SMA_20'] - 1) * 100
     
     # MACD
-    macd_indicator = MACD(close=data['close'], window_fast=12, window_slow=26, window_sign=9)
-    data['MACD'] = macd_indicator.macd()
-    data['MACD_signal'] = macd_indicator.macd_signal()
-    data['MACD_hist'] = macd_indicator.macd_diff()
+    macd = indicators.macd(close, 12, 26, 9, emas=emas)
+    data['MACD'] = macd['macd']
+    data['MACD_signal'] = macd['signal']
+    data['MACD_hist'] = macd['hist']
     
     # RSI
-    data['RSI_7'] = RSIIndicator(close=data['close'], window=7).rsi()
-    data['RSI_14'] = RSIIndicator(close=data['close'], window=14).rsi()
-    data['RSI_21'] = RSIIndicator(close=data['close'], window=21).rsi()
+    rsis = indicators.rsi(close, (7, 14, 21))
+    data['RSI_7'] = rsis[7]
+    data['RSI_14'] = rsis[14]
+    data['RSI_21'] = rsis[21]
     
     # Bollinger Bands
-    bb = BollingerBands(close=data['close'], window=20, window_dev=2)
-    data['BB_upper'] = bb.bollinger_hband()
-    data['BB_middle'] = bb.bollinger_mavg()
-    data['BB_lower'] = bb.bollinger_lband()
-    data['BB_width'] = bb.bollinger_wband()
+    bb = indicators.bollinger(close, 20, 2, middle=smas[20])
+    data['BB_upper'] = bb['upper']
+    data['BB_middle'] = bb['middle']
+    data['BB_lower'] = bb['lower']
+    data['BB_width'] = bb['width']
     data['BB_position'] = (data['close'] - data['BB_lower']) / (data['BB_upper'] - data['BB_lower'])
     
     # Stochastic
-    stoch = StochasticOscillator(high=data['high'], low=data['low'], close=data['close'], window=14, smooth_window=3)
-    data['STOCH_K'] = stoch.stoch()
-    data['STOCH_D'] = stoch.stoch_signal()
+    stoch = indicators.stochastic(high, low, close, 14, 3)
+    data['STOCH_K'] = stoch['k']
+    data['STOCH_D'] = stoch['d']
     
     # ADX and DMI
-    adx_indicator = ADXIndicator(high=data['high'], low=data['low'], close=data['close'], window=14)
-    data['ADX'] = adx_indicator.adx()
-    data['PLUS_DI'] = adx_indicator.adx_pos()
-    data['MINUS_DI'] = adx_indicator.adx_neg()
+    adx = indicators.adx(high, low, close, 14)
+    data['ADX'] = adx['adx']
+    data['PLUS_DI'] = adx['plus_di']
+    data['MINUS_DI'] = adx['minus_di']
     
     # CCI - manual calculation
     typical_price = (data['high'] + data['low'] + data['close']) / 3
     data['CCI'] = (typical_price - typical_price.rolling(14).mean()) / (0.015 * typical_price.rolling(14).std())
     
-    # Williams %R
-    willr = WilliamsRIndicator(high=data['high'], low=data['low'], close=data['close'], lbp=14)
-    data['WILLR'] = willr.williams_r()
+    # Williams %R (same 14-bar high/low pass as the stochastic)
+    data['WILLR'] = stoch['williams_r']
     
     # ATR (Volatility)
-    atr = AverageTrueRange(high=data['high'], low=data['low'], close=data['close'], window=14)
-    data['ATR'] = atr.average_true_range()
+    data['ATR'] = indicators.atr(high, low, close, 14)
     data['ATR_pct'] = data['ATR'] / data['close'] * 100
     
     # Volume indicators
-    obv = OnBalanceVolumeIndicator(close=data['close'], volume=data['volume'])
-    data['OBV'] = obv.on_balance_volume()
-    data['Volume_SMA'] = SMAIndicator(close=data['volume'], window=20).sma_indicator()
+    data['OBV'] = indicators.obv(close, volume)
+    data['Volume_SMA'] = indicators.sma(volume, (20,))[20]
     data['Volume_ratio'] = data['volume'] / data['Volume_SMA']
     
     # Momentum
     data['MOM'] = data['close'].diff(periods=10)
-    data['ROC'] = ROCIndicator(close=data['close'], window=10).roc()
-    data['ROC_5'] = ROCIndicator(close=data['close'], window=5).roc()
+    rocs = indicators.roc(close, (10, 5))
+    data['ROC'] = rocs[10]
+    data['ROC_5'] = rocs[5]
     
     # Lagged returns
     for i in range(1, 8):
@@ -1,5 +1,10 @@
 import pandas as pd
 import numpy as np
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.indicator_cache import resolve_indicator_context
+from strategies.kernels import bollinger_scalping_kernel, overlay_frame, with_date_column, signal_points
 
 def calculate_bollinger_bands(data, period=20, std_dev=2):
     """Calculate Bollinger Bands"""
@@ -11,7 +16,7 @@ def calculate_bollinger_bands(data, period=20, std_dev=2):
     
     return sma, upper_band, lower_band
 
-def bollinger_scalping_strategy(df, period=20, std_dev=2):
+def bollinger_scalping_strategy(df, period=20, std_dev=2, indicators=None):
     """
     Bollinger Bands Scalping Strategy
     
@@ -22,60 +27,26 @@ def bollinger_scalping_strategy(df, period=20, std_dev=2):
         df: DataFrame with stock data
         period: Moving average period (default: 20)
         std_dev: Standard deviation multiplier (default: 2)
+        indicators: Optional IndicatorContext shared across strategies running on the same bars
     
     Returns:
         dict with signals, data, and metadata
     """
-    df = df.copy()
+    # Ensure date is a column, not index (input bars are shared, never modified)
+    df = with_date_column(df)
     
-    # Ensure date is a column, not index
-    if 'date' not in df.columns and df.index.name == 'date':
-        df.reset_index(inplace=True)
-    elif 'date' not in df.columns:
-        df['date'] = df.index
-    
-    # Calculate Bollinger Bands
-    df['sma'], df['upper_band'], df['lower_band'] = calculate_bollinger_bands(df['close'], period, std_dev)
-    
-    # Calculate band width for squeeze detection
-    df['band_width'] = (df['upper_band'] - df['lower_band']) / df['sma']
-    df['band_width_prev'] = df['band_width'].shift(1)
-    
-    # Calculate previous close for crossover detection
-    df['close_prev'] = df['close'].shift(1)
-    
-    # Generate signals
-    df['signal'] = 0
-    
-    # Buy signal: Price crosses below lower band (was above, now below or touching)
-    buy_condition = (df['close_prev'] > df['lower_band'].shift(1)) & (df['close'] <= df['lower_band'])
-    df.loc[buy_condition, 'signal'] = 1
-    
-    # Sell signal: Price crosses above upper band (was below, now above or touching)
-    sell_condition = (df['close_prev'] < df['upper_band'].shift(1)) & (df['close'] >= df['upper_band'])
-    df.loc[sell_condition, 'signal'] = -1
-    
-    # Additional signals: Mean reversion from bands back to SMA
-    mean_reversion_buy = (df['close_prev'] <= df['lower_band'].shift(1)) & (df['close'] > df['lower_band']) & (df['close'] < df['sma'])
-    mean_reversion_sell = (df['close_prev'] >= df['upper_band'].shift(1)) & (df['close'] < df['upper_band']) & (df['close'] > df['sma'])
-    
-    df.loc[mean_reversion_buy & (df['signal'] == 0), 'signal'] = 1
-    df.loc[mean_reversion_sell & (df['signal'] == 0), 'signal'] = -1
+    # Indicator and signal columns from the array kernel
+    indicators = resolve_indicator_context(df, indicators)
+    columns = bollinger_scalping_kernel(indicators, period, std_dev)
+    df = overlay_frame(df, columns)
     
     # Extract buy and sell points
-    buy_signals = df[df['signal'] == 1].copy()
-    sell_signals = df[df['signal'] == -1].copy()
-    
-    # Add band position percentage to signals
-    buy_signals['band_position'] = ((buy_signals['close'] - buy_signals['lower_band']) / 
-                                     (buy_signals['upper_band'] - buy_signals['lower_band']) * 100)
-    sell_signals['band_position'] = ((sell_signals['close'] - sell_signals['lower_band']) / 
-                                      (sell_signals['upper_band'] - sell_signals['lower_band']) * 100)
+    buy_list, sell_list = signal_points(df, columns['signal'])
     
     return {
         'data': df.to_dict('records'),
-        'buy_signals': buy_signals[['date', 'close']].to_dict('records'),
-        'sell_signals': sell_signals[['date', 'close']].to_dict('records'),
+        'buy_signals': buy_list,
+        'sell_signals': sell_list,
         'metadata': {
             'name': 'Bollinger Scalping',
             'description': f'Bollinger Bands scalping strategy using {period}-period SMA and {std_dev} standard deviations. Buy when price touches lower band, sell when price touches upper band.',
@@ -4,12 +4,14 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.confidence_calculator import calculate_signal_confidence
+from utils.indicator_cache import resolve_indicator_context
+from strategies.kernels import ema_crossover_kernel, overlay_frame, with_date_column, unique_string_columns, signal_points
 
 def calculate_ema(data, period):
     """Calculate Exponential Moving Average"""
     return data.ewm(span=period, adjust=False).mean()
 
-def ema_crossover_strategy(df, short_period=9, long_period=21):
+def ema_crossover_strategy(df, short_period=9, long_period=21, indicators=None):
     """
     EMA Crossover Strategy
     
@@ -20,57 +22,27 @@ def ema_crossover_strategy(df, short_period=9, long_period=21):
         df: DataFrame with stock data
         short_period: Short EMA period (default: 9)
         long_period: Long EMA period (default: 21)
+        indicators: Optional IndicatorContext shared across strategies running on the same bars
     
     Returns:
         dict with signals, data, and metadata
     """
-    df = df.copy()
-    # Ensure columns are simple strings and de-duplicated (pandas may error on .at with duplicate columns)
-    df.columns = [str(c) for c in df.columns]
-    df = df.loc[:, ~pd.Index(df.columns).duplicated()].copy()
+    # Ensure columns are simple strings and de-duplicated
+    df = unique_string_columns(df)
     
-    # Ensure date is a column, not index
-    if 'date' not in df.columns and df.index.name == 'date':
-        df.reset_index(inplace=True)
-    elif 'date' not in df.columns:
-        df['date'] = df.index
+    # Ensure date is a column, not index (input bars are shared, never modified)
+    df = with_date_column(df)
     
-    # Calculate EMAs
-    df['ema_short'] = calculate_ema(df['close'], short_period)
-    df['ema_long'] = calculate_ema(df['close'], long_period)
-    
-    # Calculate EMA difference for better signal detection
-    df['ema_diff'] = df['ema_short'] - df['ema_long']
-    df['ema_diff_prev'] = df['ema_diff'].shift(1)
-    
-    # Generate signals - detect actual crossovers
-    df['signal'] = 0
-    
-    # Buy signal: Short EMA crosses above Long EMA (was below, now above)
-    buy_condition = (df['ema_diff_prev'] <= 0) & (df['ema_diff'] > 0)
-    df.loc[buy_condition, 'signal'] = 1
-    
-    # Sell signal: Short EMA crosses below Long EMA (was above, now below)
-    sell_condition = (df['ema_diff_prev'] >= 0) & (df['ema_diff'] < 0)
-    df.loc[sell_condition, 'signal'] = -1
+    # Indicator, signal and signal strength columns from the array kernel
+    indicators = resolve_indicator_context(df, indicators)
+    columns = ema_crossover_kernel(indicators, short_period, long_period)
+    df = overlay_frame(df, columns)
     
     # Extract buy and sell points
-    buy_signals = df[df['signal'] == 1].copy()
-    sell_signals = df[df['signal'] == -1].copy()
-    
-    # Add momentum strength to signals
-    for idx in buy_signals.index:
-        if idx in df.index:
-            df.at[idx, 'signal_strength'] = abs(df.at[idx, 'ema_diff']) / df.at[idx, 'close'] * 100
-    
-    for idx in sell_signals.index:
-        if idx in df.index:
-            df.at[idx, 'signal_strength'] = abs(df.at[idx, 'ema_diff']) / df.at[idx, 'close'] * 100
+    buy_list, sell_list = signal_points(df, columns['signal'])
     
     # Add confidence scores
-    buy_list = buy_signals[['date', 'close']].to_dict('records')
-    sell_list = sell_signals[['date', 'close']].to_dict('records')
-    buy_list, sell_list = calculate_signal_confidence(df, buy_list, sell_list, 'ema_crossover')
+    buy_list, sell_list = calculate_signal_confidence(df, buy_list, sell_list, 'ema_crossover', indicators)
     
     return {
         'data': df.to_dict('records'),
@@ -0,0 +1,132 @@
+import numpy as np
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.confidence_calculator import calculate_signal_confidence
+from utils.indicator_cache import resolve_indicator_context
+from strategies.kernels import strategy_signals, overlay_frame, with_date_column, unique_string_columns, signal_points
+
+DEFAULT_MEMBERS = ['ema_crossover', 'macd', 'supertrend', 'adx_dmi', 'vwap']
+
+
+def signal_matrix(df, members, params=None, indicators=None):
+    """
+    Run each member strategy once on the same bars and stack their signals
+
+    Args:
+        df: DataFrame with OHLCV data
+        members: List of strategy names from STRATEGIES
+        params: Optional dict of {member_name: {param: value}}
+        indicators: Optional IndicatorContext shared by every member
+
+    Returns:
+        (bars x members) array of signals (1 = buy, -1 = sell, 0 = hold)
+    """
+    # Imported here because the registry itself imports this module
+    from strategies.registry import STRATEGIES
+
+    params = params or {}
+    unknown = [name for name in members if name not in STRATEGIES or name == 'ensemble']
+    if unknown:
+        raise ValueError(f"Invalid ensemble members: {unknown}")
+    indicators = resolve_indicator_context(df, indicators)
+    matrix = np.zeros((len(df), len(members)))
+    for col, name in enumerate(members):
+        matrix[:, col] = strategy_signals(df, name, params.get(name), indicators)
+    return matrix
+
+
+def member_votes(signals, vote_window=None):
+    """
+    Each member's vote per bar from its signal column
+
+    With ``vote_window=None`` a member keeps voting for its last signal until the opposite
+    signal; otherwise a signal only counts for ``vote_window`` bars (including its own bar).
+    """
+    signals = np.asarray(signals, dtype=float)
+    steps = np.arange(len(signals))[:, None]
+    last = np.maximum.accumulate(np.where(signals != 0, steps, -1), axis=0)
+    votes = np.take_along_axis(signals, np.maximum(last, 0), axis=0)
+    active = last >= 0
+    if vote_window is not None:
+        active &= (steps - last) < vote_window
+    return np.where(active, votes, 0.0)
+
+
+def _held_for(condition, bars):
+    """True where ``condition`` has held for the last ``bars`` bars"""
+    if bars <= 1:
+        return condition
+    if bars > len(condition):
+        return np.zeros(len(condition), dtype=bool)
+    count = np.cumsum(condition, dtype=int)
+    window = count - np.concatenate([np.zeros(bars, dtype=int), count[:-bars]])
+    return window >= bars
+
+
+def ensemble_strategy(df, members=None, weights=None, min_agree=3, vote_window=None, confirm_bars=1,
+                      params=None, indicators=None):
+    """
+    Ensemble Voting Strategy
+
+    Buy Signal: When the weighted member vote first reaches +min_agree (held for confirm_bars bars)
+    Sell Signal: When the weighted member vote first reaches -min_agree (held for confirm_bars bars)
+
+    Args:
+        df: DataFrame with stock data
+        members: Member strategy names (default: EMA, MACD, SuperTrend, ADX/DMI, VWAP)
+        weights: Optional vote weight per member (default: 1 each)
+        min_agree: Weighted votes needed on one side (default: 3)
+        vote_window: Bars a member signal keeps voting (default: until the member's opposite signal)
+        confirm_bars: Bars the agreement must hold before signalling (default: 1)
+        params: Optional dict of {member_name: {param: value}}
+        indicators: Optional IndicatorContext shared across strategies running on the same bars
+
+    Returns:
+        dict with signals, data, and metadata
+    """
+    # Input bars are shared with the members, never modified
+    df = with_date_column(unique_string_columns(df)).reset_index(drop=True)
+
+    if isinstance(members, str):
+        members = [m.strip() for m in members.split(',') if m.strip()]
+    members = list(members or DEFAULT_MEMBERS)
+    weights = np.ones(len(members)) if weights is None else np.asarray(weights, dtype=float)
+    if len(weights) != len(members):
+        raise ValueError(f"Expected {len(members)} weights, got {len(weights)}")
+
+    # Bars x members votes, combined with one weighted sum per bar
+    indicators = resolve_indicator_context(df, indicators)
+    votes = member_votes(signal_matrix(df, members, params, indicators), vote_window)
+    score = votes @ weights
+
+    bullish = _held_for(score >= min_agree, confirm_bars)
+    bearish = _held_for(score <= -min_agree, confirm_bars)
+    bullish_prev = np.concatenate([[False], bullish[:-1]])
+    bearish_prev = np.concatenate([[False], bearish[:-1]])
+
+    columns = {f'vote_{name}': votes[:, col] for col, name in enumerate(members)}
+    columns['ensemble_score'] = score
+    columns['signal'] = np.where(bullish & ~bullish_prev, 1, np.where(bearish & ~bearish_prev, -1, 0))
+    df = overlay_frame(df, columns)
+
+    # Extract buy and sell points, then add confidence scores
+    buy_list, sell_list = signal_points(df, columns['signal'])
+    buy_list, sell_list = calculate_signal_confidence(df, buy_list, sell_list, 'ensemble', indicators)
+
+    return {
+        'data': df.to_dict('records'),
+        'buy_signals': buy_list,
+        'sell_signals': sell_list,
+        'metadata': {
+            'name': 'Ensemble Voting',
+            'description': f'Buy when at least {min_agree} weighted votes of {", ".join(members)} agree on a buy, sell when they agree on a sell.',
+            'parameters': {
+                'members': members,
+                'weights': weights.tolist(),
+                'min_agree': min_agree,
+                'vote_window': vote_window,
+                'confirm_bars': confirm_bars
+            }
+        }
+    }
@@ -0,0 +1,330 @@
+"""
+Incremental strategy evaluation over a polled bar window.
+
+Live polling re-sends nearly the same window every time: the oldest bars slide out, one or
+two bars are appended and the last (still forming) candle may change. An IncrementalStrategy
+keeps the polled bar history together with the kernel's indicator arrays, output columns and
+per-bar records, splices in each new window and recomputes only a warm-up tail before the
+first changed bar. Recursive indicators (EMAs, cumulative sums, SuperTrend) resume from seeds
+taken from the stored arrays.
+
+Results match running the strategy on the polled window alone, whatever was polled before:
+
+- Path-dependent kernels (any recursive indicator) keep their history anchored at the
+  window's first bar. While polls share that first bar only the tail is recomputed; when the
+  window start moves, the state is recomputed in full on the new window.
+- Kernels built only from rolling windows keep sliding incrementally. Their values past the
+  window's first warm-up do not depend on earlier bars, and that first warm-up is evaluated
+  on the window itself.
+
+Any revision of earlier bars, a gap, or a missing seed also falls back to a full
+recomputation.
+"""
+import json
+import inspect
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.indicator_cache import IndicatorContext
+from utils.confidence_calculator import calculate_signal_confidence
+from strategies.kernels import KERNELS, overlay_frame, with_date_column, unique_string_columns
+from strategies.registry import STRATEGIES
+from strategies.runner import prepare_bars
+
+BAR_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+# Smallest warm-up, enough for the fixed 50-bar windows some kernels use regardless of params
+MIN_WARMUP = 60
+
+# Kernel parameters that are levels or multipliers rather than bar windows
+LEVEL_PARAMS = ('oversold', 'overbought', 'adx_threshold', 'std_dev', 'std_mult', 'volume_mult', 'threshold')
+
+# Strategies whose signals carry confidence scores, scored on the polled window like the strategy does
+SCORED_STRATEGIES = ('ema_crossover',)
+
+
+def warmup_bars(strategy, params=None):
+    """
+    Bars of history a kernel needs before a bar for that bar's values to be final
+
+    Three times the largest window parameter (covers chained windows such as ADX over
+    DI over ATR and the Ichimoku displacement), and at least MIN_WARMUP.
+    """
+    windows = {
+        name: p.default for name, p in inspect.signature(KERNELS[strategy]).parameters.items()
+        if p.default is not inspect.Parameter.empty
+    }
+    windows.update(params or {})
+    lengths = [int(v) for name, v in windows.items()
+               if name not in LEVEL_PARAMS and isinstance(v, (int, float)) and not isinstance(v, bool)]
+    return max([MIN_WARMUP] + [3 * v for v in lengths])
+
+
+def _same_bars(a, b):
+    """Per-row equality of two bar frames of the same length (NaN equals NaN)"""
+    same = a['date'].to_numpy() == b['date'].to_numpy()
+    for column in BAR_COLUMNS:
+        if column not in a.columns:
+            continue
+        x = a[column].to_numpy(dtype=float)
+        y = b[column].to_numpy(dtype=float)
+        same &= (x == y) | (np.isnan(x) & np.isnan(y))
+    return same
+
+
+class IncrementalStrategy:
+    """
+    One strategy/parameter set evaluated over successive polls of a sliding bar window
+    """
+
+    def __init__(self, strategy, params=None):
+        if strategy not in KERNELS:
+            raise ValueError(f"Strategy {strategy} has no array kernel for incremental evaluation")
+        self.strategy = strategy
+        self.params = dict(params or {})
+        self.warmup = warmup_bars(strategy, self.params)
+        self.history = None
+        self.path_dependent = True
+        # True while the stored values were evaluated from the history's first bar
+        self.anchored = True
+        self.arrays = {}
+        self.columns = {}
+        self.records = []
+        self.metadata = None
+        self.last_update = None
+        self.lock = threading.Lock()
+
+    def _evaluate(self, bars, seeds=None, seed_start=0):
+        indicators = IndicatorContext(bars, seeds, seed_start)
+        columns = KERNELS[self.strategy](indicators, **self.params)
+        return indicators.cached(), columns
+
+    def _full(self, bars, reason):
+        self.arrays, self.columns = self._evaluate(bars)
+        self.path_dependent = any(key[0] in IndicatorContext.SEEDED for key in self.arrays)
+        self.anchored = True
+        self.history = bars
+        self.records = overlay_frame(bars, self.columns).to_dict('records')
+        self.last_update = {'mode': 'full', 'reason': reason, 'recomputed_bars': len(bars)}
+
+    def _splice_point(self, bars):
+        """
+        Position in the history where ``bars`` (the new window) starts and where it first differs
+
+        Returns:
+            (offset, first_changed) or None when earlier history was revised or the window
+            does not continue the history
+        """
+        history = self.history
+        if list(bars.columns) != list(history.columns):
+            return None
+        dates = history['date'].to_numpy()
+        offset = int(np.searchsorted(dates, bars['date'].iloc[0]))
+        if offset >= len(history) or dates[offset] != bars['date'].iloc[0]:
+            return None
+        overlap = len(history) - offset
+        if len(bars) < overlap:
+            return None
+        changed = np.flatnonzero(~_same_bars(history.iloc[offset:], bars.iloc[:overlap]))
+        if not len(changed):
+            return offset, len(history)
+        # Only the last (still forming) bar of the history may change
+        if offset + changed[0] < len(history) - 1:
+            return None
+        return offset, offset + int(changed[0])
+
+    def update(self, bars):
+        """
+        Bring the state up to date with the latest window of bars
+
+        Args:
+            bars: Positional bar frame with a 'date' column, oldest first
+
+        Returns:
+            Position of ``bars`` in the stored history
+        """
+        bars = with_date_column(unique_string_columns(bars))
+        splice = self._splice_point(bars) if self.history is not None else None
+        if splice is None:
+            self._full(bars, 'cold' if self.history is None else 'revised')
+            return 0
+
+        offset, first_changed = splice
+        if offset and (self.path_dependent or len(bars) <= 4 * self.warmup):
+            # Recursive indicators start at the window's first bar, as a run on the window would.
+            # A window of a few warm-ups is cheaper to recompute than to splice and re-head.
+            self._full(bars, 're-anchored')
+            return 0
+        if first_changed == len(self.history) == offset + len(bars):
+            self.last_update = {'mode': 'unchanged', 'recomputed_bars': 0}
+            return offset
+        history = pd.concat([self.history.iloc[:first_changed], bars.iloc[first_changed - offset:]], ignore_index=True)
+
+        # Values from `keep` on are replaced (a warm-up back, for forward-shifted series such as
+        # the Ichimoku chikou span). The tail starts another warm-up earlier; recursions resume
+        # half-way into it so series derived from them are warm again by `keep`.
+        keep = first_changed - self.warmup
+        tail_start = keep - self.warmup
+        seed_start = self.warmup // 2
+        if tail_start < 0:
+            self._full(history, 'short history')
+            return offset
+        seeds = {key: values[..., tail_start + seed_start - 1] for key, values in self.arrays.items()
+                 if key[0] in IndicatorContext.SEEDED}
+        if any(np.isnan(seed).any() for seed in seeds.values()):
+            self._full(history, 'unseeded')
+            return offset
+
+        tail = history.iloc[tail_start:].reset_index(drop=True)
+        arrays, columns = self._evaluate(tail, seeds, seed_start)
+        # Columns only emitted around signals (ema_crossover's signal_strength) are NaN elsewhere
+        columns = {name: columns.get(name, np.full(len(tail), np.nan)) for name in self.columns} \
+            if set(columns) <= set(self.columns) else columns
+        if set(arrays) != set(self.arrays) or list(columns) != list(self.columns):
+            self._full(history, 'indicator set changed')
+            return offset
+
+        self.arrays = {
+            key: np.concatenate([self.arrays[key][..., :keep], values[..., self.warmup:]], axis=-1)
+            for key, values in arrays.items()
+        }
+        self.columns = {
+            name: np.concatenate([self.columns[name][:keep], values[self.warmup:]])
+            for name, values in columns.items()
+        }
+        new_rows = tail.iloc[self.warmup:]
+        self.records = self.records[:keep] + overlay_frame(
+            new_rows, {name: values[self.warmup:] for name, values in columns.items()}
+        ).to_dict('records')
+        self.history = history
+        self.last_update = {'mode': 'incremental', 'recomputed_bars': len(tail)}
+
+        # Keep the window plus the two warm-ups the next tail can reach back into
+        drop = max(0, min(offset, len(history) - 2 - 2 * self.warmup))
+        if drop:
+            self.history = history.iloc[drop:].reset_index(drop=True)
+            self.arrays = {key: values[..., drop:] for key, values in self.arrays.items()}
+            self.columns = {name: values[drop:] for name, values in self.columns.items()}
+            self.records = self.records[drop:]
+            self.anchored = False
+            offset -= drop
+        return offset
+
+    def _window_head(self, offset, length):
+        """
+        Records and signals of the window's first warm-up, evaluated on the window alone
+
+        Used when the stored values were evaluated from bars before the window, so those bars
+        get the indicator warm-up (NaN) a run on the window would give them.
+        """
+        head = min(length, self.warmup)
+        # Evaluated over two warm-ups so forward-shifted series are complete for the head
+        window = self.history.iloc[offset:offset + min(length, 2 * self.warmup)].reset_index(drop=True)
+        columns = self._evaluate(window)[1]
+        columns = {name: columns.get(name, np.full(len(window), np.nan))[:head] for name in self.columns}
+        return overlay_frame(window.iloc[:head], columns).to_dict('records'), columns['signal']
+
+    def result(self, offset, length):
+        """
+        Strategy result for ``length`` bars of the history starting at ``offset``
+
+        Returns:
+            dict with data, buy_signals, sell_signals and metadata, like the strategy function
+        """
+        records = self.records[offset:offset + length]
+        signal = self.columns['signal'][offset:offset + length]
+        if offset or not self.anchored:
+            head_records, head_signal = self._window_head(offset, length)
+            records = head_records + records[len(head_records):]
+            signal = np.concatenate([head_signal, signal[len(head_signal):]])
+        buy_list = [{'date': records[i]['date'], 'close': records[i]['close']} for i in np.flatnonzero(signal == 1)]
+        sell_list = [{'date': records[i]['date'], 'close': records[i]['close']} for i in np.flatnonzero(signal == -1)]
+
+        if self.strategy in SCORED_STRATEGIES:
+            # Scored strategies are path-dependent, so their history starts at the window (offset 0)
+            window = self.history.iloc[offset:offset + length].reset_index(drop=True)
+            indicators = IndicatorContext(window)
+            indicators.preload({key: values[..., offset:offset + length] for key, values in self.arrays.items()})
+            window = overlay_frame(window, {name: values[offset:offset + length] for name, values in self.columns.items()})
+            buy_list, sell_list = calculate_signal_confidence(window, buy_list, sell_list, self.strategy, indicators)
+
+        if self.metadata is None:
+            # Metadata only depends on the parameters; take it from one small run of the strategy
+            self.metadata = STRATEGIES[self.strategy](self.history.iloc[:2], **self.params)['metadata']
+        return {
+            'data': records,
+            'buy_signals': buy_list,
+            'sell_signals': sell_list,
+            'metadata': self.metadata
+        }
+
+
+class LiveStrategyCache:
+    """
+    Incremental strategy states keyed by (symbol, strategy, params, resolution), least recently used evicted
+
+    Only windows that can slide incrementally are cached. Strategies without a kernel,
+    path-dependent kernels (every slide re-anchors them) and windows of at most four warm-ups
+    (cheaper to recompute than to splice) run the strategy directly.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._states = OrderedDict()
+        # Strategies found to use recursive indicators, which do not depend on the parameters
+        self._path_dependent = set()
+        self._lock = threading.Lock()
+
+    def _direct_reason(self, strategy, params, length):
+        """Why a poll runs the strategy directly instead of through a cached state, or None"""
+        if strategy not in KERNELS:
+            return 'no kernel'
+        if strategy in self._path_dependent:
+            return 'path-dependent'
+        if length <= 4 * warmup_bars(strategy, params):
+            return 'short window'
+        return None
+
+    def _state(self, key, strategy, params):
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                state = self._states[key] = IncrementalStrategy(strategy, params)
+            self._states.move_to_end(key)
+            while len(self._states) > self.max_entries:
+                self._states.popitem(last=False)
+            return state
+
+    def evaluate(self, df, symbol, strategy, params=None, resolution=None):
+        """
+        Strategy result for the latest bars of a symbol, reusing the previous poll's state
+
+        Returns:
+            The strategy's usual result dict plus 'incremental' ({'mode', 'recomputed_bars', ...});
+            polls run directly report mode 'full' and the reason
+        """
+        params = params or {}
+        df = prepare_bars(df)
+        reason = self._direct_reason(strategy, params, len(df))
+        if reason:
+            result = STRATEGIES[strategy](df, **params)
+            result['incremental'] = {'mode': 'full', 'reason': reason, 'recomputed_bars': len(df)}
+            return result
+
+        key = (symbol, strategy, json.dumps(params, sort_keys=True, default=str), str(resolution))
+        state = self._state(key, strategy, params)
+        with state.lock:
+            offset = state.update(df)
+            result = state.result(offset, len(df))
+            result['incremental'] = dict(state.last_update)
+        if state.path_dependent:
+            # Known after the first full run; later polls of the strategy skip the cache
+            with self._lock:
+                self._path_dependent.add(strategy)
+                self._states.pop(key, None)
+        return result
@@ -0,0 +1,559 @@
+"""
+Array kernels for the rule-based strategies.
+
+Each kernel reads bar columns and indicators from an IndicatorContext and returns the
+columns its strategy adds to the bars, as NumPy arrays in the order the strategy adds
+them (an int64 'signal' array among them). Kernels never touch a DataFrame, so callers
+that only need signals (backtests, optimizers, the screener) can skip building and
+serializing the per-bar output, and the strategy functions are thin wrappers that
+lay the arrays over the unmodified input bars (``overlay_frame``).
+"""
+import numpy as np
+import pandas as pd
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.indicator_cache import resolve_indicator_context
+
+
+def _shift(values, periods=1):
+    """
+    Float copy of ``values`` shifted along the last axis like Series.shift (NaN where no
+    value moves in); stacks of series (e.g. one row per parameter value) shift row by row
+    """
+    values = np.asarray(values, dtype=float)
+    shifted = np.full(values.shape, np.nan)
+    n = values.shape[-1]
+    if periods >= 0:
+        if periods < n:
+            shifted[..., periods:] = values[..., :n - periods]
+    elif -periods < n:
+        shifted[..., :periods] = values[..., -periods:]
+    return shifted
+
+
+def _rolling_mean(values, window):
+    return pd.Series(values).rolling(window=window).mean().to_numpy()
+
+
+def _empty_signal(indicators):
+    return np.zeros(len(indicators), dtype=np.int64)
+
+
+def ema_crossover_kernel(indicators, short_period=9, long_period=21):
+    """Columns of ema_crossover_strategy"""
+    close = indicators.column('close')
+    ema_short = indicators.ema('close', short_period)
+    ema_long = indicators.ema('close', long_period)
+    ema_diff = ema_short - ema_long
+    ema_diff_prev = _shift(ema_diff)
+
+    signal = _empty_signal(indicators)
+    signal[(ema_diff_prev <= 0) & (ema_diff > 0)] = 1
+    signal[(ema_diff_prev >= 0) & (ema_diff < 0)] = -1
+
+    columns = {
+        'ema_short': ema_short,
+        'ema_long': ema_long,
+        'ema_diff': ema_diff,
+        'ema_diff_prev': ema_diff_prev,
+        'signal': signal
+    }
+    # Momentum strength only exists on signal bars (the column is absent without signals)
+    if signal.any():
+        with np.errstate(divide='ignore', invalid='ignore'):
+            columns['signal_strength'] = np.where(signal != 0, np.abs(ema_diff) / close * 100, np.nan)
+    return columns
+
+
+def rsi_kernel(indicators, period=14, oversold=35, overbought=65):
+    """Columns of rsi_strategy"""
+    rsi = indicators.rsi('close', period)
+    rsi_prev = _shift(rsi)
+
+    signal = _empty_signal(indicators)
+    signal[(rsi_prev < oversold) & (rsi >= oversold)] = 1
+    signal[(rsi_prev > overbought) & (rsi <= overbought)] = -1
+    # Extreme RSI crosses override the threshold crosses
+    signal[(rsi < 25) & (rsi_prev >= 25)] = 1
+    signal[(rsi > 75) & (rsi_prev <= 75)] = -1
+
+    return {'rsi': rsi, 'rsi_prev': rsi_prev, 'signal': signal}
+
+
+def macd_kernel(indicators, fast=12, slow=26, signal=9):
+    """Columns of macd_strategy"""
+    macd_line = indicators.ema('close', fast) - indicators.ema('close', slow)
+    signal_line = indicators.ewm('macd_line', ('close', fast, slow), macd_line, signal)
+    histogram = macd_line - signal_line
+    macd_prev = _shift(macd_line)
+    signal_prev = _shift(signal_line)
+    histogram_prev = _shift(histogram)
+
+    crossover = _empty_signal(indicators)
+    crossover[(macd_prev <= signal_prev) & (macd_line > signal_line)] = 1
+    crossover[(macd_prev >= signal_prev) & (macd_line < signal_line)] = -1
+    # Histogram zero-line crosses only fill bars without a line cross
+    crossover[(histogram_prev <= 0) & (histogram > 0) & (crossover == 0)] = 1
+    crossover[(histogram_prev >= 0) & (histogram < 0) & (crossover == 0)] = -1
+
+    return {
+        'macd': macd_line,
+        'signal_line': signal_line,
+        'histogram': histogram,
+        'macd_prev': macd_prev,
+        'signal_prev': signal_prev,
+        'histogram_prev': histogram_prev,
+        'signal': crossover
+    }
+
+
+def bollinger_scalping_kernel(indicators, period=20, std_dev=2):
+    """Columns of bollinger_scalping_strategy"""
+    close = indicators.column('close')
+    sma = indicators.sma('close', period)
+    std = indicators.rolling_std('close', period)
+    upper_band = sma + (std * std_dev)
+    lower_band = sma - (std * std_dev)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        band_width = (upper_band - lower_band) / sma
+    close_prev = _shift(close)
+    upper_prev = _shift(upper_band)
+    lower_prev = _shift(lower_band)
+
+    signal = _empty_signal(indicators)
+    signal[(close_prev > lower_prev) & (close <= lower_band)] = 1
+    signal[(close_prev < upper_prev) & (close >= upper_band)] = -1
+    # Mean reversion from the bands back towards the SMA
+    reversion_buy = (close_prev <= lower_prev) & (close > lower_band) & (close < sma)
+    reversion_sell = (close_prev >= upper_prev) & (close < upper_band) & (close > sma)
+    signal[reversion_buy & (signal == 0)] = 1
+    signal[reversion_sell & (signal == 0)] = -1
+
+    return {
+        'sma': sma,
+        'upper_band': upper_band,
+        'lower_band': lower_band,
+        'band_width': band_width,
+        'band_width_prev': _shift(band_width),
+        'close_prev': close_prev,
+        'signal': signal
+    }
+
+
+def _supertrend_pass(close, upper_band, lower_band, period, seed=None, start=0):
+    """
+    Single pass over plain float buffers.
+
+    Reads and writes go through Python lists built from the NumPy arrays, which
+    avoids per-element pandas indexing. NaN comparisons behave exactly like the
+    Series version (they are always False, so the previous value carries over).
+    With a ``seed`` (line, direction) of the bar before ``start`` the pass resumes
+    there instead of starting at bar ``period``.
+    """
+    n = len(close)
+    supertrend = np.full(n, np.nan)
+    direction = np.full(n, np.nan)
+    if seed is None and n <= period:
+        return supertrend, direction
+
+    close_l = close.tolist()
+    upper_l = upper_band.tolist()
+    lower_l = lower_band.tolist()
+    st_out = supertrend.tolist()
+    dir_out = direction.tolist()
+
+    if seed is None:
+        st_prev = lower_l[period]
+        dir_prev = 1.0
+        st_out[period] = st_prev
+        dir_out[period] = dir_prev
+        start = period + 1
+    else:
+        st_prev, dir_prev = float(seed[0]), float(seed[1])
+
+    for i in range(start, n):
+        c = close_l[i]
+        if c > st_prev:
+            st_prev = lower_l[i]
+            dir_prev = 1.0
+        elif c < st_prev:
+            st_prev = upper_l[i]
+            dir_prev = -1.0
+        st_out[i] = st_prev
+        dir_out[i] = dir_prev
+
+    return np.array(st_out, dtype=float), np.array(dir_out, dtype=float)
+
+
+def supertrend_lines(indicators, period=10, multiplier=3):
+    """SuperTrend line and direction (+1/-1) arrays, cached per (period, multiplier)"""
+    def compute():
+        hl_avg = (indicators.column('high') + indicators.column('low')) / 2
+        atr = indicators.atr(period)
+        upper_band = hl_avg + (multiplier * atr)
+        lower_band = hl_avg - (multiplier * atr)
+        seed = indicators.seeds.get(('supertrend', (period, multiplier)))
+        return np.vstack(_supertrend_pass(indicators.column('close'), upper_band, lower_band, period,
+                                          seed, indicators.seed_start))
+    lines = indicators.get('supertrend', (period, multiplier), compute)
+    return lines[0], lines[1]
+
+
+def supertrend_kernel(indicators, period=10, multiplier=3):
+    """Columns of supertrend_strategy"""
+    supertrend, direction = supertrend_lines(indicators, period, multiplier)
+    direction_prev = _shift(direction)
+
+    signal = _empty_signal(indicators)
+    signal[(direction_prev == -1) & (direction == 1)] = 1
+    signal[(direction_prev == 1) & (direction == -1)] = -1
+
+    return {'supertrend': supertrend, 'direction': direction, 'direction_prev': direction_prev, 'signal': signal}
+
+
+def donchian_midlines(indicators, windows):
+    """(highest high + lowest low) / 2 for each window, from one multi-window extrema pass per side"""
+    highs = indicators.rolling_extrema('high', windows, 'max')
+    lows = indicators.rolling_extrema('low', windows, 'min')
+    return {window: (highs[window] + lows[window]) / 2 for window in windows}
+
+
+def ichimoku_kernel(indicators, tenkan=9, kijun=26, senkou_b=52):
+    """Columns of ichimoku_strategy"""
+    close = indicators.column('close')
+    midlines = donchian_midlines(indicators, (tenkan, kijun, senkou_b))
+    tenkan_sen = midlines[tenkan]
+    kijun_sen = midlines[kijun]
+    senkou_a = _shift((tenkan_sen + kijun_sen) / 2, kijun)
+    senkou_b_line = _shift(midlines[senkou_b], kijun)
+    chikou_span = _shift(close, -kijun)
+    cloud_top = np.fmax(senkou_a, senkou_b_line)
+    cloud_bottom = np.fmin(senkou_a, senkou_b_line)
+    tenkan_prev = _shift(tenkan_sen)
+    kijun_prev = _shift(kijun_sen)
+    close_prev = _shift(close)
+
+    tk_buy = (tenkan_prev <= kijun_prev) & (tenkan_sen > kijun_sen)
+    tk_sell = (tenkan_prev >= kijun_prev) & (tenkan_sen < kijun_sen)
+    cloud_buy = (close_prev <= _shift(cloud_top)) & (close > cloud_top)
+    cloud_sell = (close_prev >= _shift(cloud_bottom)) & (close < cloud_bottom)
+
+    signal = _empty_signal(indicators)
+    # Strong signals (TK cross on the right side of the cloud) first, then plain TK or cloud crosses
+    signal[tk_buy & (close > cloud_top)] = 1
+    signal[(tk_buy | cloud_buy) & (signal == 0)] = 1
+    signal[tk_sell & (close < cloud_bottom)] = -1
+    signal[(tk_sell | cloud_sell) & (signal == 0)] = -1
+
+    return {
+        'tenkan_sen': tenkan_sen,
+        'kijun_sen': kijun_sen,
+        'senkou_a': senkou_a,
+        'senkou_b': senkou_b_line,
+        'chikou_span': chikou_span,
+        'cloud_top': cloud_top,
+        'cloud_bottom': cloud_bottom,
+        'tenkan_prev': tenkan_prev,
+        'kijun_prev': kijun_prev,
+        'close_prev': close_prev,
+        'signal': signal
+    }
+
+
+def adx_dmi_kernel(indicators, period=14, adx_threshold=25):
+    """Columns of adx_dmi_strategy"""
+    high = indicators.column('high')
+    low = indicators.column('low')
+    prev_close = _shift(indicators.column('close'))
+    up_move = high - _shift(high)
+    down_move = _shift(low) - low
+    plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0)
+    minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0)
+
+    atr = indicators.atr(period)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        plus_di = 100 * (_rolling_mean(plus_dm, period) / atr)
+        minus_di = 100 * (_rolling_mean(minus_dm, period) / atr)
+        dx = 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di)
+    adx = _rolling_mean(dx, period)
+    plus_di_prev = _shift(plus_di)
+    minus_di_prev = _shift(minus_di)
+    adx_prev = _shift(adx)
+
+    di_buy = (plus_di_prev <= minus_di_prev) & (plus_di > minus_di)
+    di_sell = (minus_di_prev <= plus_di_prev) & (minus_di > plus_di)
+
+    signal = _empty_signal(indicators)
+    # Strong trend (ADX above threshold), then moderate (20..threshold), then rising ADX
+    signal[di_buy & (adx > adx_threshold)] = 1
+    signal[di_sell & (adx > adx_threshold)] = -1
+    moderate = (adx >= 20) & (adx <= adx_threshold) & (signal == 0)
+    signal[di_buy & moderate] = 1
+    signal[di_sell & moderate] = -1
+    rising = (adx > adx_prev) & (signal == 0)
+    signal[di_buy & rising] = 1
+    signal[di_sell & rising] = -1
+
+    return {
+        'high_low': high - low,
+        'high_close': np.abs(high - prev_close),
+        'low_close': np.abs(low - prev_close),
+        'true_range': indicators.true_range(),
+        'up_move': up_move,
+        'down_move': down_move,
+        'plus_dm': plus_dm,
+        'minus_dm': minus_dm,
+        'adx': adx,
+        'plus_di': plus_di,
+        'minus_di': minus_di,
+        'plus_di_prev': plus_di_prev,
+        'minus_di_prev': minus_di_prev,
+        'adx_prev': adx_prev,
+        'signal': signal
+    }
+
+
+def vwap_kernel(indicators, use_bands=True, std_mult=2):
+    """Columns of vwap_strategy"""
+    close = indicators.column('close')
+    volume = indicators.column('volume')
+    typical_price = (indicators.column('high') + indicators.column('low') + close) / 3
+    tp_volume = typical_price * volume
+    cum_volume = indicators.cumsum('volume', volume)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        vwap = indicators.cumsum('tp_volume', tp_volume) / cum_volume
+    columns = {'tp_volume': tp_volume, 'vwap': vwap}
+    if use_bands:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            std = np.sqrt(indicators.cumsum('vwap_deviation', (typical_price - vwap) ** 2 * volume) / cum_volume)
+        columns['vwap_upper'] = upper = vwap + (std * std_mult)
+        columns['vwap_lower'] = lower = vwap - (std * std_mult)
+    close_prev = _shift(close)
+    vwap_prev = _shift(vwap)
+
+    signal = _empty_signal(indicators)
+    signal[(close_prev <= vwap_prev) & (close > vwap)] = 1
+    signal[(close_prev >= vwap_prev) & (close < vwap)] = -1
+    if use_bands:
+        lower_prev = _shift(lower)
+        upper_prev = _shift(upper)
+        # Bounce off the lower band / rejection at the upper band
+        band_buy = (close_prev <= lower_prev) & (close > lower) & (close < vwap)
+        band_sell = (close_prev >= upper_prev) & (close < upper) & (close > vwap)
+        signal[band_buy & (signal == 0)] = 1
+        signal[band_sell & (signal == 0)] = -1
+        # Band breakouts on above-average volume
+        busy = volume > indicators.sma('volume', 20)
+        signal[(close_prev < upper_prev) & (close > upper) & busy & (signal == 0)] = 1
+        signal[(close_prev > lower_prev) & (close < lower) & busy & (signal == 0)] = -1
+
+    columns.update({'close_prev': close_prev, 'vwap_prev': vwap_prev, 'signal': signal})
+    return columns
+
+
+def breakout_kernel(indicators, period=20, volume_confirm=True, volume_mult=1.5):
+    """Columns of breakout_strategy"""
+    high = indicators.column('high')
+    low = indicators.column('low')
+    close = indicators.column('close')
+    volume = indicators.column('volume')
+    support = indicators.rolling_min('low', period)
+    resistance = indicators.rolling_max('high', period)
+    avg_volume = indicators.sma('volume', period)
+    close_prev = _shift(close)
+    resistance_prev = _shift(resistance)
+    support_prev = _shift(support)
+
+    breakout_up = (close_prev <= resistance_prev) & (close > resistance)
+    breakout_down = (close_prev >= support_prev) & (close < support)
+
+    signal = _empty_signal(indicators)
+    if volume_confirm:
+        confirmed = volume > (avg_volume * volume_mult)
+        signal[breakout_up & confirmed] = 1
+        signal[breakout_down & confirmed] = -1
+        moderate = (volume > avg_volume) & (volume <= avg_volume * volume_mult)
+        signal[breakout_up & moderate & (signal == 0)] = 1
+        signal[breakout_down & moderate & (signal == 0)] = -1
+    else:
+        signal[breakout_up] = 1
+        signal[breakout_down] = -1
+
+    # Retests of the broken level
+    signal[(close_prev > resistance_prev) & (low <= resistance) & (close > resistance) & (signal == 0)] = 1
+    signal[(close_prev < support_prev) & (high >= support) & (close < support) & (signal == 0)] = -1
+
+    # Breakouts on range expansion
+    bar_range = high - low
+    avg_range = indicators.get('avg_range', (period,), lambda: _rolling_mean(bar_range, period))
+    expansion = bar_range > (avg_range * 1.5)
+    signal[breakout_up & expansion & (signal == 0)] = 1
+    signal[breakout_down & expansion & (signal == 0)] = -1
+
+    return {
+        'support': support,
+        'resistance': resistance,
+        'avg_volume': avg_volume,
+        'high_prev': _shift(high),
+        'low_prev': _shift(low),
+        'close_prev': close_prev,
+        'resistance_prev': resistance_prev,
+        'support_prev': support_prev,
+        'signal': signal,
+        'range': bar_range,
+        'avg_range': avg_range
+    }
+
+
+def ml_lstm_kernel(indicators, lookback=60, threshold=0.02):
+    """Columns of ml_lstm_strategy"""
+    close = indicators.column('close')
+    volume = indicators.column('volume')
+    returns = pd.Series(close).pct_change()
+    momentum_5 = returns.rolling(window=5).mean().to_numpy()
+    momentum_10 = returns.rolling(window=10).mean().to_numpy()
+    momentum_20 = returns.rolling(window=20).mean().to_numpy()
+    volatility = returns.rolling(window=20).std().to_numpy()
+    sma_20 = indicators.sma('close', 20)
+    sma_50 = indicators.sma('close', 50)
+    volume_ma = indicators.sma('volume', 20)
+    rsi = indicators.rsi('close', 14)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        price_to_sma20 = (close - sma_20) / sma_20
+        price_to_sma50 = (close - sma_50) / sma_50
+        volume_ratio = volume / volume_ma
+
+    # Simulated ML score: positive is bullish, negative bearish
+    ml_score = (
+        (momentum_5 * 3) +
+        (momentum_10 * 2) +
+        (momentum_20 * 1) +
+        (price_to_sma20 * 2) +
+        (price_to_sma50 * 1) +
+        ((rsi - 50) / 100) +
+        ((volume_ratio - 1) * 0.5)
+    )
+    ml_score_smooth = _rolling_mean(ml_score, 3)
+    ml_score_prev = _shift(ml_score_smooth)
+
+    buy = (ml_score_prev <= threshold) & (ml_score_smooth > threshold)
+    sell = (ml_score_prev >= -threshold) & (ml_score_smooth < -threshold)
+    signal = _empty_signal(indicators)
+    signal[buy] = 1
+    signal[sell] = -1
+    signal[buy & (ml_score_smooth > threshold * 2) & (volume_ratio > 1.2)] = 1
+    signal[sell & (ml_score_smooth < -threshold * 2) & (volume_ratio > 1.2)] = -1
+    # Oversold/overbought reversals only fill bars without a score cross
+    signal[(rsi < 30) & (momentum_5 > 0) & (ml_score_smooth > 0) & (signal == 0)] = 1
+    signal[(rsi > 70) & (momentum_5 < 0) & (ml_score_smooth < 0) & (signal == 0)] = -1
+
+    return {
+        'returns': returns.to_numpy(),
+        'momentum_5': momentum_5,
+        'momentum_10': momentum_10,
+        'momentum_20': momentum_20,
+        'volatility': volatility,
+        'sma_20': sma_20,
+        'sma_50': sma_50,
+        'price_to_sma20': price_to_sma20,
+        'price_to_sma50': price_to_sma50,
+        'volume_ma': volume_ma,
+        'volume_ratio': volume_ratio,
+        'rsi': rsi,
+        'ml_score': ml_score,
+        'ml_score_smooth': ml_score_smooth,
+        'ml_score_prev': ml_score_prev,
+        'signal': signal
+    }
+
+
+KERNELS = {
+    'ema_crossover': ema_crossover_kernel,
+    'rsi': rsi_kernel,
+    'macd': macd_kernel,
+    'bollinger_scalping': bollinger_scalping_kernel,
+    'supertrend': supertrend_kernel,
+    'ichimoku': ichimoku_kernel,
+    'adx_dmi': adx_dmi_kernel,
+    'vwap': vwap_kernel,
+    'breakout': breakout_kernel,
+    'ml_lstm': ml_lstm_kernel
+}
+
+
+def with_date_column(df):
+    """``df`` with its index as a 'date' column if it has none (a new frame sharing the bar data)"""
+    if 'date' in df.columns:
+        return df
+    if df.index.name == 'date':
+        return df.reset_index()
+    return df.assign(date=df.index)
+
+
+def unique_string_columns(df):
+    """``df`` with string column labels and only the first of any duplicated column"""
+    labels = pd.Index([str(c) for c in df.columns])
+    if labels.is_unique and labels.equals(df.columns):
+        return df
+    df = df.set_axis(labels, axis=1)
+    return df.loc[:, ~labels.duplicated()]
+
+
+def overlay_frame(bars, columns):
+    """
+    Strategy output frame: the input bar columns followed by the derived ``columns``
+
+    The bars are treated as immutable and the derived arrays are wrapped without copying.
+    Under copy-on-write (always on from pandas 3; app.py opts in on pandas 2) the bars are
+    shared too, so neither side is duplicated per request; without it ``concat`` copies the
+    bars, which gives the same frame at the cost of the copy.
+    """
+    overlay = pd.DataFrame(columns, index=bars.index, copy=False)
+    if bars.columns.intersection(overlay.columns).empty:
+        return pd.concat([bars, overlay], axis=1)
+    # A derived column replacing an input column (e.g. a stale 'signal') keeps its position
+    return bars.assign(**columns)
+
+
+def signal_points(df, signal):
+    """Buy and sell bars as lists of {'date', 'close'} records"""
+    points = df[['date', 'close']]
+    return points[signal == 1].to_dict('records'), points[signal == -1].to_dict('records')
+
+
+def signal_records(df, signal):
+    """
+    Per-bar {'date', 'open', 'high', 'low', 'close', 'volume', 'signal'} records
+
+    Built from whole columns: dates as strings, prices as floats, volume and the signal
+    (NaN = 0) as ints, zipped into dicts without a per-bar lookup.
+    """
+    signal = np.nan_to_num(np.asarray(signal, dtype=float)).astype(np.int64)
+    columns = {
+        'date': df['date'].astype(str).tolist(),
+        'open': df['open'].to_numpy(dtype=float).tolist(),
+        'high': df['high'].to_numpy(dtype=float).tolist(),
+        'low': df['low'].to_numpy(dtype=float).tolist(),
+        'close': df['close'].to_numpy(dtype=float).tolist(),
+        'volume': df['volume'].to_numpy(dtype=float).astype(np.int64).tolist(),
+        'signal': signal.tolist()
+    }
+    keys = list(columns)
+    return [dict(zip(keys, row)) for row in zip(*columns.values())]
+
+
+def strategy_signals(df, strategy, params=None, indicators=None):
+    """
+    Signal column (1 = buy, -1 = sell, 0 = hold) of a strategy as a float array
+
+    Uses the strategy's kernel when it has one, so no per-bar output is built;
+    other strategies (e.g. the ensemble) run in full.
+    """
+    params = params or {}
+    if strategy in KERNELS:
+        return KERNELS[strategy](resolve_indicator_context(df, indicators), **params)['signal'].astype(float)
+    # Imported here because the registry imports the strategy modules, which import this one
+    from strategies.registry import STRATEGIES
+    result = STRATEGIES[strategy](df, indicators=indicators, **params)
+    return np.array([row.get('signal', 0) or 0 for row in result['data']], dtype=float)
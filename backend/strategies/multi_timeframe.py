@@ -0,0 +1,144 @@
+import pandas as pd
+import numpy as np
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from strategies.registry import STRATEGIES
+from strategies.kernels import strategy_signals
+from strategies.runner import prepare_bars
+from strategies.ensemble import member_votes
+
+STATE_LABELS = {1: 'bullish', -1: 'bearish', 0: 'neutral'}
+
+
+def timeframe_offset(timeframe):
+    """Pandas offset for a yfinance/pandas-style timeframe ('5m', '1h', '1d', '1wk', '15min', ...)"""
+    text = str(timeframe).strip().lower()
+    for suffix, unit in (('min', 'min'), ('wk', 'W'), ('mo', 'MS'), ('m', 'min'), ('h', 'h'), ('d', 'D')):
+        if text.endswith(suffix):
+            digits = text[:-len(suffix)] or '1'
+            if digits.isdigit():
+                return pd.tseries.frequencies.to_offset(f"{int(digits)}{unit}")
+    raise ValueError(f"Unsupported timeframe: {timeframe}")
+
+
+def _span(offset):
+    """Approximate length of an offset (calendar offsets measured from a Monday)"""
+    start = pd.Timestamp('2000-01-03')
+    return (start + offset) - start
+
+
+def finest_timeframe(timeframes):
+    """The shortest of several timeframes"""
+    return min(timeframes, key=lambda tf: _span(timeframe_offset(tf)))
+
+
+def resample_bars(df, rule):
+    """
+    Aggregate bars to a coarser timeframe
+
+    Returns:
+        OHLCV DataFrame with one row per non-empty period, a 'date' column (period start) and a
+        'close_time' column (period end): the first moment the bar is final
+    """
+    resampled = df.set_index('date').resample(rule, label='left', closed='left').agg({
+        'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'
+    })
+    resampled = resampled.dropna(subset=['close']).reset_index()
+    resampled['close_time'] = resampled['date'] + rule
+    return resampled
+
+
+def _signal_state(df, strategy, params):
+    signal = strategy_signals(df, strategy, params)
+    return signal, member_votes(signal[:, None])[:, 0]
+
+
+def multi_timeframe_analysis(df, strategy, timeframes, params=None):
+    """
+    Run a strategy on several timeframes built from one base series and measure their agreement
+
+    Each coarser timeframe is resampled locally from the base bars. A timeframe's state
+    (+1 after its last buy, -1 after its last sell) is aligned onto the base bars by close time
+    with merge_asof, so a base bar only sees higher-timeframe periods that had already ended
+    (a daily state is first used on the next day's bars).
+
+    Args:
+        df: Base OHLCV bars at the finest timeframe requested
+        strategy: Strategy name from STRATEGIES
+        timeframes: Timeframes such as ['1d', '1h', '5m']; the finest should match the base bars
+        params: Optional strategy parameters used on every timeframe
+
+    Returns:
+        dict with per-timeframe summaries, aligned states on the base index and confluence
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy: {strategy}")
+    base = prepare_bars(df)[['date', 'open', 'high', 'low', 'close', 'volume']]
+    base['date'] = pd.to_datetime(base['date'])
+    base = base.sort_values('date', kind='mergesort').reset_index(drop=True)
+    if len(base) < 2:
+        raise ValueError("Need at least 2 base bars")
+    base_step = base['date'].diff().median()
+
+    offsets = sorted(((timeframe_offset(tf), tf) for tf in timeframes), key=lambda item: _span(item[0]), reverse=True)
+    base_close_time = base['date'] + base_step
+    aligned = {}
+    summaries = {}
+    for offset, timeframe in offsets:
+        if _span(offset) <= base_step:
+            bars = base.assign(close_time=base_close_time)
+        else:
+            bars = resample_bars(base, offset)
+        signal, state = _signal_state(bars[['date', 'open', 'high', 'low', 'close', 'volume']], strategy, params)
+
+        states = pd.DataFrame({'close_time': bars['close_time'], 'state': state})
+        lookup = pd.merge_asof(
+            pd.DataFrame({'close_time': base_close_time}), states, on='close_time', direction='backward'
+        )
+        aligned[timeframe] = lookup['state'].fillna(0).to_numpy()
+
+        # A period still in progress at the last base bar is not final yet and is left out
+        final = (bars['close_time'] <= base_close_time.iloc[-1]).to_numpy()
+        fired = np.flatnonzero((signal != 0) & final)
+        last = fired[-1] if len(fired) else None
+        summaries[timeframe] = {
+            'bars': int(final.sum()),
+            'state': STATE_LABELS[int(aligned[timeframe][-1])],
+            'last_signal': None if last is None else {
+                'type': 'BUY' if signal[last] > 0 else 'SELL',
+                'date': pd.Timestamp(bars['date'].iloc[last]).isoformat(),
+                'close': float(bars['close'].iloc[last])
+            }
+        }
+
+    matrix = np.column_stack([aligned[tf] for _, tf in offsets])
+    score = matrix.mean(axis=1)
+    all_bull = (matrix == 1).all(axis=1)
+    all_bear = (matrix == -1).all(axis=1)
+    prev_bull = np.concatenate([[False], all_bull[:-1]])
+    prev_bear = np.concatenate([[False], all_bear[:-1]])
+    dates = base['date']
+
+    latest = matrix[-1]
+    return {
+        'strategy': strategy,
+        'timeframes': [tf for _, tf in offsets],
+        'summaries': summaries,
+        'aligned': {
+            'date': [pd.Timestamp(d).isoformat() for d in dates],
+            'close': base['close'].tolist(),
+            'states': {tf: aligned[tf].astype(int).tolist() for _, tf in offsets},
+            'confluence': np.round(score, 4).tolist()
+        },
+        'confluence': {
+            'state': 'bullish' if all_bull[-1] else 'bearish' if all_bear[-1] else 'mixed',
+            'score': float(score[-1]),
+            'agreeing': int(max((latest == 1).sum(), (latest == -1).sum())),
+            'of': int(len(latest)),
+            'bullish_since': [pd.Timestamp(d).isoformat() for d in dates[all_bull & ~prev_bull]],
+            'bearish_since': [pd.Timestamp(d).isoformat() for d in dates[all_bear & ~prev_bear]],
+            'pct_bars_bullish': round(float(all_bull.mean() * 100), 1),
+            'pct_bars_bearish': round(float(all_bear.mean() * 100), 1)
+        }
+    }
@@ -0,0 +1,221 @@
+import numpy as np
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.indicator_cache import resolve_indicator_context
+from strategies.kernels import _shift
+from backtesting.metrics import positions_from_signals, simple_returns, performance_metrics
+
+# Upper bound on elements per (params..., bars) block so large grids on long histories stay in memory
+MAX_BLOCK_ELEMENTS = 4_000_000
+
+
+def _unique_stack(values, compute):
+    """Compute one row per unique parameter value and return (stack, positions of each input value)"""
+    values = list(values)
+    unique = sorted(set(values))
+    stack = np.vstack([compute(v) for v in unique]) if unique else np.empty((0, 0))
+    lookup = {v: i for i, v in enumerate(unique)}
+    return stack, np.array([lookup[v] for v in values], dtype=int)
+
+
+def _evaluate_blocks(signal_block, grid_shape, close, periods_per_year):
+    """Run the metrics for every block produced by ``signal_block(start, stop)`` over the first grid axis"""
+    n_bars = len(close)
+    returns = simple_returns(close)
+    inner = int(np.prod(grid_shape[1:])) if len(grid_shape) > 1 else 1
+    rows_per_block = max(1, MAX_BLOCK_ELEMENTS // max(1, inner * n_bars))
+
+    metrics = None
+    for start in range(0, grid_shape[0], rows_per_block):
+        stop = min(grid_shape[0], start + rows_per_block)
+        signals = signal_block(start, stop)
+        block = performance_metrics(positions_from_signals(signals), returns, periods_per_year)
+        if metrics is None:
+            metrics = {name: np.empty(grid_shape, dtype=float) for name in block}
+        for name, values in block.items():
+            metrics[name][start:stop] = values
+    return metrics
+
+
+def _best(metrics, axes, objective='sharpe'):
+    """Parameter combination with the highest objective value"""
+    scores = np.where(np.isfinite(metrics[objective]), metrics[objective], -np.inf)
+    position = np.unravel_index(int(np.argmax(scores)), scores.shape)
+    best = {name: axes[name][i] for name, i in zip(axes, position)}
+    best.update({metric: float(values[position]) for metric, values in metrics.items()})
+    return best
+
+
+def ema_crossover_surface(df, short_periods, long_periods, periods_per_year=252, indicators=None):
+    """
+    Evaluate ema_crossover_strategy over a whole (short_period x long_period) grid at once
+
+    EMAs are computed once per distinct span; crossover signals and long/flat returns
+    are then computed for every combination with broadcasting over a (short, long, bars)
+    array. Signals match ema_crossover_strategy for each combination.
+
+    Returns:
+        dict with 'axes' (parameter values per axis), 'metrics' (arrays shaped like the grid)
+        and 'best' (the highest-Sharpe combination)
+    """
+    indicators = resolve_indicator_context(df, indicators)
+    close = df['close'].to_numpy(dtype=float)
+    short_periods = [int(p) for p in short_periods]
+    long_periods = [int(p) for p in long_periods]
+
+    emas, rows = _unique_stack(short_periods + long_periods, lambda span: indicators.ema('close', span))
+    short_emas = emas[rows[:len(short_periods)]]
+    long_emas = emas[rows[len(short_periods):]]
+
+    def signal_block(start, stop):
+        ema_diff = short_emas[start:stop, None, :] - long_emas[None, :, :]
+        ema_diff_prev = _shift(ema_diff)
+        buy = (ema_diff_prev <= 0) & (ema_diff > 0)
+        sell = (ema_diff_prev >= 0) & (ema_diff < 0)
+        return np.where(sell, -1, np.where(buy, 1, 0))
+
+    grid_shape = (len(short_periods), len(long_periods))
+    metrics = _evaluate_blocks(signal_block, grid_shape, close, periods_per_year)
+    axes = {'short_period': short_periods, 'long_period': long_periods}
+    return {'strategy': 'ema_crossover', 'axes': axes, 'metrics': metrics, 'best': _best(metrics, axes)}
+
+
+def rsi_surface(df, periods, oversold_levels, overbought_levels, periods_per_year=252, indicators=None):
+    """
+    Evaluate rsi_strategy over a (period x oversold x overbought) grid at once
+
+    RSI is computed once per period and thresholds are broadcast against it, reproducing
+    rsi_strategy's signal precedence (threshold crosses, then extreme 25/75 crosses).
+    """
+    indicators = resolve_indicator_context(df, indicators)
+    close = df['close'].to_numpy(dtype=float)
+    periods = [int(p) for p in periods]
+    oversold = np.asarray(oversold_levels, dtype=float)
+    overbought = np.asarray(overbought_levels, dtype=float)
+
+    rsi_stack, rows = _unique_stack(periods, lambda period: indicators.rsi('close', period))
+    rsi_stack = rsi_stack[rows]
+    rsi_prev_stack = _shift(rsi_stack)
+
+    def signal_block(start, stop):
+        rsi = rsi_stack[start:stop, None, None, :]
+        rsi_prev = rsi_prev_stack[start:stop, None, None, :]
+        low = oversold[None, :, None, None]
+        high = overbought[None, None, :, None]
+
+        signal = np.where((rsi_prev < low) & (rsi >= low), 1, 0)
+        signal = np.where((rsi_prev > high) & (rsi <= high), -1, signal)
+        signal = np.where((rsi < 25) & (rsi_prev >= 25), 1, signal)
+        signal = np.where((rsi > 75) & (rsi_prev <= 75), -1, signal)
+        return signal
+
+    grid_shape = (len(periods), len(oversold), len(overbought))
+    metrics = _evaluate_blocks(signal_block, grid_shape, close, periods_per_year)
+    axes = {'period': periods, 'oversold': oversold.tolist(), 'overbought': overbought.tolist()}
+    return {'strategy': 'rsi', 'axes': axes, 'metrics': metrics, 'best': _best(metrics, axes)}
+
+
+def supertrend_surface(df, periods, multipliers, periods_per_year=252, indicators=None):
+    """
+    Evaluate supertrend_strategy over a (period x multiplier) grid at once
+
+    The SuperTrend recurrence is inherently sequential in time, so it runs as one pass
+    over the bars with every parameter combination advanced together as a vector.
+    """
+    indicators = resolve_indicator_context(df, indicators)
+    close = df['close'].to_numpy(dtype=float)
+    hl_avg = ((df['high'] + df['low']) / 2).to_numpy(dtype=float)
+    periods = [int(p) for p in periods]
+    multipliers = np.asarray(multipliers, dtype=float)
+    n_bars = len(close)
+
+    atr_stack, rows = _unique_stack(periods, indicators.atr)
+    atr = atr_stack[rows][:, None, :]
+    upper = (hl_avg + multipliers[None, :, None] * atr).reshape(-1, n_bars)
+    lower = (hl_avg - multipliers[None, :, None] * atr).reshape(-1, n_bars)
+    start = np.repeat(periods, len(multipliers))
+
+    supertrend = np.full(upper.shape, np.nan)
+    direction = np.full(upper.shape, np.nan)
+    st_prev = np.full(len(start), np.nan)
+    dir_prev = np.full(len(start), np.nan)
+    for t in range(n_bars):
+        c = close[t]
+        st_new = np.where(c > st_prev, lower[:, t], np.where(c < st_prev, upper[:, t], st_prev))
+        dir_new = np.where(c > st_prev, 1.0, np.where(c < st_prev, -1.0, dir_prev))
+        seeded = start == t
+        st_new = np.where(seeded, lower[:, t], st_new)
+        dir_new = np.where(seeded, 1.0, dir_new)
+        st_prev = np.where(start <= t, st_new, np.nan)
+        dir_prev = np.where(start <= t, dir_new, np.nan)
+        supertrend[:, t] = st_prev
+        direction[:, t] = dir_prev
+
+    direction = direction.reshape(len(periods), len(multipliers), n_bars)
+    direction_prev = _shift(direction)
+
+    def signal_block(block_start, block_stop):
+        cur = direction[block_start:block_stop]
+        prev = direction_prev[block_start:block_stop]
+        signal = np.where((prev == -1) & (cur == 1), 1, 0)
+        return np.where((prev == 1) & (cur == -1), -1, signal)
+
+    grid_shape = (len(periods), len(multipliers))
+    metrics = _evaluate_blocks(signal_block, grid_shape, close, periods_per_year)
+    axes = {'period': periods, 'multiplier': multipliers.tolist()}
+    return {'strategy': 'supertrend', 'axes': axes, 'metrics': metrics, 'best': _best(metrics, axes)}
+
+
+# Batched evaluators by strategy name, with the grid axes each one takes
+PARAM_SURFACES = {
+    'ema_crossover': (ema_crossover_surface, ['short_period', 'long_period']),
+    'rsi': (rsi_surface, ['period', 'oversold', 'overbought']),
+    'supertrend': (supertrend_surface, ['period', 'multiplier'])
+}
+
+
+# Grids used when a request does not specify an axis
+DEFAULT_GRIDS = {
+    'ema_crossover': {'short_period': list(range(5, 55, 5)), 'long_period': list(range(20, 210, 10))},
+    'rsi': {'period': list(range(6, 30, 2)), 'oversold': [20, 25, 30, 35, 40], 'overbought': [60, 65, 70, 75, 80]},
+    'supertrend': {'period': list(range(5, 25, 1)), 'multiplier': [1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0]}
+}
+
+
+def parse_grid_axis(text):
+    """
+    Parse a grid axis from a query string: 'start:stop:step' (stop exclusive) or 'a,b,c'
+    """
+    text = str(text).strip()
+    if ':' in text:
+        parts = [float(p) for p in text.split(':')]
+        start, stop = parts[0], parts[1]
+        step = parts[2] if len(parts) > 2 else 1
+        if step <= 0:
+            raise ValueError(f"Grid step must be positive: {text}")
+        values = np.arange(start, stop, step)
+    else:
+        values = np.array([float(p) for p in text.split(',') if p.strip()])
+    return [int(v) if float(v).is_integer() else float(v) for v in values]
+
+
+def evaluate_param_surface(name, df, grid, periods_per_year=252, indicators=None):
+    """
+    Evaluate a named strategy over a parameter grid
+
+    Args:
+        name: Strategy name with a batched evaluator (see PARAM_SURFACES)
+        df: DataFrame with OHLCV data
+        grid: dict of {axis_name: list of values}; every axis of the strategy is required
+
+    Returns:
+        dict with 'axes', 'metrics' and 'best'
+    """
+    if name not in PARAM_SURFACES:
+        raise ValueError(f"No parameter surface for strategy '{name}'. Available: {list(PARAM_SURFACES)}")
+    func, axis_names = PARAM_SURFACES[name]
+    missing = [axis for axis in axis_names if axis not in grid]
+    if missing:
+        raise ValueError(f"Missing grid axes for {name}: {missing}")
+    return func(df, *[grid[axis] for axis in axis_names], periods_per_year=periods_per_year, indicators=indicators)
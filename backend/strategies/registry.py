@@ -0,0 +1,28 @@
+# Strategy registry shared by the API and batch/research tooling
+from .ema_crossover import ema_crossover_strategy
+from .rsi_strategy import rsi_strategy
+from .macd_strategy import macd_strategy
+from .bollinger_scalping import bollinger_scalping_strategy
+from .supertrend import supertrend_strategy
+from .ichimoku_strategy import ichimoku_strategy
+from .adx_dmi_strategy import adx_dmi_strategy
+from .vwap_strategy import vwap_strategy
+from .breakout_strategy import breakout_strategy
+from .ml_lstm_strategy import ml_lstm_strategy
+from .ensemble import ensemble_strategy
+
+# Strategy mapping
+STRATEGIES = {
+    'ema_crossover': ema_crossover_strategy,
+    'rsi': rsi_strategy,
+    'macd': macd_strategy,
+    'bollinger_scalping': bollinger_scalping_strategy,
+    'supertrend': supertrend_strategy,
+    'ichimoku': ichimoku_strategy,
+    'adx_dmi': adx_dmi_strategy,
+    'vwap': vwap_strategy,
+    'breakout': breakout_strategy,
+    'ml_lstm': ml_lstm_strategy,
+    # Virtual strategy voting over the others (see strategies/ensemble.py)
+    'ensemble': ensemble_strategy
+}
@@ -1,5 +1,10 @@
 import pandas as pd
 import numpy as np
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.indicator_cache import resolve_indicator_context
+from strategies.kernels import rsi_kernel, overlay_frame, with_date_column, signal_points
 
 def calculate_rsi(data, period=14):
     """Calculate Relative Strength Index"""
@@ -11,7 +16,7 @@ def calculate_rsi(data, period=14):
     rsi = 100 - (100 / (1 + rs))
     return rsi
 
-def rsi_strategy(df, period=14, oversold=35, overbought=65):
+def rsi_strategy(df, period=14, oversold=35, overbought=65, indicators=None):
     """
     RSI Strategy
     
@@ -23,52 +28,26 @@ def rsi_strategy(df, period=14, oversold=35, overbought=65):
         period: RSI period (default: 14)
         oversold: Oversold threshold (default: 35)
         overbought: Overbought threshold (default: 65)
+        indicators: Optional IndicatorContext shared across strategies running on the same bars
     
     Returns:
         dict with signals, data, and metadata
     """
-    df = df.copy()
+    # Ensure date is a column, not index (input bars are shared, never modified)
+    df = with_date_column(df)
     
-    # Ensure date is a column, not index
-    if 'date' not in df.columns and df.index.name == 'date':
-        df.reset_index(inplace=True)
-    elif 'date' not in df.columns:
-        df['date'] = df.index
-    
-    # Calculate RSI
-    df['rsi'] = calculate_rsi(df['close'], period)
-    df['rsi_prev'] = df['rsi'].shift(1)
-    
-    # Generate signals - detect crossovers
-    df['signal'] = 0
-    
-    # Buy signal: RSI crosses above oversold threshold (was below, now above)
-    buy_condition = (df['rsi_prev'] < oversold) & (df['rsi'] >= oversold)
-    df.loc[buy_condition, 'signal'] = 1
-    
-    # Sell signal: RSI crosses below overbought threshold (was above, now below)  
-    sell_condition = (df['rsi_prev'] > overbought) & (df['rsi'] <= overbought)
-    df.loc[sell_condition, 'signal'] = -1
-    
-    # Also generate signals for extreme RSI values for better coverage
-    extreme_buy = (df['rsi'] < 25) & (df['rsi_prev'] >= 25)  # Extreme oversold
-    extreme_sell = (df['rsi'] > 75) & (df['rsi_prev'] <= 75)  # Extreme overbought
-    
-    df.loc[extreme_buy, 'signal'] = 1
-    df.loc[extreme_sell, 'signal'] = -1
+    # Indicator and signal columns from the array kernel
+    indicators = resolve_indicator_context(df, indicators)
+    columns = rsi_kernel(indicators, period, oversold, overbought)
+    df = overlay_frame(df, columns)
     
     # Extract buy and sell points
-    buy_signals = df[df['signal'] == 1].copy()
-    sell_signals = df[df['signal'] == -1].copy()
-    
-    # Add RSI value to signals for context
-    buy_signals['rsi_value'] = buy_signals['rsi']
-    sell_signals['rsi_value'] = sell_signals['rsi']
+    buy_list, sell_list = signal_points(df, columns['signal'])
     
     return {
         'data': df.to_dict('records'),
-        'buy_signals': buy_signals[['date', 'close']].to_dict('records'),
-        'sell_signals': sell_signals[['date', 'close']].to_dict('records'),
+        'buy_signals': buy_list,
+        'sell_signals': sell_list,
         'metadata': {
             'name': 'RSI Strategy',
             'description': f'Relative Strength Index strategy with {period}-period RSI. Buy when RSI is below {oversold} (oversold), sell when RSI is above {overbought} (overbought).',
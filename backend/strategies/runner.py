@@ -0,0 +1,151 @@
+import inspect
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.indicator_cache import IndicatorContext
+from strategies.registry import STRATEGIES
+from backtesting.metrics import positions_from_signals, simple_returns, held_positions
+
+BAR_FIELDS = ['date', 'open', 'high', 'low', 'close', 'volume']
+
+
+def prepare_bars(df):
+    """Normalize a fetched frame so every strategy sees the same positional bars with a 'date' column"""
+    if 'date' not in df.columns:
+        if 'datetime' in df.columns:
+            df = df.rename(columns={'datetime': 'date'})
+        else:
+            index_name = df.index.name or 'index'
+            df = df.reset_index().rename(columns={index_name: 'date'})
+    return df.reset_index(drop=True)
+
+
+def check_params(name, params):
+    """Raise ValueError unless ``params`` is a dict of keyword arguments the strategy accepts"""
+    if not isinstance(params, dict):
+        raise ValueError("params must be a JSON object")
+    accepted = [p for p in inspect.signature(STRATEGIES[name]).parameters if p not in ('df', 'indicators')]
+    unknown = [p for p in params if p not in accepted]
+    if unknown:
+        raise ValueError(f"Unknown parameters for {name}: {unknown}. Accepted: {accepted}")
+    # The ensemble passes {member: {param: value}} on to its members
+    member_params = params.get('params') if name == 'ensemble' else None
+    if member_params is not None:
+        if not isinstance(member_params, dict):
+            raise ValueError("ensemble params must map member names to parameter objects")
+        for member, values in member_params.items():
+            if member not in STRATEGIES or member == 'ensemble':
+                raise ValueError(f"Invalid ensemble member: {member}")
+            check_params(member, values)
+
+
+def compact_bars(df):
+    """One array per OHLCV field instead of one dict per bar"""
+    bars = {}
+    for field in BAR_FIELDS:
+        if field not in df.columns:
+            continue
+        if field == 'date':
+            bars[field] = [pd.Timestamp(d).isoformat() for d in df['date']]
+        else:
+            values = df[field].to_numpy(dtype=float)
+            bars[field] = [None if not np.isfinite(v) else v for v in values.tolist()]
+    return bars
+
+
+def summarize_signals(df, signal):
+    """Summary metrics for a signal column, trading long on buys and going flat on sells"""
+    close = df['close'].to_numpy(dtype=float)
+    signal = np.asarray(signal, dtype=float)
+    position = positions_from_signals(signal)
+
+    returns = simple_returns(close)
+
+    # Yesterday's position earns today's return
+    held = held_positions(position)
+    strategy_return = float(np.prod(1 + held * returns) - 1) if len(returns) else 0.0
+    buy_and_hold = float(close[-1] / close[0] - 1) if len(close) > 1 and close[0] else 0.0
+
+    # Round trips: entry on a flat->long change, exit on the following long->flat change
+    change = np.diff(np.concatenate([[0.0], position]))
+    entries = np.flatnonzero(change > 0)
+    exits = np.flatnonzero(change < 0)
+    num_trades = min(len(entries), len(exits))
+    trade_returns = close[exits[:num_trades]] / close[entries[:num_trades]] - 1 if num_trades else np.array([])
+    win_rate = float((trade_returns > 0).mean() * 100) if num_trades else None
+
+    latest_signal = None
+    fired = np.flatnonzero(signal != 0)
+    if len(fired):
+        last = fired[-1]
+        latest_signal = {
+            'type': 'BUY' if signal[last] > 0 else 'SELL',
+            'date': pd.Timestamp(df['date'].iloc[last]).isoformat() if 'date' in df.columns else int(last),
+            'close': float(close[last]),
+            'bars_ago': int(len(signal) - 1 - last)
+        }
+
+    return {
+        'buy_count': int((signal == 1).sum()),
+        'sell_count': int((signal == -1).sum()),
+        'strategy_return_pct': round(strategy_return * 100, 2),
+        'buy_and_hold_return_pct': round(buy_and_hold * 100, 2),
+        'num_trades': int(num_trades),
+        'win_rate': round(win_rate, 1) if win_rate is not None else None,
+        'exposure_pct': round(float(position.mean() * 100), 1) if len(position) else 0.0,
+        'latest_signal': latest_signal
+    }
+
+
+def _run_one(name, df, params, indicators):
+    strategy_func = STRATEGIES[name]
+    result = strategy_func(df, indicators=indicators, **params)
+    signal = [row.get('signal', 0) for row in result['data']]
+    return {
+        'buy_signals': result['buy_signals'],
+        'sell_signals': result['sell_signals'],
+        'metadata': result['metadata'],
+        'summary': summarize_signals(df, signal)
+    }
+
+
+def run_strategies_batch(df, strategies, params=None, max_workers=4):
+    """
+    Run several strategies over one set of bars with a shared indicator cache
+
+    Args:
+        df: DataFrame with OHLCV data (fetched once by the caller)
+        strategies: List of strategy names from STRATEGIES
+        params: Optional dict of {strategy_name: {param: value}}
+        max_workers: Thread pool size for running strategies concurrently
+
+    Returns:
+        dict with compact 'bars', per-strategy 'strategies' results and any 'errors'
+    """
+    params = params or {}
+    df = prepare_bars(df)
+    indicators = IndicatorContext(df)
+
+    results = {}
+    errors = {}
+    workers = max(1, min(max_workers, len(strategies)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            name: executor.submit(_run_one, name, df, params.get(name) or {}, indicators)
+            for name in strategies
+        }
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                errors[name] = str(e)
+
+    return {
+        'bars': compact_bars(df),
+        'strategies': results,
+        'errors': errors,
+        'indicator_cache': {'computed': indicators.misses, 'reused': indicators.hits}
+    }
@@ -0,0 +1,85 @@
+import pandas as pd
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from strategies.registry import STRATEGIES
+from strategies.kernels import strategy_signals
+from strategies.runner import prepare_bars
+from utils.indicator_cache import IndicatorContext
+
+SIGNAL_TYPES = {'buy': (1,), 'sell': (-1,), 'any': (1, -1)}
+
+
+def latest_signal_match(df, strategy, params=None, within_bars=3, signal_type='buy'):
+    """
+    Latest signal of a strategy on one symbol if it fired within the last ``within_bars`` bars
+
+    Returns:
+        dict with type, date, close, bars_ago and confidence fields, or None when nothing matched
+    """
+    df = prepare_bars(df)
+    indicators = IndicatorContext(df)
+    signal = strategy_signals(df, strategy, params, indicators)
+    fired = np.flatnonzero(np.isin(signal, SIGNAL_TYPES[signal_type]))
+    if not len(fired) or len(signal) - 1 - fired[-1] >= within_bars:
+        return None
+
+    last = fired[-1]
+    kind = 'BUY' if signal[last] > 0 else 'SELL'
+    date = df['date'].iloc[last]
+    match = {
+        'type': kind,
+        'date': pd.Timestamp(date).isoformat() if date is not None else int(last),
+        'close': float(df['close'].iloc[last]),
+        'bars_ago': int(len(signal) - 1 - last)
+    }
+    # Confidence comes from the strategy's own signal list for that bar, built only for matches
+    result = STRATEGIES[strategy](df, indicators=indicators, **(params or {}))
+    for entry in result['buy_signals' if kind == 'BUY' else 'sell_signals']:
+        if str(entry.get('date')) == str(date):
+            match.update({k: entry[k] for k in ('confidence', 'confidence_label', 'factors') if k in entry})
+            break
+    return match
+
+
+def screen_universe(bars, strategy, params=None, within_bars=3, signal_type='buy', max_workers=8):
+    """
+    Find the symbols whose strategy signal fired recently
+
+    Args:
+        bars: dict of {symbol: DataFrame with OHLCV bars} (loaded once by the caller)
+        strategy: Strategy name from STRATEGIES
+        params: Optional strategy parameters
+        within_bars: Only signals in the last N bars match (1 = the latest bar)
+        signal_type: 'buy', 'sell' or 'any'
+        max_workers: Thread pool size for evaluating symbols concurrently
+
+    Returns:
+        (list of matches sorted by recency then confidence, dict of {symbol: error message})
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy: {strategy}")
+    if signal_type not in SIGNAL_TYPES:
+        raise ValueError(f"signal_type must be one of {list(SIGNAL_TYPES)}")
+
+    matches = []
+    errors = {}
+    workers = max(1, min(max_workers, len(bars)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            symbol: executor.submit(latest_signal_match, df, strategy, params, within_bars, signal_type)
+            for symbol, df in bars.items()
+        }
+        for symbol, future in futures.items():
+            try:
+                match = future.result()
+            except Exception as e:
+                errors[symbol] = str(e)
+                continue
+            if match is not None:
+                matches.append({'symbol': symbol, 'signal': match})
+
+    matches.sort(key=lambda m: (m['signal']['bars_ago'], -(m['signal'].get('confidence') or 0)))
+    return matches, errors
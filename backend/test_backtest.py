@@ -0,0 +1,78 @@
+import numpy as np
+
+from strategies.registry import STRATEGIES
+from backtesting.vectorized import run_backtest, backtest_report
+from utils.synthetic_market import synthetic_bars
+
+# The vectorized backtester against a bar-by-bar cash and shares simulation of each strategy's signals
+
+print("Testing backtesting.vectorized...")
+print("-" * 50)
+
+failures = 0
+
+
+def check(name, ok, detail=''):
+    global failures
+    if ok:
+        print(f"✓ {name}")
+    else:
+        failures += 1
+        print(f"✗ {name}{': ' + detail if detail else ''}")
+
+
+def simulate(close, signal, commission, slippage, capital):
+    """Fill at the signal bar's close, all in on buys, all out on sells"""
+    cash, shares, entry = capital, 0.0, None
+    equity, trades = [], []
+    for t, price in enumerate(close):
+        if signal[t] == 1 and not shares:
+            entry = price * (1 + slippage)
+            shares, cash = cash * (1 - commission) / entry, 0.0
+        elif signal[t] == -1 and shares:
+            exit_price = price * (1 - slippage)
+            cash, shares = shares * exit_price * (1 - commission), 0.0
+            trades.append(exit_price / entry * (1 - commission) ** 2 - 1)
+        equity.append(cash + shares * price)
+    return np.array(equity), np.array(trades)
+
+
+bars = synthetic_bars(1500, seed=23, volatility=0.4)
+close = bars['close'].to_numpy(dtype=float)
+
+for name in ('ema_crossover', 'rsi', 'macd', 'supertrend', 'vwap', 'breakout'):
+    result = STRATEGIES[name](bars)
+    signal = [row.get('signal', 0) for row in result['data']]
+    for commission, slippage in ((0.0, 0.0), (0.001, 0.0005)):
+        backtest = run_backtest(close, signal, commission=commission, slippage=slippage, initial_capital=10000)
+        equity, trades = simulate(close, signal, commission, slippage, 10000)
+        label = f"{name} (commission={commission}, slippage={slippage})"
+        check(f"{label}: equity matches the simulation", np.allclose(backtest['equity'], equity))
+        check(f"{label}: {len(trades)} trades with the same returns",
+              backtest['metrics']['num_trades'] == len(trades) and np.allclose(backtest['trades']['return'], trades))
+        drawdown = equity / np.maximum.accumulate(np.maximum(equity, 10000)) - 1
+        check(f"{label}: drawdown and final equity",
+              np.allclose(backtest['drawdown'], drawdown) and np.isclose(backtest['metrics']['final_equity'], equity[-1])
+              and np.isclose(backtest['metrics']['max_drawdown'], drawdown.min()))
+
+# Report: trades labelled with their bar dates, most recent kept first by max_trades
+signal = [row.get('signal', 0) for row in STRATEGIES['macd'](bars)['data']]
+backtest = run_backtest(close, signal)
+report = backtest_report(backtest, bars['date'])
+first = report['trades'][0]
+check("report trades carry their entry and exit dates",
+      first['entry_date'] == bars['date'].iloc[backtest['trades']['entry_bar'][0]].isoformat()
+      and first['bars_held'] == backtest['trades']['exit_bar'][0] - backtest['trades']['entry_bar'][0])
+check("max_trades keeps the most recent trades", backtest_report(backtest, bars['date'], max_trades=3)['trades'] == report['trades'][-3:])
+
+# Entry costs on the very first bar are a drawdown from the starting capital
+first_bar = run_backtest(close[:50], [1] + [0] * 49, commission=0.01)
+check("entry costs on the first bar count as drawdown",
+      first_bar['drawdown'][0] < 0 and np.isclose(first_bar['metrics']['max_drawdown'], min(first_bar['drawdown'])))
+
+empty = run_backtest([], [])
+check("an empty series backtests to the starting capital", empty['metrics']['final_equity'] == 10000 and empty['metrics']['num_trades'] == 0)
+
+print()
+print("-" * 50)
+print("All backtest checks passed" if not failures else f"{failures} backtest check(s) failed")
@@ -0,0 +1,76 @@
+import numpy as np
+
+from strategies.registry import STRATEGIES
+from strategies.runner import run_strategies_batch
+from utils.synthetic_market import synthetic_bars
+
+# The batch runner against each strategy run on its own, with a per-bar loop for the summary
+
+print("Testing strategies.runner.run_strategies_batch...")
+print("-" * 50)
+
+failures = 0
+
+
+def check(name, ok, detail=''):
+    global failures
+    if ok:
+        print(f"✓ {name}")
+    else:
+        failures += 1
+        print(f"✗ {name}{': ' + detail if detail else ''}")
+
+
+def reference_summary(close, signal):
+    """Long on buys, flat on sells, yesterday's position earns today's return"""
+    position, equity, entry, trades = 0, 1.0, None, []
+    for t in range(len(close)):
+        if t and position:
+            equity *= close[t] / close[t - 1]
+        if signal[t] == 1 and not position:
+            position, entry = 1, close[t]
+        elif signal[t] == -1 and position:
+            position = 0
+            trades.append(close[t] / entry - 1)
+    return {
+        'strategy_return_pct': round((equity - 1) * 100, 2),
+        'num_trades': len(trades),
+        'win_rate': round(float(np.mean(np.array(trades) > 0) * 100), 1) if trades else None,
+    }
+
+
+bars = synthetic_bars(1200, seed=14, volatility=0.4)
+names = [name for name in STRATEGIES if name != 'ml_lstm']
+params = {'ema_crossover': {'short_period': 5, 'long_period': 30}, 'rsi': {'period': 10}}
+batch = run_strategies_batch(bars, names, params)
+
+close = bars['close'].to_numpy(dtype=float)
+for name in names:
+    expected = STRATEGIES[name](bars, **params.get(name, {}))
+    actual = batch['strategies'].get(name)
+    if actual is None:
+        check(f"{name} ran", False, batch['errors'].get(name, 'missing'))
+        continue
+    check(f"{name} signals match its own run",
+          actual['buy_signals'] == expected['buy_signals'] and actual['sell_signals'] == expected['sell_signals'])
+    signal = [row.get('signal', 0) for row in expected['data']]
+    summary = reference_summary(close, signal)
+    check(f"{name} summary matches a per-bar loop",
+          all(actual['summary'][key] == value for key, value in summary.items()),
+          f"{ {key: actual['summary'][key] for key in summary} } vs {summary}")
+
+check("bars are sent once, one array per field",
+      batch['bars']['close'] == bars['close'].tolist() and len(batch['bars']['date']) == len(bars))
+check(f"indicators are shared ({batch['indicator_cache']})", batch['indicator_cache']['reused'] > 0)
+
+failing = run_strategies_batch(bars, ['macd', 'rsi'], {'rsi': {'no_such_param': 1}})
+check("a failing strategy is reported without stopping the others",
+      'rsi' in failing['errors'] and 'macd' in failing['strategies'])
+
+indexed = run_strategies_batch(bars.set_index('date'), ['macd'])
+check("bars indexed by date give the same result",
+      indexed['strategies']['macd']['buy_signals'] == batch['strategies']['macd']['buy_signals'])
+
+print()
+print("-" * 50)
+print("All batch checks passed" if not failures else f"{failures} batch check(s) failed")
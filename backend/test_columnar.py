@@ -0,0 +1,99 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+from strategies.registry import STRATEGIES
+from utils.response_format import (
+    dumps, columnar, columnar_strategy_result, columnar_prediction_result, parse_format, parse_time_encoding
+)
+from utils.synthetic_market import synthetic_bars
+from benchmarks.bench_serialization import clean_nan_values
+
+# Columnar payloads against the row-format document (clean_nan_values + stdlib json) of the same result
+
+print("Testing utils.response_format columnar payloads...")
+print("-" * 50)
+
+failures = 0
+
+
+def check(name, ok, detail=''):
+    global failures
+    if ok:
+        print(f"✓ {name}")
+    else:
+        failures += 1
+        print(f"✗ {name}{': ' + detail if detail else ''}")
+
+
+def rows_document(obj):
+    return json.loads(json.dumps(clean_nan_values(obj)))
+
+
+def epoch(text):
+    return None if text is None else int(pd.Timestamp(text).timestamp())
+
+
+bars = synthetic_bars(700, '1h', seed=45, volatility=0.4)
+for name, strategy in STRATEGIES.items():
+    if name == 'ml_lstm':
+        continue
+    result = strategy(bars)
+    rows = rows_document(result['data'])
+    for times in ('iso', 'epoch'):
+        payload = json.loads(dumps(columnar_strategy_result(result, time_encoding=times)))
+        data = payload['data']
+        expected = {f: [row.get(f) for row in rows] for f in rows[0]}
+        expected['date'] = [epoch(d) for d in expected['date']] if times == 'epoch' else expected['date']
+        bad = [f for f in expected if data['columns'].get(f) != expected[f]]
+        check(f"{name} ({times} times): every column holds the rows' values", not bad and data['fields'] == list(rows[0])
+              and data['length'] == len(rows), f"differs in {bad}")
+    others = {k: v for k, v in payload.items() if k != 'data'}
+    check(f"{name}: signals and metadata are unchanged", others == rows_document({k: v for k, v in result.items() if k != 'data'}))
+
+result = STRATEGIES['macd'](bars)
+rows = rows_document(result['data'])
+projected = json.loads(dumps(columnar(result['data'], ['signal', 'date', 'close'])))
+check("fields keep only the requested columns, in the order given",
+      projected['fields'] == ['signal', 'date', 'close'] and list(projected['columns']) == projected['fields']
+      and projected['columns']['close'] == [row['close'] for row in rows]
+      and projected['columns']['date'] == [epoch(row['date']) for row in rows])
+frame = pd.DataFrame(result['data'])
+check("a DataFrame and its records give the same payload",
+      json.loads(dumps(columnar(frame, time_encoding='iso'))) == json.loads(dumps(columnar(result['data'], time_encoding='iso'))))
+check("an empty result has no fields", columnar([])['fields'] == [] and columnar([])['length'] == 0)
+
+aware = bars.assign(date=bars['date'].dt.tz_localize('America/New_York'))
+aware_rows = rows_document(aware.to_dict('records'))
+check("zoned timestamps encode as UTC epoch seconds",
+      list(columnar(aware, ['date'])['columns']['date']) == [epoch(row['date']) for row in aware_rows])
+gaps = pd.DataFrame({'date': [bars['date'][0], pd.NaT, bars['date'][2]], 'close': [1.0, np.nan, np.inf]})
+check("missing timestamps and NaN/infinite values are null",
+      json.loads(dumps(columnar(gaps)))['columns'] == {'date': [epoch(bars['date'][0].isoformat()), None, epoch(bars['date'][2].isoformat())],
+                                                       'close': [1.0, None, None]})
+
+# Predictions: the parallel per-date lists move into one columnar series
+dates = [d.isoformat() for d in bars['date'][:50]]
+prediction = {'symbol': 'TEST', 'accuracy': 0.61, 'dates': dates, 'predictions': list(np.linspace(0, 1, 50)),
+              'actual': [float('nan')] * 5 + [1.0] * 45, 'probabilities': [0.5, 0.7]}
+encoded = json.loads(dumps(columnar_prediction_result(prediction, time_encoding='iso')))
+rows = rows_document(prediction)
+check("prediction series hold the per-date lists",
+      encoded['series']['fields'] == ['dates', 'predictions', 'actual']
+      and all(encoded['series']['columns'][f] == rows[f] for f in ('dates', 'predictions', 'actual')))
+check("prediction lists of another length and scalars stay in place",
+      {k: v for k, v in encoded.items() if k != 'series'} == {k: rows[k] for k in ('symbol', 'accuracy', 'probabilities')})
+
+for label, call in [("an unknown field", lambda: columnar(result['data'], ['close', 'nope'])),
+                    ("an unknown format", lambda: parse_format('xml')),
+                    ("an unknown time encoding", lambda: parse_time_encoding('unix'))]:
+    try:
+        call()
+        check(f"{label} is rejected", False, "no error")
+    except ValueError:
+        check(f"{label} is rejected", True)
+
+print()
+print("-" * 50)
+print("All columnar checks passed" if not failures else f"{failures} columnar check(s) failed")
@@ -0,0 +1,57 @@
+import numpy as np
+
+from utils.confidence_calculator import (
+    calculate_signal_confidence, calculate_batch_signal_confidence, calculate_single_signal_confidence
+)
+from utils.indicator_cache import IndicatorContext
+from utils.synthetic_market import synthetic_bars
+
+# Batch confidence scoring against scoring each signal on its own
+
+print("Testing utils.confidence_calculator...")
+print("-" * 50)
+
+failures = 0
+
+
+def check(name, ok, detail=''):
+    global failures
+    if ok:
+        print(f"✓ {name}")
+    else:
+        failures += 1
+        print(f"✗ {name}{': ' + detail if detail else ''}")
+
+
+def single_scores(df, positions, signal_type, strategy_type):
+    return [calculate_single_signal_confidence(df, int(idx), signal_type, strategy_type) for idx in positions]
+
+
+df = synthetic_bars(600, seed=21, volatility=0.5)
+# Every bar, including the warm-up bars where the rolling factors are still NaN
+positions = np.arange(len(df))
+for signal_type in ('buy', 'sell'):
+    batch = calculate_batch_signal_confidence(df, positions, signal_type, 'technical', IndicatorContext(df))
+    single = single_scores(df, positions, signal_type, 'technical')
+    mismatches = sum(a != b for a, b in zip(batch, single))
+    check(f"{signal_type} scores match single-signal scoring on every bar",
+          len(batch) == len(single) and not mismatches, f"{mismatches} of {len(single)} differ")
+
+no_volume = df.drop(columns=['volume'])
+batch = calculate_batch_signal_confidence(no_volume, positions, 'buy', 'technical')
+check("scores without a volume column match", batch == single_scores(no_volume, positions, 'buy', 'technical'))
+
+# Signals are matched to bars by date (first occurrence on duplicate dates); unknown dates are left unscored
+doubled = df.iloc[np.r_[0:400, 300:600]].reset_index(drop=True)
+signals = [{'date': doubled['date'].iloc[i], 'price': 1.0} for i in (10, 350, 450, 650)] + [{'date': 'not a bar', 'price': 1.0}]
+buys, _ = calculate_signal_confidence(doubled, [dict(s) for s in signals], [], 'technical')
+expected_positions = [10, 350, 350, 650]
+for signal, idx in zip(buys, expected_positions):
+    confidence = calculate_single_signal_confidence(doubled, idx, 'buy', 'technical')
+    check(f"signal on {signal['date']} is scored at its first matching bar",
+          signal.get('confidence') == confidence['score'] and signal.get('factors') == confidence['factors'])
+check("a signal with an unknown date is left unscored", 'confidence' not in buys[-1])
+
+print()
+print("-" * 50)
+print("All confidence checks passed" if not failures else f"{failures} confidence check(s) failed")
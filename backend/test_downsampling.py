@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+
+from strategies.registry import STRATEGIES
+from backtesting.vectorized import run_backtest, backtest_report
+from utils.downsampling import lttb_indices, ohlc_bucket_starts, downsample_frame, downsample_strategy_result
+from utils.synthetic_market import synthetic_bars
+
+# Downsampled payloads against the full strategy result they were reduced from
+
+print("Testing utils.downsampling...")
+print("-" * 50)
+
+failures = 0
+
+
+def check(name, ok, detail=''):
+    global failures
+    if ok:
+        print(f"✓ {name}")
+    else:
+        failures += 1
+        print(f"✗ {name}{': ' + detail if detail else ''}")
+
+
+def reference_lttb(y, threshold):
+    """Textbook LTTB loop (no kept bars)"""
+    n = len(y)
+    every = (n - 2) / (threshold - 2)
+    a, picked = 0, [0]
+    for i in range(threshold - 2):
+        start, end = int(i * every) + 1, int((i + 1) * every) + 1
+        next_start, next_end = end, min(int((i + 2) * every) + 1, n)
+        if i == threshold - 3:
+            avg_x, avg_y = n - 1, y[n - 1]
+        else:
+            avg_x, avg_y = np.mean(np.arange(next_start, next_end)), np.mean(y[next_start:next_end])
+        best, best_area = start, -1.0
+        for j in range(start, min(end, n - 1)):
+            area = abs((a - avg_x) * (y[j] - y[a]) - (a - j) * (avg_y - y[a]))
+            if area > best_area:
+                best, best_area = j, area
+        a = best
+        picked.append(a)
+    picked.append(n - 1)
+    return np.array(picked)
+
+
+bars = synthetic_bars(20000, seed=6, volatility=0.4)
+close = bars['close'].to_numpy()
+
+for max_points in (50, 500):
+    check(f"LTTB picks match the reference loop (max_points={max_points})",
+          np.array_equal(lttb_indices(close, max_points), reference_lttb(close, max_points)))
+
+# The cap holds on the total, however many bars must be kept
+for kept in (0, 10, 400, 5000):
+    keep = np.sort(np.random.default_rng(kept).choice(len(bars), kept, replace=False))
+    for max_points in (3, 7, 100, 1000):
+        lttb = lttb_indices(close, max_points, keep)
+        starts = ohlc_bucket_starts(len(bars), max_points, keep)
+        check(f"{kept} kept bars, max_points={max_points}: LTTB {len(lttb)}, OHLC {len(starts)} points",
+              len(lttb) <= max_points and len(starts) <= max_points)
+        if 2 * kept < max_points:
+            check("  every kept bar survives while they fit",
+                  np.isin(keep, lttb).all() and np.isin(keep, starts).all() and np.isin(keep + 1, np.append(starts, len(bars))).all())
+
+# OHLC buckets against a groupby over the same buckets
+starts = ohlc_bucket_starts(len(bars), 300)
+reduced, _ = downsample_frame(bars, 300, 'ohlc')
+groups = bars.groupby(np.searchsorted(starts, np.arange(len(bars)), side='right') - 1)
+expected = pd.DataFrame({'date': groups['date'].first(), 'open': groups['open'].first(), 'high': groups['high'].max(),
+                         'low': groups['low'].min(), 'close': groups['close'].last(), 'volume': groups['volume'].sum()})
+check("OHLC candles aggregate their buckets",
+      np.allclose(reduced[['open', 'high', 'low', 'close', 'volume']].to_numpy(dtype=float),
+                  expected[['open', 'high', 'low', 'close', 'volume']].to_numpy(dtype=float))
+      and (reduced['date'].to_numpy() == expected['date'].to_numpy()).all())
+
+# Strategy results: rows are original bars, signal bars survive, backtest curves and trades follow
+for strategy in ('macd', 'supertrend'):
+    result = STRATEGIES[strategy](bars)
+    signal = [row.get('signal', 0) for row in result['data']]
+    result['backtest'] = backtest_report(run_backtest(close, signal), bars['date'])
+    full_rows = {row['date']: row for row in result['data']}
+    signal_dates = {row['date'] for row in result['data'] if row.get('signal')}
+    trades = result['backtest']['trades']
+    for method in ('lttb', 'ohlc'):
+        for max_points in (200, 5000):
+            reduced = downsample_strategy_result(result, max_points, method)
+            data = reduced['data']
+            label = f"{strategy} {method} max_points={max_points}"
+            check(f"{label}: {len(data)} bars within the cap", len(data) <= max_points and reduced['downsampled']['points'] == len(data))
+            check(f"{label}: curves follow the bars",
+                  len(reduced['backtest']['equity']) == len(data) == len(reduced['backtest']['drawdown']))
+            kept_trades = reduced['backtest']['trades']
+            check(f"{label}: trades capped to the most recent",
+                  len(kept_trades) <= max_points and kept_trades == trades[len(trades) - len(kept_trades):])
+            fits = len(signal_dates) <= (max_points - 3 if method == 'lttb' else (max_points - 1) // 2)
+            if fits:
+                signal_rows = [row for row in data if row.get('signal')]
+                check(f"{label}: every signal bar is kept unchanged",
+                      len(signal_rows) == len(signal_dates) and all(full_rows[row['date']] == row for row in signal_rows))
+            if method == 'lttb':
+                check(f"{label}: every bar is an original bar", all(full_rows[row['date']] == row for row in data))
+
+print()
+print("-" * 50)
+print("All downsampling checks passed" if not failures else f"{failures} downsampling check(s) failed")
@@ -0,0 +1,107 @@
+import numpy as np
+
+from strategies.registry import STRATEGIES
+from strategies.ensemble import signal_matrix, member_votes, ensemble_strategy, DEFAULT_MEMBERS
+from strategies.runner import check_params
+from utils.synthetic_market import synthetic_bars
+
+# Ensemble voting against the member strategies' own outputs and a per-bar reference loop
+
+print("Testing strategies.ensemble...")
+print("-" * 50)
+
+failures = 0
+
+
+def check(name, ok, detail=''):
+    global failures
+    if ok:
+        print(f"✓ {name}")
+    else:
+        failures += 1
+        print(f"✗ {name}{': ' + detail if detail else ''}")
+
+
+def strategy_signal(df, strategy, params=None):
+    result = STRATEGIES[strategy](df, **(params or {}))
+    return np.array([row.get('signal', 0) or 0 for row in result['data']], dtype=float)
+
+
+def reference_votes(signals, vote_window):
+    votes = np.zeros(signals.shape)
+    for col in range(signals.shape[1]):
+        last_value, last_bar = 0.0, None
+        for t in range(signals.shape[0]):
+            if signals[t, col] != 0:
+                last_value, last_bar = signals[t, col], t
+            if last_bar is not None and (vote_window is None or t - last_bar < vote_window):
+                votes[t, col] = last_value
+    return votes
+
+
+def reference_signal(score, min_agree, confirm_bars):
+    signal = np.zeros(len(score))
+    bull_run = bear_run = 0
+    was_bullish = was_bearish = False
+    for t, value in enumerate(score):
+        bull_run = bull_run + 1 if value >= min_agree else 0
+        bear_run = bear_run + 1 if value <= -min_agree else 0
+        bullish, bearish = bull_run >= confirm_bars, bear_run >= confirm_bars
+        if bullish and not was_bullish:
+            signal[t] = 1
+        elif bearish and not was_bearish:
+            signal[t] = -1
+        was_bullish, was_bearish = bullish, bearish
+    return signal
+
+
+df = synthetic_bars(1500, seed=8, volatility=0.35)
+member_params = {'ema_crossover': {'short_period': 5, 'long_period': 20}, 'macd': {'fast': 8}}
+
+matrix = signal_matrix(df, DEFAULT_MEMBERS, member_params)
+for col, name in enumerate(DEFAULT_MEMBERS):
+    check(f"{name} column matches the member strategy", np.array_equal(matrix[:, col], strategy_signal(df, name, member_params.get(name))))
+
+for vote_window in (None, 1, 10):
+    check(f"member votes (vote_window={vote_window})",
+          np.array_equal(member_votes(matrix, vote_window), reference_votes(matrix, vote_window)))
+
+weights = [1, 2, 1, 1, 0.5]
+for min_agree, vote_window, confirm_bars in [(3, None, 1), (2, 10, 1), (2.5, None, 3), (1, 5, 2)]:
+    result = ensemble_strategy(df, weights=weights, min_agree=min_agree, vote_window=vote_window,
+                               confirm_bars=confirm_bars, params=member_params)
+    score = reference_votes(matrix, vote_window) @ np.asarray(weights)
+    actual = np.array([row['signal'] for row in result['data']], dtype=float)
+    expected = reference_signal(score, min_agree, confirm_bars)
+    check(f"ensemble signals (min_agree={min_agree}, vote_window={vote_window}, confirm_bars={confirm_bars})",
+          np.array_equal(actual, expected), f"{int(np.count_nonzero(actual))} vs {int(np.count_nonzero(expected))} signals")
+    check("buy/sell lists match the signal column",
+          len(result['buy_signals']) == (actual == 1).sum() and len(result['sell_signals']) == (actual == -1).sum())
+
+short = df.iloc[:40].reset_index(drop=True)
+try:
+    result = ensemble_strategy(short, min_agree=1, confirm_bars=100)
+    check("confirm_bars longer than the data gives no signals",
+          not result['buy_signals'] and not result['sell_signals'] and len(result['data']) == 40)
+except Exception as e:
+    check("confirm_bars longer than the data gives no signals", False, repr(e))
+
+try:
+    ensemble_strategy(df, members=['rsi', 'ensemble'])
+    check("ensemble cannot be its own member", False, "no error")
+except ValueError:
+    check("ensemble cannot be its own member", True)
+
+check_params('ensemble', {'members': ['rsi', 'macd'], 'params': {'rsi': {'period': 7}, 'macd': {'fast': 8}}})
+for label, params in [("an unknown member parameter", {'params': {'rsi': {'length': 7}}}),
+                      ("parameters for an unknown member", {'params': {'nope': {}}}),
+                      ("member parameters that are not an object", {'params': {'rsi': [7]}})]:
+    try:
+        check_params('ensemble', params)
+        check(f"{label} is rejected before the members run", False, "no error")
+    except ValueError:
+        check(f"{label} is rejected before the members run", True)
+
+print()
+print("-" * 50)
+print("All ensemble checks passed" if not failures else f"{failures} ensemble check(s) failed")
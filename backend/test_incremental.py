@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+
+from strategies.registry import STRATEGIES
+from strategies.kernels import KERNELS
+from strategies.incremental import LiveStrategyCache, IncrementalStrategy
+from utils.synthetic_market import synthetic_bars
+
+# Incremental live evaluation against running the strategy on each polled window alone
+
+print("Testing strategies.incremental...")
+print("-" * 50)
+
+failures = 0
+
+
+def check(name, ok, detail=''):
+    global failures
+    if ok:
+        print(f"✓ {name}")
+    else:
+        failures += 1
+        print(f"✗ {name}{': ' + detail if detail else ''}")
+
+
+def same_result(actual, expected):
+    """Same bars, columns and signals; numeric columns equal up to float rounding"""
+    a, b = pd.DataFrame(actual['data']), pd.DataFrame(expected['data'])
+    if list(a.columns) != list(b.columns) or len(a) != len(b):
+        return False, f"columns {list(a.columns)} vs {list(b.columns)}"
+    for column in a.columns:
+        x, y = a[column], b[column]
+        if pd.api.types.is_numeric_dtype(x) and pd.api.types.is_numeric_dtype(y):
+            if not np.allclose(x.to_numpy(dtype=float), y.to_numpy(dtype=float), rtol=1e-9, atol=1e-9, equal_nan=True):
+                return False, f"column {column} differs"
+        elif not x.equals(y):
+            return False, f"column {column} differs"
+    for side in ('buy_signals', 'sell_signals'):
+        if [s['date'] for s in actual[side]] != [s['date'] for s in expected[side]]:
+            return False, f"{side} differ"
+    return True, ''
+
+
+bars = synthetic_bars(1400, '1m', seed=12, volatility=0.4)
+
+
+def polls(window, count, start=0):
+    """Windows sliding one bar per poll; every other poll also revises the forming last bar"""
+    for i in range(start, start + count):
+        df = bars.iloc[i:i + window].reset_index(drop=True)
+        if i % 2:
+            df = df.copy()
+            df.loc[len(df) - 1, 'close'] *= 1.001
+        yield df
+
+
+for name in KERNELS:
+    cache = LiveStrategyCache()
+    modes = set()
+    mismatch = None
+    for df in polls(800, 12):
+        result = cache.evaluate(df, 'SYN', name)
+        modes.add(result['incremental']['mode'])
+        ok, detail = same_result(result, STRATEGIES[name](df))
+        if not ok and mismatch is None:
+            mismatch = detail
+    check(f"{name} sliding polls match a run on each window ({', '.join(sorted(modes))})", mismatch is None, mismatch or '')
+
+# A long first poll must not leak into later, shorter windows (cumulative VWAP, EMA seeds)
+for name in ('vwap', 'ema_crossover', 'macd', 'supertrend', 'bollinger_scalping'):
+    cache = LiveStrategyCache()
+    cache.evaluate(bars.iloc[:1200], 'SYN', name)
+    window = bars.iloc[900:1200].reset_index(drop=True)
+    ok, detail = same_result(cache.evaluate(window, 'SYN', name), STRATEGIES[name](window))
+    check(f"{name} window after a longer poll is anchored at the window", ok, detail)
+
+# A state that keeps the window's first bar stays incremental for path-dependent strategies
+for name in ('vwap', 'macd'):
+    state = IncrementalStrategy(name)
+    state.update(bars.iloc[:800])
+    offset = state.update(bars.iloc[:801])
+    ok, detail = same_result(state.result(offset, 801), STRATEGIES[name](bars.iloc[:801]))
+    check(f"{name} growing window is incremental and exact", ok and state.last_update['mode'] == 'incremental',
+          detail or str(state.last_update))
+
+# The cache only holds windows that slide incrementally
+cache = LiveStrategyCache()
+reasons = [cache.evaluate(df, 'SYN', 'rsi')['incremental'].get('reason') for df in polls(240, 3)]
+check("default 240-bar windows run directly and are not cached", reasons == ['short window'] * 3 and not cache._states, str(reasons))
+cache = LiveStrategyCache()
+updates = [cache.evaluate(df, 'SYN', 'macd')['incremental'] for df in polls(1000, 3)]
+check("path-dependent strategies run directly after their first poll and are not cached",
+      [u.get('reason') for u in updates] == ['cold', 'path-dependent', 'path-dependent'] and not cache._states, str(updates))
+cache = LiveStrategyCache()
+modes = [cache.evaluate(df, 'SYN', 'breakout')['incremental']['mode'] for df in polls(1000, 4)]
+check("large rolling windows slide incrementally", modes == ['full'] + ['incremental'] * 3, str(modes))
+
+# Eviction only costs a recomputation; results do not change
+evicting = LiveStrategyCache(max_entries=1)
+fresh_results = []
+evicted_results = []
+for df in polls(400, 6, start=300):
+    evicting.evaluate(bars.iloc[:400], 'OTHER', 'rsi')
+    evicted_results.append(evicting.evaluate(df, 'SYN', 'rsi'))
+    fresh_results.append(STRATEGIES['rsi'](df))
+check("results do not depend on LRU eviction",
+      all(same_result(a, b)[0] for a, b in zip(evicted_results, fresh_results)))
+
+print()
+print("-" * 50)
+print("All incremental checks passed" if not failures else f"{failures} incremental check(s) failed")
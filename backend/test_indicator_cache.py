@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+
+from strategies.registry import STRATEGIES
+from utils.indicator_cache import IndicatorContext
+from utils.synthetic_market import synthetic_bars
+
+# Strategies sharing one IndicatorContext against their stand-alone runs
+
+print("Testing utils.indicator_cache...")
+print("-" * 50)
+
+failures = 0
+
+
+def check(name, ok, detail=''):
+    global failures
+    if ok:
+        print(f"✓ {name}")
+    else:
+        failures += 1
+        print(f"✗ {name}{': ' + detail if detail else ''}")
+
+
+def same_data(actual, expected):
+    a, b = pd.DataFrame(actual['data']), pd.DataFrame(expected['data'])
+    return list(a.columns) == list(b.columns) and a.equals(b)
+
+
+bars = synthetic_bars(1500, seed=9, volatility=0.4)
+close = bars['close']
+
+# Indicators against their pandas definitions
+ctx = IndicatorContext(bars)
+prev_close = close.shift(1)
+true_range = np.fmax(np.fmax(bars['high'] - bars['low'], (bars['high'] - prev_close).abs()), (bars['low'] - prev_close).abs())
+delta = close.diff()
+rsi = 100 - 100 / (1 + delta.where(delta > 0, 0).rolling(14).mean() / (-delta.where(delta < 0, 0)).rolling(14).mean())
+references = [
+    ('ema', ctx.ema('close', 12), close.ewm(span=12, adjust=False).mean()),
+    ('sma', ctx.sma('close', 20), close.rolling(20).mean()),
+    ('rolling std', ctx.rolling_std('close', 20), close.rolling(20).std()),
+    ('rolling max', ctx.rolling_max('high', 55), bars['high'].rolling(55).max()),
+    ('rolling min', ctx.rolling_min('low', 9), bars['low'].rolling(9).min()),
+    ('true range', ctx.true_range(), true_range),
+    ('atr', ctx.atr(14), true_range.rolling(14).mean()),
+    ('rsi', ctx.rsi('close', 14), rsi),
+]
+for name, actual, expected in references:
+    check(f"{name} matches pandas", np.allclose(actual, expected.to_numpy(dtype=float), equal_nan=True))
+check("cached arrays are read-only", not ctx.ema('close', 12).flags.writeable)
+check("a second request is a cache hit", ctx.sma('close', 20) is ctx.sma('close', 20) and ctx.hits > 0)
+
+# A seeded context over the tail continues the recursion of the full series
+seed_start = 200
+tail = IndicatorContext(bars, seeds={('ema', ('close', 26)): close.ewm(span=26, adjust=False).mean().iloc[seed_start - 1]},
+                        seed_start=seed_start)
+check("seeded EMA resumes the full-series EMA",
+      np.allclose(tail.ema('close', 26)[seed_start:], close.ewm(span=26, adjust=False).mean().to_numpy()[seed_start:]))
+
+# Every strategy gives the same result with a shared context, after the others filled it
+shared = IndicatorContext(bars)
+for name, strategy in STRATEGIES.items():
+    if name == 'ml_lstm':
+        continue
+    check(f"{name} with a shared context matches its own run", same_data(strategy(bars, indicators=shared), strategy(bars)))
+check(f"strategies reuse each other's indicators ({shared.hits} hits, {shared.misses} computed)", shared.hits > 0)
+
+# A context built for other bars is not used
+other = IndicatorContext(synthetic_bars(700, seed=10))
+check("a context over other bars is ignored", same_data(STRATEGIES['macd'](bars, indicators=other), STRATEGIES['macd'](bars)))
+same_length = IndicatorContext(synthetic_bars(1500, seed=11, volatility=0.4))
+check("a context over other bars of the same length is ignored",
+      same_data(STRATEGIES['macd'](bars, indicators=same_length), STRATEGIES['macd'](bars)))
+check("a context serves frames derived from its bars",
+      shared.matches(bars.set_index('date')) and shared.matches(bars.reset_index(drop=True).assign(extra=0))
+      and not shared.matches(bars.assign(close=bars['close'] * 1.01)) and not shared.matches(bars.drop(columns=['volume'])))
+
+print()
+print("-" * 50)
+print("All indicator cache checks passed" if not failures else f"{failures} indicator cache check(s) failed")
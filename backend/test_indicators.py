@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+from ta.trend import SMAIndicator, EMAIndicator, MACD, ADXIndicator
+from ta.momentum import RSIIndicator, StochasticOscillator, WilliamsRIndicator, ROCIndicator
+from ta.volatility import BollingerBands, AverageTrueRange
+from ta.volume import OnBalanceVolumeIndicator, MFIIndicator
+
+from utils import indicators
+
+# Numerical parity of utils.indicators against the ta library it replaces
+
+print("Testing indicator parity with ta...")
+print("-" * 50)
+
+
+def make_bars(n, seed):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    open_ = close * (1 + rng.normal(0, 0.002, n))
+    high = np.maximum(open_, close) * (1 + rng.uniform(0, 0.01, n))
+    low = np.minimum(open_, close) * (1 - rng.uniform(0, 0.01, n))
+    volume = rng.integers(1_000, 1_000_000, n).astype(float)
+    # Flat stretches exercise zero ranges and zero gains
+    high[20:25] = low[20:25] = close[20:25] = open_[20:25] = close[19]
+    return pd.DataFrame({'open': open_, 'high': high, 'low': low, 'close': close, 'volume': volume})
+
+
+def same(actual, expected):
+    expected = np.asarray(expected, dtype=float)
+    return actual.shape == expected.shape and np.allclose(actual, expected, rtol=1e-9, atol=1e-9, equal_nan=True)
+
+
+failures = 0
+
+
+def check(name, actual, expected):
+    global failures
+    if same(actual, expected):
+        print(f"✓ {name}")
+    else:
+        failures += 1
+        diff = np.nanmax(np.abs(np.asarray(actual) - np.asarray(expected, dtype=float)))
+        print(f"✗ {name}: max abs difference {diff}")
+
+
+for n, seed in [(500, 0), (5000, 1), (40, 2)]:
+    df = make_bars(n, seed)
+    high, low, close, volume = df['high'], df['low'], df['close'], df['volume']
+    print(f"\n{n} bars")
+
+    smas = indicators.sma(close, (5, 10, 20, 50, 200))
+    for w, values in smas.items():
+        check(f"SMA {w}", values, SMAIndicator(close=close, window=w).sma_indicator())
+
+    check("Volume SMA 20", indicators.sma(volume, (20,))[20], SMAIndicator(close=volume, window=20).sma_indicator())
+
+    emas = indicators.ema(close, (12, 26))
+    for w, values in emas.items():
+        check(f"EMA {w}", values, EMAIndicator(close=close, window=w).ema_indicator())
+
+    for w, values in indicators.rsi(close, (7, 14, 21)).items():
+        check(f"RSI {w}", values, RSIIndicator(close=close, window=w).rsi())
+
+    macd = indicators.macd(close, emas=emas)
+    expected = MACD(close=close, window_fast=12, window_slow=26, window_sign=9)
+    check("MACD line", macd['macd'], expected.macd())
+    check("MACD signal", macd['signal'], expected.macd_signal())
+    check("MACD histogram", macd['hist'], expected.macd_diff())
+
+    bands = indicators.bollinger(close, 20, 2, middle=smas[20])
+    expected = BollingerBands(close=close, window=20, window_dev=2)
+    check("Bollinger upper", bands['upper'], expected.bollinger_hband())
+    check("Bollinger middle", bands['middle'], expected.bollinger_mavg())
+    check("Bollinger lower", bands['lower'], expected.bollinger_lband())
+    check("Bollinger width", bands['width'], expected.bollinger_wband())
+
+    stoch = indicators.stochastic(high, low, close, 14, 3)
+    expected = StochasticOscillator(high=high, low=low, close=close, window=14, smooth_window=3)
+    check("Stochastic %K", stoch['k'], expected.stoch())
+    check("Stochastic %D", stoch['d'], expected.stoch_signal())
+    check("Williams %R", stoch['williams_r'], WilliamsRIndicator(high=high, low=low, close=close, lbp=14).williams_r())
+
+    check("ATR 14", indicators.atr(high, low, close, 14), AverageTrueRange(high=high, low=low, close=close, window=14).average_true_range())
+
+    if n > 2 * 14:
+        adx = indicators.adx(high, low, close, 14)
+        expected = ADXIndicator(high=high, low=low, close=close, window=14)
+        check("ADX", adx['adx'], expected.adx())
+        check("+DI", adx['plus_di'], expected.adx_pos())
+        check("-DI", adx['minus_di'], expected.adx_neg())
+
+    check("OBV", indicators.obv(close, volume), OnBalanceVolumeIndicator(close=close, volume=volume).on_balance_volume())
+    check("MFI 14", indicators.mfi(high, low, close, volume, 14),
+          MFIIndicator(high=high, low=low, close=close, volume=volume, window=14).money_flow_index())
+
+    for w, values in indicators.roc(close, (5, 10)).items():
+        check(f"ROC {w}", values, ROCIndicator(close=close, window=w).roc())
+
+print()
+print("-" * 50)
+print("All indicators match ta" if not failures else f"{failures} indicator(s) differ from ta")
@@ -0,0 +1,162 @@
+import numpy as np
+import pandas as pd
+
+from strategies.registry import STRATEGIES
+from strategies.kernels import KERNELS, strategy_signals
+from utils.indicator_cache import IndicatorContext
+from utils.synthetic_market import synthetic_bars
+
+# Array kernels against the DataFrame formulations the strategies used before them
+
+print("Testing strategies.kernels...")
+print("-" * 50)
+
+failures = 0
+
+
+def check(name, ok, detail=''):
+    global failures
+    if ok:
+        print(f"✓ {name}")
+    else:
+        failures += 1
+        print(f"✗ {name}{': ' + detail if detail else ''}")
+
+
+def frame_ema_crossover(df, short_period=9, long_period=21):
+    diff = df['close'].ewm(span=short_period, adjust=False).mean() - df['close'].ewm(span=long_period, adjust=False).mean()
+    signal = pd.Series(0, index=df.index)
+    signal[(diff.shift(1) <= 0) & (diff > 0)] = 1
+    signal[(diff.shift(1) >= 0) & (diff < 0)] = -1
+    return signal, {'ema_diff': diff}
+
+
+def frame_rsi(df, period=14, oversold=35, overbought=65):
+    delta = df['close'].diff()
+    gain = delta.where(delta > 0, 0).rolling(window=period).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+    rsi = 100 - (100 / (1 + gain / loss))
+    signal = pd.Series(0, index=df.index)
+    signal[(rsi.shift(1) < oversold) & (rsi >= oversold)] = 1
+    signal[(rsi.shift(1) > overbought) & (rsi <= overbought)] = -1
+    signal[(rsi < 25) & (rsi.shift(1) >= 25)] = 1
+    signal[(rsi > 75) & (rsi.shift(1) <= 75)] = -1
+    return signal, {'rsi': rsi}
+
+
+def frame_macd(df, fast=12, slow=26, signal=9):
+    macd = df['close'].ewm(span=fast, adjust=False).mean() - df['close'].ewm(span=slow, adjust=False).mean()
+    line = macd.ewm(span=signal, adjust=False).mean()
+    histogram = macd - line
+    out = pd.Series(0, index=df.index)
+    out[(macd.shift(1) <= line.shift(1)) & (macd > line)] = 1
+    out[(macd.shift(1) >= line.shift(1)) & (macd < line)] = -1
+    out[(histogram.shift(1) <= 0) & (histogram > 0) & (out == 0)] = 1
+    out[(histogram.shift(1) >= 0) & (histogram < 0) & (out == 0)] = -1
+    return out, {'macd': macd, 'signal_line': line, 'histogram': histogram}
+
+
+def frame_bollinger(df, period=20, std_dev=2):
+    close = df['close']
+    sma = close.rolling(window=period).mean()
+    std = close.rolling(window=period).std()
+    upper, lower = sma + std * std_dev, sma - std * std_dev
+    prev = close.shift(1)
+    signal = pd.Series(0, index=df.index)
+    signal[(prev > lower.shift(1)) & (close <= lower)] = 1
+    signal[(prev < upper.shift(1)) & (close >= upper)] = -1
+    signal[(prev <= lower.shift(1)) & (close > lower) & (close < sma) & (signal == 0)] = 1
+    signal[(prev >= upper.shift(1)) & (close < upper) & (close > sma) & (signal == 0)] = -1
+    return signal, {'upper_band': upper, 'lower_band': lower}
+
+
+def frame_supertrend(df, period=10, multiplier=3):
+    prev_close = df['close'].shift()
+    true_range = np.fmax(np.fmax(df['high'] - df['low'], (df['high'] - prev_close).abs()), (df['low'] - prev_close).abs())
+    atr = true_range.rolling(period).mean()
+    hl_avg = (df['high'] + df['low']) / 2
+    upper, lower = hl_avg + multiplier * atr, hl_avg - multiplier * atr
+    supertrend = pd.Series(np.nan, index=df.index)
+    direction = pd.Series(np.nan, index=df.index)
+    supertrend.iloc[period], direction.iloc[period] = lower.iloc[period], 1
+    for i in range(period + 1, len(df)):
+        if df['close'].iloc[i] > supertrend.iloc[i - 1]:
+            supertrend.iloc[i], direction.iloc[i] = lower.iloc[i], 1
+        elif df['close'].iloc[i] < supertrend.iloc[i - 1]:
+            supertrend.iloc[i], direction.iloc[i] = upper.iloc[i], -1
+        else:
+            supertrend.iloc[i], direction.iloc[i] = supertrend.iloc[i - 1], direction.iloc[i - 1]
+    signal = pd.Series(0, index=df.index)
+    signal[(direction.shift(1) == -1) & (direction == 1)] = 1
+    signal[(direction.shift(1) == 1) & (direction == -1)] = -1
+    return signal, {'supertrend': supertrend, 'direction': direction}
+
+
+def frame_breakout(df, period=20, volume_confirm=True, volume_mult=1.5):
+    close, volume = df['close'], df['volume']
+    support = df['low'].rolling(period).min()
+    resistance = df['high'].rolling(period).max()
+    avg_volume = volume.rolling(period).mean()
+    up = (close.shift(1) <= resistance.shift(1)) & (close > resistance)
+    down = (close.shift(1) >= support.shift(1)) & (close < support)
+    signal = pd.Series(0, index=df.index)
+    if volume_confirm:
+        confirmed = volume > avg_volume * volume_mult
+        signal[up & confirmed] = 1
+        signal[down & confirmed] = -1
+        moderate = (volume > avg_volume) & (volume <= avg_volume * volume_mult)
+        signal[up & moderate & (signal == 0)] = 1
+        signal[down & moderate & (signal == 0)] = -1
+    else:
+        signal[up] = 1
+        signal[down] = -1
+    signal[(close.shift(1) > resistance.shift(1)) & (df['low'] <= resistance) & (close > resistance) & (signal == 0)] = 1
+    signal[(close.shift(1) < support.shift(1)) & (df['high'] >= support) & (close < support) & (signal == 0)] = -1
+    bar_range = df['high'] - df['low']
+    expansion = bar_range > bar_range.rolling(period).mean() * 1.5
+    signal[up & expansion & (signal == 0)] = 1
+    signal[down & expansion & (signal == 0)] = -1
+    return signal, {'support': support, 'resistance': resistance}
+
+
+REFERENCES = [
+    ('ema_crossover', frame_ema_crossover, {}), ('ema_crossover', frame_ema_crossover, {'short_period': 5, 'long_period': 34}),
+    ('rsi', frame_rsi, {}), ('rsi', frame_rsi, {'period': 7, 'oversold': 30, 'overbought': 70}),
+    ('macd', frame_macd, {}), ('macd', frame_macd, {'fast': 8, 'slow': 21, 'signal': 5}),
+    ('bollinger_scalping', frame_bollinger, {}), ('bollinger_scalping', frame_bollinger, {'period': 10, 'std_dev': 1.5}),
+    ('supertrend', frame_supertrend, {}), ('supertrend', frame_supertrend, {'period': 7, 'multiplier': 1.5}),
+    ('breakout', frame_breakout, {}), ('breakout', frame_breakout, {'period': 10, 'volume_confirm': False}),
+]
+
+bars = synthetic_bars(1200, seed=40, volatility=0.5)
+for name, reference, params in REFERENCES:
+    columns = KERNELS[name](IndicatorContext(bars), **params)
+    signal, lines = reference(bars, **params)
+    label = f"{name} {params or 'defaults'}"
+    check(f"{label}: {int((signal != 0).sum())} signals on the same bars as the DataFrame version",
+          np.array_equal(columns['signal'], signal.to_numpy()))
+    check(f"{label}: {', '.join(lines)} match", all(np.allclose(columns[k], v.to_numpy(dtype=float), equal_nan=True) for k, v in lines.items()))
+
+# Strategy wrappers: the input bars unchanged, followed by exactly the kernel columns
+snapshot = bars.copy()
+for name in STRATEGIES:
+    if name == 'ml_lstm':
+        continue
+    result = STRATEGIES[name](bars)
+    data = pd.DataFrame(result['data'])
+    signal = data['signal'].fillna(0).to_numpy(dtype=float)
+    check(f"{name}: strategy_signals is the strategy's signal column", np.array_equal(strategy_signals(bars, name), signal))
+    if name in KERNELS:
+        columns = KERNELS[name](IndicatorContext(bars))
+        check(f"{name}: output is the bars followed by the kernel columns",
+              list(data.columns) == list(bars.columns) + list(columns)
+              and all(np.allclose(data[k].to_numpy(dtype=float), v, equal_nan=True) for k, v in columns.items()))
+check("strategies leave the input bars untouched", bars.equals(snapshot))
+
+indexed = bars.set_index('date')
+check("bars indexed by date get their date column back",
+      pd.DataFrame(STRATEGIES['macd'](indexed)['data'])['date'].equals(bars['date']))
+
+print()
+print("-" * 50)
+print("All kernel checks passed" if not failures else f"{failures} kernel check(s) failed")
@@ -0,0 +1,86 @@
+import statistics
+
+import numpy as np
+
+from strategies.registry import STRATEGIES
+from backtesting.vectorized import run_backtest
+from backtesting.monte_carlo import monte_carlo, bootstrap_paths, block_bootstrap_paths
+from utils.synthetic_market import synthetic_bars
+
+# Monte Carlo paths of a strategy backtest against per-path loops
+
+print("Testing backtesting.monte_carlo...")
+print("-" * 50)
+
+failures = 0
+
+
+def check(name, ok, detail=''):
+    global failures
+    if ok:
+        print(f"✓ {name}")
+    else:
+        failures += 1
+        print(f"✗ {name}{': ' + detail if detail else ''}")
+
+
+def loop_metrics(returns, periods_per_year):
+    equity, peak, max_drawdown = 1.0, 1.0, 0.0
+    for r in returns:
+        equity *= 1 + r
+        peak = max(peak, equity)
+        max_drawdown = min(max_drawdown, equity / peak - 1)
+    std = statistics.stdev(returns)
+    sharpe = statistics.mean(returns) / std * periods_per_year ** 0.5 if std > 0 else 0.0
+    return {'total_return': equity - 1, 'max_drawdown': max_drawdown, 'sharpe': sharpe}
+
+
+bars = synthetic_bars(600, seed=41, volatility=0.4)
+close = bars['close'].to_numpy(dtype=float)
+signal = [row.get('signal', 0) for row in STRATEGIES['ema_crossover'](bars)['data']]
+backtest = run_backtest(close, signal, commission=0.0005)
+returns = backtest['returns']
+trade_returns = backtest['trades']['return']
+
+result = monte_carlo(returns=returns, trade_returns=trade_returns, n_paths=200, seed=7, include_paths=True)
+check("every method runs", set(result) == {'bootstrap', 'block_bootstrap', 'shuffle_trades'})
+for name in ('total_return', 'max_drawdown', 'sharpe'):
+    check(f"observed {name} is the backtest's", np.isclose(result['bootstrap'][name]['observed'], backtest['metrics'][name]))
+
+# Bootstrap paths: the same draws scored one path at a time
+paths = bootstrap_paths(returns, 200, np.random.default_rng(7))
+expected = [loop_metrics(list(path), 252) for path in paths]
+for name in ('total_return', 'max_drawdown', 'sharpe'):
+    check(f"bootstrap {name} of each path matches a per-path loop",
+          np.allclose(result['bootstrap']['paths'][name], [m[name] for m in expected]))
+    values = np.array([m[name] for m in expected])
+    check(f"bootstrap {name} median", np.isclose(result['bootstrap'][name]['p50'], np.median(values)))
+check("probability of loss", np.isclose(result['bootstrap']['probability_of_loss'], np.mean([m['total_return'] < 0 for m in expected])))
+
+# Shuffled trades keep the final return; only the path changes
+shuffled = result['shuffle_trades']
+check("shuffled trades keep the total return",
+      np.allclose(shuffled['paths']['total_return'], np.prod(1 + trade_returns) - 1)
+      and shuffled['total_return']['observed_percentile'] == 50)
+check("shuffled drawdowns are never worse than losing every trade in a row",
+      min(shuffled['paths']['max_drawdown']) >= np.prod(1 + trade_returns[trade_returns < 0]) - 1 - 1e-12)
+
+# Block bootstrap paths are circular runs of consecutive bars
+series = np.arange(100, dtype=float)
+block_paths = block_bootstrap_paths(series, 50, np.random.default_rng(3), block_size=8)
+consecutive = all(np.all(np.diff(path[b:b + 8]) % 100 == 1) for path in block_paths for b in range(0, 100, 8))
+check("block bootstrap paths are circular blocks of consecutive bars", consecutive and block_paths.shape == (50, 100))
+
+check("a seed makes the analysis reproducible",
+      monte_carlo(returns=returns, n_paths=50, seed=11) == monte_carlo(returns=returns, n_paths=50, seed=11))
+for label, kwargs in [("an unknown method", {'returns': returns, 'methods': ['jackknife']}),
+                      ("too few returns", {'returns': returns[:1], 'methods': ['bootstrap']})]:
+    try:
+        monte_carlo(**kwargs)
+        check(f"{label} is rejected", False, "no error")
+    except ValueError:
+        check(f"{label} is rejected", True)
+
+print()
+print("-" * 50)
+print("All Monte Carlo checks passed" if not failures else f"{failures} Monte Carlo check(s) failed")
@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+
+from strategies.registry import STRATEGIES
+from strategies.multi_timeframe import multi_timeframe_analysis, timeframe_offset
+from utils.synthetic_market import synthetic_bars
+
+# Multi-timeframe states against the strategy run on hand-aggregated bars of each timeframe
+
+print("Testing strategies.multi_timeframe...")
+print("-" * 50)
+
+failures = 0
+
+
+def check(name, ok, detail=''):
+    global failures
+    if ok:
+        print(f"✓ {name}")
+    else:
+        failures += 1
+        print(f"✗ {name}{': ' + detail if detail else ''}")
+
+
+def aggregate(df, minutes):
+    """One bar per ``minutes``-long period starting on a multiple of it, built row by row"""
+    rows = {}
+    for bar in df.itertuples(index=False):
+        start = bar.date.floor(f'{minutes}min')
+        if start not in rows:
+            rows[start] = {'date': start, 'open': bar.open, 'high': bar.high, 'low': bar.low, 'close': bar.close, 'volume': bar.volume}
+        else:
+            row = rows[start]
+            row['high'] = max(row['high'], bar.high)
+            row['low'] = min(row['low'], bar.low)
+            row['close'] = bar.close
+            row['volume'] += bar.volume
+    return pd.DataFrame(list(rows.values()))
+
+
+def held_state(df, strategy, params):
+    """+1 after the strategy's last buy, -1 after its last sell, 0 before any signal"""
+    state, states = 0, []
+    for row in STRATEGIES[strategy](df, **(params or {}))['data']:
+        if row.get('signal'):
+            state = int(np.sign(row['signal']))
+        states.append(state)
+    return states
+
+
+def reference_states(base, strategy, minutes, params=None):
+    """State of the last period that had closed by each base bar's close"""
+    bars = aggregate(base, minutes) if minutes > 5 else base
+    states = held_state(bars, strategy, params)
+    close_times = list(bars['date'] + pd.Timedelta(minutes=minutes))
+    aligned, k = [], -1
+    for t in base['date'] + pd.Timedelta(minutes=5):
+        while k + 1 < len(close_times) and close_times[k + 1] <= t:
+            k += 1
+        aligned.append(states[k] if k >= 0 else 0)
+    return aligned
+
+
+base = synthetic_bars(2400, '5m', seed=51, volatility=0.3)
+timeframes = {'1h': 60, '15m': 15, '5m': 5}
+for strategy, params in [('ema_crossover', {'short_period': 5, 'long_period': 13}), ('rsi', {'period': 7}), ('macd', None)]:
+    result = multi_timeframe_analysis(base, strategy, list(timeframes), params)
+    states = result['aligned']['states']
+    for timeframe, minutes in timeframes.items():
+        expected = reference_states(base, strategy, minutes, params)
+        mismatches = sum(a != b for a, b in zip(states[timeframe], expected))
+        check(f"{strategy} {timeframe} states match the strategy on {timeframe} bars, known only once closed",
+              len(states[timeframe]) == len(expected) and not mismatches, f"{mismatches} bars differ")
+
+    matrix = np.array([states[tf] for tf in result['timeframes']], dtype=float)
+    check(f"{strategy} confluence score is the mean state",
+          np.allclose(result['aligned']['confluence'], np.round(matrix.mean(axis=0), 4)))
+    latest = matrix[:, -1]
+    expected_state = 'bullish' if (latest == 1).all() else 'bearish' if (latest == -1).all() else 'mixed'
+    check(f"{strategy} latest confluence is {expected_state}", result['confluence']['state'] == expected_state)
+
+hourly = aggregate(base, 60)
+signals = [row for row in STRATEGIES['macd'](hourly)['data'] if row.get('signal')]
+last = multi_timeframe_analysis(base, 'macd', ['1h', '5m'])['summaries']['1h']['last_signal']
+check("hourly last signal is the strategy's last signal on hourly bars",
+      last is not None and last['date'] == pd.Timestamp(signals[-1]['date']).isoformat() and np.isclose(last['close'], signals[-1]['close']))
+
+check("timeframes parse to pandas offsets",
+      timeframe_offset('15m') == pd.tseries.frequencies.to_offset('15min') and timeframe_offset('1wk') == pd.tseries.frequencies.to_offset('W'))
+try:
+    multi_timeframe_analysis(base, 'no_such_strategy', ['1h'])
+    check("an unknown strategy is rejected", False, "no error")
+except ValueError:
+    check("an unknown strategy is rejected", True)
+
+print()
+print("-" * 50)
+print("All multi-timeframe checks passed" if not failures else f"{failures} multi-timeframe check(s) failed")
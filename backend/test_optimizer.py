@@ -0,0 +1,101 @@
+import os
+import json
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from strategies.registry import STRATEGIES
+from utils.synthetic_market import synthetic_bars
+from backtesting.metrics import positions_from_signals, simple_returns, performance_metrics
+from backtesting.optimizer import evaluate_params, optimize, CHECKPOINT_FILE
+
+# The process-pool optimizer against per-strategy results, and its checkpoint resume
+
+failures = 0
+
+
+def check(name, ok, detail=''):
+    global failures
+    if ok:
+        print(f"✓ {name}")
+    else:
+        failures += 1
+        print(f"✗ {name}{': ' + detail if detail else ''}")
+
+
+def strategy_metrics(df, strategy, params):
+    # Metrics of the full strategy output, as the API's backtest computes them
+    result = STRATEGIES[strategy](df, **params)
+    signal = np.array([row.get('signal', 0) or 0 for row in result['data']], dtype=float)
+    metrics = performance_metrics(positions_from_signals(signal), simple_returns(df['close'].to_numpy(dtype=float)))
+    return {name: float(value) for name, value in metrics.items()}
+
+
+def main():
+    print("Testing backtesting.optimizer...")
+    print("-" * 50)
+    bars = {symbol: synthetic_bars(600, seed=seed) for seed, symbol in enumerate(['AAA', 'BBB'])}
+
+    for strategy, params in [('ema_crossover', {'short_period': 9, 'long_period': 30}),
+                             ('rsi', {'period': 10, 'oversold': 30, 'overbought': 70}),
+                             ('macd', {'fast': 8, 'slow': 21, 'signal': 7}),
+                             ('supertrend', {'period': 7, 'multiplier': 2})]:
+        expected = strategy_metrics(bars['AAA'], strategy, params)
+        actual = evaluate_params(bars['AAA'], strategy, params)
+        same = all(np.isclose(actual[k], expected[k], equal_nan=True) for k in expected)
+        check(f"evaluate_params {strategy} matches the strategy output", same, f"{actual} != {expected}")
+
+    with tempfile.TemporaryDirectory() as out_dir:
+        first_grid = {'rsi': {'period': [7], 'oversold': [30], 'overbought': [70]}}
+        second_grid = {'rsi': {'period': [21], 'oversold': [25], 'overbought': [75]}}
+        run = dict(strategies=['rsi'], out_dir=out_dir, workers=1, bars=bars, progress=False)
+
+        summary = optimize(['AAA', 'BBB'], grids=first_grid, **run)
+        check("first run evaluates every unit", summary['units_run'] == summary['units_total'] == 2, str(summary))
+        summary = optimize(['AAA', 'BBB'], grids=first_grid, **run)
+        check("identical rerun resumes from the checkpoint", summary['units_run'] == 0, str(summary))
+
+        summary = optimize(['AAA', 'BBB'], grids=second_grid, **run)
+        check("rerun with another grid is not served from the checkpoint", summary['units_run'] == 2, str(summary))
+        best = [json.loads(params)['period'] for params in pd.read_csv(summary['best_params'])['params']]
+        check("best params come from the new grid", best == [21, 21], str(best))
+
+        summary = optimize(['AAA', 'BBB'], grids=second_grid, interval='1h', **run)
+        check("rerun with another interval is not served from the checkpoint", summary['units_run'] == 2, str(summary))
+
+        # Cut the last record off mid-write, as an interrupted run would
+        path = os.path.join(out_dir, CHECKPOINT_FILE)
+        with open(path, 'rb') as f:
+            content = f.read()
+        with open(path, 'wb') as f:
+            f.write(content[:-20])
+        summary = optimize(['AAA', 'BBB'], grids=second_grid, interval='1h', **run)
+        check("a truncated last record is redone", summary['units_run'] == 1, str(summary))
+        with open(path) as f:
+            lines = [line for line in f.read().splitlines() if line]
+        parsed = 0
+        for line in lines:
+            try:
+                json.loads(line)
+                parsed += 1
+            except ValueError:
+                pass
+        check("records after a truncated line start on a new line", parsed == len(lines) - 1, f"{parsed}/{len(lines)}")
+        summary = optimize(['AAA', 'BBB'], grids=second_grid, interval='1h', **run)
+        check("the redone unit is then resumed", summary['units_run'] == 0, str(summary))
+
+        unknown_dir = os.path.join(out_dir, 'unknown_objective')
+        try:
+            optimize(['AAA', 'BBB'], grids=second_grid, **{**run, 'out_dir': unknown_dir, 'objective': 'profit'})
+            check("an unknown objective is rejected", False, "no error")
+        except ValueError:
+            check("an unknown objective is rejected before any work runs", not os.path.exists(unknown_dir))
+
+    print()
+    print("-" * 50)
+    print("All optimizer checks passed" if not failures else f"{failures} optimizer check(s) failed")
+
+
+if __name__ == '__main__':
+    main()
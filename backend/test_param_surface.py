@@ -0,0 +1,91 @@
+import numpy as np
+
+import strategies.param_surface as param_surface
+from strategies.registry import STRATEGIES
+from strategies.param_surface import evaluate_param_surface, parse_grid_axis
+from backtesting.metrics import positions_from_signals, simple_returns, performance_metrics
+from backtesting.optimizer import expand_grid
+from utils.indicator_cache import IndicatorContext
+from utils.synthetic_market import synthetic_bars
+
+# Every cell of a parameter surface against the full strategy run with those parameters
+
+print("Testing strategies.param_surface...")
+print("-" * 50)
+
+failures = 0
+
+
+def check(name, ok, detail=''):
+    global failures
+    if ok:
+        print(f"✓ {name}")
+    else:
+        failures += 1
+        print(f"✗ {name}{': ' + detail if detail else ''}")
+
+
+def strategy_metrics(df, strategy, params):
+    result = STRATEGIES[strategy](df, **params)
+    signal = np.array([row.get('signal', 0) or 0 for row in result['data']], dtype=float)
+    return performance_metrics(positions_from_signals(signal), simple_returns(df['close'].to_numpy(dtype=float)))
+
+
+def compare_surface(df, strategy, grid, surface):
+    """Parameter sets whose surface metrics differ from the strategy's own"""
+    differing = []
+    for params in expand_grid(grid):
+        position = tuple(grid[axis].index(params[axis]) for axis in grid)
+        expected = strategy_metrics(df, strategy, params)
+        for metric, values in surface['metrics'].items():
+            if not np.isclose(values[position], expected[metric], equal_nan=True):
+                differing.append((params, metric))
+    return differing
+
+
+GRIDS = {
+    'ema_crossover': {'short_period': [5, 9, 20, 30], 'long_period': [10, 21, 50]},
+    'rsi': {'period': [7, 14, 21], 'oversold': [25, 30, 40], 'overbought': [60, 70]},
+    'supertrend': {'period': [7, 10, 14], 'multiplier': [1.5, 2, 3]}
+}
+
+df = synthetic_bars(900, seed=17, volatility=0.4)
+for strategy, grid in GRIDS.items():
+    surface = evaluate_param_surface(strategy, df, grid)
+    differing = compare_surface(df, strategy, grid, surface)
+    check(f"{strategy} surface matches every parameter set's own run", not differing, str(differing[:3]))
+
+    best = surface['best']
+    scores = np.where(np.isfinite(surface['metrics']['sharpe']), surface['metrics']['sharpe'], -np.inf)
+    check(f"{strategy} best is the highest sharpe", np.isclose(best['sharpe'], scores.max()))
+
+# Grids split into blocks give the same surface
+limit = param_surface.MAX_BLOCK_ELEMENTS
+param_surface.MAX_BLOCK_ELEMENTS = len(df) * 2
+try:
+    for strategy, grid in GRIDS.items():
+        split = evaluate_param_surface(strategy, df, grid)
+        check(f"{strategy} surface computed in blocks matches",
+              not compare_surface(df, strategy, grid, split))
+finally:
+    param_surface.MAX_BLOCK_ELEMENTS = limit
+
+shared = IndicatorContext(df)
+evaluate_param_surface('ema_crossover', df, GRIDS['ema_crossover'], indicators=shared)
+surface = evaluate_param_surface('ema_crossover', df, GRIDS['ema_crossover'], indicators=shared)
+check("a shared indicator context gives the same surface",
+      not compare_surface(df, 'ema_crossover', GRIDS['ema_crossover'], surface) and shared.hits > 0)
+
+check("grid axes parse from ranges and lists",
+      parse_grid_axis('5:20:5') == [5, 10, 15] and parse_grid_axis('1.5,2,3') == [1.5, 2, 3])
+for label, call in [("a missing axis", lambda: evaluate_param_surface('rsi', df, {'period': [14]})),
+                    ("a strategy without a surface", lambda: evaluate_param_surface('macd', df, {}))]:
+    try:
+        call()
+        check(f"{label} is rejected", False, "no error")
+    except ValueError:
+        check(f"{label} is rejected", True)
+
+print()
+print("-" * 50)
+print("All parameter surface checks passed" if not failures else f"{failures} parameter surface check(s) failed")
@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+
+from strategies.registry import STRATEGIES
+from utils.synthetic_market import synthetic_bars
+from backtesting.metrics import positions_from_signals, simple_returns, held_positions
+from backtesting.portfolio import align_panel, signal_panel, portfolio_backtest
+
+# Portfolio signals and returns against each symbol's own strategy run
+
+print("Testing backtesting.portfolio...")
+print("-" * 50)
+
+failures = 0
+
+
+def check(name, ok, detail=''):
+    global failures
+    if ok:
+        print(f"✓ {name}")
+    else:
+        failures += 1
+        print(f"✗ {name}{': ' + detail if detail else ''}")
+
+
+def strategy_signal(df, strategy, params):
+    result = STRATEGIES[strategy](df, **params)
+    return np.array([row.get('signal', 0) or 0 for row in result['data']], dtype=float)
+
+
+# Symbols on different calendars: one misses every fifth session, one lists a year later
+full = synthetic_bars(1000, seed=1, volatility=0.3)
+gappy = synthetic_bars(1000, seed=2, volatility=0.3)
+gappy = gappy[np.arange(len(gappy)) % 5 != 3].reset_index(drop=True)
+late = synthetic_bars(750, seed=3, volatility=0.3, start=full['date'].iloc[250])
+bars = {'FULL': full, 'GAPPY': gappy, 'LATE': late}
+dates = align_panel(bars)[0]
+
+for strategy, params in [('ema_crossover', {'short_period': 9, 'long_period': 21}),
+                         ('rsi', {'period': 14, 'oversold': 35, 'overbought': 65}),
+                         ('macd', {})]:
+    panel = signal_panel(bars, strategy, params)
+    for row, (symbol, df) in enumerate(bars.items()):
+        expected = pd.Series(strategy_signal(df, strategy, params), index=df['date'].to_numpy())
+        expected = expected.reindex(dates, fill_value=0).to_numpy()
+        check(f"{strategy} {symbol} signals match its own strategy run", np.array_equal(panel[row], expected),
+              f"{int(np.count_nonzero(panel[row]))} vs {int(np.count_nonzero(expected))} signals")
+
+# One symbol fully invested on its longs is the single-symbol long/flat backtest
+signal = strategy_signal(full, 'ema_crossover', {})
+returns = simple_returns(full['close'].to_numpy(dtype=float))
+expected_equity = 100000.0 * np.cumprod(1 + held_positions(positions_from_signals(signal)) * returns)
+result = portfolio_backtest({'FULL': full}, 'ema_crossover', sizing='equal')
+check("single-symbol portfolio equals the strategy backtest", np.allclose(result['equity'], expected_equity))
+
+# Fixed sizing splits capital evenly; each symbol earns its own strategy returns on half of it
+pair = {'FULL': full, 'OTHER': synthetic_bars(1000, seed=4, volatility=0.3)}
+result = portfolio_backtest(pair, 'rsi', sizing='fixed')
+portfolio_returns = sum(
+    0.5 * held_positions(positions_from_signals(strategy_signal(df, 'rsi', {}))) * simple_returns(df['close'].to_numpy(dtype=float))
+    for df in pair.values()
+)
+check("fixed sizing returns are the average of per-symbol strategy returns",
+      np.allclose(result['equity'], 100000.0 * np.cumprod(1 + portfolio_returns)))
+
+result = portfolio_backtest(bars, 'rsi', sizing='inverse_vol', max_weight=0.5)
+exposure = np.asarray(result['exposure'])
+check("exposure stays within capital", (exposure <= 1 + 1e-9).all() and (exposure >= 0).all())
+late_start = int(np.searchsorted(dates, late['date'].iloc[0]))
+check("no position in a symbol before it lists", result['per_symbol']['LATE']['entries'] > 0 and
+      (np.asarray(result['positions'])[:late_start] <= 2).all())
+
+print()
+print("-" * 50)
+print("All portfolio checks passed" if not failures else f"{failures} portfolio check(s) failed")
@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+
+from strategies.registry import STRATEGIES
+from utils.rolling_extrema import rolling_extrema, rolling_max, rolling_min
+from utils.indicator_cache import IndicatorContext
+from utils.synthetic_market import synthetic_bars
+
+# Multi-window rolling extrema against pandas rolling max/min, and the Donchian lines built on them
+
+print("Testing utils.rolling_extrema...")
+print("-" * 50)
+
+failures = 0
+
+
+def check(name, ok, detail=''):
+    global failures
+    if ok:
+        print(f"✓ {name}")
+    else:
+        failures += 1
+        print(f"✗ {name}{': ' + detail if detail else ''}")
+
+
+def same(a, b):
+    return len(a) == len(b) and np.array_equal(np.asarray(a), np.asarray(b, dtype=float), equal_nan=True)
+
+
+rng = np.random.default_rng(43)
+gappy = rng.normal(size=500).cumsum()
+gappy[[0, 37, 38, 200, 499]] = np.nan
+gappy[120] = np.inf
+gappy[121] = -np.inf
+series = {
+    'random walk': rng.normal(size=2000).cumsum(),
+    'NaN and infinite gaps': gappy,
+    'ties': np.round(rng.normal(size=300)),
+    'monotonic up': np.arange(400, dtype=float),
+    'monotonic down': np.arange(400, 0, -1, dtype=float),
+}
+windows = (1, 2, 3, 7, 8, 9, 26, 52, 64, 100, 299, 300, 301)
+for label, values in series.items():
+    for kind in ('max', 'min'):
+        result = rolling_extrema(values, windows, kind)
+        rolling = pd.Series(values).rolling
+        expected = {w: getattr(rolling(w), kind)().to_numpy() for w in windows}
+        bad = [w for w in windows if not same(result[w], expected[w])]
+        check(f"{label}: rolling {kind} over {len(windows)} windows matches pandas", not bad, f"windows {bad}")
+check("single-window helpers match pandas",
+      same(rolling_max(series['random walk'], 20), pd.Series(series['random walk']).rolling(20).max())
+      and same(rolling_min(series['random walk'], 20), pd.Series(series['random walk']).rolling(20).min()))
+check("an empty series gives empty windows", all(len(v) == 0 for v in rolling_extrema([], (1, 5)).values()))
+
+# Donchian lines of the strategies: cached windows and the Ichimoku / breakout levels
+bars = synthetic_bars(800, seed=43, volatility=0.5)
+indicators = IndicatorContext(bars)
+indicators.rolling_extrema('high', (9, 26, 52), 'max')
+check("windows cached by a multi-window pass match pandas",
+      same(indicators.rolling_max('high', 26), bars['high'].rolling(26).max())
+      and same(indicators.rolling_min('low', 52), bars['low'].rolling(52).min()))
+data = pd.DataFrame(STRATEGIES['ichimoku'](bars)['data'])
+for line, window in (('tenkan_sen', 9), ('kijun_sen', 26)):
+    midline = (bars['high'].rolling(window).max() + bars['low'].rolling(window).min()) / 2
+    check(f"ichimoku {line} is the {window}-bar high/low midline", np.allclose(data[line], midline, equal_nan=True))
+senkou_b = ((bars['high'].rolling(52).max() + bars['low'].rolling(52).min()) / 2).shift(26)
+check("ichimoku senkou_b is the 52-bar midline shifted forward", np.allclose(data['senkou_b'], senkou_b, equal_nan=True))
+data = pd.DataFrame(STRATEGIES['breakout'](bars, period=15)['data'])
+check("breakout levels are the 15-bar high and low",
+      same(data['resistance'], bars['high'].rolling(15).max()) and same(data['support'], bars['low'].rolling(15).min()))
+
+for label, kwargs in [("an unknown kind", {'kind': 'median'}), ("a zero window", {'windows': (0, 5)})]:
+    try:
+        rolling_extrema(series['ties'], **{'windows': (5,), **kwargs})
+        check(f"{label} is rejected", False, "no error")
+    except ValueError:
+        check(f"{label} is rejected", True)
+
+print()
+print("-" * 50)
+print("All rolling extrema checks passed" if not failures else f"{failures} rolling extrema check(s) failed")
@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+
+from strategies.registry import STRATEGIES
+from strategies.screener import screen_universe
+import utils.fetch_data as fetch_data
+from utils.synthetic_market import synthetic_bars
+
+# The screener against each symbol's full strategy result
+
+print("Testing strategies.screener...")
+print("-" * 50)
+
+failures = 0
+
+
+def check(name, ok, detail=''):
+    global failures
+    if ok:
+        print(f"✓ {name}")
+    else:
+        failures += 1
+        print(f"✗ {name}{': ' + detail if detail else ''}")
+
+
+def reference_match(df, strategy, params, within_bars, signal_type):
+    """Last signal row of the full result, with the confidence of its signal list entry"""
+    result = STRATEGIES[strategy](df, **(params or {}))
+    wanted = {'buy': (1,), 'sell': (-1,), 'any': (1, -1)}[signal_type]
+    fired = [i for i, row in enumerate(result['data']) if (row.get('signal') or 0) in wanted]
+    if not fired or len(result['data']) - 1 - fired[-1] >= within_bars:
+        return None
+    row = result['data'][fired[-1]]
+    kind = 'BUY' if row['signal'] > 0 else 'SELL'
+    entry = next(s for s in result['buy_signals' if kind == 'BUY' else 'sell_signals'] if str(s['date']) == str(row['date']))
+    return {'type': kind, 'date': pd.Timestamp(row['date']).isoformat(), 'close': row['close'],
+            'bars_ago': len(result['data']) - 1 - fired[-1], 'confidence': entry.get('confidence')}
+
+
+universe = {f"SYM{i:02d}": synthetic_bars(400, seed=100 + i, volatility=0.5) for i in range(40)}
+for strategy, params, within_bars, signal_type in [('rsi', {'period': 7}, 5, 'buy'), ('ema_crossover', None, 10, 'any'),
+                                                   ('macd', None, 8, 'sell'), ('bollinger_scalping', None, 3, 'any')]:
+    matches, errors = screen_universe(universe, strategy, params, within_bars, signal_type)
+    found = {m['symbol']: m['signal'] for m in matches}
+    expected = {symbol: reference_match(df, strategy, params, within_bars, signal_type) for symbol, df in universe.items()}
+    expected = {symbol: match for symbol, match in expected.items() if match is not None}
+    label = f"{strategy} {signal_type} within {within_bars} bars"
+    check(f"{label}: same {len(expected)} symbols as the full strategy runs", set(found) == set(expected) and not errors,
+          f"{sorted(found)} vs {sorted(expected)}")
+    check(f"{label}: same signal, bar and confidence",
+          all(all(found[s].get(k) == v for k, v in expected[s].items()) for s in set(found) & set(expected)))
+    order = [(m['signal']['bars_ago'], -(m['signal'].get('confidence') or 0)) for m in matches]
+    check(f"{label}: sorted by recency, then confidence", order == sorted(order))
+
+broken = dict(list(universe.items())[:3])
+broken['BROKEN'] = universe['SYM00'].drop(columns=['close'])
+matches, errors = screen_universe(broken, 'ema_crossover', within_bars=400, signal_type='any')
+check("a symbol that fails is reported without stopping the others", list(errors) == ['BROKEN'] and len(matches) == 3)
+
+for label, kwargs in [("an unknown strategy", {'strategy': 'nope'}), ("an unknown signal type", {'strategy': 'rsi', 'signal_type': 'hold'})]:
+    try:
+        screen_universe(universe, **kwargs)
+        check(f"{label} is rejected", False, "no error")
+    except ValueError:
+        check(f"{label} is rejected", True)
+
+# Bulk fetching with yfinance replaced: a batch download that leaves symbols out, and single fetches
+def yahoo_frame(df):
+    return df.set_index('date').rename(columns=str.title).rename_axis('Date')
+
+
+single_fetches = []
+
+
+def fake_download(symbols, **kwargs):
+    # The batch download drops the last symbol of every batch
+    return pd.concat({s: yahoo_frame(universe[s]) for s in symbols[:-1]}, axis=1)
+
+
+def fake_fetch(symbol, period='1y', interval='1d'):
+    single_fetches.append(symbol)
+    return yahoo_frame(universe[symbol]).reset_index()
+
+
+fetch_data.yf.download, fetch_data.fetch_stock_data = fake_download, fake_fetch
+symbols = list(universe)[:6]
+bars, errors = fetch_data.fetch_bulk_stock_data(symbols, batch_size=3)
+check("symbols a batch download leaves out are fetched on their own",
+      not errors and single_fetches == [symbols[2], symbols[5]]
+      and all(np.allclose(bars[s]['close'], universe[s]['close']) for s in symbols))
+bars, errors = fetch_data.fetch_bulk_stock_data(symbols, batch_size=3)
+check("fetched symbols are then served from the cache", len(single_fetches) == 2 and len(bars) == 6)
+fetch_data.BULK_CACHE_MAX_ENTRIES = 4
+fetch_data.fetch_bulk_stock_data(list(universe)[6:9], batch_size=3)
+check("the cache keeps only the most recently used symbols",
+      list(fetch_data._BULK_CACHE) == [(s, '1y', '1d') for s in symbols[5:6] + list(universe)[6:9]])
+
+print()
+print("-" * 50)
+print("All screener checks passed" if not failures else f"{failures} screener check(s) failed")
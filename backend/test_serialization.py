@@ -0,0 +1,74 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+from strategies.registry import STRATEGIES
+from utils.response_format import dumps
+from utils.synthetic_market import synthetic_bars
+from benchmarks.bench_serialization import clean_nan_values
+
+# The orjson provider against the previous clean_nan_values + stdlib json path
+
+print("Testing utils.response_format.dumps...")
+print("-" * 50)
+
+failures = 0
+
+
+def check(name, ok, detail=''):
+    global failures
+    if ok:
+        print(f"✓ {name}")
+    else:
+        failures += 1
+        print(f"✗ {name}{': ' + detail if detail else ''}")
+
+
+def previous(obj):
+    return json.loads(json.dumps(clean_nan_values(obj), ensure_ascii=False))
+
+
+def parsed(obj):
+    try:
+        return json.loads(dumps(obj))
+    except Exception as e:
+        return repr(e)
+
+
+bars = synthetic_bars(800, seed=5, volatility=0.4)
+for name, strategy in STRATEGIES.items():
+    if name == 'ml_lstm':
+        continue
+    result = strategy(bars)
+    check(f"{name} result parses to the same values as before", parsed(result) == previous(result))
+
+nan_values = {'float': float('nan'), 'inf': float('inf'), 'np': np.float64('-inf'), 'array': np.array([1.0, np.nan, np.inf])}
+check("NaN and infinity become null", parsed(nan_values) == {'float': None, 'inf': None, 'np': None, 'array': [1.0, None, None]})
+
+stamp = pd.Timestamp('2024-03-01 09:30:00')
+check("timestamps are ISO strings",
+      parsed([stamp, stamp.to_datetime64(), np.array([stamp.to_datetime64()])]) == [stamp.isoformat()] * 2 + [[stamp.isoformat()]])
+
+# NaT: alone, in lists and records, and inside datetime64 arrays of any shape and unit
+nat_cases = [
+    ('NaT scalar', np.datetime64('NaT'), None),
+    ('NaT with a unit', np.datetime64('NaT', 'ns'), None),
+    ('pandas NaT', pd.NaT, None),
+    ('NaT in a list', [1, np.datetime64('NaT')], [1, None]),
+    ('NaT in records', [{'date': stamp, 'x': 1.0}, {'date': np.datetime64('NaT'), 'x': 2.0}],
+     [{'date': stamp.isoformat(), 'x': 1.0}, {'date': None, 'x': 2.0}]),
+    ('datetime64[ns] array with NaT', np.array([stamp.to_datetime64(), 'NaT'], dtype='datetime64[ns]'), [stamp.isoformat(), None]),
+    ('datetime64[s] array starting with NaT', {'dates': np.array(['NaT', '2024-03-01T09:30'], dtype='datetime64[s]')},
+     {'dates': [None, stamp.isoformat()]}),
+    ('2-D datetime64 array with NaT', np.array([['2024-03-01T09:30', 'NaT']], dtype='datetime64[s]'), [[stamp.isoformat(), None]]),
+    ('strided datetime64 array', np.array(['2024-03-01T09:30', 'NaT', 'NaT'], dtype='datetime64[ns]')[::2], [stamp.isoformat(), None]),
+    ('object array with NaT', np.array([1, np.datetime64('NaT')], dtype=object), [1, None]),
+    ('datetime Series with NaT', pd.Series([stamp, pd.NaT]), [stamp.isoformat(), None]),
+]
+for label, value, expected in nat_cases:
+    check(f"{label} is written as null", parsed(value) == expected, str(parsed(value)))
+
+print()
+print("-" * 50)
+print("All serialization checks passed" if not failures else f"{failures} serialization check(s) failed")
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+
+from strategies.registry import STRATEGIES
+from strategies.kernels import overlay_frame
+from utils.synthetic_market import synthetic_bars
+
+# Strategies share their input bars without copying them and never modify them
+
+# Copy-on-write as app.py sets it up (the default from pandas 3)
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
+print("Testing copy-free bar sharing...")
+print("-" * 50)
+
+failures = 0
+
+
+def check(name, ok, detail=''):
+    global failures
+    if ok:
+        print(f"✓ {name}")
+    else:
+        failures += 1
+        print(f"✗ {name}{': ' + detail if detail else ''}")
+
+
+bars = synthetic_bars(600, seed=4)
+derived = {'sma_fast': bars['close'].rolling(5).mean().to_numpy(), 'signal': np.zeros(len(bars), dtype=np.int64)}
+
+out = overlay_frame(bars, derived)
+check("overlay keeps the bar columns first", list(out.columns) == list(bars.columns) + list(derived))
+check("overlay shares the bar data", np.shares_memory(out['close'].to_numpy(), bars['close'].to_numpy()))
+check("overlay wraps the derived arrays", np.shares_memory(out['sma_fast'].to_numpy(), derived['sma_fast']))
+
+snapshot = bars.copy(deep=True)
+out.loc[0, 'close'] = -1.0
+check("writing to the output leaves the bars alone", bars.equals(snapshot) and out.loc[0, 'close'] == -1.0)
+
+stale = bars.assign(signal=1)
+out = overlay_frame(stale, derived)
+check("a derived column replaces a stale input column in place",
+      list(out.columns) == list(stale.columns) + ['sma_fast'] and (out['signal'] == 0).all() and (stale['signal'] == 1).all())
+
+# Strategies that also accept bars indexed by date (the others need a 'date' column)
+DATE_INDEX = {'ema_crossover', 'rsi', 'macd', 'bollinger_scalping', 'supertrend', 'ensemble'}
+
+# Every strategy: the input is unchanged and the output starts with the same bars
+indexed = bars.set_index('date')
+for name, strategy in STRATEGIES.items():
+    if name == 'ml_lstm':
+        continue
+    inputs = [('date column', bars)] + ([('date index', indexed)] if name in DATE_INDEX else [])
+    for label, frame in inputs:
+        snapshot = frame.copy(deep=True)
+        try:
+            result = strategy(frame)
+        except Exception as e:
+            check(f"{name} ({label}) runs", False, repr(e))
+            continue
+        data = pd.DataFrame(result['data'])
+        same_bars = np.allclose(data[['open', 'high', 'low', 'close']].to_numpy(dtype=float),
+                                bars[['open', 'high', 'low', 'close']].to_numpy(dtype=float))
+        check(f"{name} ({label}) leaves its input unchanged and returns the same bars",
+              frame.equals(snapshot) and list(frame.columns) == list(snapshot.columns) and same_bars)
+
+print()
+print("-" * 50)
+print("All bar sharing checks passed" if not failures else f"{failures} bar sharing check(s) failed")
@@ -0,0 +1,58 @@
+import numpy as np
+
+from strategies.kernels import strategy_signals, signal_records
+from utils.synthetic_market import synthetic_bars
+from benchmarks.bench_simulator_signals import loop_tagging
+
+# Simulator records tagged from the signal column against the previous per-bar matching of signal dates
+
+print("Testing simulator signal tagging...")
+print("-" * 50)
+
+failures = 0
+
+
+def check(name, ok, detail=''):
+    global failures
+    if ok:
+        print(f"✓ {name}")
+    else:
+        failures += 1
+        print(f"✗ {name}{': ' + detail if detail else ''}")
+
+
+def first_difference(records, expected):
+    for i, (a, b) in enumerate(zip(records, expected)):
+        if a != b:
+            return f"bar {i}: {a} vs {b}"
+    return f"{len(records)} vs {len(expected)} records"
+
+
+# Dates as the simulator sends them (strings), and as timestamps
+daily = synthetic_bars(1500, seed=50, start_price=150.0, drift=0.0, volatility=0.32)
+intraday = synthetic_bars(3000, '5m', seed=50, start_price=150.0, drift=0.0, volatility=0.32)
+frames = {
+    'daily string dates': daily.assign(date=daily['date'].dt.strftime('%Y-%m-%d')),
+    '5m string dates': intraday.assign(date=intraday['date'].dt.strftime('%Y-%m-%d %H:%M:%S')),
+    '5m timestamps': intraday,
+}
+for label, df in frames.items():
+    for strategy in ('macd', 'rsi', 'ema_crossover'):
+        signal = strategy_signals(df, strategy)
+        records = signal_records(df, signal)
+        expected = loop_tagging(df, strategy)
+        check(f"{label}, {strategy}: records match the per-bar tagging", records == expected, first_difference(records, expected))
+        counts = (int(np.count_nonzero(signal == 1)), int(np.count_nonzero(signal == -1)))
+        check(f"{label}, {strategy}: {counts[0]} buys and {counts[1]} sells as counted before",
+              counts == (sum(r['signal'] == 1 for r in expected), sum(r['signal'] == -1 for r in expected)))
+
+records = signal_records(frames['daily string dates'], strategy_signals(frames['daily string dates'], 'macd'))
+check("record values are plain Python types",
+      all(type(records[0][k]) is t for k, t in (('date', str), ('close', float), ('volume', int), ('signal', int))))
+check("missing signals are holds", [r['signal'] for r in signal_records(daily[:3], [np.nan, 1, -1.0])] == [0, 1, -1])
+check("ensemble signals (no kernel) come from its full result",
+      np.array_equal(strategy_signals(daily, 'ensemble'), [row.get('signal', 0) or 0 for row in loop_tagging(daily, 'ensemble')]))
+
+print()
+print("-" * 50)
+print("All simulator signal checks passed" if not failures else f"{failures} simulator signal check(s) failed")
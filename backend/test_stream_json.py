@@ -0,0 +1,75 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+from strategies.registry import STRATEGIES
+from backtesting.vectorized import run_backtest, backtest_report
+from utils.response_format import (
+    dumps, stream_json, columnar_strategy_result, columnar_prediction_result, STRATEGY_STREAM_KEYS, PREDICTION_STREAM_KEYS
+)
+from utils.synthetic_market import synthetic_bars
+
+# Streamed chunks of strategy and prediction results against the single dumps() document
+
+print("Testing utils.response_format.stream_json...")
+print("-" * 50)
+
+failures = 0
+
+
+def check(name, ok, detail=''):
+    global failures
+    if ok:
+        print(f"✓ {name}")
+    else:
+        failures += 1
+        print(f"✗ {name}{': ' + detail if detail else ''}")
+
+
+def streamed(payload, stream_keys, batch_size):
+    chunks = list(stream_json(payload, stream_keys, batch_size))
+    try:
+        return json.loads(b''.join(chunks)), chunks
+    except ValueError as e:
+        return repr(e), chunks
+
+
+bars = synthetic_bars(900, seed=48, volatility=0.4)
+for name in ('ema_crossover', 'macd', 'ichimoku', 'ensemble'):
+    result = STRATEGIES[name](bars)
+    signal = [row.get('signal', 0) for row in result['data']]
+    result['backtest'] = backtest_report(run_backtest(bars['close'].to_numpy(dtype=float), signal), [row['date'] for row in result['data']])
+    for label, payload in (('rows', result), ('columnar', columnar_strategy_result(result))):
+        expected = json.loads(dumps(payload))
+        for batch_size in (1, 64, 900, 5000):
+            document, chunks = streamed(payload, STRATEGY_STREAM_KEYS, batch_size)
+            check(f"{name} {label} in batches of {batch_size}: {len(chunks)} chunks parse to the dumps() document",
+                  document == expected)
+
+# Small keys go out before the per-bar payload, which is split into batches
+result = STRATEGIES['macd'](bars)
+document, chunks = streamed(result, STRATEGY_STREAM_KEYS, 100)
+text = b''.join(chunks)
+check("metadata and signals come before the bars",
+      text.index(b'"metadata"') < text.index(b'"data"') and text.index(b'"buy_signals"') < text.index(b'"data"'))
+check("no chunk holds more than one batch of bars", max(chunk.count(b'"date"') for chunk in chunks) <= 100)
+
+# Predictions: parallel lists and their columnar series, with missing values
+dates = pd.Series(bars['date'][:300].to_numpy())
+dates[[3, 250]] = pd.NaT
+prediction = {'symbol': 'TEST', 'accuracy': 0.55, 'dates': dates.to_numpy(), 'predictions': np.linspace(-1, 1, 300),
+              'actual': [float('nan')] * 10 + [1.0] * 290}
+for label, payload in (('lists', prediction),
+                       ('columnar series', columnar_prediction_result({**prediction, 'dates': list(dates)}, time_encoding='iso'))):
+    expected = json.loads(dumps(payload))
+    document, chunks = streamed(payload, PREDICTION_STREAM_KEYS, 64)
+    check(f"prediction {label} with missing dates and values parse to the dumps() document", document == expected)
+
+check("an empty payload is an empty object", streamed({}, STRATEGY_STREAM_KEYS, 10)[0] == {})
+check("an empty per-bar list stays a list", streamed({'data': [], 'metadata': {}}, STRATEGY_STREAM_KEYS, 10)[0] == {'data': [], 'metadata': {}})
+check("a list of exactly one batch is one chunk", streamed({'data': list(range(10))}, ('data',), 10) == ({'data': list(range(10))}, [b'{"data":', b'[0,1,2,3,4,5,6,7,8,9]', b'}']))
+
+print()
+print("-" * 50)
+print("All stream checks passed" if not failures else f"{failures} stream check(s) failed")
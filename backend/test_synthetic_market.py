@@ -0,0 +1,112 @@
+import numpy as np
+import pandas as pd
+
+from strategies.registry import STRATEGIES
+from utils.synthetic_market import generate_market, synthetic_bars, regime_path, trading_calendar, TRADING_DAYS
+from benchmarks.bench_synthetic_market import loop_random_walk
+
+# The vectorized generator against per-bar compounding, its configured statistics, and the strategies run on it
+
+print("Testing utils.synthetic_market...")
+print("-" * 50)
+
+failures = 0
+
+
+def check(name, ok, detail=''):
+    global failures
+    if ok:
+        print(f"✓ {name}")
+    else:
+        failures += 1
+        print(f"✗ {name}{': ' + detail if detail else ''}")
+
+
+def log_returns(df):
+    return np.diff(np.log(df['close'].to_numpy()))
+
+
+# Without volatility a bar is the previous close compounded by the drift, as in a per-bar loop
+flat = synthetic_bars(500, seed=1, start_price=80.0, drift=0.1, volatility=0.0)
+price, expected = 80.0, []
+for _ in range(500):
+    price *= np.exp(0.1 / TRADING_DAYS)
+    expected.append(price)
+check("without volatility, closes compound the drift bar by bar", np.allclose(flat['close'], expected))
+check("without volatility, each bar opens at the previous close",
+      np.allclose(flat['open'], [80.0] + expected[:-1]) and np.allclose(flat['high'], flat['close']) and np.allclose(flat['low'], flat['open']))
+
+# Bars are well-formed for every interval and option
+for interval in ('1d', '1m', '5m', '1h'):
+    market = generate_market(('A', 'B', 'C'), 3000, interval, seed=2, correlation=0.5, jump_intensity=20, regimes=(0.5, 1.0, 3.0))
+    frames = list(market.values())
+    ok = all(
+        (df['high'] >= df[['open', 'close']].max(axis=1)).all() and (df['low'] <= df[['open', 'close']].min(axis=1)).all()
+        and (df['low'] > 0).all() and df['volume'].dtype == np.int64 and (df['volume'] >= 1).all() and len(df) == 3000
+        for df in frames
+    )
+    check(f"{interval}: high/low bound the bar, prices and volumes are positive", ok)
+    dates = frames[0]['date']
+    times = dates - dates.dt.normalize()
+    in_session = (times >= pd.Timedelta(hours=9, minutes=30)) & (times < pd.Timedelta(hours=16)) if interval != '1d' else times == pd.Timedelta(0)
+    check(f"{interval}: weekday bars in the regular session, strictly increasing",
+          (dates.dt.dayofweek < 5).all() and in_session.all() and dates.is_monotonic_increasing and dates.is_unique
+          and all(df['date'].equals(dates) for df in frames))
+
+dates, _ = trading_calendar(200, '5m', end='2024-03-15')
+check("an end date anchors the last session", dates[-1] == pd.Timestamp('2024-03-15 15:55') and len(dates) == 200)
+check("a 5m session has 78 bars", (pd.Series(dates).dt.date.value_counts() == 78).sum() == 2)
+
+# Statistics of a long sample match the configuration
+long = generate_market(('A', 'B'), 200_000, '1d', seed=3, drift=0.05, volatility=0.3, correlation=0.6)
+returns = np.column_stack([log_returns(df) for df in long.values()])
+vol = returns.std(axis=0) * np.sqrt(TRADING_DAYS)
+check("annualized volatility matches", np.allclose(vol, 0.3, rtol=0.01), f"{vol}")
+mean = returns.mean(axis=0) * TRADING_DAYS
+check("annualized log drift is drift - volatility^2 / 2", np.allclose(mean, 0.05 - 0.045, atol=0.02), f"{mean}")
+correlation = np.corrcoef(returns.T)[0, 1]
+check("correlation of returns matches", abs(correlation - 0.6) < 0.01, f"{correlation:.4f}")
+
+jumpy = synthetic_bars(10_000, seed=4, drift=0.0, volatility=1e-6, jump_intensity=25, jump_mean=0.1, jump_std=1e-9)
+jumps = np.round(log_returns(jumpy) / 0.1)
+expected_jumps = 25 * 10_000 / TRADING_DAYS
+check("jumps arrive at the configured rate with the configured size",
+      abs(jumps.sum() - expected_jumps) < 4 * np.sqrt(expected_jumps) and np.allclose(log_returns(jumpy), jumps * 0.1, atol=1e-4),
+      f"{jumps.sum():.0f} jumps, ~{expected_jumps:.0f} expected")
+
+path = regime_path(100_000, (1.0, 2.0, 4.0), 0.95, np.random.default_rng(5))
+switches = np.mean(path[1:] != path[:-1])
+check("regimes switch with probability 1 - persistence, always to another regime",
+      abs(switches - 0.05) < 0.005 and set(np.unique(path)) == {1.0, 2.0, 4.0}, f"{switches:.4f}")
+
+minute = synthetic_bars(390 * 400, '1m', seed=6, seasonality=2.0)
+moves = pd.Series(np.abs(log_returns(minute))).groupby(np.arange(1, len(minute)) % 390).mean()
+check("intraday moves are larger at the open and close than at midday",
+      moves.iloc[1:30].mean() > 1.5 * moves.iloc[180:210].mean() and moves.iloc[360:].mean() > 1.5 * moves.iloc[180:210].mean())
+
+check("the same seed gives the same market",
+      generate_market(('A', 'B'), 500, '5m', seed=7, jump_intensity=5)['B'].equals(generate_market(('A', 'B'), 500, '5m', seed=7, jump_intensity=5)['B']))
+check("different seeds give different markets", not synthetic_bars(100, seed=8)['close'].equals(synthetic_bars(100, seed=9)['close']))
+
+# The simulator's previous random walk and the generator give comparable bars to the strategies
+np.random.seed(10)
+previous = loop_random_walk(2000)
+previous['date'] = pd.bdate_range('2020-01-01', periods=2000)
+current = synthetic_bars(2000, seed=10, start_price=150.0, drift=0.0, volatility=0.32)
+daily = {label: np.std(np.diff(np.log(df['close']))) for label, df in (('previous', previous), ('current', current))}
+check("daily moves are about 2%, as in the previous random walk",
+      abs(daily['current'] - 0.02) < 0.002 and abs(daily['previous'] - 0.02) < 0.002, f"{daily}")
+for name in ('macd', 'rsi', 'ema_crossover'):
+    counts = {label: sum(1 for row in STRATEGIES[name](df)['data'] if row.get('signal')) for label, df in (('previous', previous), ('current', current))}
+    check(f"{name} signals as often as on the previous random walk", 0.7 < counts['current'] / counts['previous'] < 1.4, f"{counts}")
+
+for label, kwargs in [("an unknown interval", {'interval': '2h'}), ("a mis-shaped correlation", {'symbols': ('A', 'B'), 'correlation': np.eye(3)})]:
+    try:
+        generate_market(**{'n_bars': 10, **kwargs})
+        check(f"{label} is rejected", False, "no error")
+    except ValueError:
+        check(f"{label} is rejected", True)
+
+print()
+print("-" * 50)
+print("All synthetic market checks passed" if not failures else f"{failures} synthetic market check(s) failed")
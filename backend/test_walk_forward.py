@@ -0,0 +1,85 @@
+import numpy as np
+
+from strategies.registry import STRATEGIES
+from utils.synthetic_market import synthetic_bars
+from backtesting.metrics import positions_from_signals, simple_returns, held_positions, performance_metrics
+from backtesting.optimizer import expand_grid
+from backtesting.walk_forward import optimize_window, walk_forward
+
+# Walk-forward optimization against a brute-force search over full strategy outputs
+
+print("Testing backtesting.walk_forward...")
+print("-" * 50)
+
+failures = 0
+
+
+def check(name, ok, detail=''):
+    global failures
+    if ok:
+        print(f"✓ {name}")
+    else:
+        failures += 1
+        print(f"✗ {name}{': ' + detail if detail else ''}")
+
+
+def strategy_signal(df, strategy, params):
+    result = STRATEGIES[strategy](df, **params)
+    return np.array([row.get('signal', 0) or 0 for row in result['data']], dtype=float)
+
+
+def brute_force_best(df, strategy, grid, objective):
+    # Highest objective value over every parameter set, each run through the full strategy
+    returns = simple_returns(df['close'].to_numpy(dtype=float))
+    scores = []
+    for params in expand_grid(grid):
+        metrics = performance_metrics(positions_from_signals(strategy_signal(df, strategy, params)), returns)
+        value = float(metrics[objective])
+        scores.append(value if np.isfinite(value) else -np.inf)
+    return max(scores)
+
+
+GRIDS = {
+    # Batched parameter surfaces
+    'ema_crossover': {'short_period': [5, 9, 15], 'long_period': [21, 30, 50]},
+    'rsi': {'period': [7, 14, 21], 'oversold': [25, 30], 'overbought': [70, 75]},
+    'supertrend': {'period': [7, 10], 'multiplier': [2, 3]},
+    # Per-parameter-set path
+    'macd': {'fast': [8, 12], 'slow': [21, 26], 'signal': [9]}
+}
+
+df = synthetic_bars(800, seed=5, volatility=0.35)
+for strategy, grid in GRIDS.items():
+    for objective in ('sharpe', 'total_return', 'max_drawdown'):
+        params, metrics = optimize_window(df, strategy, grid, objective)
+        expected = brute_force_best(df, strategy, grid, objective)
+        check(f"{strategy} optimizes {objective}", np.isclose(metrics[objective], expected),
+              f"{metrics[objective]} != {expected} ({params})")
+
+# Each window's out-of-sample returns come from its chosen params run over the whole window
+result = walk_forward(df, 'ema_crossover', GRIDS['ema_crossover'], train_size=300, test_size=100,
+                      objective='total_return', workers=1)
+check("windows cover the data after the first training slice", len(result['equity_curve']['equity']) == 500)
+returns = simple_returns(df['close'].to_numpy(dtype=float))
+stitched = []
+for i, window in enumerate(result['windows']):
+    start, train_end, test_end = i * 100, 300 + i * 100, min(800, 400 + i * 100)
+    window_df = df.iloc[start:test_end].reset_index(drop=True)
+    position = positions_from_signals(strategy_signal(window_df, 'ema_crossover', window['params']))
+    stitched.append((held_positions(position) * returns[start:test_end])[train_end - start:])
+    expected_params, _ = optimize_window(df.iloc[start:train_end].reset_index(drop=True), 'ema_crossover',
+                                         GRIDS['ema_crossover'], 'total_return')
+    check(f"window {i} params re-optimized on its training slice", window['params'] == expected_params)
+equity = np.cumprod(1 + np.concatenate(stitched))
+check("stitched equity matches the per-window strategy runs",
+      np.allclose(result['equity_curve']['equity'], equity), "equity curves differ")
+
+try:
+    walk_forward(df, 'rsi', GRIDS['rsi'], train_size=300, test_size=100, objective='profit', workers=1)
+    check("unknown objective is rejected", False, "no error")
+except ValueError as e:
+    check("unknown objective is rejected", 'objective' in str(e), str(e))
+
+print()
+print("-" * 50)
+print("All walk-forward checks passed" if not failures else f"{failures} walk-forward check(s) failed")
@@ -1,7 +1,8 @@
 import numpy as np
 import pandas as pd
+from .indicator_cache import resolve_indicator_context
 
-def calculate_signal_confidence(df, buy_signals, sell_signals, strategy_type='technical'):
+def calculate_signal_confidence(df, buy_signals, sell_signals, strategy_type='technical', indicators=None):
     """
     Calculate confidence scores for buy/sell signals based on multiple factors
 
@@ -10,67 +11,165 @@ def calculate_signal_confidence(df, buy_signals, sell_signals, strategy_type='te
         buy_signals: List of buy signal dictionaries
         sell_signals: List of sell signal dictionaries
         strategy_type: Type of strategy being used
+        indicators: Optional IndicatorContext shared with the strategy that produced the signals
     
     Returns:
         Updated buy_signals and sell_signals with confidence scores
     """
-    # Ensure positional indexing is safe for downstream iloc
-    df = df.reset_index(drop=True).copy()
+    # Ensure positional indexing is safe for downstream iloc (a view under copy-on-write, nothing is copied)
+    df = df.reset_index(drop=True)
+    indicators = resolve_indicator_context(df, indicators)
     
-    # Add confidence to buy signals
-    for signal in buy_signals:
-        signal_date = signal.get('date')
-        signal_row = df[df['date'] == signal_date]
-        
-        if not signal_row.empty:
-            # Convert DataFrame index label to integer position for iloc-safe access
-            idx_label = signal_row.index[0]
-            try:
-                if isinstance(idx_label, (int, np.integer)):
-                    idx_pos = int(idx_label)
-                else:
-                    idx_pos = int(df.index.get_indexer([idx_label])[0])
-            except Exception:
-                # Fallback to first matching position
-                idx_pos = int(signal_row.reset_index().index[0])
-
-            confidence = calculate_single_signal_confidence(
-                df, idx_pos, 'buy', strategy_type
-            )
+    # Score every buy signal, then every sell signal, in one vectorized pass each
+    for signals, signal_type in ((buy_signals, 'buy'), (sell_signals, 'sell')):
+        positions = locate_signal_positions(df, signals)
+        found = np.flatnonzero(positions >= 0)
+        confidences = calculate_batch_signal_confidence(
+            df, positions[found], signal_type, strategy_type, indicators
+        )
+        for i, confidence in zip(found, confidences):
+            signal = signals[i]
             signal['confidence'] = confidence['score']
             signal['confidence_label'] = confidence['label']
             signal['confidence_color'] = confidence['color']
             signal['factors'] = confidence['factors']
     
-    # Add confidence to sell signals
-    for signal in sell_signals:
-        signal_date = signal.get('date')
-        signal_row = df[df['date'] == signal_date]
+    return buy_signals, sell_signals
+
+def locate_signal_positions(df, signals):
+    """
+    Positional index of each signal's date in df (first match), or -1 when the date is not found
+    """
+    if not signals or 'date' not in df.columns:
+        return np.full(len(signals), -1, dtype=int)
+    
+    dates = pd.Index(df['date'])
+    keys = [signal.get('date') for signal in signals]
+    if dates.is_unique:
+        return np.asarray(dates.get_indexer(keys), dtype=int)
+    
+    # Duplicate dates: match against the first occurrence like a boolean-mask lookup would
+    first = ~dates.duplicated()
+    first_positions = np.flatnonzero(first)
+    found = np.asarray(dates[first].get_indexer(keys), dtype=int)
+    return np.where(found >= 0, first_positions[np.maximum(found, 0)], -1)
+
+def _py_min(cap, values):
+    """Element-wise min(cap, x) with Python semantics (NaN compares False, so the cap wins)"""
+    return np.where(values < cap, values, cap)
+
+def _py_max(floor, values):
+    """Element-wise max(floor, x) with Python semantics (NaN compares False, so the floor wins)"""
+    return np.where(values > floor, values, floor)
+
+def calculate_batch_signal_confidence(df, positions, signal_type, strategy_type, indicators=None):
+    """
+    Vectorized calculate_single_signal_confidence for many signals of one type
+
+    Factor series are computed once (through the indicator cache) and gathered at
+    all signal positions with array indexing, giving the same scores as scoring
+    each signal on its own.
+
+    Args:
+        df: DataFrame with stock data, positionally indexed
+        positions: Integer positions of the signals in df
+        signal_type: 'buy' or 'sell'
+        strategy_type: Type of strategy being used
+        indicators: Optional IndicatorContext for df
+
+    Returns:
+        List of confidence dicts (score, label, color, factors), one per position
+    """
+    indicators = resolve_indicator_context(df, indicators)
+    n = len(df)
+    idx = np.clip(np.asarray(positions, dtype=int), 0, max(n - 1, 0))
+    count = len(idx)
+    if count == 0 or n == 0:
+        return []
+    
+    total = np.zeros(count)
+    factors = {}
+    
+    # Factor 1: Volume confirmation (30% weight)
+    if 'volume' in df.columns:
+        avg_volume = indicators.sma('volume', 20)[idx]
+        current_volume = df['volume'].to_numpy(dtype=float)[idx]
+        valid = pd.notna(avg_volume) & (avg_volume > 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            volume_score = _py_min(100, current_volume / avg_volume * 50)
+        factors['volume'] = (np.round(volume_score, 1), valid)
+        total += np.where(valid, volume_score * 0.3, 0.0)
+    
+    # Factor 2: Price momentum (25% weight)
+    if 'close' in df.columns:
+        close = df['close'].to_numpy(dtype=float)
+        base = close[np.maximum(0, idx - 5)]
+        denom = np.where(base != 0, base, np.nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            price_change_5d = np.where(pd.notna(denom), (close[idx] - base) / denom * 100, 0)
         
-        if not signal_row.empty:
-            idx_label = signal_row.index[0]
-            try:
-                if isinstance(idx_label, (int, np.integer)):
-                    idx_pos = int(idx_label)
-                else:
-                    idx_pos = int(df.index.get_indexer([idx_label])[0])
-            except Exception:
-                idx_pos = int(signal_row.reset_index().index[0])
-
-            confidence = calculate_single_signal_confidence(
-                df, idx_pos, 'sell', strategy_type
-            )
-            signal['confidence'] = confidence['score']
-            signal['confidence_label'] = confidence['label']
-            signal['confidence_color'] = confidence['color']
-            signal['factors'] = confidence['factors']
+        if signal_type == 'buy':
+            momentum_score = _py_max(0, _py_min(100, 50 + price_change_5d * 10))
+        else:
+            momentum_score = _py_max(0, _py_min(100, 50 - price_change_5d * 10))
+        
+        factors['momentum'] = (np.round(momentum_score, 1), np.ones(count, dtype=bool))
+        total += momentum_score * 0.25
     
-    return buy_signals, sell_signals
+    # Factor 3: Volatility (20% weight)
+    if 'close' in df.columns:
+        volatility = indicators.rolling_std('close', 10)[idx]
+        avg_volatility = float(indicators.get(
+            'rolling_std_mean', ('close', 20),
+            lambda: pd.Series(indicators.rolling_std('close', 20)).mean()
+        ))
+        valid = pd.notna(volatility) & pd.notna(avg_volatility) & (avg_volatility > 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            volatility_ratio = volatility / avg_volatility
+        volatility_score = _py_max(0, 100 - (volatility_ratio - 1) * 50)
+        factors['volatility'] = (np.round(volatility_score, 1), valid)
+        total += np.where(valid, volatility_score * 0.2, 0.0)
+    
+    # Factor 4: Trend strength (25% weight)
+    trend_score = calculate_batch_trend_strength(df, idx, signal_type, indicators)
+    total += trend_score * 0.25
+    
+    overall = _py_max(0, _py_min(100, total))
+    scores = np.round(overall, 1)
+    labels = np.select(
+        [overall >= 80, overall >= 65, overall >= 50, overall >= 35],
+        ['Very Strong', 'Strong', 'Moderate', 'Weak'],
+        default='Very Weak'
+    )
+    colors = np.select(
+        [overall >= 80, overall >= 65, overall >= 50, overall >= 35],
+        ['green', 'lightgreen', 'yellow', 'orange'],
+        default='red'
+    )
+    
+    factor_lists = {name: (values.tolist(), valid.tolist()) for name, (values, valid) in factors.items()}
+    trend_list = trend_score.tolist()
+    results = []
+    for i, (score, label, color) in enumerate(zip(scores.tolist(), labels.tolist(), colors.tolist())):
+        signal_factors = {}
+        for name, (values, valid) in factor_lists.items():
+            if valid[i]:
+                signal_factors[name] = values[i]
+        signal_factors['trend'] = trend_list[i]
+        results.append({
+            'score': score,
+            'label': label,
+            'color': color,
+            'factors': signal_factors
+        })
+    return results
 
-def calculate_single_signal_confidence(df, idx, signal_type, strategy_type):
+def calculate_single_signal_confidence(df, idx, signal_type, strategy_type, indicators=None):
     """
     Calculate confidence for a single signal based on multiple factors
     """
+    indicators = resolve_indicator_context(df, indicators)
+
     # Ensure idx is an integer positional index
     try:
         if isinstance(idx, (list, tuple, np.ndarray, pd.Series)):
@@ -91,7 +190,7 @@ def calculate_single_signal_confidence(df, idx, signal_type, strategy_type):
     
     # Factor 1: Volume confirmation (30% weight)
     if 'volume' in df.columns and len(df) > 0:
-        avg_volume = df['volume'].rolling(window=20).mean().iloc[idx]
+        avg_volume = indicators.sma('volume', 20)[idx]
         current_volume = df['volume'].iloc[idx]
         if pd.notna(avg_volume) and avg_volume > 0:
             volume_ratio = current_volume / avg_volume
@@ -119,8 +218,11 @@ def calculate_single_signal_confidence(df, idx, signal_type, strategy_type):
     
     # Factor 3: Volatility (20% weight)
     if 'close' in df.columns and len(df) > 0:
-        volatility = df['close'].rolling(window=10).std().iloc[idx]
-        avg_volatility = df['close'].rolling(window=20).std().mean()
+        volatility = indicators.rolling_std('close', 10)[idx]
+        avg_volatility = float(indicators.get(
+            'rolling_std_mean', ('close', 20),
+            lambda: pd.Series(indicators.rolling_std('close', 20)).mean()
+        ))
         if pd.notna(volatility) and pd.notna(avg_volatility) and avg_volatility > 0:
             volatility_ratio = volatility / avg_volatility
             # Lower volatility = higher confidence
@@ -129,7 +231,7 @@ def calculate_single_signal_confidence(df, idx, signal_type, strategy_type):
             scores.append(volatility_score * 0.2)
     
     # Factor 4: Trend strength (25% weight)
-    trend_score = calculate_trend_strength(df, idx, signal_type)
+    trend_score = calculate_trend_strength(df, idx, signal_type, indicators)
     factors['trend'] = round(trend_score, 1)
     scores.append(trend_score * 0.25)
     
@@ -161,22 +263,21 @@ def calculate_single_signal_confidence(df, idx, signal_type, strategy_type):
         'factors': factors
     }
 
-def calculate_trend_strength(df, idx, signal_type):
+def calculate_trend_strength(df, idx, signal_type, indicators=None):
     """
     Calculate trend strength using price action
     """
     if 'close' not in df.columns or len(df) < idx + 10:
         return 50
     
-    # Calculate moving averages if not present
-    if 'sma_20' not in df.columns:
-        df['sma_20'] = df['close'].rolling(window=20).mean()
-    if 'sma_50' not in df.columns:
-        df['sma_50'] = df['close'].rolling(window=50).mean()
+    # Use moving averages already on the frame, else take them from the indicator cache
+    indicators = resolve_indicator_context(df, indicators)
+    sma_20_values = df['sma_20'].to_numpy() if 'sma_20' in df.columns else indicators.sma('close', 20)
+    sma_50_values = df['sma_50'].to_numpy() if 'sma_50' in df.columns else indicators.sma('close', 50)
     
     current_price = df['close'].iloc[idx]
-    sma_20 = df['sma_20'].iloc[idx]
-    sma_50 = df['sma_50'].iloc[idx] if len(df) > 50 else sma_20
+    sma_20 = sma_20_values[idx]
+    sma_50 = sma_50_values[idx] if len(df) > 50 else sma_20
     
     if pd.isna(sma_20) or pd.isna(sma_50):
         return 50
@@ -202,6 +303,40 @@ def calculate_trend_strength(df, idx, signal_type):
         else:
             return 40
 
+def calculate_batch_trend_strength(df, positions, signal_type, indicators=None):
+    """
+    Vectorized calculate_trend_strength for an array of positions
+    """
+    idx = np.asarray(positions, dtype=int)
+    n = len(df)
+    if 'close' not in df.columns:
+        return np.full(len(idx), 50)
+    
+    indicators = resolve_indicator_context(df, indicators)
+    sma_20_values = df['sma_20'].to_numpy(dtype=float) if 'sma_20' in df.columns else indicators.sma('close', 20)
+    sma_50_values = df['sma_50'].to_numpy(dtype=float) if 'sma_50' in df.columns else indicators.sma('close', 50)
+    
+    current_price = df['close'].to_numpy(dtype=float)[idx]
+    sma_20 = sma_20_values[idx]
+    sma_50 = sma_50_values[idx] if n > 50 else sma_20
+    
+    if signal_type == 'buy':
+        score = np.select(
+            [(current_price > sma_20) & (sma_20 > sma_50), current_price > sma_20, current_price > sma_50],
+            [90, 70, 55],
+            default=40
+        )
+    else:
+        score = np.select(
+            [(current_price < sma_20) & (sma_20 < sma_50), current_price < sma_20, current_price < sma_50],
+            [90, 70, 55],
+            default=40
+        )
+    
+    # Too close to the end of the data, or moving averages not warmed up yet
+    neutral = (n < idx + 10) | pd.isna(sma_20) | pd.isna(sma_50)
+    return np.where(neutral, 50, score)
+
 def get_confidence_explanation():
     """
     Get explanation of confidence score calculation
@@ -0,0 +1,259 @@
+"""
+Shape-preserving downsampling of chart payloads.
+
+Charts draw a few thousand points at most, so long bar histories are reduced before they
+are sent:
+
+- 'lttb' (Largest-Triangle-Three-Buckets) keeps, per bucket, the bar that forms the largest
+  triangle with the previously kept bar and the next bucket's average. Peaks, troughs and
+  turning points survive, and every kept row is an original bar with all of its columns.
+- 'ohlc' merges each bucket into one candle: first open, highest high, lowest low, last
+  close, summed volume, the bucket's first date and, for the other columns, their value at
+  the bucket's last bar.
+
+Bars that must stay visible (e.g. buy/sell signals) are kept as they are: LTTB keeps them
+in addition to its picks, and OHLC buckets never merge across them. The result never has more
+than max_points rows; when the kept bars alone would not fit, an evenly spread subset of them
+is kept.
+"""
+import numpy as np
+import pandas as pd
+from .response_format import PREDICTION_SERIES
+
+METHODS = ('lttb', 'ohlc')
+
+# Candle fields and how OHLC buckets aggregate them
+OHLC_FIELDS = {'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'}
+
+
+def parse_max_points(text, minimum=3):
+    """Validated max_points query value (None when missing)"""
+    if text in (None, ''):
+        return None
+    try:
+        max_points = int(text)
+    except (TypeError, ValueError):
+        raise ValueError("max_points must be an integer")
+    if max_points < minimum:
+        raise ValueError(f"max_points must be at least {minimum}")
+    return max_points
+
+
+def parse_method(text, default='lttb'):
+    """Validated downsampling method"""
+    method = (text or default).lower()
+    if method not in METHODS:
+        raise ValueError(f"downsample must be one of {', '.join(METHODS)}")
+    return method
+
+
+def _keep_indices(keep, n):
+    if keep is None:
+        return np.array([], dtype=int)
+    keep = np.asarray(keep)
+    if keep.dtype == bool:
+        keep = np.flatnonzero(keep)
+    return np.unique(keep[(keep >= 0) & (keep < n)].astype(int))
+
+
+def _thin(keep, count):
+    """At most ``count`` of the sorted positions ``keep``, evenly spread over them"""
+    if len(keep) <= count:
+        return keep
+    if count <= 0:
+        return keep[:0]
+    return keep[np.linspace(0, len(keep) - 1, count).round().astype(int)]
+
+
+def lttb_indices(values, max_points, keep=None):
+    """
+    Positions of the bars Largest-Triangle-Three-Buckets keeps (bars equally spaced on x)
+
+    Args:
+        values: Series to preserve the shape of (e.g. close); NaN points are never picked
+            over finite ones
+        max_points: Maximum number of points (at least 3), including the first and last bar
+        keep: Optional positions or boolean mask of bars to keep in addition to the picks;
+            thinned evenly when they leave fewer than 3 points for the picks
+
+    Returns:
+        Sorted int array of at most max_points positions
+    """
+    y = np.asarray(values, dtype=float)
+    n = len(y)
+    keep = _thin(_keep_indices(keep, n), max_points - 3)
+    # The kept bars use part of the budget so the total stays within max_points
+    budget = max(3, max_points - len(keep))
+    if budget >= n:
+        return np.arange(n)
+
+    selected = np.empty(budget, dtype=int)
+    selected[0] = 0
+    selected[-1] = n - 1
+    # Interior buckets split bars 1..n-2 evenly
+    edges = (np.arange(budget - 1) * ((n - 2) / (budget - 2))).astype(int) + 1
+    edges[-1] = n - 1
+    x = np.arange(n, dtype=float)
+    finite_y = np.where(np.isfinite(y), y, np.nan)
+
+    a = 0
+    for i in range(budget - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_start, next_end = edges[i + 1], edges[i + 2]
+            avg_x = x[next_start:next_end].mean()
+            next_y = finite_y[next_start:next_end]
+            avg_y = np.nanmean(next_y) if np.isfinite(next_y).any() else np.nan
+        else:
+            avg_x, avg_y = x[n - 1], finite_y[n - 1]
+        if not np.isfinite(avg_y):
+            avg_y = finite_y[a] if np.isfinite(finite_y[a]) else 0.0
+        ay = finite_y[a] if np.isfinite(finite_y[a]) else avg_y
+        area = np.abs((x[a] - avg_x) * (finite_y[start:end] - ay) - (x[a] - x[start:end]) * (avg_y - ay))
+        area = np.where(np.isnan(area), -1.0, area)
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return np.union1d(selected, keep)
+
+
+def ohlc_bucket_starts(n, max_points, keep=None):
+    """
+    Start positions of at most max_points OHLC buckets: even buckets, with every kept bar
+    in a bucket of its own (kept bars are thinned evenly when they do not fit)
+    """
+    # A kept bar splits its bucket in up to three, so it costs two buckets of the budget
+    keep = _thin(_keep_indices(keep, n), (max_points - 1) // 2)
+    budget = min(n, max(1, max_points - 2 * len(keep)))
+    starts = (np.arange(budget) * (n / budget)).astype(int)
+    starts = np.unique(np.concatenate([starts, keep, keep + 1]))
+    return starts[starts < n]
+
+
+def aggregate_ohlc(frame, starts):
+    """
+    One row per bucket of ``frame`` (buckets begin at ``starts``)
+
+    Returns:
+        DataFrame with the columns of ``frame``
+    """
+    n = len(frame)
+    ends = np.append(starts[1:], n) - 1
+    out = {}
+    for column in frame.columns:
+        values = frame[column]
+        how = OHLC_FIELDS.get(column)
+        if how == 'sum' and values.dtype.kind in 'iu':
+            out[column] = np.add.reduceat(values.to_numpy(), starts)
+        elif how in ('max', 'min', 'sum') and pd.api.types.is_numeric_dtype(values.dtype):
+            array = values.to_numpy(dtype=float)
+            if how == 'max':
+                out[column] = np.fmax.reduceat(array, starts)
+            elif how == 'min':
+                out[column] = np.fmin.reduceat(array, starts)
+            else:
+                out[column] = np.add.reduceat(np.nan_to_num(array), starts)
+        elif how == 'first' or column in ('date', 'datetime', 'time', 'timestamp'):
+            out[column] = values.iloc[starts].to_numpy()
+        else:
+            out[column] = values.iloc[ends].to_numpy()
+    return pd.DataFrame(out, columns=frame.columns)
+
+
+def downsample_frame(frame, max_points, method='lttb', value_column='close', keep=None):
+    """
+    Reduce a bar frame to about ``max_points`` rows
+
+    Returns:
+        (reduced frame with a fresh index, positions) where positions are the kept rows
+        ('lttb') or the bucket starts ('ohlc')
+    """
+    n = len(frame)
+    if method == 'ohlc':
+        starts = ohlc_bucket_starts(n, max_points, keep)
+        if len(starts) == n:
+            return frame.reset_index(drop=True), starts
+        return aggregate_ohlc(frame.reset_index(drop=True), starts), starts
+    indices = lttb_indices(frame[value_column], max_points, keep)
+    return frame.iloc[indices].reset_index(drop=True), indices
+
+
+def _reduce_curve(values, positions, method, how):
+    """A per-bar curve (equity, drawdown) reduced like the bars it belongs to"""
+    values = np.asarray(values, dtype=float)
+    if method == 'lttb':
+        return values[positions].tolist()
+    if how == 'min':
+        return np.fmin.reduceat(values, positions).tolist()
+    ends = np.append(positions[1:], len(values)) - 1
+    return values[ends].tolist()
+
+
+def downsample_strategy_result(result, max_points, method='lttb'):
+    """
+    Strategy result with its per-bar data (and backtest curves) reduced to at most max_points bars
+
+    Bars with a buy or sell signal are kept (an evenly spread subset of them when there are
+    more than fit). Backtest trades are cut to the most recent max_points. Signal lists,
+    metadata and backtest metrics are left as they are.
+    """
+    records = result.get('data') or []
+    n = len(records)
+    if not max_points or n <= max_points:
+        return result
+    fields = list(records[0])
+    value_column = 'close' if 'close' in fields else None
+    # LTTB only needs the shape and signal columns; OHLC buckets aggregate every column
+    needed = fields if method == 'ohlc' or value_column is None else [f for f in (value_column, 'signal') if f in fields]
+    frame = pd.DataFrame.from_records(records, columns=needed)
+    if value_column is None:
+        value_column = frame.select_dtypes('number').columns[0]
+    keep = np.flatnonzero(frame['signal'].fillna(0).to_numpy() != 0) if 'signal' in frame.columns else None
+    if method == 'lttb':
+        positions = lttb_indices(frame[value_column], max_points, keep)
+        data = [records[i] for i in positions]
+    else:
+        reduced, positions = downsample_frame(frame, max_points, 'ohlc', value_column, keep)
+        data = reduced.to_dict('records')
+
+    result = dict(result)
+    result['data'] = data
+    result['downsampled'] = {'method': method, 'original_points': n, 'points': len(data)}
+    backtest = result.get('backtest')
+    if backtest:
+        backtest = dict(backtest)
+        if len(backtest.get('equity') or []) == n:
+            backtest['equity'] = _reduce_curve(backtest['equity'], positions, method, 'last')
+            backtest['drawdown'] = _reduce_curve(backtest['drawdown'], positions, method, 'min')
+        trades = backtest.get('trades') or []
+        if len(trades) > max_points:
+            # Like backtest_report(max_trades=...): the most recent trades
+            backtest['trades'] = trades[-max_points:]
+            result['downsampled']['original_trades'] = len(trades)
+        result['backtest'] = backtest
+    return result
+
+
+def downsample_prediction_result(result, max_points):
+    """
+    Prediction result with its parallel per-date series reduced to about max_points by LTTB
+
+    The shape of the actual price series (falling back to the predictions) is preserved.
+    """
+    dates = result.get('dates')
+    if not max_points or not isinstance(dates, list) or len(dates) <= max_points:
+        return result
+    n = len(dates)
+    series = [key for key in PREDICTION_SERIES if isinstance(result.get(key), list) and len(result[key]) == n]
+    shape_key = next((key for key in ('actual_prices', 'actual', 'predictions') if key in series), None)
+    if shape_key is None:
+        return result
+    try:
+        values = np.asarray(result[shape_key], dtype=float).reshape(n)
+    except (TypeError, ValueError):
+        return result
+    positions = lttb_indices(values, max_points)
+    result = dict(result)
+    for key in series:
+        result[key] = [result[key][i] for i in positions]
+    result['downsampled'] = {'method': 'lttb', 'original_points': n, 'points': len(positions)}
+    return result
@@ -2,11 +2,15 @@ import yfinance as yf
 import pandas as pd
 from datetime import datetime, timedelta
 import os
+import time
+import threading
+from collections import OrderedDict
 
 
 def _normalize_ohlcv_df(df: pd.DataFrame) -> pd.DataFrame:
     """Normalize various OHLCV column naming schemes to: date, open, high, low, close, volume."""
-    df = df.copy()
+    # Shallow copy: relabelling below must not touch the caller's frame, the data itself is shared
+    df = df.copy(deep=False)
 
     # Flatten MultiIndex columns if present
     if isinstance(df.columns, pd.MultiIndex):
@@ -94,6 +98,92 @@ def fetch_stock_data(symbol, period="1y", interval="1d"):
     except Exception as e:
         raise Exception(f"Error fetching data for {symbol}: {str(e)}")
 
+# Bars fetched by fetch_bulk_stock_data: {(symbol, period, interval): (fetched_at, DataFrame)},
+# least recently used first. Entries expire with the app's response cache (300 s) and at most
+# BULK_CACHE_MAX_ENTRIES frames are kept, so a screener run does not pin its bars for the process.
+_BULK_CACHE = OrderedDict()
+_BULK_CACHE_LOCK = threading.Lock()
+BULK_CACHE_TTL = 300
+BULK_CACHE_MAX_ENTRIES = 1000
+
+
+def _split_bulk_download(raw, symbol):
+    """One symbol's normalized OHLCV frame from a grouped yf.download result"""
+    if isinstance(raw.columns, pd.MultiIndex):
+        if symbol not in raw.columns.get_level_values(0):
+            raise ValueError(f"No data found for symbol: {symbol}")
+        raw = raw[symbol]
+    df = raw.dropna(how='all')
+    if df.empty:
+        raise ValueError(f"No data found for symbol: {symbol}")
+    df = _normalize_ohlcv_df(df.reset_index())
+    return df.dropna(subset=['close']).reset_index(drop=True)
+
+
+def fetch_bulk_stock_data(symbols, period="1y", interval="1d", batch_size=100, cache_ttl=BULK_CACHE_TTL):
+    """
+    Fetch bars for many symbols with batched yfinance downloads and an in-process cache
+    
+    Args:
+        symbols: List of ticker symbols
+        period: Data period (as in fetch_stock_data)
+        interval: Data interval (as in fetch_stock_data)
+        batch_size: Symbols per yf.download call
+        cache_ttl: Seconds a cached symbol stays fresh (0 disables the cache)
+    
+    Symbols a batch download leaves out (or returns empty) are fetched one by one with
+    fetch_stock_data before they are reported as errors.
+    
+    Returns:
+        (dict of {symbol: DataFrame with date, open, high, low, close, volume}, dict of {symbol: error message})
+    """
+    bars = {}
+    errors = {}
+    now = time.time()
+    with _BULK_CACHE_LOCK:
+        for symbol in symbols:
+            key = (symbol, period, interval)
+            cached = _BULK_CACHE.get(key)
+            if cached and cache_ttl and now - cached[0] < cache_ttl:
+                bars[symbol] = cached[1]
+                _BULK_CACHE.move_to_end(key)
+    missing = [s for s in dict.fromkeys(symbols) if s not in bars]
+
+    for start in range(0, len(missing), batch_size):
+        batch = missing[start:start + batch_size]
+        try:
+            raw = yf.download(batch, period=period, interval=interval, group_by='ticker',
+                              auto_adjust=True, threads=True, progress=False)
+        except Exception:
+            raw = None
+        for symbol in batch:
+            try:
+                try:
+                    if raw is None or raw.empty:
+                        raise ValueError("Batch download returned no data")
+                    df = _split_bulk_download(raw, symbol)
+                except ValueError:
+                    df = _normalize_ohlcv_df(fetch_stock_data(symbol, period=period, interval=interval))
+                bars[symbol] = df
+            except Exception as e:
+                errors[symbol] = str(e)
+
+    if not cache_ttl:
+        return bars, errors
+    fetched_at = time.time()
+    with _BULK_CACHE_LOCK:
+        for symbol in missing:
+            if symbol in bars:
+                key = (symbol, period, interval)
+                _BULK_CACHE[key] = (fetched_at, bars[symbol])
+                _BULK_CACHE.move_to_end(key)
+        expired = [key for key, (stored_at, _) in _BULK_CACHE.items() if fetched_at - stored_at >= max(cache_ttl, BULK_CACHE_TTL)]
+        for key in expired:
+            del _BULK_CACHE[key]
+        while len(_BULK_CACHE) > BULK_CACHE_MAX_ENTRIES:
+            _BULK_CACHE.popitem(last=False)
+    return bars, errors
+
 def _fetch_intraday_yf(symbol, resolution='1', lookback_minutes=390):
     """Fetch intraday candles via yfinance."""
     interval_map = {
@@ -127,7 +217,7 @@ def _fetch_intraday_yf(symbol, resolution='1', lookback_minutes=390):
         if df is None or df.empty:
             raise Exception(f"yfinance returned no data for {symbol}")
 
-    df = df.copy().reset_index()
+    df = df.reset_index()
     
     # Normalize columns using the common function
     df = _normalize_ohlcv_df(df)
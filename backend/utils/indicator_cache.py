@@ -0,0 +1,216 @@
+import threading
+import numpy as np
+import pandas as pd
+from .rolling_extrema import rolling_extrema as _rolling_extrema
+
+
+class IndicatorContext:
+    """
+    Memoizing indicator cache attached to one bar frame.
+
+    Indicators are keyed by (indicator, params) and computed at most once, so
+    several strategies (and the confidence calculator) running over the same
+    bars share EMAs, rolling windows, true range, etc. Values are returned as
+    read-only NumPy arrays aligned by position with the bar frame, which keeps
+    them safe to share between strategies that copy or re-index their input.
+
+    Recursive indicators (SEEDED: EMAs, cumulative sums, SuperTrend) can resume
+    from ``seeds`` taken from an earlier evaluation of a longer series, so a
+    context over the tail of that series only recomputes from ``seed_start`` on.
+    """
+
+    # Indicator names whose values depend on every earlier bar, not just a window
+    SEEDED = ('ema', 'ewm', 'cumsum', 'supertrend')
+
+    # Bar columns indicators are computed from; a frame with other values gets its own context
+    BAR_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+    def __init__(self, df, seeds=None, seed_start=0):
+        self.df = df
+        self.seeds = seeds or {}
+        self.seed_start = seed_start
+        self._cache = {}
+        self._key_locks = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_arrays(cls, **columns):
+        """Context over plain bar arrays (open, high, low, close, volume) instead of a fetched frame"""
+        return cls(pd.DataFrame(columns, copy=False))
+
+    def __len__(self):
+        return len(self.df)
+
+    def matches(self, df):
+        """
+        Check whether this context can serve indicators for ``df``
+
+        Strategies pass frames derived from the same bars (a reset index, an added date
+        column), so frames match on their bar values rather than on identity or index.
+        """
+        if df is self.df:
+            return True
+        if len(df) != len(self.df):
+            return False
+        for column in self.BAR_COLUMNS:
+            if (column in df.columns) != (column in self.df.columns):
+                return False
+            if column in df.columns and not np.array_equal(df[column].to_numpy(dtype=float),
+                                                           self.df[column].to_numpy(dtype=float), equal_nan=True):
+                return False
+        return True
+
+    def get(self, name, params, compute):
+        """
+        Return a cached indicator, computing it with ``compute()`` on first use
+
+        Args:
+            name: Indicator name (e.g. 'ema')
+            params: Hashable tuple of parameters (e.g. ('close', 12))
+            compute: Zero-argument callable returning an array-like aligned with the bars
+        """
+        key = (name, params)
+        with self._lock:
+            if key in self._cache:
+                self.hits += 1
+                return self._cache[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # Only one thread computes a given indicator; others wait for its result
+        with key_lock:
+            with self._lock:
+                if key in self._cache:
+                    self.hits += 1
+                    return self._cache[key]
+
+            values = np.asarray(compute(), dtype=float)
+            values.flags.writeable = False
+
+            with self._lock:
+                self._cache[key] = values
+                self.misses += 1
+        return values
+
+    def cached(self):
+        """Snapshot of every computed indicator as {(name, params): array}"""
+        with self._lock:
+            return dict(self._cache)
+
+    def preload(self, values):
+        """Seed the cache with indicators computed elsewhere for these same bars"""
+        with self._lock:
+            for key, array in values.items():
+                array = np.asarray(array, dtype=float)
+                array.flags.writeable = False
+                self._cache[key] = array
+
+    def resume(self, key, values, accumulate):
+        """
+        Run the recursion ``accumulate`` (e.g. an EMA or cumulative sum) over ``values``
+
+        When a seed exists for ``key`` the recursion continues from it at ``seed_start``
+        (earlier positions are NaN), giving the same values as running over the full series.
+        """
+        seed = self.seeds.get(key)
+        if seed is None:
+            return np.asarray(accumulate(values), dtype=float)
+        values = np.asarray(values, dtype=float)
+        resumed = np.full(len(values), np.nan)
+        resumed[self.seed_start:] = np.asarray(accumulate(np.concatenate([[seed], values[self.seed_start:]])), dtype=float)[1:]
+        return resumed
+
+    def series(self, column):
+        """Raw bar column as a float Series (not cached, the frame already holds it)"""
+        return self.df[column].astype(float)
+
+    def column(self, column):
+        """Raw bar column as a read-only float array"""
+        return self.get('column', (column,), lambda: self.df[column].to_numpy(dtype=float))
+
+    def ema(self, column, span):
+        """Exponential moving average (adjust=False, same as the strategies)"""
+        return self.get('ema', (column, span),
+                        lambda: self.resume(('ema', (column, span)), self.series(column),
+                                            lambda v: pd.Series(v).ewm(span=span, adjust=False).mean()))
+
+    def ewm(self, name, params, values, span):
+        """EMA (adjust=False) of a derived series such as the MACD line, cached under ``name``"""
+        key = ('ewm', (name, params, span))
+        return self.get(*key, lambda: self.resume(key, values, lambda v: pd.Series(v).ewm(span=span, adjust=False).mean()))
+
+    def cumsum(self, name, values):
+        """Cumulative sum of a derived series (NaN-skipping like Series.cumsum), cached under ``name``"""
+        key = ('cumsum', (name,))
+        return self.get(*key, lambda: self.resume(key, values, lambda v: pd.Series(v).cumsum()))
+
+    def sma(self, column, window):
+        """Simple rolling mean"""
+        return self.get('sma', (column, window),
+                        lambda: self.series(column).rolling(window=window).mean())
+
+    def rolling_std(self, column, window):
+        """Rolling sample standard deviation"""
+        return self.get('rolling_std', (column, window),
+                        lambda: self.series(column).rolling(window=window).std())
+
+    def rolling_extrema(self, column, windows, kind='max'):
+        """
+        Rolling maximum or minimum of a column for several windows, computed in one pass
+
+        Each window is cached as ('rolling_max' or 'rolling_min', (column, window)), so later
+        rolling_max/rolling_min calls for these windows are cache hits.
+
+        Returns:
+            dict of {window: read-only array}
+        """
+        name = f'rolling_{kind}'
+        with self._lock:
+            missing = [w for w in windows if (name, (column, w)) not in self._cache]
+        computed = _rolling_extrema(self.column(column), missing, kind) if missing else {}
+        return {w: self.get(name, (column, w), lambda w=w: computed[int(w)]) for w in windows}
+
+    def rolling_max(self, column, window):
+        """Rolling maximum"""
+        return self.rolling_extrema(column, (window,), 'max')[window]
+
+    def rolling_min(self, column, window):
+        """Rolling minimum"""
+        return self.rolling_extrema(column, (window,), 'min')[window]
+
+    def true_range(self):
+        """True range: max of high-low, |high-prev close| and |low-prev close|"""
+        def compute():
+            high = self.series('high')
+            low = self.series('low')
+            prev_close = self.series('close').shift(1)
+            high_low = high - low
+            high_close = np.abs(high - prev_close)
+            low_close = np.abs(low - prev_close)
+            return np.fmax(np.fmax(high_low, high_close), low_close)
+        return self.get('true_range', (), compute)
+
+    def atr(self, period):
+        """Average true range as a simple rolling mean of the true range"""
+        return self.get('atr', (period,),
+                        lambda: pd.Series(self.true_range()).rolling(window=period).mean())
+
+    def rsi(self, column, period):
+        """RSI from simple rolling means of gains and losses"""
+        def compute():
+            delta = self.series(column).diff()
+            gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
+            loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+            rs = gain / loss
+            return 100 - (100 / (1 + rs))
+        return self.get('rsi', (column, period), compute)
+
+
+def resolve_indicator_context(df, indicators=None):
+    """
+    Return ``indicators`` if it was built for bars matching ``df``, else a fresh context on ``df``
+    """
+    if indicators is not None and indicators.matches(df):
+        return indicators
+    return IndicatorContext(df)
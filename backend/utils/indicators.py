@@ -0,0 +1,286 @@
+"""
+Vectorized technical indicators on NumPy arrays.
+
+Drop-in replacements for the ``ta`` indicator classes used to build model features
+(same formulas, warm-up NaNs and zero-filled starts as ta 0.11 with fillna=False). Related
+indicators are computed as families sharing their intermediates: SMAs for several windows
+come from one cumulative sum, RSIs share the gain/loss split, stochastic %K/%D and
+Williams %R share one rolling high/low pass, and ADX, +DI and -DI come from the same
+Wilder-smoothed sums. Wilder recursions run through pandas' EWM instead of Python loops,
+so values match ta to floating-point rounding rather than bit for bit.
+
+All functions take array-likes aligned by position and return float arrays (or dicts of
+them keyed by window or component name).
+"""
+import numpy as np
+import pandas as pd
+from .rolling_extrema import rolling_extrema
+
+
+def _array(values):
+    return np.asarray(values, dtype=float)
+
+
+def _shift(values, periods=1):
+    """Shift by ``periods`` bars with NaN fill (like Series.shift)"""
+    shifted = np.full(len(values), np.nan)
+    if periods < len(values):
+        shifted[periods:] = values[:len(values) - periods]
+    return shifted
+
+
+def _rolling_sums(values, windows):
+    """
+    Rolling sums for several windows from one cumulative sum
+
+    Windows containing a NaN or infinity are NaN, as pandas rolling treats infinities as missing.
+    """
+    values = _array(values)
+    n = len(values)
+    missing = ~np.isfinite(values)
+    clean = np.where(missing, 0.0, values)
+    # Accumulate deviations from the first value so the running sum stays small
+    offset = clean[np.argmax(~missing)] if n and not missing.all() else 0.0
+    totals = np.concatenate([[0.0], np.cumsum(np.where(missing, 0.0, clean - offset))])
+    gaps = np.concatenate([[0], np.cumsum(missing)])
+
+    sums = {}
+    for window in windows:
+        result = np.full(n, np.nan)
+        if 0 < window <= n:
+            result[window - 1:] = totals[window:] - totals[:n - window + 1] + offset * window
+            result[window - 1:][gaps[window:] - gaps[:n - window + 1] > 0] = np.nan
+        sums[window] = result
+    return sums
+
+
+def _wilder(first, values, window):
+    """
+    Wilder recursion ``s[0] = first``, ``s[i] = s[i-1] * (1 - 1/window) + values[i-1] / window``
+
+    Returns:
+        Array of len(values) + 1
+    """
+    alpha = 1 / window
+    return pd.Series(np.concatenate([[first], values])).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+
+
+def sma(values, windows):
+    """
+    Simple moving averages for several windows (ta SMAIndicator)
+
+    Args:
+        values: Price or volume array
+        windows: Iterable of window lengths
+
+    Returns:
+        dict of {window: array}, NaN until the window is full
+    """
+    return {window: total / window for window, total in _rolling_sums(values, windows).items()}
+
+
+def ema(values, windows):
+    """
+    Exponential moving averages for several spans (ta EMAIndicator: adjust=False, NaN until ``window`` bars)
+
+    Returns:
+        dict of {window: array}
+    """
+    series = pd.Series(_array(values))
+    return {window: series.ewm(span=window, min_periods=window, adjust=False).mean().to_numpy()
+            for window in windows}
+
+
+def rsi(close, windows):
+    """
+    Wilder RSI for several windows from one gain/loss split (ta RSIIndicator)
+
+    Returns:
+        dict of {window: array}
+    """
+    delta = np.diff(_array(close), prepend=np.nan)
+    moves = pd.DataFrame({
+        'up': np.where(delta > 0, delta, 0.0),
+        'down': -np.where(delta < 0, delta, 0.0)
+    })
+    result = {}
+    for window in windows:
+        averages = moves.ewm(alpha=1 / window, min_periods=window, adjust=False).mean()
+        up = averages['up'].to_numpy()
+        down = averages['down'].to_numpy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result[window] = np.where(down == 0, 100, 100 - 100 / (1 + up / down))
+    return result
+
+
+def macd(close, fast=12, slow=26, signal=9, emas=None):
+    """
+    MACD line, signal line and histogram (ta MACD)
+
+    Args:
+        close: Close prices
+        fast, slow, signal: EMA spans
+        emas: Optional dict of already computed ema() results to reuse
+
+    Returns:
+        dict with 'macd', 'signal' and 'hist' arrays
+    """
+    emas = dict(emas or {})
+    missing = [w for w in (fast, slow) if w not in emas]
+    if missing:
+        emas.update(ema(close, missing))
+    line = emas[fast] - emas[slow]
+    signal_line = ema(line, (signal,))[signal]
+    return {'macd': line, 'signal': signal_line, 'hist': line - signal_line}
+
+
+def bollinger(close, window=20, num_std=2, middle=None):
+    """
+    Bollinger bands with a population standard deviation (ta BollingerBands)
+
+    Args:
+        close: Close prices
+        window: Moving average window
+        num_std: Band width in standard deviations
+        middle: Optional precomputed SMA of ``window`` bars
+
+    Returns:
+        dict with 'upper', 'middle', 'lower' and 'width' (band width as % of the middle band)
+    """
+    close = _array(close)
+    if middle is None:
+        middle = sma(close, (window,))[window]
+    std = pd.Series(close).rolling(window).std(ddof=0).to_numpy()
+    upper = middle + num_std * std
+    lower = middle - num_std * std
+    with np.errstate(divide='ignore', invalid='ignore'):
+        width = (upper - lower) / middle * 100
+    return {'upper': upper, 'middle': middle, 'lower': lower, 'width': width}
+
+
+def stochastic(high, low, close, window=14, smooth_window=3):
+    """
+    Stochastic %K/%D and Williams %R from one rolling high/low pass
+    (ta StochasticOscillator and WilliamsRIndicator with lbp=window)
+
+    Returns:
+        dict with 'k', 'd' and 'williams_r' arrays
+    """
+    close = _array(close)
+    highest = rolling_extrema(high, (window,), 'max')[window]
+    lowest = rolling_extrema(low, (window,), 'min')[window]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        k = 100 * (close - lowest) / (highest - lowest)
+        williams_r = -100 * (highest - close) / (highest - lowest)
+    return {'k': k, 'd': sma(k, (smooth_window,))[smooth_window], 'williams_r': williams_r}
+
+
+def true_range(high, low, close):
+    """True range; the first bar (no previous close) is its high - low"""
+    high = _array(high)
+    low = _array(low)
+    prev_close = _shift(_array(close))
+    return np.fmax(np.fmax(high - low, np.abs(high - prev_close)), np.abs(low - prev_close))
+
+
+def atr(high, low, close, window=14):
+    """
+    Wilder average true range (ta AverageTrueRange): 0 for the first ``window - 1`` bars
+
+    Returns:
+        array
+    """
+    tr = true_range(high, low, close)
+    n = len(tr)
+    result = np.zeros(n)
+    if n >= window:
+        result[window - 1:] = _wilder(pd.Series(tr[:window]).mean(), tr[window:], window)
+    return result
+
+
+def adx(high, low, close, window=14):
+    """
+    ADX with +DI and -DI from shared Wilder sums (ta ADXIndicator)
+
+    Reproduces ta's layout: ADX is 0 for the first ``2 * window - 1`` bars, the DIs are 0
+    for the first ``window + 1`` bars.
+
+    Returns:
+        dict with 'adx', 'plus_di' and 'minus_di' arrays
+    """
+    high = _array(high)
+    low = _array(low)
+    close = _array(close)
+    n = len(close)
+    result = {'adx': np.zeros(n), 'plus_di': np.zeros(n), 'minus_di': np.zeros(n)}
+    length = n - (window - 1)
+    if length <= window:
+        return result
+
+    prev_close = _shift(close)
+    with np.errstate(invalid='ignore'):
+        ranges = np.maximum(high, prev_close) - np.minimum(low, prev_close)
+    up = high - _shift(high)
+    down = _shift(low) - low
+    plus_move = np.where(np.isnan(up), np.nan, np.abs(np.where((up > down) & (up > 0), up, 0.0)))
+    minus_move = np.where(np.isnan(down), np.nan, np.abs(np.where((down > up) & (down > 0), down, 0.0)))
+
+    def smoothed(values):
+        # First sum over the first `window` valid values, then Wilder steps; the last slot stays 0
+        sums = np.zeros(length)
+        first = values[~np.isnan(values)][:window].sum()
+        sums[:length - 1] = _wilder(first, values[window + 1:] * window, window)
+        return sums
+
+    tr_sum = smoothed(ranges)
+    plus_sum = smoothed(plus_move)
+    minus_sum = smoothed(minus_move)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        plus_di = np.where(tr_sum != 0, 100 * (plus_sum / tr_sum), 0.0)
+        minus_di = np.where(tr_sum != 0, 100 * (minus_sum / tr_sum), 0.0)
+        total = plus_di + minus_di
+        dx = np.where(total != 0, 100 * np.abs((plus_di - minus_di) / total), 0.0)
+
+    adx_values = np.zeros(length)
+    adx_values[window:] = _wilder(dx[:window].mean(), dx[window:length - 1], window)
+    result['adx'][window - 1:] = adx_values
+    result['plus_di'][window + 1:] = plus_di[1:length - 1]
+    result['minus_di'][window + 1:] = minus_di[1:length - 1]
+    return result
+
+
+def obv(close, volume):
+    """On-balance volume (ta OnBalanceVolumeIndicator)"""
+    close = _array(close)
+    volume = _array(volume)
+    signed = np.where(close < _shift(close), -volume, volume)
+    return pd.Series(signed).cumsum().to_numpy()
+
+
+def mfi(high, low, close, volume, window=14):
+    """Money flow index (ta MFIIndicator)"""
+    typical_price = (_array(high) + _array(low) + _array(close)) / 3.0
+    prev = _shift(typical_price)
+    direction = np.where(typical_price > prev, 1, np.where(typical_price < prev, -1, 0))
+    flow = typical_price * _array(volume) * direction
+    # NaN flows stay NaN so windows containing them are NaN
+    positive = _rolling_sums(np.where(flow < 0.0, 0.0, flow), (window,))[window]
+    negative = np.abs(_rolling_sums(np.where(flow >= 0.0, 0.0, flow), (window,))[window])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return 100 - 100 / (1 + positive / negative)
+
+
+def roc(close, windows):
+    """
+    Rate of change in percent for several windows (ta ROCIndicator)
+
+    Returns:
+        dict of {window: array}
+    """
+    close = _array(close)
+    result = {}
+    for window in windows:
+        base = _shift(close, window)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result[window] = (close - base) / base * 100
+    return result
@@ -0,0 +1,333 @@
+"""
+Columnar response encoding for bar-by-bar payloads.
+
+Strategy results carry ``data`` as one dict per bar with every intermediate column, and
+prediction results carry parallel per-date lists. ``format=columnar`` sends one array per
+field instead: field names appear once rather than once per bar, ``fields=`` drops the
+columns a client does not draw, and timestamps become integer epoch seconds instead of
+ISO strings. Numeric columns stay NumPy arrays and are written directly by ``dumps``.
+
+Every response is serialized by ``dumps`` (installed as the app's JSON provider): orjson
+encodes dicts, lists and NumPy arrays in C, writing NaN and infinity as null and
+timestamps as ISO strings, missing timestamps (NaT) as null. Results therefore go to
+jsonify as computed, without first being rebuilt as plain Python values.
+
+``stream=1`` responses are produced by ``stream_json``: the small keys (metadata, signals,
+metrics) go out first, then the per-bar payload in batches, so the whole document is never
+held in memory as one string and clients can start parsing before the end.
+"""
+import decimal
+import numpy as np
+import pandas as pd
+import orjson
+from datetime import datetime
+from itertools import chain
+from flask.json.provider import DefaultJSONProvider
+
+FORMATS = ('rows', 'columnar')
+TIME_ENCODINGS = ('epoch', 'iso')
+
+# Fields holding bar timestamps
+TIME_FIELDS = ('date', 'datetime', 'dates', 'time', 'timestamp')
+
+# Parallel per-date lists of a prediction result, encoded together as its 'series'
+PREDICTION_SERIES = ('dates', 'predictions', 'probabilities', 'actual', 'actual_prices')
+
+
+def parse_format(text):
+    """Validated response format ('rows' when missing)"""
+    response_format = (text or 'rows').lower()
+    if response_format not in FORMATS:
+        raise ValueError(f"format must be one of {', '.join(FORMATS)}")
+    return response_format
+
+
+def parse_fields(text):
+    """Comma-separated field projection as a list (None = all fields)"""
+    if not text:
+        return None
+    fields = [f.strip() for f in text.split(',') if f.strip()]
+    return fields or None
+
+
+def parse_time_encoding(text):
+    """Validated timestamp encoding for columnar payloads ('epoch' when missing)"""
+    encoding = (text or 'epoch').lower()
+    if encoding not in TIME_ENCODINGS:
+        raise ValueError(f"times must be one of {', '.join(TIME_ENCODINGS)}")
+    return encoding
+
+
+def _default(obj):
+    """Values orjson does not encode natively"""
+    if obj is pd.NaT or obj is pd.NA:
+        return None
+    if isinstance(obj, pd.Timestamp):
+        return obj.isoformat()
+    if isinstance(obj, np.datetime64):
+        return None if np.isnat(obj) else pd.Timestamp(obj).isoformat()
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.kind == 'M':
+            return _without_nat(obj)
+        # Object, float16 or non-contiguous arrays; their elements go through orjson again
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, (pd.Series, pd.Index)):
+        if pd.api.types.is_datetime64_any_dtype(obj.dtype):
+            return encode_times(obj, 'iso')
+        return obj.to_numpy()
+    if isinstance(obj, pd.DataFrame):
+        return obj.to_dict('records')
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Values that are, or may contain, NumPy datetime64 values
+_NESTED = (np.datetime64, np.ndarray, dict, list, tuple)
+
+
+def _inner_values(rows, types):
+    """Iterator over the values of a list of dicts, or the items of a list of lists"""
+    if dict in types:
+        return chain.from_iterable(map(dict.values, rows))
+    return chain.from_iterable(rows)
+
+
+def _holds_datetime64(obj):
+    """
+    True when ``obj`` is, or contains, a NumPy datetime64 scalar or array
+
+    Lists are checked by the set of their element types, and a list of dicts (or of lists)
+    by the types of all their values in one pass, so per-bar records and lists of floats
+    are scanned without a Python-level visit of each value.
+    """
+    if isinstance(obj, np.datetime64):
+        return True
+    if isinstance(obj, np.ndarray):
+        return obj.dtype.kind == 'M' or (obj.dtype.kind == 'O' and _holds_datetime64(obj.tolist()))
+    if isinstance(obj, dict):
+        return any(_holds_datetime64(value) for value in obj.values() if isinstance(value, _NESTED))
+    if not isinstance(obj, (list, tuple)):
+        return False
+    types = set(map(type, obj))
+    if types and (types == {dict} or types <= {list, tuple}):
+        if not any(issubclass(t, _NESTED) for t in set(map(type, _inner_values(obj, types)))):
+            return False
+        return _holds_datetime64([value for value in _inner_values(obj, types) if isinstance(value, _NESTED)])
+    if not any(issubclass(t, _NESTED) for t in types):
+        return False
+    return any(_holds_datetime64(value) for value in obj if isinstance(value, _NESTED))
+
+
+def _without_nat(obj):
+    """``obj`` with its NumPy datetime64 scalars and arrays as ISO strings (NaT -> None)"""
+    if isinstance(obj, np.ndarray) and obj.dtype.kind == 'M':
+        if obj.ndim != 1:
+            return [_without_nat(row) for row in obj]
+        return encode_times(obj, 'iso')
+    if isinstance(obj, np.ndarray) and obj.dtype.kind == 'O':
+        return _without_nat(obj.tolist())
+    if isinstance(obj, np.datetime64):
+        return _scalar(obj)
+    if isinstance(obj, dict):
+        return {key: _without_nat(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_without_nat(item) for item in obj]
+    return obj
+
+
+def dumps(obj):
+    """
+    JSON bytes for a response payload
+
+    NaN and infinity (Python floats, NumPy scalars and arrays) become null, timestamps ISO
+    strings (NaT null), NumPy arrays are written directly and non-string dict keys are stringified.
+    """
+    if _holds_datetime64(obj):
+        # orjson writes datetime64 values itself and fails on NaT (aborting on NaT in arrays)
+        obj = _without_nat(obj)
+    return orjson.dumps(obj, default=_default, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider serializing with ``dumps`` (request bodies still parse with the stdlib)"""
+
+    def dumps(self, obj, **kwargs):
+        return dumps(obj).decode('utf-8')
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps(obj), mimetype='application/json')
+
+
+# Bars (or per-date values) serialized per streamed chunk
+STREAM_BATCH_ROWS = 2000
+
+# Keys of a strategy / prediction result streamed last and in batches
+STRATEGY_STREAM_KEYS = ('data', 'backtest')
+PREDICTION_STREAM_KEYS = ('series',) + PREDICTION_SERIES
+
+
+def parse_stream(text):
+    """True when a streamed response was requested (stream=1/true/yes)"""
+    return (text or '0').lower() in ['1', 'true', 'yes']
+
+
+def _stream_value(value, batch_size):
+    """JSON chunks of one value: lists and arrays in batches, dicts key by key"""
+    if isinstance(value, dict):
+        yield b'{'
+        for i, (key, item) in enumerate(value.items()):
+            yield (b',' if i else b'') + dumps(str(key)) + b':'
+            yield from _stream_value(item, batch_size)
+        yield b'}'
+    elif isinstance(value, (list, np.ndarray)) and len(value) > batch_size:
+        yield b'['
+        for start in range(0, len(value), batch_size):
+            # Each batch is encoded as a list and its brackets dropped
+            yield (b',' if start else b'') + dumps(value[start:start + batch_size])[1:-1]
+        yield b']'
+    else:
+        yield dumps(value)
+
+
+def stream_json(payload, stream_keys=(), batch_size=STREAM_BATCH_ROWS):
+    """
+    Generator of JSON chunks for ``payload`` (a dict)
+
+    Keys not in ``stream_keys`` are written first, each in one chunk; the ``stream_keys``
+    present follow in that order, with their lists (and the lists inside them, e.g.
+    columnar columns or backtest curves) written ``batch_size`` items at a time.
+    Concatenated, the chunks parse to the same document as ``dumps(payload)``.
+    """
+    head = [key for key in payload if key not in stream_keys]
+    tail = [key for key in stream_keys if key in payload]
+    for i, key in enumerate(head + tail):
+        prefix = (b',' if i else b'{') + dumps(str(key)) + b':'
+        if key in stream_keys:
+            yield prefix
+            yield from _stream_value(payload[key], batch_size)
+        else:
+            yield prefix + dumps(payload[key])
+    yield b'}' if payload else b'{}'
+
+
+def _scalar(value):
+    """JSON-safe scalar (NaN/inf -> None, NumPy scalars -> Python, timestamps -> ISO)"""
+    if isinstance(value, (pd.Timestamp, datetime, np.datetime64)):
+        return None if pd.isna(value) else pd.Timestamp(value).isoformat()
+    if isinstance(value, (float, np.floating)):
+        return float(value) if np.isfinite(value) else None
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, np.bool_):
+        return bool(value)
+    return value
+
+
+def encode_times(values, encoding='epoch'):
+    """
+    Timestamps as integer epoch seconds (UTC) or ISO strings; missing values become None
+
+    Values that do not parse as timestamps are returned as they are.
+    """
+    try:
+        index = pd.DatetimeIndex(pd.to_datetime(pd.Index(values)))
+    except (ValueError, TypeError):
+        return [_scalar(v) for v in values]
+    missing = index.isna()
+    if encoding == 'iso':
+        return [t.isoformat() if not m else None for t, m in zip(index, missing)]
+    encoded = index.as_unit('s').asi8
+    if missing.any():
+        encoded = encoded.astype(object)
+        encoded[missing] = None
+    return encoded
+
+
+def encode_column(values):
+    """
+    One field for ``dumps``: numeric columns stay NumPy arrays (NaN is written as null),
+    other columns become lists of JSON-safe scalars
+    """
+    if isinstance(values, pd.Series):
+        if pd.api.types.is_datetime64_any_dtype(values.dtype):
+            return encode_times(values, 'iso')
+        values = values.to_numpy()
+    values = np.asarray(values)
+    if values.dtype.kind in 'fiub':
+        return values
+    return [_scalar(v) for v in values.tolist()]
+
+
+def columnar(frame, fields=None, time_encoding='epoch'):
+    """
+    Columnar payload of a frame (or a list of per-bar dicts)
+
+    Args:
+        frame: DataFrame, or records as produced by ``df.to_dict('records')``
+        fields: Optional list of fields to keep, in the order given
+        time_encoding: 'epoch' (integer seconds) or 'iso' for timestamp fields
+
+    Returns:
+        dict with 'format', 'length', 'fields', 'columns' ({field: list or array}) and 'time_encoding'
+    """
+    if isinstance(frame, pd.DataFrame):
+        available = [str(c) for c in frame.columns]
+    else:
+        available = list(frame[0]) if len(frame) else []
+    if fields is None:
+        fields = available
+    else:
+        unknown = [f for f in fields if f not in available]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)} (available: {', '.join(available)})")
+    if not isinstance(frame, pd.DataFrame):
+        # Only the projected fields are pulled out of the records
+        frame = pd.DataFrame.from_records(frame, columns=fields)
+
+    columns = {}
+    for field in fields:
+        values = frame[field]
+        if field in TIME_FIELDS:
+            columns[field] = encode_times(values, time_encoding)
+        else:
+            columns[field] = encode_column(values)
+    return {
+        'format': 'columnar',
+        'length': len(frame),
+        'fields': list(fields),
+        'columns': columns,
+        'time_encoding': time_encoding
+    }
+
+
+def columnar_strategy_result(result, fields=None, time_encoding='epoch'):
+    """
+    Strategy result with its per-bar ``data`` records replaced by a columnar payload
+
+    Signals, metadata and the other keys are left as they are.
+    """
+    result = dict(result)
+    result['data'] = columnar(result.get('data') or [], fields, time_encoding)
+    return result
+
+
+def columnar_prediction_result(result, fields=None, time_encoding='epoch'):
+    """
+    Prediction result with its parallel per-date lists moved into one columnar 'series'
+
+    Lists whose length differs from 'dates' (or a result without dates) are left in place.
+    """
+    dates = result.get('dates')
+    if not isinstance(dates, list):
+        return result
+    series = {key: result[key] for key in PREDICTION_SERIES
+              if isinstance(result.get(key), list) and len(result[key]) == len(dates)}
+    result = {key: value for key, value in result.items() if key not in series}
+    result['series'] = columnar(pd.DataFrame(series), fields, time_encoding)
+    return result
@@ -0,0 +1,69 @@
+"""
+Rolling maximum / minimum over several window lengths in one pass.
+
+Donchian-style indicators (breakout channels, Ichimoku's Tenkan/Kijun/Senkou B lines) need
+rolling highs and lows over several windows of the same series. A sparse table of
+power-of-two block extrema answers every window with two overlapping lookups, and its
+levels are shared by all windows: building up to the largest window is log2(window)
+vectorized NumPy passes, after which each window costs one more pass. (A monotonic-deque
+scan is O(n) per window too, but needs a Python-level loop per bar.)
+
+Results match ``pd.Series(values).rolling(window).max()`` / ``.min()``: the first
+``window - 1`` values and every window containing a NaN (or an infinity, which pandas
+treats as missing) are NaN.
+"""
+import numpy as np
+
+
+def rolling_extrema(values, windows, kind='max'):
+    """
+    Rolling maximum or minimum of ``values`` for each window length
+
+    Args:
+        values: 1-D array-like of floats
+        windows: Iterable of positive window lengths
+        kind: 'max' or 'min'
+
+    Returns:
+        dict of {window: float array aligned with values}
+    """
+    if kind not in ('max', 'min'):
+        raise ValueError("kind must be 'max' or 'min'")
+    values = np.asarray(values, dtype=float)
+    windows = sorted({int(w) for w in windows})
+    if windows and windows[0] < 1:
+        raise ValueError("window must be a positive integer")
+    n = len(values)
+    op = np.maximum if kind == 'max' else np.minimum
+
+    nan = ~np.isfinite(values)
+    nan_count = np.concatenate([[0], np.cumsum(nan)])
+    level = np.where(nan, -np.inf if kind == 'max' else np.inf, values)
+    span = 1
+
+    results = {}
+    for window in windows:
+        out = np.full(n, np.nan)
+        if window > n:
+            results[window] = out
+            continue
+        # Extend the table to the largest power of two not above the window
+        while span * 2 <= window:
+            level = op(level[:len(level) - span], level[span:])
+            span *= 2
+        # [i - window + 1, i] is covered by the blocks starting at i - window + 1 and i - span + 1
+        out[window - 1:] = op(level[:n - window + 1], level[window - span:n - span + 1])
+        has_nan = nan_count[window:] - nan_count[:n - window + 1] > 0
+        out[window - 1:][has_nan] = np.nan
+        results[window] = out
+    return results
+
+
+def rolling_max(values, window):
+    """Rolling maximum over one window (NaN like pandas)"""
+    return rolling_extrema(values, (window,), 'max')[int(window)]
+
+
+def rolling_min(values, window):
+    """Rolling minimum over one window (NaN like pandas)"""
+    return rolling_extrema(values, (window,), 'min')[int(window)]
@@ -1,6 +1,6 @@
 import pandas as pd
 import numpy as np
-from ta.volatility import AverageTrueRange
+from .indicators import atr
 
 
 def calculate_atr_volatility(df, period=14, forecast_days=1):
@@ -19,13 +19,7 @@ def calculate_atr_volatility(df, period=14, forecast_days=1):
         df = df.copy()
         
         # Calculate ATR
-        atr_indicator = AverageTrueRange(
-            high=df['high'],
-            low=df['low'],
-            close=df['close'],
-            window=period
-        )
-        df['atr'] = atr_indicator.average_true_range()
+        df['atr'] = atr(df['high'], df['low'], df['close'], period)
         
         # Get last 5 days of high-low range
         df['daily_range'] = df['high'] - df['low']
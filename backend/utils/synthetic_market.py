@@ -0,0 +1,189 @@
+"""
+Seeded synthetic OHLCV markets for the simulator, demos and load tests.
+
+Every series is generated in whole-array NumPy operations. No loop runs per bar, so a
+panel of millions of bars takes seconds. Log returns combine:
+
+- geometric Brownian motion: annual drift and volatility;
+- correlated assets: shocks share one correlation matrix, or one pairwise correlation;
+- volatility regimes: a market-wide Markov chain of volatility multipliers, switching
+  with probability 1 - persistence per bar;
+- jumps: Poisson arrivals with normally distributed log sizes;
+- intraday seasonality: a U-shaped volatility and volume profile over the trading session.
+
+The same seed gives the same market.
+"""
+import numpy as np
+import pandas as pd
+
+TRADING_DAYS = 252
+
+# Regular US equity session used for intraday calendars
+SESSION_OPEN = pd.Timedelta(hours=9, minutes=30)
+SESSION_MINUTES = 390
+
+# Bar length in minutes for intraday intervals; '1d' bars are business days
+INTERVAL_MINUTES = {'1m': 1, '5m': 5, '15m': 15, '30m': 30, '1h': 60}
+
+
+def business_days(n_days, start=None, end=None):
+    """``n_days`` consecutive weekdays from ``start`` (default 2020-01-01), or up to ``end``"""
+    if end is not None:
+        anchor = np.datetime64(pd.Timestamp(end).date(), 'D')
+        days = np.busday_offset(anchor, np.arange(-(n_days - 1), 1), roll='backward')
+    else:
+        anchor = np.datetime64(pd.Timestamp(start or '2020-01-01').date(), 'D')
+        days = np.busday_offset(anchor, np.arange(n_days), roll='forward')
+    return pd.DatetimeIndex(days.astype('datetime64[s]'))
+
+
+def trading_calendar(n_bars, interval='1d', start=None, end=None):
+    """
+    Timestamps of ``n_bars`` consecutive bars: business days for '1d', regular-session bars
+    for intraday intervals
+
+    Args:
+        n_bars: Number of bars
+        interval: '1d' or a key of INTERVAL_MINUTES
+        start: First session date (default 2020-01-01 unless ``end`` is given)
+        end: Last session date; the calendar counts back from it when given
+
+    Returns:
+        (DatetimeIndex of bar open times, array of each bar's position in its session in [0, 1])
+    """
+    if interval == '1d':
+        return business_days(n_bars, start, end), np.full(n_bars, 0.5)
+
+    if interval not in INTERVAL_MINUTES:
+        raise ValueError(f"interval must be '1d' or one of {', '.join(INTERVAL_MINUTES)}")
+    minutes = INTERVAL_MINUTES[interval]
+    per_session = SESSION_MINUTES // minutes
+    n_days = -(-n_bars // per_session)
+    days = business_days(n_days, start, end)
+    offsets = SESSION_OPEN + pd.to_timedelta(np.arange(per_session) * minutes, unit='min')
+    stamps = (days.values[:, None] + offsets.values[None, :]).ravel()
+    position = np.tile((np.arange(per_session) + 0.5) / per_session, n_days)
+    if end is not None:
+        return pd.DatetimeIndex(stamps[-n_bars:]), position[-n_bars:]
+    return pd.DatetimeIndex(stamps[:n_bars]), position[:n_bars]
+
+
+def intraday_profile(position, strength):
+    """U-shaped multiplier over the session (mean 1): ``1 + strength * (2 * position - 1) ** 2``"""
+    profile = 1 + strength * (2 * position - 1) ** 2
+    return profile / profile.mean()
+
+
+def regime_path(n_bars, multipliers, persistence, rng):
+    """
+    Volatility multiplier per bar from a Markov chain over ``multipliers``
+
+    Each bar switches regime with probability 1 - persistence, to one of the other regimes
+    chosen uniformly.
+    """
+    multipliers = np.asarray(multipliers, dtype=float)
+    k = len(multipliers)
+    if k == 1 or n_bars == 0:
+        return np.full(n_bars, multipliers[0] if k else 1.0)
+    switches = rng.random(n_bars) > persistence
+    switches[0] = False
+    # A switch moves 1..k-1 regimes ahead (mod k), so it never lands on the current regime
+    steps = np.where(switches, rng.integers(1, k, n_bars), 0)
+    state = (rng.integers(0, k) + np.cumsum(steps)) % k
+    return multipliers[state]
+
+
+def correlation_matrix(correlation, k):
+    """k x k correlation matrix from a matrix or one pairwise correlation"""
+    if np.ndim(correlation) == 0:
+        matrix = np.full((k, k), float(correlation))
+        np.fill_diagonal(matrix, 1.0)
+        return matrix
+    matrix = np.asarray(correlation, dtype=float)
+    if matrix.shape != (k, k):
+        raise ValueError(f"correlation must be a number or a {k}x{k} matrix")
+    return matrix
+
+
+def generate_market(symbols=('SYN',), n_bars=252, interval='1d', seed=None, start=None, end=None,
+                    start_price=100.0, drift=0.07, volatility=0.2, correlation=0.0,
+                    jump_intensity=0.0, jump_mean=0.0, jump_std=0.05,
+                    regimes=(1.0,), regime_persistence=0.98, seasonality=1.0, base_volume=1_000_000):
+    """
+    Synthetic OHLCV bars for several symbols
+
+    Args:
+        symbols: Symbol names
+        n_bars: Bars per symbol
+        interval: '1d' (business days) or an intraday interval ('1m', '5m', '15m', '30m', '1h')
+        seed: Random seed (None = fresh randomness)
+        start, end: Calendar anchor (see trading_calendar)
+        start_price: First open, a number or one per symbol
+        drift, volatility: Annualized GBM drift and volatility, numbers or one per symbol
+        correlation: Pairwise correlation of the shocks, or a correlation matrix
+        jump_intensity: Expected jumps per year per symbol
+        jump_mean, jump_std: Mean and standard deviation of a jump's log size
+        regimes: Volatility multipliers of the market-wide regimes
+        regime_persistence: Probability of staying in the current regime each bar
+        seasonality: Strength of the intraday U-shaped volatility/volume profile (0 = flat)
+        base_volume: Average volume per bar (per day for '1d')
+
+    Returns:
+        dict of {symbol: DataFrame with date, open, high, low, close, volume}
+    """
+    symbols = list(symbols)
+    k = len(symbols)
+    rng = np.random.default_rng(seed)
+    dates, position = trading_calendar(n_bars, interval, start, end)
+    bars_per_year = TRADING_DAYS * (1 if interval == '1d' else SESSION_MINUTES // INTERVAL_MINUTES[interval])
+    dt = 1.0 / bars_per_year
+
+    drift = np.broadcast_to(np.asarray(drift, dtype=float), (k,))
+    volatility = np.broadcast_to(np.asarray(volatility, dtype=float), (k,))
+    start_price = np.broadcast_to(np.asarray(start_price, dtype=float), (k,))
+
+    # Per-bar volatility: base x regime x intraday profile
+    profile = intraday_profile(position, seasonality if interval != '1d' else 0.0)
+    scale = (regime_path(n_bars, regimes, regime_persistence, rng) * profile)[:, None]
+    sigma = volatility[None, :] * scale * np.sqrt(dt)
+
+    shocks = rng.standard_normal((n_bars, k))
+    if k > 1:
+        shocks = shocks @ np.linalg.cholesky(correlation_matrix(correlation, k)).T
+    log_returns = (drift[None, :] - 0.5 * (volatility[None, :] * scale) ** 2) * dt + sigma * shocks
+
+    if jump_intensity > 0:
+        counts = rng.poisson(jump_intensity * dt, (n_bars, k))
+        jumped = counts > 0
+        log_returns[jumped] += rng.normal(counts[jumped] * jump_mean, np.sqrt(counts[jumped]) * jump_std)
+
+    close = start_price[None, :] * np.exp(np.cumsum(log_returns, axis=0))
+    # Each bar opens near the previous close; the first opens at the start price
+    prev_close = np.vstack([start_price[None, :], close[:-1]])
+    open_ = prev_close * np.exp(0.1 * sigma * rng.standard_normal((n_bars, k)))
+    # Intrabar excursions beyond the open/close body, in units of the bar's volatility
+    high = np.maximum(open_, close) * np.exp(0.5 * sigma * np.abs(rng.standard_normal((n_bars, k))))
+    low = np.minimum(open_, close) * np.exp(-0.5 * sigma * np.abs(rng.standard_normal((n_bars, k))))
+
+    # Volume follows the session profile and rises with the size of the move
+    per_bar_volume = base_volume / (bars_per_year / TRADING_DAYS)
+    move = np.abs(log_returns) / np.maximum(sigma, 1e-12)
+    volume = per_bar_volume * profile[:, None] * (0.5 + 0.5 * move) * rng.lognormal(0.0, 0.25, (n_bars, k))
+    volume = np.maximum(volume, 1).astype(np.int64)
+
+    return {
+        symbol: pd.DataFrame({
+            'date': dates,
+            'open': open_[:, j],
+            'high': high[:, j],
+            'low': low[:, j],
+            'close': close[:, j],
+            'volume': volume[:, j]
+        })
+        for j, symbol in enumerate(symbols)
+    }
+
+
+def synthetic_bars(n_bars=252, interval='1d', seed=None, **kwargs):
+    """Synthetic OHLCV frame for one symbol (see generate_market for the options)"""
+    return generate_market(('SYN',), n_bars, interval, seed, **kwargs)['SYN']